@@ -0,0 +1,139 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Standalone runner for the asv-style benchmarks in this package.
+
+This runs each ``time_*`` method after calling ``setup`` for each repeat,
+and reports the best wall-clock time per call, the time per operation and
+throughput (using the benchmark's ``ops`` attribute).  ``peakmem_*``
+methods are run once under `tracemalloc`, and report the peak size of
+Python allocations during the call (asv instead reports the peak resident
+size of the process).
+"""
+
+import argparse
+import importlib
+import inspect
+import itertools
+import os
+import pkgutil
+import re
+import sys
+import time
+import tracemalloc
+
+
+def findBenchmarks(pattern):
+    """Find benchmark classes and methods.
+
+    Parameters
+    ----------
+    pattern : `re.Pattern`
+        Regular expression that full benchmark names
+        (``module.Class.method``) must contain a match for.
+
+    Yields
+    ------
+    name : `str`
+        Full benchmark name.
+    cls : `type`
+        Benchmark class.
+    method : `str`
+        Benchmark method name.
+    """
+    package = os.path.dirname(os.path.abspath(__file__))
+    for info in pkgutil.iter_modules([package]):
+        if not info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"{__package__}.{info.name}")
+        for className, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            for method in sorted(vars(cls)):
+                if not method.startswith(("time_", "peakmem_")):
+                    continue
+                name = f"{info.name}.{className}.{method}"
+                if pattern.search(name):
+                    yield name, cls, method
+
+
+def runBenchmark(cls, method, params, repeat):
+    """Run a benchmark for one combination of parameters.
+
+    Parameters
+    ----------
+    cls : `type`
+        Benchmark class.
+    method : `str`
+        Benchmark method name.
+    params : `tuple`
+        Parameters passed to ``setup``, the method, and ``teardown``.
+    repeat : `int`
+        Number of times to run a ``time_*`` benchmark.
+
+    Returns
+    -------
+    report : `str`
+        Formatted results.
+    """
+    if method.startswith("peakmem_"):
+        repeat = 1
+    best = None
+    for _ in range(repeat):
+        benchmark = cls()
+        benchmark.setup(*params)
+        try:
+            func = getattr(benchmark, method)
+            if method.startswith("peakmem_"):
+                tracemalloc.start()
+                try:
+                    func(*params)
+                    _, peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+                return f"{peak / 2**20:.1f} MiB peak allocations"
+            start = time.perf_counter()
+            func(*params)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+            ops = benchmark.ops
+        finally:
+            benchmark.teardown(*params)
+    return (f"{best * 1e3:10.1f} ms/call {best / ops * 1e6:10.1f} us/op {ops / best:10.0f} ops/s"
+            f"  ({ops} ops)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n")[0])
+    parser.add_argument("pattern", nargs="?", default="",
+                        help="Only run benchmarks whose module.Class.method name matches this regex.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of times to run each benchmark.")
+    args = parser.parse_args(argv)
+    for name, cls, method in findBenchmarks(re.compile(args.pattern)):
+        for params in itertools.product(*getattr(cls, "params", [[]])):
+            label = ", ".join(f"{k}={v}" for k, v in zip(getattr(cls, "param_names", []), params))
+            print(f"{name}[{label}]: ", end="", flush=True)
+            print(runBenchmark(cls, method, params, args.repeat), flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
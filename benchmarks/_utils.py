@@ -0,0 +1,103 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Utilities shared by the benchmark suites.
+"""
+
+__all__ = ("DB", "SCALES", "RepoBenchmark")
+
+import os
+import shutil
+import tempfile
+import uuid
+
+from lsst.daf.butler.tests import BenchmarkScale, makeBenchmarkRepo
+
+
+def _scalesFromEnvironment():
+    value = os.environ.get("DAF_BUTLER_BENCHMARK_SCALES", "10,100,1000")
+    return [int(s) for s in value.split(",") if s.strip()]
+
+
+SCALES = _scalesFromEnvironment()
+"""Numbers of datasets to create for each benchmark (`list` [ `int` ]).
+
+Set by the ``DAF_BUTLER_BENCHMARK_SCALES`` environment variable, as a
+comma-separated list.
+"""
+
+DB = os.environ.get("DAF_BUTLER_BENCHMARK_DB")
+"""SQLAlchemy connection string for the registry database, or `None` to use
+a SQLite database in each repository (`str` or `None`).
+
+Set by the ``DAF_BUTLER_BENCHMARK_DB`` environment variable, e.g. to a local
+PostgreSQL server.  Each repository uses a new namespace in that database.
+"""
+
+
+class RepoBenchmark:
+    """Base class for benchmarks that need a synthetic repository.
+
+    Subclasses are parameterized by the number of datasets in the repository,
+    and may set `store` to `False` if they do not read datasets, and `runs`
+    and `chains` to change the collection structure.
+    """
+
+    params = [SCALES]
+    param_names = ["datasets"]
+    timeout = 600
+
+    store = True
+    """Whether to write datasets to the datastore, rather than only insert
+    them into the registry (`bool`).
+    """
+
+    runs = 4
+    """Number of RUN collections in the repository (`int`).
+    """
+
+    chains = 1
+    """Number of CHAINED collections in the repository (`int`).
+    """
+
+    ops = 1
+    """Number of operations performed by each call to a benchmark method, used
+    by the standalone runner to report per-operation latency and throughput
+    (`int`).  Subclasses should set this in `setup`.
+    """
+
+    def setup(self, n):
+        self.root = tempfile.mkdtemp(prefix="daf_butler_benchmark_")
+        scale = BenchmarkScale.fromDatasets(n, runs=self.runs, chains=self.chains)
+        namespace = f"bench_{uuid.uuid4().hex}" if DB is not None else None
+        self.repo = makeBenchmarkRepo(self.root, scale, db=DB, namespace=namespace, store=self.store)
+        self.butler = self.repo.butler
+        self.ops = len(self.repo.refs)
+
+    def teardown(self, n):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def newRun(self):
+        """Register a new, empty RUN collection and return its name.
+        """
+        run = f"bench/new/{uuid.uuid4().hex}"
+        self.butler.registry.registerRun(run)
+        return run
@@ -0,0 +1,67 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks for reading and writing datasets with `Butler`.
+"""
+
+from ._utils import RepoBenchmark
+
+
+class ButlerPut(RepoBenchmark):
+    """Write one dataset for each data ID in the repository to a new run.
+    """
+
+    store = False
+
+    def setup(self, n):
+        super().setup(n)
+        self.ops = len(self.repo.dataIds)
+
+    def time_put(self, n):
+        run = self.newRun()
+        datasetType = self.repo.datasetTypes[0]
+        for dataId in self.repo.dataIds:
+            self.butler.put(self.repo.makeObject(dataId), datasetType, dataId, run=run)
+
+
+class ButlerGet(RepoBenchmark):
+    """Read all datasets in the repository.
+    """
+
+    def time_get_run(self, n):
+        for ref in self.repo.refs:
+            self.butler.get(ref, collections=ref.run)
+
+    def time_get_chain(self, n):
+        chain = self.repo.chains[0]
+        for ref in self.repo.refs:
+            self.butler.get(ref.datasetType, ref.dataId, collections=chain)
+
+    def time_getDirect(self, n):
+        for ref in self.repo.refs:
+            self.butler.getDirect(ref)
+
+    def time_getURIs(self, n):
+        self.butler.getManyURIs(self.repo.refs)
+
+    def peakmem_getDirect(self, n):
+        for ref in self.repo.refs:
+            self.butler.getDirect(ref)
@@ -0,0 +1,94 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks for `Registry` lookups and queries.
+"""
+
+from ._utils import RepoBenchmark
+
+
+class FindDataset(RepoBenchmark):
+    """Look up every dataset in the repository by data ID.
+    """
+
+    store = False
+    runs = 8
+    chains = 2
+
+    def time_findDataset_run(self, n):
+        for ref in self.repo.refs:
+            self.butler.registry.findDataset(ref.datasetType, ref.dataId, collections=ref.run)
+
+    def time_findDataset_chain(self, n):
+        chain = self.repo.chains[0]
+        for ref in self.repo.refs:
+            self.butler.registry.findDataset(ref.datasetType, ref.dataId, collections=chain)
+
+    def time_getDataset(self, n):
+        for ref in self.repo.refs:
+            self.butler.registry.getDataset(ref.id)
+
+    def time_getDatasets(self, n):
+        self.butler.registry.getDatasets([ref.id for ref in self.repo.refs])
+
+
+class QueryDatasets(RepoBenchmark):
+    """Query for all datasets in the repository.
+    """
+
+    store = False
+    runs = 8
+    chains = 2
+
+    def time_queryDatasets(self, n):
+        list(self.butler.registry.queryDatasets(..., collections=...))
+
+    def time_queryDatasets_findFirst(self, n):
+        list(self.butler.registry.queryDatasets(self.repo.datasetTypes[0], collections=self.repo.chains[0],
+                                                findFirst=True))
+
+    def time_queryDatasets_where(self, n):
+        list(self.butler.registry.queryDatasets(self.repo.datasetTypes[0], collections=self.repo.chains[0],
+                                                where="instrument = 'BenchCam' AND detector < 5"))
+
+    def time_queryDataIds_expanded(self, n):
+        list(self.butler.registry.queryDataIds(["exposure", "detector"], datasets=self.repo.datasetTypes,
+                                               collections=self.repo.chains[0]).expanded())
+
+    def peakmem_queryDatasets(self, n):
+        list(self.butler.registry.queryDatasets(..., collections=...))
+
+
+class ExpandDataId(RepoBenchmark):
+    """Expand every data ID in the repository from its required values.
+    """
+
+    store = False
+
+    def setup(self, n):
+        super().setup(n)
+        self.minimal = [dataId.byName() for dataId in self.repo.dataIds]
+        self.ops = len(self.minimal)
+
+    def time_expandDataId(self, n):
+        graph = self.repo.datasetTypes[0].dimensions
+        for dataId in self.minimal:
+            self.butler.registry.expandDataId(dataId, graph=graph)
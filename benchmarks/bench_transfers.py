@@ -0,0 +1,94 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks for moving datasets into and out of repositories.
+"""
+
+import os
+import uuid
+
+import yaml
+
+from lsst.daf.butler import Butler, Config, DatasetRef, FileDataset
+
+from ._utils import DB, RepoBenchmark
+
+
+class Ingest(RepoBenchmark):
+    """Ingest one file for each data ID in the repository into a new run.
+    """
+
+    number = 1
+    store = False
+
+    def setup(self, n):
+        super().setup(n)
+        directory = os.path.join(self.root, "external")
+        os.makedirs(directory)
+        self.files = []
+        for dataId in self.repo.dataIds:
+            path = os.path.join(directory, f"{dataId['exposure']}_{dataId['detector']}.yaml")
+            with open(path, "w") as stream:
+                yaml.safe_dump(self.repo.makeObject(dataId), stream)
+            self.files.append((path, dataId))
+        self.ops = len(self.files)
+
+    def time_ingest_copy(self, n):
+        datasetType = self.repo.datasetTypes[0]
+        self.butler.ingest(*[FileDataset(path=path, refs=[DatasetRef(datasetType, dataId)])
+                             for path, dataId in self.files],
+                           transfer="copy", run=self.newRun())
+
+    def time_ingest_direct(self, n):
+        datasetType = self.repo.datasetTypes[0]
+        self.butler.ingest(*[FileDataset(path=path, refs=[DatasetRef(datasetType, dataId)])
+                             for path, dataId in self.files],
+                           transfer="direct", run=self.newRun())
+
+
+class Import(RepoBenchmark):
+    """Export all datasets in the repository, and import them into a new
+    repository.
+    """
+
+    number = 1
+
+    def setup(self, n):
+        super().setup(n)
+        self.exportFile = os.path.join(self.root, "export.yaml")
+        with self.butler.export(filename=self.exportFile) as export:
+            export.saveDatasets(self.repo.refs)
+        # Each call needs an empty repository to import into.
+        self.target = os.path.join(self.root, "target", uuid.uuid4().hex)
+        config = Config()
+        if DB is not None:
+            config["registry", "db"] = DB
+            config["registry", "namespace"] = f"bench_{uuid.uuid4().hex}"
+        Butler.makeRepo(self.target, config=config)
+
+    def time_import(self, n):
+        butler = Butler(self.target, writeable=True)
+        butler.import_(directory=self.butler.datastore.root.ospath, filename=self.exportFile,
+                       transfer="direct")
+
+    def time_export(self, n):
+        with self.butler.export(filename=os.path.join(self.root, f"{uuid.uuid4().hex}.yaml")) as export:
+            export.saveDatasets(self.repo.refs)
@@ -5,11 +5,41 @@ Data Access Butler
 # Some components are not auto-imported since they can have additional runtime
 # dependencies.
 
-from .core import *
-# Import the registry subpackage directly for other symbols.
-from .registry import Registry, RegistryConfig, CollectionType, CollectionSearch
-from ._butlerConfig import *
-from ._deferredDatasetHandle import *
-from ._butler import *
-from .transfers import YamlRepoExportBackend, YamlRepoImportBackend
-from .version import *
+# Symbols are imported on first access (PEP 562), so that the command-line
+# tools and code that only needs a few lightweight classes do not pay for
+# importing the whole package; see lsst.daf.butler.core.__init__.
+
+from typing import TYPE_CHECKING
+
+from .core import __all__ as _coreSymbols
+from .core._lazyImport import lazyAttributes
+
+__all__, __getattr__, __dir__ = lazyAttributes(
+    __name__,
+    {
+        ".core": _coreSymbols,
+        # Import the registry subpackage directly for other symbols.
+        ".registry": ("Registry", "RegistryConfig", "CollectionType", "CollectionSearch"),
+        "._butlerConfig": ("ButlerConfig",),
+        "._deferredDatasetHandle": ("DeferredDatasetHandle",),
+        "._butler": ("Butler", "ButlerValidationError", "PruneCollectionsArgsError",
+                     "PurgeWithoutUnstorePruneCollectionsError", "RunWithoutPurgePruneCollectionsError",
+                     "PurgeUnsupportedPruneCollectionsError"),
+        "._asyncButler": ("AsyncButler",),
+        ".transfers": ("YamlRepoExportBackend", "YamlRepoImportBackend"),
+        ".version": ("__version__",),
+    },
+)
+
+if TYPE_CHECKING:
+    from .core import *
+    from .registry import Registry, RegistryConfig, CollectionType, CollectionSearch
+    from ._butlerConfig import *
+    from ._deferredDatasetHandle import *
+    from ._butler import *
+    from ._asyncButler import *
+    from .transfers import YamlRepoExportBackend, YamlRepoImportBackend
+    from .version import *
+
+# Keep the names used above out of the package namespace.
+del TYPE_CHECKING, lazyAttributes, _coreSymbols
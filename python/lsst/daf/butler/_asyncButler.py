@@ -0,0 +1,304 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Asyncio facade for the Butler.
+"""
+from __future__ import annotations
+
+__all__ = ("AsyncButler",)
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import logging
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .core import (
+    ButlerURI,
+    DataId,
+    DatasetRef,
+    DatasetType,
+)
+from ._butler import Butler
+
+log = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class AsyncButler:
+    """An asyncio-native facade for a `Butler`.
+
+    Parameters
+    ----------
+    butler : `Butler`
+        The butler to wrap.  Its configuration, default collections, default
+        run and default data ID values are used for all operations.
+    workers : `int`, optional
+        Maximum number of butler operations that may be in flight at once.
+    maxWriters : `int`, optional
+        Maximum number of `put` operations that may be in flight at once.
+        Registry writes are serialized by most database backends (and
+        SQLite in particular), so the default of one avoids lock contention.
+    cloneButlers : `bool`, optional
+        If `True` (default), each worker thread lazily constructs its own
+        `Butler` (and hence its own database connection) from ``butler``'s
+        pickle state, allowing registry lookups and artifact transfers to
+        proceed concurrently.  If `False`, all operations share ``butler``
+        itself and are serialized by a lock; this is required when the
+        repository cannot be reconstructed from its configuration (e.g.
+        in-memory registries or datastores, or mocked butlers in tests).
+
+    Notes
+    -----
+    `Butler` and its `Registry` and `Datastore` are synchronous, and a single
+    `Butler` shares one database connection that must not be used from
+    several threads at once.  This class therefore runs each operation to
+    completion on a bounded thread pool, rather than reimplementing the
+    butler on top of asynchronous I/O clients; `ButlerURI` does not (yet)
+    have asynchronous implementations to delegate to.  Registry-only
+    queries always run on the wrapped butler, serialized by a lock.
+
+    Each butler caches collection and dataset type definitions and
+    summaries of which dataset types are in each collection.  After
+    `registerRun`, `registerDatasetType`, or the first `put` of a dataset type
+    into a run, every other butler this instance uses refreshes its registry
+    (see `Registry.refresh`) before its next operation.  Collections and
+    dataset types registered by other clients (including directly via the
+    wrapped butler) after this instance was created may not be visible to it.
+
+    Instances can be used as asynchronous context managers, which calls
+    `close` on exit::
+
+        butler = Butler("/repo", collections=["HSC/defaults"])
+        async with AsyncButler(butler) as abutler:
+            flat = await abutler.get("flat", instrument="HSC", detector=50,
+                                     physical_filter="HSC-R")
+    """
+    def __init__(self, butler: Butler, *, workers: int = 8, maxWriters: int = 1,
+                 cloneButlers: bool = True):
+        if workers < 1 or maxWriters < 1:
+            raise ValueError(f"Concurrency limits must be positive; got workers={workers}, "
+                             f"maxWriters={maxWriters}.")
+        self.butler = butler
+        self._cloneButlers = cloneButlers
+        self._maxWriters = min(maxWriters, workers)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="AsyncButler")
+        self._sharedLock = threading.Lock()
+        self._local = threading.local()
+        self._clonesLock = threading.Lock()
+        self._clones: List[Butler] = []
+        # Incremented after writes that other butlers' registry caches may
+        # not reflect; each butler refreshes its registry when the generation
+        # it last saw is out of date.
+        self._generation = 0
+        self._sharedGeneration = 0
+        self._knownOutputs: Set[Tuple[Optional[str], str]] = set()
+        # Created lazily, because asyncio.Semaphore binds to the event loop
+        # that is running when it is constructed (on older Pythons).
+        self._writeLimit: Optional[asyncio.Semaphore] = None
+
+    butler: Butler
+    """The wrapped butler (`Butler`).
+    """
+
+    def _makeClone(self) -> Butler:
+        """Construct a new `Butler` equivalent to ``self.butler``, with its
+        own database connection.
+        """
+        factory, args = self.butler.__reduce__()
+        butler = factory(*args)
+        with self._clonesLock:
+            self._clones.append(butler)
+        return butler
+
+    def _callWithButler(self, func: Callable[..., _T], *args: Any, shared: bool = False,
+                        **kwargs: Any) -> _T:
+        """Call ``func(butler, *args, **kwargs)`` on the current thread, with
+        the butler appropriate for that thread.
+        """
+        if shared or not self._cloneButlers:
+            with self._sharedLock:
+                if self._sharedGeneration != self._generation:
+                    self._sharedGeneration = self._generation
+                    self.butler.registry.refresh()
+                return func(self.butler, *args, **kwargs)
+        butler = getattr(self._local, "butler", None)
+        if butler is None:
+            log.debug("Constructing butler for thread %s.", threading.current_thread().name)
+            self._local.generation = self._generation
+            butler = self._makeClone()
+            self._local.butler = butler
+        elif self._local.generation != self._generation:
+            self._local.generation = self._generation
+            butler.registry.refresh()
+        return func(butler, *args, **kwargs)
+
+    async def _run(self, func: Callable[..., _T], *args: Any, shared: bool = False, **kwargs: Any) -> _T:
+        """Run ``func(butler, *args, **kwargs)`` on the worker pool and await
+        its result.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(self._callWithButler, func, *args, shared=shared, **kwargs)
+        )
+
+    def _invalidate(self) -> None:
+        """Make every butler refresh its registry before its next operation.
+        """
+        if self._cloneButlers:
+            self._generation += 1
+
+    async def get(self, datasetRefOrType: Union[DatasetRef, DatasetType, str],
+                  dataId: Optional[DataId] = None, *,
+                  parameters: Optional[Dict[str, Any]] = None,
+                  collections: Any = None,
+                  **kwds: Any) -> Any:
+        """Retrieve a stored dataset.
+
+        See `Butler.get` for a description of the parameters, return value,
+        and exceptions.
+        """
+        return await self._run(Butler.get, datasetRefOrType, dataId, parameters=parameters,
+                               collections=collections, **kwds)
+
+    async def put(self, obj: Any, datasetRefOrType: Union[DatasetRef, DatasetType, str],
+                  dataId: Optional[DataId] = None, *,
+                  run: Optional[str] = None,
+                  **kwds: Any) -> DatasetRef:
+        """Store and register a dataset.
+
+        See `Butler.put` for a description of the parameters, return value,
+        and exceptions.
+        """
+        if self._writeLimit is None:
+            self._writeLimit = asyncio.Semaphore(self._maxWriters)
+        async with self._writeLimit:
+            ref = await self._run(Butler.put, obj, datasetRefOrType, dataId, run=run, **kwds)
+        key = (ref.run, ref.datasetType.name)
+        if key not in self._knownOutputs:
+            # The put may have added this dataset type to the run's collection
+            # summary, which other butlers have cached.
+            self._knownOutputs.add(key)
+            self._invalidate()
+        return ref
+
+    async def registerRun(self, name: str, doc: Optional[str] = None) -> None:
+        """Add a new run if one with the given name does not exist.
+
+        See `Registry.registerRun` for a description of the parameters.
+        """
+        def register(butler: Butler) -> None:
+            butler.registry.registerRun(name, doc=doc)
+        await self._run(register, shared=True)
+        self._invalidate()
+
+    async def registerDatasetType(self, datasetType: DatasetType) -> bool:
+        """Add a new `DatasetType` to the registry.
+
+        See `Registry.registerDatasetType` for a description of the
+        parameters, return value, and exceptions.
+        """
+        def register(butler: Butler) -> bool:
+            return butler.registry.registerDatasetType(datasetType)
+        inserted = await self._run(register, shared=True)
+        if inserted:
+            self._invalidate()
+        return inserted
+
+    async def getURIs(self, datasetRefOrType: Union[DatasetRef, DatasetType, str],
+                      dataId: Optional[DataId] = None, *,
+                      predict: bool = False,
+                      collections: Any = None,
+                      run: Optional[str] = None,
+                      **kwds: Any) -> Tuple[Optional[ButlerURI], Dict[str, ButlerURI]]:
+        """Return the URIs associated with the dataset.
+
+        See `Butler.getURIs` for a description of the parameters, return
+        value, and exceptions.
+        """
+        return await self._run(Butler.getURIs, datasetRefOrType, dataId, predict=predict,
+                               collections=collections, run=run, **kwds)
+
+    async def exists(self, datasetRefOrType: Union[DatasetRef, DatasetType, str],
+                     dataId: Optional[DataId] = None, *,
+                     collections: Any = None,
+                     **kwds: Any) -> bool:
+        """Return `True` if the dataset is actually present in the datastore.
+
+        See `Butler.datasetExists` for a description of the parameters and
+        exceptions.
+        """
+        return await self._run(Butler.datasetExists, datasetRefOrType, dataId,
+                               collections=collections, **kwds)
+
+    async def queryDatasets(self, datasetType: Any, **kwargs: Any) -> List[DatasetRef]:
+        """Query for datasets in the registry.
+
+        Parameters
+        ----------
+        datasetType
+            An expression that fully or partially identifies the dataset types
+            to be queried; see `Registry.queryDatasets`.
+        **kwargs
+            Additional keyword arguments forwarded to
+            `Registry.queryDatasets`.
+
+        Returns
+        -------
+        refs : `list` [ `DatasetRef` ]
+            Dataset references matching the given query criteria, fully
+            materialized (so no database access happens on the event loop).
+        """
+        def query(butler: Butler) -> List[DatasetRef]:
+            return list(butler.registry.queryDatasets(datasetType, **kwargs))
+        return await self._run(query, shared=True)
+
+    def close(self) -> None:
+        """Shut down the worker pool, waiting for pending operations, and
+        close the database connections of the butlers it constructed.
+
+        The wrapped butler is not closed.
+        """
+        self._executor.shutdown(wait=True)
+        with self._clonesLock:
+            clones, self._clones = self._clones, []
+        for butler in clones:
+            butler.registry.close()
+
+    async def __aenter__(self) -> AsyncButler:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.close()
@@ -36,6 +36,7 @@ __all__ = (
 
 from collections import defaultdict
 import contextlib
+import io
 import logging
 import numbers
 import os
@@ -44,13 +45,13 @@ from typing import (
     ClassVar,
     Counter,
     Dict,
+    IO,
     Iterable,
     Iterator,
     List,
     MutableMapping,
     Optional,
     Set,
-    TextIO,
     Tuple,
     Type,
     Union,
@@ -1055,6 +1056,43 @@ class Butler:
             ref = ref.resolved(id=0, run=run)
         return self.datastore.getURIs(ref, predict)
 
+    def getManyURIs(self, refs: Iterable[DatasetRef], *,
+                    predict: bool = False,
+                    allowMissing: bool = False) -> Dict[DatasetRef, Tuple[Optional[ButlerURI],
+                                                                          Dict[str, ButlerURI]]]:
+        """Return the URIs associated with many resolved datasets.
+
+        Unlike `getURIs`, this does not look the datasets up in the registry,
+        and the datastore fetches its records for all of them at once.
+
+        Parameters
+        ----------
+        refs : iterable of `DatasetRef`
+            Resolved references to the datasets, such as those returned by
+            `Registry.queryDatasets`.
+        predict : `bool`, optional
+            If `True`, allow URIs to be returned of datasets that have not
+            been written.
+        allowMissing : `bool`, optional
+            If `True`, omit datasets that are not in the datastore from the
+            result instead of raising.
+
+        Returns
+        -------
+        uris : `dict` [ `DatasetRef`, `tuple` ]
+            Mapping from each dataset to its ``(primary, components)`` URIs,
+            as returned by `getURIs`.
+
+        Raises
+        ------
+        AmbiguousDatasetError
+            Raised if any of the given references is unresolved.
+        FileNotFoundError
+            Raised if a dataset is not in the datastore and neither
+            ``predict`` nor ``allowMissing`` is `True`.
+        """
+        return self.datastore.getManyURIs(refs, predict=predict, allowMissing=allowMissing)
+
     def getURI(self, datasetRefOrType: Union[DatasetRef, DatasetType, str],
                dataId: Optional[DataId] = None, *,
                predict: bool = False,
@@ -1414,7 +1452,8 @@ class Butler:
     def export(self, *, directory: Optional[str] = None,
                filename: Optional[str] = None,
                format: Optional[str] = None,
-               transfer: Optional[str] = None) -> Iterator[RepoExportContext]:
+               transfer: Optional[str] = None,
+               workers: Optional[int] = None) -> Iterator[RepoExportContext]:
         """Export datasets from the repository represented by this `Butler`.
 
         This method is a context manager that returns a helper object
@@ -1437,6 +1476,9 @@ class Butler:
             extension of ``filename`` will be used.
         transfer : `str`, optional
             Transfer mode passed to `Datastore.export`.
+        workers : `int`, optional
+            Maximum number of threads used to transfer files, passed to
+            `Datastore.export`.
 
         Raises
         ------
@@ -1472,11 +1514,11 @@ class Butler:
         if directory is not None:
             filename = os.path.join(directory, filename)
         BackendClass = getClassOf(self._config["repo_transfer_formats"][format]["export"])
-        with open(filename, 'w') as stream:
+        with open(filename, "wb" if BackendClass.binary else "w") as stream:
             backend = BackendClass(stream)
             try:
                 helper = RepoExportContext(self.registry, self.datastore, backend=backend,
-                                           directory=directory, transfer=transfer)
+                                           directory=directory, transfer=transfer, workers=workers)
                 yield helper
             except BaseException:
                 raise
@@ -1484,7 +1526,7 @@ class Butler:
                 helper._finish()
 
     def import_(self, *, directory: Optional[str] = None,
-                filename: Union[str, TextIO, None] = None,
+                filename: Union[str, IO, None] = None,
                 format: Optional[str] = None,
                 transfer: Optional[str] = None,
                 skip_dimensions: Optional[Set] = None) -> None:
@@ -1497,7 +1539,7 @@ class Butler:
             Directory containing dataset files to import from. If `None`,
             ``filename`` and all dataset file paths specified therein must
             be absolute.
-        filename : `str` or `TextIO`, optional
+        filename : `str` or `IO`, optional
             A stream or name of file that contains database information
             associated with the exported datasets, typically generated by
             `~lsst.daf.butler.Butler.export`.  If this a string (name) and
@@ -1531,7 +1573,7 @@ class Butler:
             filename = os.path.join(directory, filename)
         BackendClass = getClassOf(self._config["repo_transfer_formats"][format]["import"])
 
-        def doImport(importStream: TextIO) -> None:
+        def doImport(importStream: IO) -> None:
             backend = BackendClass(importStream, self.registry)
             backend.register()
             with self.transaction():
@@ -1539,8 +1581,12 @@ class Butler:
                              skip_dimensions=skip_dimensions)
 
         if isinstance(filename, str):
-            with open(filename, "r") as stream:
+            with open(filename, "rb" if BackendClass.binary else "r") as stream:
                 doImport(stream)
+        elif BackendClass.binary and isinstance(filename, io.TextIOBase):
+            # Binary formats can still be read from a text stream opened on a
+            # file (e.g. by the command-line interface).
+            doImport(filename.buffer)  # type: ignore
         else:
             doImport(filename)
 
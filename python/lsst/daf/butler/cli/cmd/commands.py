@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import Any
+
 import click
 
 from ..opt import (
@@ -32,7 +34,10 @@ from ..opt import (
     directory_argument,
     element_argument,
     glob_argument,
+    limit_option,
     options_file_option,
+    output_file_option,
+    query_format_option,
     repo_argument,
     transfer_option,
     verbose_option,
@@ -47,9 +52,20 @@ from ..utils import (
     unwrap,
 )
 
-from ... import script
+
+class _LazyScript:
+    """Stand-in for the `lsst.daf.butler.script` package that imports it
+    only when a command runs, so that loading the command-line interface
+    (e.g. for --help) does not import the rest of the package.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        from ... import script
+        return getattr(script, name)
 
 
+script = _LazyScript()
+
 willCreateRepoHelp = "REPO is the URI or path to the new repository. Will be created if it does not exist."
 existingRepoHelp = "REPO is the URI or path to an existing data repository root or configuration file."
 whereHelp = unwrap("""A string expression similar to a SQL WHERE clause. May involve any column of a dimension
@@ -72,6 +88,10 @@ whereHelp = unwrap("""A string expression similar to a SQL WHERE clause. May inv
                    "directory, and --dir is provided, it is assumed to be in that directory.  Defaults "
                    "to \"export.yaml\".",
               type=click.File("r"))
+@click.option("--format",
+              help="Format of the export file, as a key in the repo_transfer_formats configuration "
+                   "(e.g. \"yaml\" or \"arrow\").  Defaults to the extension of --export-file, or "
+                   "\"yaml\".")
 @click.option("--skip-dimensions", "-s", type=str, multiple=True, callback=split_commas,
               metavar=typeStrAcceptsMultiple,
               help="Dimensions that should be skipped during import")
@@ -214,9 +234,27 @@ def remove_dataset_type(*args, **kwargs):
 @click.option("--show-uri",
               is_flag=True,
               help="Show the dataset URI in results.")
+@click.option("--explain",
+              is_flag=True,
+              help=unwrap("""Print the database's plan for the query of each dataset type, instead of running
+                          the queries."""))
+@limit_option()
+@query_format_option()
+@output_file_option()
 @options_file_option()
-def query_datasets(**kwargs):
+def query_datasets(format, output, explain, **kwargs):
     """List the datasets in a repository."""
+    if explain:
+        for datasetTypeName, plan in script.explainDatasets(kwargs["repo"], kwargs["glob"],
+                                                            kwargs["collections"], kwargs["where"],
+                                                            kwargs["find_first"]):
+            click.echo(f"{datasetTypeName}:")
+            for line in plan:
+                click.echo(f"  {line}")
+        return
+    if format != "table":
+        script.streamDatasets(format=format, output=output, **kwargs)
+        return
     tables = script.queryDatasets(**kwargs)
 
     for table in tables:
@@ -256,18 +294,29 @@ def certify_calibrations(*args, **kwargs):
                              "physical_filter" values to only those for which at least one "raw" dataset
                              exists in "collections"."""))
 @where_option(help=whereHelp)
+@limit_option()
+@query_format_option()
+@output_file_option()
 @options_file_option()
-def query_data_ids(**kwargs):
+def query_data_ids(format, output, **kwargs):
     """List the data IDs in a repository.
     """
-    table = script.queryDataIds(**kwargs)
-    if table:
-        table.pprint_all()
+    if format != "table":
+        # Keep any message off standard output, which may be piped.
+        found = script.streamDataIds(format=format, output=output, **kwargs)
+        err = True
     else:
+        table = script.queryDataIds(**kwargs)
+        if table:
+            table.pprint_all()
+        found = bool(table)
+        err = False
+    if not found:
         if not kwargs.get("dimensions") and not kwargs.get("datasets"):
-            print("No results. Try requesting some dimensions or datasets, see --help for more information.")
+            click.echo("No results. Try requesting some dimensions or datasets, see --help for more "
+                       "information.", err=err)
         else:
-            print("No results. Try --help for more information.")
+            click.echo("No results. Try --help for more information.", err=err)
 
 
 @click.command(cls=ButlerCommand)
@@ -100,6 +100,12 @@ dataset_type_option = MWOptionDecorator("-d", "--dataset-type",
 datasets_option = MWOptionDecorator("--datasets")
 
 
+limit_option = MWOptionDecorator("--limit",
+                                 default=0,
+                                 help="Maximum number of results to show; 0 (the default) means no limit.",
+                                 type=click.IntRange(min=0))
+
+
 logLevelChoices = ["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"]
 log_level_option = MWOptionDecorator("--log-level",
                                      callback=partial(split_kv,
@@ -129,12 +135,28 @@ options_file_option = MWOptionDecorator("--options-file", "-@",
                                         callback=yaml_presets)
 
 
+output_file_option = MWOptionDecorator("--output-file", "output",
+                                       help=unwrap("""File to write results to instead of standard output.
+                                                   Required for --format parquet."""),
+                                       type=click.Path(dir_okay=False, writable=True))
+
+
 processes_option = MWOptionDecorator("-j", "--processes",
                                      default=1,
                                      help="Number of processes to use.",
                                      type=click.IntRange(min=1))
 
 
+query_format_option = MWOptionDecorator("--format",
+                                        default="csv",
+                                        help=unwrap("""Output format.  Results are written as they arrive from
+                                                    the database in the csv, json (one object per line) and
+                                                    parquet formats; 'table' collects, de-duplicates and sorts
+                                                    all results before showing them."""),
+                                        type=click.Choice(["table", "csv", "json", "parquet"],
+                                                          case_sensitive=False))
+
+
 regex_option = MWOptionDecorator("--regex")
 
 
@@ -23,10 +23,13 @@ import click
 import click.testing
 from contextlib import contextmanager
 import copy
+import csv
 from functools import partial
 import itertools
+import json
 import logging
 import os
+import sys
 import textwrap
 import traceback
 from unittest.mock import patch
@@ -766,3 +769,129 @@ def sortAstropyTable(table, dimensions, sort_first=None):
 
     table.sort(sort_keys)
     return table
+
+
+class StreamingTableWriter:
+    """Write rows of query results as they arrive, in chunks, instead of
+    collecting them into a table first.
+
+    Parameters
+    ----------
+    format : `str`
+        Output format: ``"csv"``, ``"json"`` (one JSON object per line), or
+        ``"parquet"``.
+    output : `str`, optional
+        Path of the file to write.  Standard output is used if `None`, which
+        is not supported for ``"parquet"``.
+    chunkSize : `int`, optional
+        Number of rows buffered before they are written.
+
+    Notes
+    -----
+    Rows with different columns (e.g. datasets of types with different
+    dimensions) may be mixed.  In CSV output each change of columns starts a
+    new header, preceded by a blank line; a Parquet file must have a single
+    set of columns.
+
+    Instances are context managers, which call `close` on exit.
+    """
+
+    formats = ("csv", "json", "parquet")
+    """Supported output formats (`tuple` [ `str` ])."""
+
+    def __init__(self, format, output=None, chunkSize=1000):
+        if format not in self.formats:
+            raise ValueError(f"Unsupported output format {format!r}; expected one of {self.formats}.")
+        if format == "parquet" and output is None:
+            raise ValueError("An output file is required to write Parquet.")
+        self.format = format
+        self.chunkSize = chunkSize
+        self.count = 0
+        self._output = output
+        self._stream = None
+        self._parquetWriter = None
+        self._columns = None
+        self._chunk = []
+
+    def write(self, columns, row):
+        """Add a row to the output.
+
+        Parameters
+        ----------
+        columns : `tuple` [ `str` ]
+            Names of the columns in the row.
+        row : `tuple`
+            Values of the columns.
+        """
+        columns = tuple(columns)
+        if columns != self._columns:
+            self.flush()
+            self._startColumns(columns)
+        self._chunk.append(tuple(row))
+        self.count += 1
+        if len(self._chunk) >= self.chunkSize:
+            self.flush()
+
+    def _startColumns(self, columns):
+        """Prepare to write rows with a new set of columns.
+        """
+        if self.format == "csv":
+            stream = self._getStream()
+            if self._columns is not None:
+                stream.write("\n")
+            csv.writer(stream).writerow(columns)
+        elif self.format == "parquet" and self._columns is not None:
+            raise ValueError(f"Cannot write rows with columns {columns} to a Parquet file with columns "
+                             f"{self._columns}.")
+        self._columns = columns
+
+    def _getStream(self):
+        """Return the text stream to write to, opening it if necessary.
+        """
+        if self._stream is None:
+            self._stream = sys.stdout if self._output is None else open(self._output, "w", newline="")
+        return self._stream
+
+    def flush(self):
+        """Write any buffered rows.
+        """
+        if not self._chunk:
+            return
+        if self.format == "csv":
+            csv.writer(self._getStream()).writerows(self._chunk)
+        elif self.format == "json":
+            stream = self._getStream()
+            for row in self._chunk:
+                stream.write(json.dumps(dict(zip(self._columns, row)), default=str))
+                stream.write("\n")
+        else:
+            import pyarrow
+            import pyarrow.parquet
+            data = {name: [row[i] for row in self._chunk] for i, name in enumerate(self._columns)}
+            if self._parquetWriter is None:
+                table = pyarrow.table(data)
+                self._parquetWriter = pyarrow.parquet.ParquetWriter(self._output, table.schema)
+            else:
+                # Later chunks must match the schema inferred from the first.
+                table = pyarrow.table(data, schema=self._parquetWriter.schema)
+            self._parquetWriter.write_table(table)
+        if self._stream is not None:
+            self._stream.flush()
+        self._chunk = []
+
+    def close(self):
+        """Write any buffered rows and close the output.
+        """
+        self.flush()
+        if self._parquetWriter is not None:
+            self._parquetWriter.close()
+        if self._stream is not None and self._stream is not sys.stdout:
+            self._stream.close()
+        self._stream = None
+        self._parquetWriter = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -4,28 +4,81 @@ Core code for butler.
 
 # Do not export the utility routines from utils and queries.
 
-from ._butlerUri import *
-from .config import *
-from .configSupport import LookupKey
-from .composites import *
-from .constraints import *
-from . import ddl
-from .datasets import *
-from .datastore import *
-from .exceptions import *
-from .fileDescriptor import *
-from .fileTemplates import *
-from .formatter import *
-from .location import *
-from .mappingFactory import *
-from .named import *
-from .quantum import *
-from .simpleQuery import *
-from .storageClass import *
-from .storageClassDelegate import *
-from .storedFileInfo import *
-from .dimensions import *
-from .fileDataset import *
-from . import time_utils
-from ._topology import *
-from .timespan import *
+# Symbols are imported on first access (PEP 562), so that importing this
+# package (or any module in it) does not pull in sqlalchemy, astropy and
+# sphgeom unless something that needs them is actually used.  New exports
+# must be added both here and to the TYPE_CHECKING block below.
+
+from typing import TYPE_CHECKING
+
+from ._lazyImport import lazyAttributes
+
+__all__, __getattr__, __dir__ = lazyAttributes(
+    __name__,
+    {
+        "._butlerUri": ("ButlerURI",),
+        ".config": ("Config", "ConfigSubset"),
+        ".configSupport": ("LookupKey",),
+        ".composites": ("CompositesConfig", "CompositesMap"),
+        ".constraints": ("Constraints", "ConstraintsValidationError", "ConstraintsConfig"),
+        ".datasets": ("DatasetType", "AmbiguousDatasetError", "DatasetRef", "DatasetAssociation"),
+        ".datastore": ("DatastoreConfig", "Datastore", "DatastoreValidationError"),
+        ".exceptions": ("DatasetTypeNotSupportedError", "ValidationError"),
+        ".fileDescriptor": ("FileDescriptor",),
+        ".fileTemplates": ("FileTemplates", "FileTemplate", "FileTemplatesConfig",
+                           "FileTemplateValidationError"),
+        ".formatter": ("Formatter", "FormatterFactory", "FormatterParameter"),
+        ".location": ("Location", "LocationFactory"),
+        ".mappingFactory": ("MappingFactory",),
+        ".named": ("NamedKeyDict", "NamedKeyMapping", "NamedValueAbstractSet", "NamedValueMutableSet",
+                   "NamedValueSet", "NameLookupMapping", "NameMappingSetView"),
+        ".quantum": ("Quantum",),
+        ".simpleQuery": ("SimpleQuery",),
+        ".storageClass": ("StorageClass", "StorageClassFactory", "StorageClassConfig"),
+        ".storageClassDelegate": ("DatasetComponent", "StorageClassDelegate"),
+        ".storedFileInfo": ("StoredFileInfo", "StoredDatastoreItemInfo"),
+        ".dimensions": ("Dimension", "DimensionCombination", "DimensionElement", "addDimensionForeignKey",
+                        "DimensionGraph", "DimensionRecord", "DimensionPacker", "SkyPixDimension",
+                        "SkyPixSystem", "GovernorDimension", "DatabaseDimension",
+                        "DatabaseDimensionCombination", "DatabaseDimensionElement",
+                        "DatabaseTopologicalFamily", "DimensionConfig", "DimensionUniverse",
+                        "DataCoordinate", "DataId", "DataIdKey", "DataIdValue", "DataCoordinateIterable",
+                        "DataCoordinateSet", "DataCoordinateSequence"),
+        ".fileDataset": ("FileDataset",),
+        "._topology": ("SpatialRegionDatabaseRepresentation", "TopologicalSpace", "TopologicalFamily",
+                       "TopologicalRelationshipEndpoint", "TopologicalExtentDatabaseRepresentation"),
+        ".timespan": ("Timespan", "TimespanDatabaseRepresentation"),
+    },
+    submodules=("ddl", "metrics", "time_utils"),
+)
+
+if TYPE_CHECKING:
+    from ._butlerUri import *
+    from .config import *
+    from .configSupport import LookupKey
+    from .composites import *
+    from .constraints import *
+    from . import ddl
+    from . import metrics
+    from .datasets import *
+    from .datastore import *
+    from .exceptions import *
+    from .fileDescriptor import *
+    from .fileTemplates import *
+    from .formatter import *
+    from .location import *
+    from .mappingFactory import *
+    from .named import *
+    from .quantum import *
+    from .simpleQuery import *
+    from .storageClass import *
+    from .storageClassDelegate import *
+    from .storedFileInfo import *
+    from .dimensions import *
+    from .fileDataset import *
+    from . import time_utils
+    from ._topology import *
+    from .timespan import *
+
+# Keep the names used above out of the package namespace.
+del TYPE_CHECKING, lazyAttributes
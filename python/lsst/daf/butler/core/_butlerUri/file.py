@@ -42,6 +42,7 @@ from typing import (
 from ..utils import safeMakeDir
 from .utils import NoTransaction, os2posix, posix2os
 from ._butlerUri import ButlerURI
+from ..metrics import timed
 
 
 if TYPE_CHECKING:
@@ -68,11 +69,13 @@ class ButlerFileURI(ButlerURI):
         """
         return urllib.parse.unquote(posix2os(self._uri.path))
 
+    @timed("uri.file.exists")
     def exists(self) -> bool:
         # Uses os.path.exists so if there is a soft link that points
         # to a file that no longer exists this will return False
         return os.path.exists(self.ospath)
 
+    @timed("uri.file.size")
     def size(self) -> int:
         if not os.path.isdir(self.ospath):
             stat = os.stat(self.ospath)
@@ -174,11 +177,13 @@ class ButlerFileURI(ButlerURI):
         # in order to get to this part of the code.
         return self._force_to_file().relative_to(cast(ButlerFileURI, other)._force_to_file())
 
+    @timed("uri.file.read")
     def read(self, size: int = -1) -> bytes:
         # Docstring inherits
         with open(self.ospath, "rb") as fh:
             return fh.read(size)
 
+    @timed("uri.file.write")
     def write(self, data: bytes, overwrite: bool = True) -> None:
         dir = os.path.dirname(self.ospath)
         if not os.path.exists(dir):
@@ -196,6 +201,7 @@ class ButlerFileURI(ButlerURI):
         elif not os.path.isdir(self.ospath):
             raise FileExistsError(f"URI {self} exists but is not a directory!")
 
+    @timed("uri.file.transfer_from")
     def transfer_from(self, src: ButlerURI, transfer: str,
                       overwrite: bool = False,
                       transaction: Optional[Union[DatastoreTransaction, NoTransaction]] = None) -> None:
@@ -41,6 +41,7 @@ from typing import (
 
 from .utils import NoTransaction
 from ._butlerUri import ButlerURI
+from ..metrics import timed
 from ..location import Location
 
 if TYPE_CHECKING:
@@ -348,6 +349,7 @@ class ButlerHttpURI(ButlerURI):
         ButlerHttpURI._sessionInitialized = True
         return s
 
+    @timed("uri.http.exists")
     def exists(self) -> bool:
         """Check that a remote HTTP resource exists."""
         log.debug("Checking if resource exists: %s", self.geturl())
@@ -355,6 +357,7 @@ class ButlerHttpURI(ButlerURI):
 
         return True if r.status_code == 200 else False
 
+    @timed("uri.http.size")
     def size(self) -> int:
         if self.dirLike:
             return 0
@@ -412,6 +415,7 @@ class ButlerHttpURI(ButlerURI):
                 tmpFile.write(chunk)
         return tmpFile.name, True
 
+    @timed("uri.http.read")
     def read(self, size: int = -1) -> bytes:
         """Open the resource and return the contents in bytes.
 
@@ -431,6 +435,7 @@ class ButlerHttpURI(ButlerURI):
         else:
             return next(r.iter_content(chunk_size=size))
 
+    @timed("uri.http.write")
     def write(self, data: bytes, overwrite: bool = True) -> None:
         """Write the supplied bytes to the new resource.
 
@@ -452,6 +457,7 @@ class ButlerHttpURI(ButlerURI):
         if r.status_code not in [201, 202, 204]:
             raise ValueError(f"Can not write file {self}, status code: {r.status_code}")
 
+    @timed("uri.http.transfer_from")
     def transfer_from(self, src: ButlerURI, transfer: str = "copy",
                       overwrite: bool = False,
                       transaction: Optional[Union[DatastoreTransaction, NoTransaction]] = None) -> None:
@@ -24,6 +24,7 @@ from typing import Tuple
 __all__ = ('ButlerInMemoryURI',)
 
 from ._butlerUri import ButlerURI
+from ..metrics import timed
 
 
 class ButlerInMemoryURI(ButlerURI):
@@ -33,6 +34,7 @@ class ButlerInMemoryURI(ButlerURI):
     is in memory.
     """
 
+    @timed("uri.mem.exists")
     def exists(self) -> bool:
         """Test for existence and always return False."""
         return True
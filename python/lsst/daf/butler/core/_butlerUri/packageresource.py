@@ -25,6 +25,7 @@ import logging
 __all__ = ('ButlerPackageResourceURI',)
 
 from ._butlerUri import ButlerURI
+from ..metrics import timed
 
 log = logging.getLogger(__name__)
 
@@ -37,10 +38,12 @@ class ButlerPackageResourceURI(ButlerURI):
     resource name.
     """
 
+    @timed("uri.resource.exists")
     def exists(self) -> bool:
         """Check that the python resource exists."""
         return pkg_resources.resource_exists(self.netloc, self.relativeToPathRoot)
 
+    @timed("uri.resource.read")
     def read(self, size: int = -1) -> bytes:
         with pkg_resources.resource_stream(self.netloc, self.relativeToPathRoot) as fh:
             return fh.read(size)
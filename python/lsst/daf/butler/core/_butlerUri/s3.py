@@ -37,6 +37,7 @@ from typing import (
 
 from .utils import NoTransaction
 from ._butlerUri import ButlerURI
+from ..metrics import timed
 from .s3utils import getS3Client, s3CheckFileExists, bucketExists
 
 from botocore.exceptions import ClientError
@@ -96,6 +97,7 @@ class ButlerS3URI(ButlerURI):
         # Defer import for circular dependencies
         return getS3Client()
 
+    @timed("uri.s3.exists")
     @backoff.on_exception(backoff.expo, retryable_client_errors, max_time=max_retry_time)
     def exists(self) -> bool:
         if self.is_root:
@@ -104,6 +106,7 @@ class ButlerS3URI(ButlerURI):
         exists, _ = s3CheckFileExists(self, client=self.client)
         return exists
 
+    @timed("uri.s3.size")
     @backoff.on_exception(backoff.expo, retryable_client_errors, max_time=max_retry_time)
     def size(self) -> int:
         if self.dirLike:
@@ -121,6 +124,7 @@ class ButlerS3URI(ButlerURI):
         # response all the time
         self.client.delete_object(Bucket=self.netloc, Key=self.relativeToPathRoot)
 
+    @timed("uri.s3.read")
     @backoff.on_exception(backoff.expo, all_retryable_errors, max_time=max_retry_time)
     def read(self, size: int = -1) -> bytes:
         args = {}
@@ -136,6 +140,7 @@ class ButlerS3URI(ButlerURI):
         response["Body"].close()
         return body
 
+    @timed("uri.s3.write")
     @backoff.on_exception(backoff.expo, all_retryable_errors, max_time=max_retry_time)
     def write(self, data: bytes, overwrite: bool = True) -> None:
         if not overwrite:
@@ -171,6 +176,7 @@ class ButlerS3URI(ButlerURI):
             self.client.download_fileobj(self.netloc, self.relativeToPathRoot, tmpFile)
         return tmpFile.name, True
 
+    @timed("uri.s3.transfer_from")
     @backoff.on_exception(backoff.expo, all_retryable_errors, max_time=max_retry_time)
     def transfer_from(self, src: ButlerURI, transfer: str = "copy",
                       overwrite: bool = False,
@@ -0,0 +1,94 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Support for package namespaces whose contents are imported on first use
+(PEP 562).
+
+This module must not import anything beyond the standard library, since it is
+imported by package ``__init__`` files that are expected to be cheap to
+import.
+"""
+
+from __future__ import annotations
+
+__all__ = ("lazyAttributes",)
+
+import importlib
+import sys
+from typing import Any, Callable, Iterable, List, Mapping, Tuple
+
+
+def lazyAttributes(
+    package: str,
+    modules: Mapping[str, Iterable[str]],
+    submodules: Iterable[str] = (),
+) -> Tuple[Tuple[str, ...], Callable[[str], Any], Callable[[], List[str]]]:
+    """Construct the ``__all__``, ``__getattr__`` and ``__dir__`` of a
+    package whose public symbols are imported only when first accessed.
+
+    Parameters
+    ----------
+    package : `str`
+        Fully-qualified name of the package.  It must already be in
+        `sys.modules`, which is always true when this is called from the
+        package's ``__init__.py``.
+    modules : `Mapping` [ `str`, `Iterable` [ `str` ] ]
+        Mapping from module name (relative names are interpreted relative to
+        ``package``) to the names that the package re-exports from that
+        module.
+    submodules : `Iterable` [ `str` ], optional
+        Names of submodules of ``package`` that should be exported as
+        attributes without being imported up front.
+
+    Returns
+    -------
+    all : `tuple` [ `str` ]
+        Names of all lazily-exported symbols, suitable for ``__all__``.
+    getattr : `Callable`
+        Module-level ``__getattr__`` function.  It imports the module that
+        provides the requested name, caches the result in the package
+        namespace (so subsequent lookups do not call it again), and returns
+        it.
+    dir : `Callable`
+        Module-level ``__dir__`` function, which includes symbols that have
+        not been imported yet.
+    """
+    namespace = vars(sys.modules[package])
+    sources = {name: module for module, names in modules.items() for name in names}
+    submoduleNames = frozenset(submodules)
+    exported = tuple(sources) + tuple(submoduleNames)
+
+    def __getattr__(name: str) -> Any:
+        if name in submoduleNames:
+            value: Any = importlib.import_module(f"{package}.{name}")
+        else:
+            try:
+                module = sources[name]
+            except KeyError:
+                raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+            value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exported))
+
+    return exported, __getattr__, __dir__
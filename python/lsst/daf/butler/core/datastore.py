@@ -593,6 +593,48 @@ class Datastore(metaclass=ABCMeta):
         """
         raise NotImplementedError()
 
+    def getManyURIs(self, refs: Iterable[DatasetRef], predict: bool = False,
+                    allowMissing: bool = False) -> Dict[DatasetRef, Tuple[Optional[ButlerURI],
+                                                                          Dict[str, ButlerURI]]]:
+        """Return URIs associated with many datasets.
+
+        Parameters
+        ----------
+        refs : iterable of `DatasetRef`
+            Resolved references to the required datasets.
+        predict : `bool`, optional
+            If the datastore does not know about a dataset, should it
+            return a predicted URI or not?
+        allowMissing : `bool`, optional
+            If `True`, omit datasets unknown to this datastore from the
+            result instead of raising (ignored if ``predict`` is `True`).
+
+        Returns
+        -------
+        uris : `dict` [ `DatasetRef`, `tuple` ]
+            Mapping from each dataset to the ``(primary, components)`` tuple
+            that would be returned by `getURIs`.
+
+        Raises
+        ------
+        FileNotFoundError
+            Raised if a dataset is not known to this datastore and neither
+            ``predict`` nor ``allowMissing`` is `True`.
+
+        Notes
+        -----
+        The default implementation simply calls `getURIs` for each dataset;
+        subclasses should override it to look up many datasets at once.
+        """
+        uris: Dict[DatasetRef, Tuple[Optional[ButlerURI], Dict[str, ButlerURI]]] = {}
+        for ref in refs:
+            try:
+                uris[ref] = self.getURIs(ref, predict)
+            except FileNotFoundError:
+                if not allowMissing:
+                    raise
+        return uris
+
     @abstractmethod
     def getURI(self, datasetRef: DatasetRef, predict: bool = False) -> ButlerURI:
         """URI to the Dataset.
@@ -697,7 +739,8 @@ class Datastore(metaclass=ABCMeta):
         raise NotImplementedError("Must be implemented by subclass")
 
     def export(self, refs: Iterable[DatasetRef], *,
-               directory: Optional[str] = None, transfer: Optional[str] = None) -> Iterable[FileDataset]:
+               directory: Optional[str] = None, transfer: Optional[str] = None,
+               workers: Optional[int] = None) -> Iterable[FileDataset]:
         """Export datasets for transfer to another data repository.
 
         Parameters
@@ -712,6 +755,10 @@ class Datastore(metaclass=ABCMeta):
             Valid options are the same as those of the ``transfer`` argument
             to ``ingest``, and datastores may similarly signal that a transfer
             mode is not supported by raising `NotImplementedError`.
+        workers : `int`, optional
+            Maximum number of threads to use when transferring file artifacts.
+            If `None`, an implementation-defined default is used; ``1`` means
+            transfers are performed serially.
 
         Returns
         -------
@@ -167,14 +167,27 @@ class DataCoordinateIterable(Iterable[DataCoordinate]):
             SQLAlchemy objects representing a column for that dimension's
             primary key value in the query.
         """
+        names = list(self.graph.required.names)
         toOrTogether: List[sqlalchemy.sql.ColumnElement] = []
-        for dataId in self:
-            toOrTogether.append(
-                sqlalchemy.sql.and_(*[
-                    columns(dimension.name) == dataId[dimension.name]
-                    for dimension in self.graph.required
-                ])
-            )
+        if not names:
+            for dataId in self:
+                toOrTogether.append(sqlalchemy.sql.and_())
+        else:
+            # Group data IDs by the values of all but the last dimension, so
+            # we can use one IN expression for each group, instead of an
+            # equality expression for each dimension of each data ID; that
+            # keeps the SQL expression tree small and shallow.
+            outerNames, innerName = names[:-1], names[-1]
+            grouped: Dict[tuple, List[Any]] = {}
+            for dataId in self:
+                grouped.setdefault(tuple(dataId[name] for name in outerNames), []).append(dataId[innerName])
+            for outerValues, innerValues in grouped.items():
+                terms = [columns(name) == value for name, value in zip(outerNames, outerValues)]
+                if len(innerValues) == 1:
+                    terms.append(columns(innerName) == innerValues[0])
+                else:
+                    terms.append(columns(innerName).in_(innerValues))
+                toOrTogether.append(sqlalchemy.sql.and_(*terms))
         query.where.append(sqlalchemy.sql.or_(*toOrTogether))
 
     @abstractmethod
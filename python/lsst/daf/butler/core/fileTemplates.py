@@ -34,6 +34,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Iterable,
+    List,
     Mapping,
     Optional,
     Set,
@@ -54,6 +55,9 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# One (literal, field_name, format_spec, conversion) segment of a template.
+_TemplatePart = Tuple[str, Optional[str], Optional[str], Optional[str]]
+
 
 class FileTemplateValidationError(ValidationError):
     """Exception thrown when a file template is not consistent with the
@@ -353,10 +357,25 @@ class FileTemplate:
             raise FileTemplateValidationError(f"Template ('{template}') does "
                                               "not contain any format specifiers")
         self.template = template
+        self._parsed: Optional[Tuple[str, List[_TemplatePart]]] = None
 
         # Do basic validation without access to dimensions
         self.validateTemplate(None)
 
+    def _parse(self) -> List[_TemplatePart]:
+        """Return the parsed segments of the template string.
+
+        Returns
+        -------
+        parts : `list` [ `tuple` ]
+            The ``(literal, field_name, format_spec, conversion)`` tuples
+            returned by `string.Formatter.parse`.  These are cached, since
+            templates are formatted far more often than they are changed.
+        """
+        if self._parsed is None or self._parsed[0] != self.template:
+            self._parsed = (self.template, list(string.Formatter().parse(self.template)))
+        return self._parsed[1]
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, FileTemplate):
             return False
@@ -392,8 +411,7 @@ class FileTemplate:
         The returned set will include the special values such as `datasetType`
         and `component`.
         """
-        fmt = string.Formatter()
-        parts = fmt.parse(self.template)
+        parts = self._parse()
 
         names = set()
         for literal, field_name, format_spec, conversion in parts:
@@ -460,8 +478,7 @@ class FileTemplate:
         usedRun = False
         fields["run"] = ref.run
 
-        fmt = string.Formatter()
-        parts = fmt.parse(self.template)
+        parts = self._parse()
         output = ""
 
         for literal, field_name, format_spec, conversion in parts:
@@ -472,6 +472,17 @@ class FormatterFactory:
 
     def __init__(self) -> None:
         self._mappingFactory = MappingFactory(Formatter)
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter that is incremented whenever a formatter is registered
+        (`int`).
+
+        Callers that cache the results of formatter lookups can compare this
+        with its value at the time of the lookup to detect stale entries.
+        """
+        return self._generation
 
     def __contains__(self, key: Union[LookupKey, str]) -> bool:
         """Indicates whether the supplied key is present in the factory.
@@ -771,6 +782,7 @@ class FormatterFactory:
             ``overwrite`` is `False`.
         """
         self._mappingFactory.placeInRegistry(type_, formatter, overwrite=overwrite, **kwargs)
+        self._generation += 1
 
 
 # Type to use when allowing a Formatter or its class name
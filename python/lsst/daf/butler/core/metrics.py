@@ -0,0 +1,528 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Opt-in timers and counters for the butler's hot paths.
+
+Instrumented code calls `timer`, `timed` or `countMetric` with a dotted
+operation name (e.g. ``"database.query"``, ``"uri.s3.read"``,
+``"formatter.fromBytes"``, ``"cache.dimensionRecord.hit"``).  Nothing is
+recorded unless at least one `MetricsCollector` is active, either the global
+one (see `enableMetrics`) or a scoped one (see `collectMetrics`), and in that
+case the cost of instrumentation is a single check of a module-level list.
+
+The global collector is enabled at import if the ``DAF_BUTLER_METRICS``
+environment variable is set to a non-empty value other than ``0``.
+"""
+
+from __future__ import annotations
+
+__all__ = (
+    "MetricsCollector",
+    "MetricsReporter",
+    "OperationStats",
+    "collectMetrics",
+    "countMetric",
+    "disableMetrics",
+    "enableMetrics",
+    "metricsEnabled",
+    "metricsSnapshot",
+    "timed",
+    "timer",
+)
+
+import contextlib
+import functools
+import logging
+import os
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+log = logging.getLogger(__name__)
+
+_F = TypeVar("_F", bound=Callable)
+
+
+class OperationStats:
+    """Aggregated timings for one kind of operation.
+    """
+
+    __slots__ = ("count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    count: int
+    """Number of times the operation was performed (`int`).
+    """
+
+    total: float
+    """Total wall-clock time spent in the operation, in seconds (`float`).
+    """
+
+    min: float
+    """Shortest duration of the operation, in seconds (`float`).
+    """
+
+    max: float
+    """Longest duration of the operation, in seconds (`float`).
+    """
+
+    def add(self, elapsed: float) -> None:
+        """Record one occurrence of the operation.
+
+        Parameters
+        ----------
+        elapsed : `float`
+            Duration of the operation, in seconds.
+        """
+        self.count += 1
+        self.total += elapsed
+        if elapsed < self.min:
+            self.min = elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def toDict(self) -> Dict[str, float]:
+        """Return the statistics as a dictionary.
+
+        Returns
+        -------
+        stats : `dict` [ `str`, `float` ]
+            Dictionary with ``count``, ``total``, ``mean``, ``min`` and
+            ``max`` keys; times are in seconds.
+        """
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+        }
+
+
+class MetricsCollector:
+    """Aggregated timers and counters, keyed by operation name.
+
+    Collectors only record anything while they are active; see
+    `enableMetrics` and `collectMetrics`.  All methods are thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._timers: Dict[str, OperationStats] = {}
+        self._counters: Dict[str, int] = {}
+
+    def addTime(self, name: str, elapsed: float) -> None:
+        """Record one timed occurrence of an operation.
+
+        Parameters
+        ----------
+        name : `str`
+            Name of the operation.
+        elapsed : `float`
+            Duration of the operation, in seconds.
+        """
+        with self._lock:
+            stats = self._timers.get(name)
+            if stats is None:
+                stats = self._timers[name] = OperationStats()
+            stats.add(elapsed)
+
+    def addCount(self, name: str, n: int = 1) -> None:
+        """Increment a counter.
+
+        Parameters
+        ----------
+        name : `str`
+            Name of the counter.
+        n : `int`, optional
+            Amount to increment the counter by.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def reset(self) -> None:
+        """Discard everything recorded so far.
+        """
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return a copy of everything recorded so far.
+
+        Returns
+        -------
+        snapshot : `dict`
+            Dictionary with a ``"timers"`` key, mapping operation name to
+            the dictionary returned by `OperationStats.toDict`, and a
+            ``"counters"`` key, mapping counter name to its `int` value.
+        """
+        with self._lock:
+            return {
+                "timers": {name: stats.toDict() for name, stats in sorted(self._timers.items())},
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+    def format(self) -> str:
+        """Return a human-readable summary of everything recorded so far.
+
+        Returns
+        -------
+        summary : `str`
+            One line per timer and counter.
+        """
+        snapshot = self.snapshot()
+        lines = []
+        for name, stats in snapshot["timers"].items():
+            lines.append(f"{name}: {stats['count']} calls, {stats['total']:.3f}s total, "
+                         f"{stats['mean'] * 1e3:.3f}ms mean, {stats['max'] * 1e3:.3f}ms max")
+        for name, value in snapshot["counters"].items():
+            lines.append(f"{name}: {value}")
+        return "\n".join(lines)
+
+    def toPrometheus(self, prefix: str = "daf_butler") -> str:
+        """Return everything recorded so far in the Prometheus text
+        exposition format.
+
+        Parameters
+        ----------
+        prefix : `str`, optional
+            Prefix for the metric names.
+
+        Returns
+        -------
+        text : `str`
+            Timers as a ``<prefix>_operation_seconds`` summary (with
+            ``_count`` and ``_sum`` samples) labeled by operation, and counters
+            as a ``<prefix>_events_total`` counter labeled by event.
+        """
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_operation_seconds Time spent in instrumented butler operations.",
+            f"# TYPE {prefix}_operation_seconds summary",
+        ]
+        for name, stats in snapshot["timers"].items():
+            lines.append(f'{prefix}_operation_seconds_count{{operation="{name}"}} {stats["count"]}')
+            lines.append(f'{prefix}_operation_seconds_sum{{operation="{name}"}} {stats["total"]!r}')
+        lines.append(f"# HELP {prefix}_events_total Counts of instrumented butler events.")
+        lines.append(f"# TYPE {prefix}_events_total counter")
+        for name, value in snapshot["counters"].items():
+            lines.append(f'{prefix}_events_total{{event="{name}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+_GLOBAL_COLLECTOR = MetricsCollector()
+
+_active: List[MetricsCollector] = []
+"""Collectors that are currently recording.  This is replaced rather than
+modified in place, so instrumented code can iterate over it without a lock.
+"""
+
+_activeLock = threading.Lock()
+
+_running = threading.local()
+"""Per-thread set of the names of operations currently being timed, so that
+an instrumented method that calls an instrumented override or base-class
+implementation of the same operation is only counted once.
+"""
+
+
+def _activate(collector: MetricsCollector) -> None:
+    global _active
+    with _activeLock:
+        if collector not in _active:
+            _active = _active + [collector]
+
+
+def _deactivate(collector: MetricsCollector) -> None:
+    global _active
+    with _activeLock:
+        _active = [c for c in _active if c is not collector]
+
+
+def enableMetrics(reset: bool = False) -> MetricsCollector:
+    """Start recording into the global collector.
+
+    Parameters
+    ----------
+    reset : `bool`, optional
+        If `True`, discard anything recorded by the global collector
+        previously.
+
+    Returns
+    -------
+    collector : `MetricsCollector`
+        The global collector.
+    """
+    if reset:
+        _GLOBAL_COLLECTOR.reset()
+    _activate(_GLOBAL_COLLECTOR)
+    return _GLOBAL_COLLECTOR
+
+
+def disableMetrics() -> None:
+    """Stop recording into the global collector.
+
+    Scoped collectors created by `collectMetrics` are not affected, and
+    what the global collector has recorded is kept.
+    """
+    _deactivate(_GLOBAL_COLLECTOR)
+
+
+def metricsEnabled() -> bool:
+    """Return whether any collector is recording.
+
+    Returns
+    -------
+    enabled : `bool`
+        `True` if the global collector or a scoped collector is active.
+    """
+    return bool(_active)
+
+
+def metricsSnapshot() -> Dict[str, Dict[str, Any]]:
+    """Return a copy of everything recorded by the global collector.
+
+    Returns
+    -------
+    snapshot : `dict`
+        See `MetricsCollector.snapshot`.
+    """
+    return _GLOBAL_COLLECTOR.snapshot()
+
+
+@contextlib.contextmanager
+def collectMetrics() -> Iterator[MetricsCollector]:
+    """Record metrics into a new collector for the duration of a ``with``
+    block.
+
+    Yields
+    ------
+    collector : `MetricsCollector`
+        Collector that records everything instrumented in any thread while
+        the block is executing.  It is independent of the global collector,
+        which keeps recording if it is enabled.
+
+    Examples
+    --------
+    >>> with collectMetrics() as metrics:
+    ...     butler.get("calexp", dataId)  # doctest: +SKIP
+    >>> metrics.snapshot()["timers"]["formatter.read"]  # doctest: +SKIP
+    """
+    collector = MetricsCollector()
+    _activate(collector)
+    try:
+        yield collector
+    finally:
+        _deactivate(collector)
+
+
+def countMetric(name: str, n: int = 1) -> None:
+    """Increment a counter in all active collectors.
+
+    Parameters
+    ----------
+    name : `str`
+        Name of the counter.
+    n : `int`, optional
+        Amount to increment the counter by.
+    """
+    if _active:
+        for collector in _active:
+            collector.addCount(name, n)
+
+
+class _Timer:
+    """Context manager that records the time spent in its block.
+    """
+
+    __slots__ = ("name", "start", "outermost")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> None:
+        running: Optional[Set[str]] = getattr(_running, "names", None)
+        if running is None:
+            running = _running.names = set()
+        self.outermost = self.name not in running
+        if self.outermost:
+            running.add(self.name)
+        self.start = time.perf_counter()
+
+    def __exit__(self, *args: Any) -> None:
+        elapsed = time.perf_counter() - self.start
+        if self.outermost:
+            _running.names.discard(self.name)
+            for collector in _active:
+                collector.addTime(self.name, elapsed)
+
+
+_NULL_TIMER = contextlib.nullcontext()
+
+
+def timer(name: str) -> ContextManager[None]:
+    """Return a context manager that records the time spent in its block in
+    all active collectors.
+
+    Parameters
+    ----------
+    name : `str`
+        Name of the operation.
+
+    Returns
+    -------
+    context : `contextlib.AbstractContextManager`
+        The context manager; a shared no-op one if no collector is active.
+    """
+    if _active:
+        return _Timer(name)
+    return _NULL_TIMER
+
+
+def timed(name: str) -> Callable[[_F], _F]:
+    """Return a decorator that records the time spent in calls to a function
+    in all active collectors.
+
+    Parameters
+    ----------
+    name : `str`
+        Name of the operation.
+
+    Returns
+    -------
+    decorator : `Callable`
+        Decorator for functions or methods.
+
+    Notes
+    -----
+    Calls made while another call with the same operation name is in progress
+    in the same thread (e.g. an override calling ``super()``) are not recorded
+    separately.
+    """
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _active:
+                return func(*args, **kwargs)
+            with _Timer(name):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore
+    return decorator
+
+
+class MetricsReporter:
+    """Periodically write a collector's metrics to the log and/or a file in
+    the Prometheus text format.
+
+    Parameters
+    ----------
+    interval : `float`
+        Time between reports, in seconds.
+    collector : `MetricsCollector`, optional
+        Collector to report; defaults to the global collector, which is
+        enabled by `start`.
+    logLevel : `int`, optional
+        Level at which to log a summary; `None` disables logging.
+    prometheusPath : `str`, optional
+        File to (atomically) overwrite with the metrics in the Prometheus
+        text format on each report, e.g. for the node exporter's textfile
+        collector.
+
+    Notes
+    -----
+    Reports are made by a daemon thread, and a final report is made by
+    `stop`.  Instances may be used as context managers.
+    """
+
+    def __init__(self, interval: float, collector: Optional[MetricsCollector] = None, *,
+                 logLevel: Optional[int] = logging.INFO, prometheusPath: Optional[str] = None):
+        self.interval = interval
+        self.collector = collector if collector is not None else _GLOBAL_COLLECTOR
+        self.logLevel = logLevel
+        self.prometheusPath = prometheusPath
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def report(self) -> None:
+        """Write a report now.
+        """
+        if self.logLevel is not None and log.isEnabledFor(self.logLevel):
+            log.log(self.logLevel, "Butler metrics:\n%s", self.collector.format())
+        if self.prometheusPath is not None:
+            tmpPath = f"{self.prometheusPath}.tmp"
+            with open(tmpPath, "w") as stream:
+                stream.write(self.collector.toPrometheus())
+            os.replace(tmpPath, self.prometheusPath)
+
+    def start(self) -> None:
+        """Start reporting periodically.
+        """
+        if self._thread is not None:
+            return
+        if self.collector is _GLOBAL_COLLECTOR:
+            enableMetrics()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="daf_butler-metrics", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop reporting periodically, after writing a final report.
+        """
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self.report()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.report()
+            except Exception:
+                log.exception("Failed to report butler metrics.")
+
+    def __enter__(self) -> MetricsReporter:
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+
+if os.environ.get("DAF_BUTLER_METRICS", "0") not in ("", "0"):
+    enableMetrics()
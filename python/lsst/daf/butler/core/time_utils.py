@@ -23,11 +23,12 @@ from __future__ import annotations
 __all__ = ("TimeConverter",)
 
 import logging
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Sequence, Union
 import warnings
 
 import astropy.time
 import astropy.utils.exceptions
+import numpy
 import yaml
 
 # As of astropy 4.2, the erfa interface is shipped independently and
@@ -56,7 +57,29 @@ class TimeConverter(metaclass=Singleton):
         self.epoch = astropy.time.Time("1970-01-01 00:00:00", format="iso", scale="tai", precision=6)
         self.max_time = astropy.time.Time("2100-01-01 00:00:00", format="iso", scale="tai")
         self.min_nsec = 0
-        self.max_nsec = self.astropy_to_nsec(self.max_time)
+        self.max_nsec = self._delta_to_nsec(self.max_time - self.epoch)
+
+    def _to_tai(self, astropy_time: astropy.time.Time) -> astropy.time.Time:
+        """Convert astropy time (scalar or array) to TAI scale, ignoring any
+        warnings this produces.
+        """
+        # sometimes comparison produces warnings if input value is in UTC
+        # scale, transform it to TAI before doing anything but also trap
+        # warnings in case we are dealing with simulated data from the future
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=astropy.utils.exceptions.AstropyWarning)
+            if erfa is not None:
+                warnings.simplefilter("ignore", category=erfa.ErfaWarning)
+            return astropy_time.tai
+
+    def _delta_to_nsec(self, delta: astropy.time.TimeDelta) -> int:
+        """Convert a scalar astropy time difference to integer nanoseconds,
+        without any range checks.
+        """
+        # Special care needed to preserve nanosecond precision.
+        # Usually jd1 has no fractional part but just in case.
+        jd1, extra_jd2 = divmod(delta.jd1, 1)
+        return int(jd1) * self._NSEC_PER_DAY + int(round((delta.jd2 + extra_jd2)*self._NSEC_PER_DAY))
 
     def astropy_to_nsec(self, astropy_time: astropy.time.Time) -> int:
         """Convert astropy time to nanoseconds since epoch.
@@ -81,31 +104,61 @@ class TimeConverter(metaclass=Singleton):
         is earlier `min_time` then this method returns `min_nsec`. If input
         time comes after `max_time` then it returns `max_nsec`.
         """
-        # sometimes comparison produces warnings if input value is in UTC
-        # scale, transform it to TAI before doing anything but also trap
-        # warnings in case we are dealing with simulated data from the future
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", category=astropy.utils.exceptions.AstropyWarning)
-            if erfa is not None:
-                warnings.simplefilter("ignore", category=erfa.ErfaWarning)
-            value = astropy_time.tai
+        # Range checks are done on the integer result, which is much cheaper
+        # than comparing astropy times.
+        tai = self._to_tai(astropy_time)
+        value = self._delta_to_nsec(tai - self.epoch)
         # anything before epoch or after max_time is truncated
-        if value < self.epoch:
+        if value < self.min_nsec:
             _LOG.warning("'%s' is earlier than epoch time '%s', epoch time will be used instead",
                          astropy_time, self.epoch)
-            value = self.epoch
-        elif value > self.max_time:
+            value = self.min_nsec
+        elif value > self.max_nsec:
             _LOG.warning("'%s' is later than max. time '%s', max. time time will be used instead",
-                         value, self.max_time)
-            value = self.max_time
-
-        delta = value - self.epoch
-        # Special care needed to preserve nanosecond precision.
-        # Usually jd1 has no fractional part but just in case.
-        jd1, extra_jd2 = divmod(delta.jd1, 1)
-        value = int(jd1) * self._NSEC_PER_DAY + int(round((delta.jd2 + extra_jd2)*self._NSEC_PER_DAY))
+                         tai, self.max_time)
+            value = self.max_nsec
         return value
 
+    def astropy_to_nsec_array(self, astropy_time: astropy.time.Time) -> numpy.ndarray:
+        """Convert an array of astropy times to nanoseconds since epoch.
+
+        This is equivalent to calling `astropy_to_nsec` on each element of
+        ``astropy_time``, but is much faster for large arrays.
+
+        Parameters
+        ----------
+        astropy_time : `astropy.time.Time`
+            Array-valued time to be converted.
+
+        Returns
+        -------
+        time_nsec : `numpy.ndarray`
+            One-dimensional array of `numpy.int64` nanoseconds since epoch.
+
+        Note
+        ----
+        As in `astropy_to_nsec`, input times outside the supported range are
+        truncated to `min_nsec` or `max_nsec`.
+        """
+        delta = self._to_tai(astropy_time) - self.epoch
+        jd1, extra_jd2 = numpy.divmod(numpy.ravel(delta.jd1), 1.0)
+        jd2 = numpy.ravel(delta.jd2) + extra_jd2
+        # Clip the day count before converting it, so times far outside the
+        # supported range cannot overflow 64-bit integers; anything clipped
+        # is still out of range and is truncated below.
+        max_days = self.max_nsec // self._NSEC_PER_DAY + 1
+        jd1 = numpy.clip(jd1, -1, max_days).astype(numpy.int64)
+        value = jd1 * self._NSEC_PER_DAY + numpy.round(jd2*self._NSEC_PER_DAY).astype(numpy.int64)
+        n_early = numpy.count_nonzero(value < self.min_nsec)
+        if n_early:
+            _LOG.warning("%d time(s) are earlier than epoch time '%s', epoch time will be used instead",
+                         n_early, self.epoch)
+        n_late = numpy.count_nonzero(value > self.max_nsec)
+        if n_late:
+            _LOG.warning("%d time(s) are later than max. time '%s', max. time will be used instead",
+                         n_late, self.max_time)
+        return numpy.clip(value, self.min_nsec, self.max_nsec)
+
     def nsec_to_astropy(self, time_nsec: int) -> astropy.time.Time:
         """Convert nanoseconds since epoch to astropy time.
 
@@ -131,6 +184,27 @@ class TimeConverter(metaclass=Singleton):
         value = self.epoch + delta
         return value
 
+    def nsec_to_astropy_array(self, time_nsec: Union[numpy.ndarray, Sequence[int]]) -> astropy.time.Time:
+        """Convert an array of nanoseconds since epoch to astropy time.
+
+        This is equivalent to calling `nsec_to_astropy` on each element of
+        ``time_nsec``, but is much faster for large arrays.
+
+        Parameters
+        ----------
+        time_nsec : `numpy.ndarray` or sequence of `int`
+            Nanoseconds since epoch.
+
+        Returns
+        -------
+        astropy_time : `astropy.time.Time`
+            One-dimensional array-valued time.
+        """
+        jd1, jd2 = numpy.divmod(numpy.asarray(time_nsec, dtype=numpy.int64).ravel(), self._NSEC_PER_DAY)
+        delta = astropy.time.TimeDelta(jd1.astype(float), jd2.astype(float)/self._NSEC_PER_DAY,
+                                       format="jd", scale="tai")
+        return self.epoch + delta
+
     def times_equal(self, time1: astropy.time.Time,
                     time2: astropy.time.Time,
                     precision_nsec: float = 1.0) -> bool:
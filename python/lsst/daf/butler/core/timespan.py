@@ -137,8 +137,8 @@ class Timespan:
     """
     def __init__(self, begin: TimespanBound, end: TimespanBound, padInstantaneous: bool = True,
                  _nsec: Optional[Tuple[int, int]] = None):
-        converter = TimeConverter()
         if _nsec is None:
+            converter = TimeConverter()
             begin_nsec: int
             if begin is None:
                 begin_nsec = converter.min_nsec
@@ -184,11 +184,40 @@ class Timespan:
             # Standardizing all empty timespans to the same underlying values
             # here simplifies all other operations (including interactions
             # with TimespanDatabaseRepresentation implementations).
+            converter = TimeConverter()
             _nsec = (converter.max_nsec, converter.min_nsec)
         self._nsec = _nsec
 
     __slots__ = ("_nsec", "_cached_begin", "_cached_end")
 
+    @classmethod
+    def _fromNsec(cls, begin_nsec: int, end_nsec: int) -> Timespan:
+        """Construct a timespan directly from integer nanosecond bounds.
+
+        This is equivalent to ``Timespan(None, None, _nsec=(begin, end))``,
+        but avoids the overhead of argument processing; it is intended for
+        internal use by `Timespan` and `TimespanDatabaseRepresentation`
+        implementations only.
+
+        Parameters
+        ----------
+        begin_nsec : `int`
+            Minimum bound (inclusive) in TAI nanoseconds since the epoch.
+        end_nsec : `int`
+            Maximum bound (exclusive) in TAI nanoseconds since the epoch.
+
+        Returns
+        -------
+        timespan : `Timespan`
+            New timespan.  Never has its astropy bounds computed yet.
+        """
+        self = object.__new__(cls)
+        if begin_nsec >= end_nsec:
+            converter = TimeConverter()
+            begin_nsec, end_nsec = converter.max_nsec, converter.min_nsec
+        self._nsec = (begin_nsec, end_nsec)
+        return self
+
     EMPTY: ClassVar[_SpecialTimespanBound] = _SpecialTimespanBound.EMPTY
 
     @classmethod
@@ -202,7 +231,7 @@ class Timespan:
             and overlaps no other timespans (including itself).
         """
         converter = TimeConverter()
-        return Timespan(None, None, _nsec=(converter.max_nsec, converter.min_nsec))
+        return cls._fromNsec(converter.max_nsec, converter.min_nsec)
 
     @classmethod
     def fromInstant(cls, time: astropy.time.Time) -> Timespan:
@@ -229,7 +258,7 @@ class Timespan:
                 f"Cannot construct near-instantaneous timespan at {time}; "
                 "within one ns of maximum time."
             )
-        return Timespan(None, None, _nsec=(nsec, nsec + 1))
+        return cls._fromNsec(nsec, nsec + 1)
 
     @property  # type: ignore
     @cached_getter
@@ -442,12 +471,9 @@ class Timespan:
         """
         if not args:
             return self
-        lowers = [self._nsec[0]]
-        lowers.extend(ts._nsec[0] for ts in args)
-        uppers = [self._nsec[1]]
-        uppers.extend(ts._nsec[1] for ts in args)
-        nsec = (max(*lowers), min(*uppers))
-        return Timespan(begin=None, end=None, _nsec=nsec)
+        begin_nsec = max(self._nsec[0], *[ts._nsec[0] for ts in args])
+        end_nsec = min(self._nsec[1], *[ts._nsec[1] for ts in args])
+        return Timespan._fromNsec(begin_nsec, end_nsec)
 
     def difference(self, other: Timespan) -> Generator[Timespan, None, None]:
         """Return the one or two timespans that cover the interval(s) that are
@@ -468,16 +494,16 @@ class Timespan:
             A `Timespan` that is contained by ``self`` but does not overlap
             ``other``.  Guaranteed not to be empty.
         """
-        intersection = self.intersection(other)
-        if intersection.isEmpty():
+        # Bounds of the intersection of self and other.
+        begin_nsec = max(self._nsec[0], other._nsec[0])
+        end_nsec = min(self._nsec[1], other._nsec[1])
+        if begin_nsec >= end_nsec:
             yield self
-        elif intersection == self:
-            yield from ()
-        else:
-            if intersection._nsec[0] > self._nsec[0]:
-                yield Timespan(None, None, _nsec=(self._nsec[0], intersection._nsec[0]))
-            if intersection._nsec[1] < self._nsec[1]:
-                yield Timespan(None, None, _nsec=(intersection._nsec[1], self._nsec[1]))
+            return
+        if begin_nsec > self._nsec[0]:
+            yield Timespan._fromNsec(self._nsec[0], begin_nsec)
+        if end_nsec < self._nsec[1]:
+            yield Timespan._fromNsec(end_nsec, self._nsec[1])
 
 
 _S = TypeVar("_S", bound="TimespanDatabaseRepresentation")
@@ -732,7 +758,7 @@ class _CompoundTimespanDatabaseRepresentation(TimespanDatabaseRepresentation):
                 f"Corrupted timespan extracted: end is NULL, but begin is {begin_nsec}ns -> "
                 f"{TimeConverter().nsec_to_astropy(begin_nsec).tai.isot}."
             )
-        return Timespan(None, None, _nsec=(begin_nsec, end_nsec))
+        return Timespan._fromNsec(begin_nsec, end_nsec)
 
     @classmethod
     def fromSelectable(cls, selectable: sqlalchemy.sql.FromClause,
@@ -483,6 +483,42 @@ class ChainedDatastore(Datastore):
 
         raise FileNotFoundError("Dataset {} not in any datastore".format(ref))
 
+    def getManyURIs(self, refs: Iterable[DatasetRef], predict: bool = False,
+                    allowMissing: bool = False) -> Dict[DatasetRef, Tuple[Optional[ButlerURI],
+                                                                          Dict[str, ButlerURI]]]:
+        # Docstring inherited from Datastore.
+        # Follows the same preferences as getURIs, but asks each child
+        # datastore about all of the remaining datasets at once.
+        DatastoreURIs = Tuple[Optional[ButlerURI], Dict[str, ButlerURI]]
+        uris: Dict[DatasetRef, DatastoreURIs] = {}
+        ephemeralUris: Dict[DatasetRef, DatastoreURIs] = {}
+        remaining = list(refs)
+        for datastore in self.datastores:
+            if not remaining:
+                break
+            found = datastore.getManyURIs(remaining, allowMissing=True)
+            if datastore.isEphemeral:
+                for ref, uri in found.items():
+                    ephemeralUris.setdefault(ref, uri)
+            else:
+                uris.update(found)
+                remaining = [ref for ref in remaining if ref not in found]
+        for ref in remaining:
+            if ref in ephemeralUris:
+                uris[ref] = ephemeralUris[ref]
+        remaining = [ref for ref in remaining if ref not in uris]
+
+        if predict and remaining:
+            ordered = ([datastore for datastore in self.datastores if not datastore.isEphemeral]
+                       + [datastore for datastore in self.datastores if datastore.isEphemeral])
+            if ordered:
+                uris.update(ordered[0].getManyURIs(remaining, predict=True))
+                remaining = []
+
+        if remaining and not allowMissing:
+            raise FileNotFoundError("Dataset {} not in any datastore".format(remaining[0]))
+        return uris
+
     def getURI(self, ref: DatasetRef, predict: bool = False) -> ButlerURI:
         """URI to the Dataset.
 
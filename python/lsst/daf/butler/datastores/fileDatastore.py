@@ -24,10 +24,14 @@ from __future__ import annotations
 
 __all__ = ("FileDatastore", )
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import copy
 import hashlib
 import logging
 import os
 import tempfile
+import threading
 
 from sqlalchemy import BigInteger, String
 
@@ -59,6 +63,7 @@ from lsst.daf.butler import (
     DatastoreConfig,
     DatastoreValidationError,
     FileDescriptor,
+    FileTemplate,
     FileTemplates,
     FileTemplateValidationError,
     Formatter,
@@ -75,6 +80,7 @@ from lsst.daf.butler.registry.interfaces import (
     DatastoreRegistryBridge,
 )
 
+from lsst.daf.butler.core.metrics import countMetric, timer
 from lsst.daf.butler.core.repoRelocation import replaceRoot
 from lsst.daf.butler.core.utils import getInstanceOf, getClassOf, transactional
 from .genericDatastore import GenericBaseDatastore
@@ -130,6 +136,33 @@ class DatastoreFileGetInformation:
     """The `StorageClass` of the dataset being read."""
 
 
+@dataclass(frozen=True)
+class _DatastoreWritePlan:
+    """Configuration resolved for writing datasets of one dataset type (and
+    instrument) to a `FileDatastore`.
+    """
+
+    acceptable: bool
+    """Whether the datastore constraints accept the dataset."""
+
+    template: Optional[FileTemplate]
+    """The validated file template (`None` if not ``acceptable``)."""
+
+    formatterClass: Optional[Type[Formatter]]
+    """The `Formatter` subclass to write with (`None` if not
+    ``acceptable``)."""
+
+    formatterKwargs: Dict[str, Any]
+    """Keyword arguments configured for the formatter.
+
+    These must be copied before being passed to a formatter, as formatters
+    are free to modify their parameters.
+    """
+
+    formatterGeneration: int
+    """Value of `FormatterFactory.generation` when the plan was made."""
+
+
 class FileDatastore(GenericBaseDatastore):
     """Generic Datastore for file-based implementations.
 
@@ -282,6 +315,26 @@ class FileDatastore(GenericBaseDatastore):
         # Determine whether checksums should be used - default to False
         self.useChecksum = self.config.get("checksum", False)
 
+        # Number of threads used to transfer files and compute their sizes
+        # and checksums during ingest; by default everything is serial.
+        self.ingestWorkers = self.config.get("ingest_workers", 1)
+        if self.ingestWorkers is not None and self.ingestWorkers < 1:
+            raise ValueError(f"ingest_workers must be positive; got {self.ingestWorkers}.")
+
+        # Object stores have no real directories, so creating (or checking
+        # for) them before every write is wasted round trips.
+        self.createDirectories = self.config.get("create_directories", True)
+
+        # Bounded cache of the directories known to exist, so consecutive
+        # writes into the same directory do not each have to check.
+        self._directoryCacheSize = self.config.get("directory_cache_size", 1024)
+        self._knownDirectories: OrderedDict[str, None] = OrderedDict()
+        self._knownDirectoriesLock = threading.Lock()
+
+        # Resolved templates, formatters and constraints for put, keyed by
+        # dataset type and instrument.
+        self._writePlans: Dict[Tuple[DatasetType, Any], _DatastoreWritePlan] = {}
+
         # Check existence and create directory structure if necessary
         if not self.root.exists():
             if "create" not in self.config or not self.config["create"]:
@@ -295,6 +348,51 @@ class FileDatastore(GenericBaseDatastore):
     def __str__(self) -> str:
         return str(self.root)
 
+    def _ensureDirectory(self, directory: ButlerURI) -> None:
+        """Create a directory in the datastore if it does not already exist.
+
+        Parameters
+        ----------
+        directory : `ButlerURI`
+            URI of the directory.
+
+        Notes
+        -----
+        Directories that were created or found to exist are remembered (up to
+        the ``directory_cache_size`` configuration value), so later calls for
+        the same directory do not touch the storage at all.  Callers should
+        call `_forgetDirectory` if a write into the directory fails.  Nothing
+        is done if the ``create_directories`` configuration value is `False`.
+        """
+        if not self.createDirectories:
+            return
+        key = str(directory)
+        with self._knownDirectoriesLock:
+            if key in self._knownDirectories:
+                self._knownDirectories.move_to_end(key)
+                countMetric("cache.datastoreDirectory.hit")
+                return
+        countMetric("cache.datastoreDirectory.miss")
+        if not directory.exists():
+            log.debug("Folder %s does not exist yet so creating it.", directory)
+            directory.mkdir()
+        if self._directoryCacheSize > 0:
+            with self._knownDirectoriesLock:
+                self._knownDirectories[key] = None
+                while len(self._knownDirectories) > self._directoryCacheSize:
+                    self._knownDirectories.popitem(last=False)
+
+    def _forgetDirectory(self, directory: ButlerURI) -> None:
+        """Remove a directory from the cache of directories known to exist.
+
+        Parameters
+        ----------
+        directory : `ButlerURI`
+            URI of the directory.
+        """
+        with self._knownDirectoriesLock:
+            self._knownDirectories.pop(str(directory), None)
+
     @property
     def bridge(self) -> DatastoreRegistryBridge:
         return self._bridge
@@ -352,25 +450,42 @@ class FileDatastore(GenericBaseDatastore):
 
         # Look for the dataset_id -- there might be multiple matches
         # if we have disassembled the dataset.
-        records = list(self._table.fetch(dataset_id=ref.id))
-
-        results = []
-        for record in records:
-            # Convert name of StorageClass to instance
-            storageClass = self.storageClassFactory.getStorageClass(record["storage_class"])
-            component = record["component"] if (record["component"]
-                                                and record["component"] != NULLSTR) else None
-
-            info = StoredFileInfo(formatter=record["formatter"],
-                                  path=record["path"],
-                                  storageClass=storageClass,
-                                  component=component,
-                                  checksum=record["checksum"],
-                                  file_size=record["file_size"])
-            results.append(info)
+        return [self._recordToInfo(record) for record in self._table.fetch(dataset_id=ref.id)]
+
+    def _getStoredItemsInfoMany(self, refs: Iterable[DatasetIdRef]) -> Dict[int, List[StoredFileInfo]]:
+        """Retrieve information associated with files stored in this
+        `Datastore` for many datasets at once.
+
+        Parameters
+        ----------
+        refs : iterable of `DatasetIdRef`
+            The datasets to look up.
 
+        Returns
+        -------
+        infos : `dict` [ `int`, `list` [ `StoredFileInfo` ] ]
+            Stored information about the files associated with each dataset,
+            keyed by dataset ID.  Datasets with no stored files are omitted.
+        """
+        results: Dict[int, List[StoredFileInfo]] = {}
+        for record in self._table.fetch(dataset_id=[ref.id for ref in refs]):
+            results.setdefault(record["dataset_id"], []).append(self._recordToInfo(record))
         return results
 
+    def _recordToInfo(self, record: Mapping[str, Any]) -> StoredFileInfo:
+        """Convert a row of the opaque records table to a `StoredFileInfo`.
+        """
+        # Convert name of StorageClass to instance
+        storageClass = self.storageClassFactory.getStorageClass(record["storage_class"])
+        component = record["component"] if (record["component"]
+                                            and record["component"] != NULLSTR) else None
+        return StoredFileInfo(formatter=record["formatter"],
+                              path=record["path"],
+                              storageClass=storageClass,
+                              component=component,
+                              checksum=record["checksum"],
+                              file_size=record["file_size"])
+
     def _registered_refs_per_artifact(self, pathInStore: ButlerURI) -> Set[int]:
         """Return all dataset refs associated with the supplied path.
 
@@ -409,18 +524,19 @@ class FileDatastore(GenericBaseDatastore):
         """
         # Get the file information (this will fail if no file)
         records = self.getStoredItemsInfo(ref)
+        return [(self._infoToLocation(r), r) for r in records]
 
+    def _infoToLocation(self, info: StoredFileInfo) -> Location:
+        """Return the `Location` of the file described by stored file
+        information.
+        """
         # Use the path to determine the location -- we need to take
         # into account absolute URIs in the datastore record
-        locations: List[Tuple[Location, StoredFileInfo]] = []
-        for r in records:
-            uriInStore = ButlerURI(r.path, forceAbsolute=False)
-            if uriInStore.isabs():
-                location = Location(None, uriInStore)
-            else:
-                location = self.locationFactory.fromPath(r.path)
-            locations.append((location, r))
-        return locations
+        uriInStore = ButlerURI(info.path, forceAbsolute=False)
+        if uriInStore.isabs():
+            return Location(None, uriInStore)
+        else:
+            return self.locationFactory.fromPath(info.path)
 
     def _can_remove_dataset_artifact(self, ref: DatasetIdRef, location: Location) -> bool:
         """Check that there is only one dataset associated with the
@@ -547,9 +663,66 @@ class FileDatastore(GenericBaseDatastore):
         DatasetTypeNotSupportedError
             The associated `DatasetType` is not handled by this datastore.
         """
-        self._validate_put_parameters(inMemoryDataset, ref)
+        self._validate_put_type(inMemoryDataset, ref)
+        plan = self._getWritePlan(ref)
+        if not plan.acceptable:
+            # Raise rather than use boolean return value.
+            raise DatasetTypeNotSupportedError(f"Dataset {ref} has been rejected by this datastore via"
+                                               " configuration.")
+        assert plan.template is not None and plan.formatterClass is not None
 
         # Work out output file name
+        location = self.locationFactory.fromPath(plan.template.format(ref))
+
+        # Each formatter gets its own copy of the configured parameters, so
+        # one that modifies them cannot affect later puts.
+        storageClass = ref.datasetType.storageClass
+        formatter = plan.formatterClass(FileDescriptor(location, storageClass=storageClass), ref.dataId,
+                                        **copy.deepcopy(plan.formatterKwargs))
+
+        # Now that we know the formatter, update the location
+        location = formatter.makeUpdatedLocation(location)
+
+        return location, formatter
+
+    def _getWritePlan(self, ref: DatasetRef) -> _DatastoreWritePlan:
+        """Return the configuration needed to write a dataset.
+
+        The constraints, template and formatter lookups depend only on the
+        dataset type and the ``instrument`` in the data ID, so they are
+        resolved once and cached.  Cached plans are discarded if a new
+        formatter is registered.
+
+        Parameters
+        ----------
+        ref : `DatasetRef`
+            Reference to the dataset to be written.
+
+        Returns
+        -------
+        plan : `_DatastoreWritePlan`
+            The resolved configuration.
+
+        Raises
+        ------
+        DatasetTypeNotSupportedError
+            Raised if there is no template or formatter for this dataset.
+        FileTemplateValidationError
+            Raised if the template is inconsistent with the dataset type.
+        """
+        key = (ref.datasetType, ref.dataId.get("instrument"))
+        plan = self._writePlans.get(key)
+        if plan is not None and plan.formatterGeneration == self.formatterFactory.generation:
+            countMetric("cache.datastoreWritePlan.hit")
+            return plan
+        countMetric("cache.datastoreWritePlan.miss")
+
+        generation = self.formatterFactory.generation
+        if not self.constraints.isAcceptable(ref):
+            plan = _DatastoreWritePlan(acceptable=False, template=None, formatterClass=None,
+                                       formatterKwargs={}, formatterGeneration=generation)
+            self._writePlans[key] = plan
+            return plan
         try:
             template = self.templates.getTemplate(ref)
         except KeyError as e:
@@ -559,23 +732,16 @@ class FileDatastore(GenericBaseDatastore):
         # dataIds returning the same and causing overwrite confusion.
         template.validateTemplate(ref)
 
-        location = self.locationFactory.fromPath(template.format(ref))
-
-        # Get the formatter based on the storage class
-        storageClass = ref.datasetType.storageClass
         try:
-            formatter = self.formatterFactory.getFormatter(ref,
-                                                           FileDescriptor(location,
-                                                                          storageClass=storageClass),
-                                                           ref.dataId)
+            _, formatterClass, formatterKwargs = self.formatterFactory.getFormatterClassWithMatch(ref)
         except KeyError as e:
             raise DatasetTypeNotSupportedError(f"Unable to find formatter for {ref} in datastore "
                                                f"{self.name}") from e
-
-        # Now that we know the formatter, update the location
-        location = formatter.makeUpdatedLocation(location)
-
-        return location, formatter
+        plan = _DatastoreWritePlan(acceptable=True, template=template, formatterClass=formatterClass,
+                                   formatterKwargs=Config(formatterKwargs).toDict(),
+                                   formatterGeneration=generation)
+        self._writePlans[key] = plan
+        return plan
 
     def _overrideTransferMode(self, *datasets: FileDataset, transfer: Optional[str] = None) -> Optional[str]:
         # Docstring inherited from base class
@@ -741,9 +907,8 @@ class FileDatastore(GenericBaseDatastore):
             # Work out the name we want this ingested file to have
             # inside the datastore
             tgtLocation = self._calculate_ingested_datastore_name(srcUri, ref, formatter)
-            if not tgtLocation.uri.dirname().exists():
-                log.debug("Folder %s does not exist yet.", tgtLocation.uri.dirname())
-                tgtLocation.uri.dirname().mkdir()
+            directory = tgtLocation.uri.dirname()
+            self._ensureDirectory(directory)
 
             # if we are transferring from a local file to a remote location
             # it may be more efficient to get the size and checksum of the
@@ -754,7 +919,11 @@ class FileDatastore(GenericBaseDatastore):
                 have_sized = True
 
             # transfer the resource to the destination
-            tgtLocation.uri.transfer_from(srcUri, transfer=transfer, transaction=self._transaction)
+            try:
+                tgtLocation.uri.transfer_from(srcUri, transfer=transfer, transaction=self._transaction)
+            except Exception:
+                self._forgetDirectory(directory)
+                raise
 
         if tgtLocation is None:
             # This means we are using direct mode
@@ -795,11 +964,24 @@ class FileDatastore(GenericBaseDatastore):
     @transactional
     def _finishIngest(self, prepData: Datastore.IngestPrepData, *, transfer: Optional[str] = None) -> None:
         # Docstring inherited from Datastore._finishIngest.
-        refsAndInfos = []
-        for dataset in prepData.datasets:
+        def extract(dataset: FileDataset) -> StoredFileInfo:
             # Do ingest as if the first dataset ref is associated with the file
-            info = self._extractIngestInfo(dataset.path, dataset.refs[0], formatter=dataset.formatter,
+            return self._extractIngestInfo(dataset.path, dataset.refs[0], formatter=dataset.formatter,
                                            transfer=transfer)
+
+        datasets = prepData.datasets
+        if self.ingestWorkers == 1 or len(datasets) <= 1:
+            infos = [extract(dataset) for dataset in datasets]
+        else:
+            # Transfers register their undo actions with the current
+            # transaction as they complete.  Leaving the executor block waits
+            # for all of them, even if one fails, so a rollback triggered by
+            # the first failure undoes everything that did succeed.
+            with ThreadPoolExecutor(max_workers=self.ingestWorkers,
+                                    thread_name_prefix="FileDatastoreIngest") as executor:
+                infos = list(executor.map(extract, datasets))
+        refsAndInfos = []
+        for dataset, info in zip(datasets, infos):
             refsAndInfos.extend([(ref, info) for ref in dataset.refs])
         self._register_datasets(refsAndInfos)
 
@@ -856,10 +1038,8 @@ class FileDatastore(GenericBaseDatastore):
         """
         location, formatter = self._prepare_for_put(inMemoryDataset, ref)
         uri = location.uri
-
-        if not uri.dirname().exists():
-            log.debug("Folder %s does not exist yet so creating it.", uri.dirname())
-            uri.dirname().mkdir()
+        directory = uri.dirname()
+        self._ensureDirectory(directory)
 
         if self._transaction is None:
             raise RuntimeError("Attempting to write artifact without transaction enabled")
@@ -880,28 +1060,36 @@ class FileDatastore(GenericBaseDatastore):
         # something fails below
         self._transaction.registerUndo("artifactWrite", _removeFileExists, uri)
 
-        # For a local file, simply use the formatter directly
-        if uri.isLocal:
-            formatter.write(inMemoryDataset)
-            log.debug("Successfully wrote python object to local file at %s", uri)
-        else:
-            # This is a remote URI, so first try bytes and write directly else
-            # fallback to a temporary file
-            try:
-                serializedDataset = formatter.toBytes(inMemoryDataset)
-                log.debug("Writing bytes directly to %s", uri)
-                uri.write(serializedDataset, overwrite=True)
-                log.debug("Successfully wrote bytes directly to %s", uri)
-            except NotImplementedError:
-                with tempfile.NamedTemporaryFile(suffix=uri.getExtension()) as tmpFile:
-                    # Need to configure the formatter to write to a different
-                    # location and that needs us to overwrite internals
-                    tmpLocation = Location(*os.path.split(tmpFile.name))
-                    log.debug("Writing dataset to temporary location at %s", tmpLocation.uri)
-                    with formatter._updateLocation(tmpLocation):
-                        formatter.write(inMemoryDataset)
-                    uri.transfer_from(tmpLocation.uri, transfer="copy", overwrite=True)
-                log.debug("Successfully wrote dataset to %s via a temporary file.", uri)
+        try:
+            # For a local file, simply use the formatter directly
+            if uri.isLocal:
+                with timer("formatter.write"):
+                    formatter.write(inMemoryDataset)
+                log.debug("Successfully wrote python object to local file at %s", uri)
+            else:
+                # This is a remote URI, so first try bytes and write directly
+                # else fallback to a temporary file
+                try:
+                    with timer("formatter.toBytes"):
+                        serializedDataset = formatter.toBytes(inMemoryDataset)
+                    log.debug("Writing bytes directly to %s", uri)
+                    uri.write(serializedDataset, overwrite=True)
+                    log.debug("Successfully wrote bytes directly to %s", uri)
+                except NotImplementedError:
+                    with tempfile.NamedTemporaryFile(suffix=uri.getExtension()) as tmpFile:
+                        # Need to configure the formatter to write to a
+                        # different location and that needs us to overwrite
+                        # internals
+                        tmpLocation = Location(*os.path.split(tmpFile.name))
+                        log.debug("Writing dataset to temporary location at %s", tmpLocation.uri)
+                        with formatter._updateLocation(tmpLocation), timer("formatter.write"):
+                            formatter.write(inMemoryDataset)
+                        uri.transfer_from(tmpLocation.uri, transfer="copy", overwrite=True)
+                    log.debug("Successfully wrote dataset to %s via a temporary file.", uri)
+        except Exception:
+            # The directory may have been removed behind our back.
+            self._forgetDirectory(directory)
+            raise
 
         # URI is needed to resolve what ingest case are we dealing with
         return self._extractIngestInfo(uri, ref, formatter=formatter)
@@ -952,8 +1140,9 @@ class FileDatastore(GenericBaseDatastore):
                       f"component {getInfo.component}" if isComponent else "",
                       len(serializedDataset), uri, formatter.name())
             try:
-                result = formatter.fromBytes(serializedDataset,
-                                             component=getInfo.component if isComponent else None)
+                with timer("formatter.fromBytes"):
+                    result = formatter.fromBytes(serializedDataset,
+                                                 component=getInfo.component if isComponent else None)
             except Exception as e:
                 raise ValueError(f"Failure from formatter '{formatter.name()}' for dataset {ref.id}"
                                  f" ({ref.datasetType.name} from {uri}): {e}") from e
@@ -973,7 +1162,7 @@ class FileDatastore(GenericBaseDatastore):
                           f"component {getInfo.component}" if isComponent else "",
                           uri, msg, formatter.name())
                 try:
-                    with formatter._updateLocation(newLocation):
+                    with formatter._updateLocation(newLocation), timer("formatter.read"):
                         result = formatter.read(component=getInfo.component if isComponent else None)
                 except Exception as e:
                     raise ValueError(f"Failure from formatter '{formatter.name()}' for dataset {ref.id}"
@@ -1073,23 +1262,52 @@ class FileDatastore(GenericBaseDatastore):
 
         # If this is a ref that we have written we can get the path.
         # Get file metadata and internal metadata
-        fileLocations = self._get_dataset_locations_info(ref)
+        return self._infosToURIs(ref, self.getStoredItemsInfo(ref))
 
-        if not fileLocations:
+    def _infosToURIs(self, ref: DatasetRef, infos: List[StoredFileInfo]
+                     ) -> Tuple[Optional[ButlerURI], Dict[str, ButlerURI]]:
+        """Convert the stored file information for a dataset into its
+        primary and component URIs.
+        """
+        primary: Optional[ButlerURI] = None
+        components: Dict[str, ButlerURI] = {}
+
+        if not infos:
             raise RuntimeError(f"Unexpectedly got no artifacts for dataset {ref}")
 
-        if len(fileLocations) == 1:
+        if len(infos) == 1:
             # No disassembly so this is the primary URI
-            primary = ButlerURI(fileLocations[0][0].uri)
+            primary = ButlerURI(self._infoToLocation(infos[0]).uri)
 
         else:
-            for location, storedFileInfo in fileLocations:
+            for storedFileInfo in infos:
+                location = self._infoToLocation(storedFileInfo)
                 if storedFileInfo.component is None:
                     raise RuntimeError(f"Unexpectedly got no component name for a component at {location}")
                 components[storedFileInfo.component] = ButlerURI(location.uri)
 
         return primary, components
 
+    def getManyURIs(self, refs: Iterable[DatasetRef], predict: bool = False,
+                    allowMissing: bool = False) -> Dict[DatasetRef, Tuple[Optional[ButlerURI],
+                                                                          Dict[str, ButlerURI]]]:
+        # Docstring inherited from Datastore.
+        # Unlike getURIs, this trusts the datastore records for datasets that
+        # have them instead of checking that every artifact exists, so that
+        # only one query is needed for all of them.
+        refs = list(refs)
+        infos = self._getStoredItemsInfoMany(refs)
+        uris: Dict[DatasetRef, Tuple[Optional[ButlerURI], Dict[str, ButlerURI]]] = {}
+        for ref in refs:
+            fileInfos = infos.get(ref.getCheckedId())
+            if fileInfos:
+                uris[ref] = self._infosToURIs(ref, fileInfos)
+            elif predict:
+                uris[ref] = self.getURIs(ref, predict=True)
+            elif not allowMissing:
+                raise FileNotFoundError(f"Dataset {ref} not in this datastore")
+        return uris
+
     def getURI(self, ref: DatasetRef, predict: bool = False) -> ButlerURI:
         """URI to the Dataset.
 
@@ -1550,7 +1768,8 @@ class FileDatastore(GenericBaseDatastore):
 
     def export(self, refs: Iterable[DatasetRef], *,
                directory: Optional[Union[ButlerURI, str]] = None,
-               transfer: Optional[str] = "auto") -> Iterable[FileDataset]:
+               transfer: Optional[str] = "auto",
+               workers: Optional[int] = None) -> Iterable[FileDataset]:
         # Docstring inherited from Datastore.export.
         if transfer is not None and directory is None:
             raise RuntimeError(f"Cannot export using transfer mode {transfer} with no "
@@ -1566,14 +1785,19 @@ class FileDatastore(GenericBaseDatastore):
             if not directoryUri.exists():
                 raise FileNotFoundError(f"Export location {directory} does not exist")
 
+        refs = list(refs)
+        infos = self._getStoredItemsInfoMany(refs)
+        exports = []
+        transfers: List[Tuple[ButlerURI, ButlerURI]] = []
         for ref in refs:
-            fileLocations = self._get_dataset_locations_info(ref)
-            if not fileLocations:
+            fileInfos = infos.get(ref.getCheckedId())
+            if not fileInfos:
                 raise FileNotFoundError(f"Could not retrieve dataset {ref}.")
             # For now we can not export disassembled datasets
-            if len(fileLocations) > 1:
+            if len(fileInfos) > 1:
                 raise NotImplementedError(f"Can not export disassembled datasets such as {ref}")
-            location, storedFileInfo = fileLocations[0]
+            storedFileInfo = fileInfos[0]
+            location = self._infoToLocation(storedFileInfo)
 
             pathInStore = location.pathInStore.path
             if transfer is None:
@@ -1598,13 +1822,44 @@ class FileDatastore(GenericBaseDatastore):
                     template = self.templates.getTemplate(ref)
                     pathInStore = template.format(ref)
 
-                exportUri = directoryUri.join(pathInStore)
-                exportUri.transfer_from(storeUri, transfer=transfer)
+                transfers.append((directoryUri.join(pathInStore), storeUri))
+
+            exports.append(FileDataset(refs=[ref], path=pathInStore, formatter=storedFileInfo.formatter))
 
-            yield FileDataset(refs=[ref], path=pathInStore, formatter=storedFileInfo.formatter)
+        if transfer is not None and transfers:
+            self._transferArtifacts(transfers, transfer=transfer, workers=workers)
+        return exports
+
+    @staticmethod
+    def _transferArtifacts(transfers: List[Tuple[ButlerURI, ButlerURI]], *, transfer: str,
+                           workers: Optional[int] = None) -> None:
+        """Transfer file artifacts, possibly in parallel.
+
+        Parameters
+        ----------
+        transfers : `list` [ `tuple` [ `ButlerURI`, `ButlerURI` ] ]
+            Pairs of (destination, source) URIs.
+        transfer : `str`
+            Transfer mode passed to `ButlerURI.transfer_from`.
+        workers : `int`, optional
+            Maximum number of threads to use.  If `None`, the
+            `concurrent.futures.ThreadPoolExecutor` default is used; if ``1``,
+            all transfers are performed serially in the calling thread.
+        """
+        if workers == 1 or len(transfers) == 1:
+            for target, source in transfers:
+                target.transfer_from(source, transfer=transfer)
+            return
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="FileDatastoreExport") as executor:
+            futures = [executor.submit(target.transfer_from, source, transfer=transfer)
+                       for target, source in transfers]
+            # Wait for everything and re-raise the first failure, if any.
+            for future in futures:
+                future.result()
 
     @staticmethod
-    def computeChecksum(uri: ButlerURI, algorithm: str = "blake2b", block_size: int = 8192) -> Optional[str]:
+    def computeChecksum(uri: ButlerURI, algorithm: str = "blake2b",
+                        block_size: int = 1 << 20) -> Optional[str]:
         """Compute the checksum of the supplied file.
 
         Parameters
@@ -1634,9 +1889,16 @@ class FileDatastore(GenericBaseDatastore):
 
         hasher = hashlib.new(algorithm)
 
+        # Read into a single reusable buffer to avoid allocating a new bytes
+        # object for every block.
+        buffer = bytearray(block_size)
+        view = memoryview(buffer)
         with uri.as_local() as local_uri:
-            with open(local_uri.ospath, "rb") as f:
-                for chunk in iter(lambda: f.read(block_size), b""):
-                    hasher.update(chunk)
+            with open(local_uri.ospath, "rb", buffering=0) as f:
+                while True:
+                    n = f.readinto(buffer)
+                    if not n:
+                        break
+                    hasher.update(view[:n])
 
         return hasher.hexdigest()
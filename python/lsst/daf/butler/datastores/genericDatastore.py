@@ -200,13 +200,7 @@ class GenericBaseDatastore(Datastore):
         ref : `DatasetRef`
             Reference to the associated Dataset.
         """
-        storageClass = ref.datasetType.storageClass
-
-        # Sanity check
-        if not isinstance(inMemoryDataset, storageClass.pytype):
-            raise TypeError("Inconsistency between supplied object ({}) "
-                            "and storage class type ({})".format(type(inMemoryDataset),
-                                                                 storageClass.pytype))
+        self._validate_put_type(inMemoryDataset, ref)
 
         # Confirm that we can accept this dataset
         if not self.constraints.isAcceptable(ref):
@@ -216,6 +210,28 @@ class GenericBaseDatastore(Datastore):
 
         return
 
+    def _validate_put_type(self, inMemoryDataset: Any, ref: DatasetRef) -> None:
+        """Check that the object to be stored matches the storage class of
+        the dataset.
+
+        Parameters
+        ----------
+        inMemoryDataset : `object`
+            The dataset to store.
+        ref : `DatasetRef`
+            Reference to the associated Dataset.
+
+        Raises
+        ------
+        TypeError
+            Supplied object and storage class are inconsistent.
+        """
+        storageClass = ref.datasetType.storageClass
+        if not isinstance(inMemoryDataset, storageClass.pytype):
+            raise TypeError("Inconsistency between supplied object ({}) "
+                            "and storage class type ({})".format(type(inMemoryDataset),
+                                                                 storageClass.pytype))
+
     def remove(self, ref: DatasetRef) -> None:
         """Indicate to the Datastore that a dataset can be removed.
 
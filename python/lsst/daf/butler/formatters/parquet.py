@@ -35,28 +35,43 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Tuple,
     Union,
 )
 
 import pyarrow.parquet as pq
 import pandas as pd
 import pyarrow as pa
+import pyarrow.dataset as pds
 
 from lsst.daf.butler.core.utils import iterable
 from lsst.daf.butler import Formatter
 
 
 class _ParquetLoader:
-    """Helper class for loading Parquet files into `pandas.DataFrame`
-    instances.
+    """Helper class for loading Parquet files into `pandas.DataFrame` or
+    `pyarrow.Table` instances.
 
     Parameters
     ----------
     path : `str`
         Full path to the file to be loaded.
+    memoryMap : `bool`, optional
+        If `True` (default), memory-map the file instead of reading it into
+        buffers, so only the pages that back the requested row groups and
+        columns are ever read from disk.
+
+    Notes
+    -----
+    The file is opened once, here, and all reads (including the lazy ones
+    done by `iterBatches`) go through that open file, so they keep working
+    if the path is removed afterwards, as happens to the temporary local
+    copies of remote datasets.
     """
-    def __init__(self, path: str):
-        self.file = pq.ParquetFile(path)
+    def __init__(self, path: str, memoryMap: bool = True):
+        self.path = path
+        self.source = pa.memory_map(path) if memoryMap else pa.OSFile(path)
+        self.file = pq.ParquetFile(self.source)
         self.md = json.loads(self.file.metadata.metadata[b"pandas"])
         indexes = self.md["column_indexes"]
         if len(indexes) == 1:
@@ -135,39 +150,186 @@ class _ParquetLoader:
                                          f"for index {self.indexLevelNames[i]!r}.")
                 yield str(requested)
 
-    def read(self, columns: Union[str, List[str], List[tuple],
-                                  Dict[str, Union[str, List[str]]]] = None) -> pd.DataFrame:
-        """Read some or all of the Parquet file into a `pandas.DataFrame`
-        instance.
+    def _standardizeColumns(
+        self, columns: Union[str, List[str], List[tuple], Dict[str, Union[str, List[str]]], None]
+    ) -> Optional[List[str]]:
+        """Validate a ``columns`` read parameter and transform it into the
+        list of column names understood by PyArrow.
 
         Parameters
         ----------
-        columns:  : `dict`, `list`, or `str`, optional
+        columns : `dict`, `list`, `str`, or `None`
             A description of the columns to be loaded.  See
             :ref:`lsst.daf.butler-concrete_storage_classes_dataframe`.
 
         Returns
         -------
-        df : `pandas.DataFrame`
-            A Pandas DataFrame.
+        names : `list` [ `str` ] or `None`
+            Names of the columns to read, or `None` to read all columns.
         """
         if columns is None:
-            return self.file.read(use_pandas_metadata=True).to_pandas()
+            return None
         elif isinstance(self.columns, pd.MultiIndex):
             assert isinstance(columns, dict) or isinstance(columns, list)
-            columns = list(self._standardizeColumnParameter(columns))
+            return list(self._standardizeColumnParameter(columns))
         else:
+            if isinstance(columns, str):
+                columns = [columns]
             for column in columns:
                 if column not in self.columns:
                     raise ValueError(f"Unrecognized column name {column!r}.")
-        return self.file.read(columns=columns, use_pandas_metadata=True).to_pandas()
+            return list(columns)
+
+    def _standardizeRowGroups(self, rowGroups: Union[int, Iterable[int], None]) -> Optional[List[int]]:
+        """Validate a ``rowGroups`` read parameter.
+
+        Parameters
+        ----------
+        rowGroups : `int`, `~collections.abc.Iterable` [ `int` ], or `None`
+            Index or indices of the row groups to read.
+
+        Returns
+        -------
+        rowGroups : `list` [ `int` ] or `None`
+            Indices of the row groups to read, or `None` to read all of them.
+        """
+        if rowGroups is None:
+            return None
+        rowGroups = list(iterable(rowGroups))
+        for i in rowGroups:
+            if not 0 <= i < self.file.num_row_groups:
+                raise ValueError(f"Row group {i} out of range; file has {self.file.num_row_groups}.")
+        return rowGroups
+
+    def _filterFragment(self, columns: Optional[List[str]],
+                        rowGroups: Optional[List[int]]) -> Tuple[Any, Optional[List[str]]]:
+        """Return a `pyarrow.dataset` fragment for this file, for use with
+        row filters.
+
+        Parameters
+        ----------
+        columns : `list` [ `str` ] or `None`
+            Standardized names of the columns to read.
+        rowGroups : `list` [ `int` ] or `None`
+            Standardized indices of the row groups to read.
+
+        Returns
+        -------
+        fragment : `pyarrow.dataset.ParquetFileFragment`
+            Fragment restricted to the requested row groups.
+        columns : `list` [ `str` ] or `None`
+            Names of the columns to read, including any columns that back
+            the pandas index.
+        """
+        fragment = pds.ParquetFileFormat().make_fragment(self.source)
+        if rowGroups is not None:
+            fragment = fragment.subset(row_group_ids=rowGroups)
+        if columns is not None:
+            # Unlike ParquetFile.read, fragments do not add the columns that
+            # back the pandas index themselves.
+            columns = columns + [name for name in self.md["index_columns"]
+                                 if isinstance(name, str) and name not in columns]
+        return fragment, columns
+
+    def readArrow(self, columns: Union[str, List[str], List[tuple],
+                                       Dict[str, Union[str, List[str]]]] = None,
+                  rowGroups: Union[int, Iterable[int], None] = None,
+                  filters: Optional[List[Any]] = None) -> pa.Table:
+        """Read some or all of the Parquet file into a `pyarrow.Table`
+        instance.
+
+        Parameters
+        ----------
+        columns : `dict`, `list`, or `str`, optional
+            A description of the columns to be loaded.  See
+            :ref:`lsst.daf.butler-concrete_storage_classes_dataframe`.
+        rowGroups : `int` or `~collections.abc.Iterable` [ `int` ], optional
+            Index or indices of the row groups to load.
+        filters : `list`, optional
+            Row filters in the disjunctive normal form understood by
+            `pyarrow.parquet.read_table`.  Row groups whose statistics rule
+            out any matches are not read.
+
+        Returns
+        -------
+        table : `pyarrow.Table`
+            An Arrow table, with pandas metadata.
+        """
+        columns = self._standardizeColumns(columns)
+        rowGroups = self._standardizeRowGroups(rowGroups)
+        if filters:
+            fragment, columns = self._filterFragment(columns, rowGroups)
+            return fragment.to_table(filter=pq.filters_to_expression(filters), columns=columns)
+        if rowGroups is not None:
+            return self.file.read_row_groups(rowGroups, columns=columns, use_pandas_metadata=True)
+        return self.file.read(columns=columns, use_pandas_metadata=True)
+
+    def iterBatches(self, columns: Union[str, List[str], List[tuple],
+                                         Dict[str, Union[str, List[str]]]] = None,
+                    rowGroups: Union[int, Iterable[int], None] = None,
+                    filters: Optional[List[Any]] = None,
+                    batchSize: int = 65536) -> Iterator[pa.RecordBatch]:
+        """Read some or all of the Parquet file incrementally.
+
+        Parameters
+        ----------
+        columns : `dict`, `list`, or `str`, optional
+            A description of the columns to be loaded.  See
+            :ref:`lsst.daf.butler-concrete_storage_classes_dataframe`.
+        rowGroups : `int` or `~collections.abc.Iterable` [ `int` ], optional
+            Index or indices of the row groups to load.
+        filters : `list`, optional
+            Row filters in the disjunctive normal form understood by
+            `pyarrow.parquet.read_table`.
+        batchSize : `int`, optional
+            Maximum number of rows in each batch.
+
+        Returns
+        -------
+        batches : `~collections.abc.Iterator` [ `pyarrow.RecordBatch` ]
+            Iterator over record batches.  The file is only read as the
+            iterator is consumed.
+        """
+        columns = self._standardizeColumns(columns)
+        rowGroups = self._standardizeRowGroups(rowGroups)
+        if filters:
+            fragment, columns = self._filterFragment(columns, rowGroups)
+            return iter(fragment.to_batches(filter=pq.filters_to_expression(filters), columns=columns,
+                                            batch_size=batchSize))
+        return self.file.iter_batches(batch_size=batchSize, row_groups=rowGroups, columns=columns,
+                                      use_pandas_metadata=True)
+
+    def read(self, columns: Union[str, List[str], List[tuple],
+                                  Dict[str, Union[str, List[str]]]] = None,
+             rowGroups: Union[int, Iterable[int], None] = None,
+             filters: Optional[List[Any]] = None) -> pd.DataFrame:
+        """Read some or all of the Parquet file into a `pandas.DataFrame`
+        instance.
+
+        Parameters
+        ----------
+        columns : `dict`, `list`, or `str`, optional
+            A description of the columns to be loaded.  See
+            :ref:`lsst.daf.butler-concrete_storage_classes_dataframe`.
+        rowGroups : `int` or `~collections.abc.Iterable` [ `int` ], optional
+            Index or indices of the row groups to load.
+        filters : `list`, optional
+            Row filters in the disjunctive normal form understood by
+            `pyarrow.parquet.read_table`.
+
+        Returns
+        -------
+        df : `pandas.DataFrame`
+            A Pandas DataFrame.
+        """
+        return self.readArrow(columns, rowGroups=rowGroups, filters=filters).to_pandas()
 
 
-def _writeParquet(path: str, inMemoryDataset: pd.DataFrame) -> None:
+def _writeParquet(path: str, inMemoryDataset: pd.DataFrame, rowGroupSize: Optional[int] = None) -> None:
     """Write a `pandas.DataFrame` instance as a Parquet file.
     """
     table = pa.Table.from_pandas(inMemoryDataset)
-    pq.write_table(table, path, compression="none")
+    pq.write_table(table, path, compression="none", row_group_size=rowGroupSize)
 
 
 class ParquetFormatter(Formatter):
@@ -176,9 +338,12 @@ class ParquetFormatter(Formatter):
 
     This formatter is for the
     :ref:`lsst.daf.butler-concrete_storage_classes_dataframe` StorageClass.
+    Its ``arrowTable`` and ``recordBatches`` derived components skip the
+    conversion to pandas.
     """
 
     extension = ".parq"
+    supportedWriteParameters = frozenset({"row_group_size"})
 
     def read(self, component: Optional[str] = None) -> Any:
         # Docstring inherited from Formatter.read.
@@ -186,12 +351,18 @@ class ParquetFormatter(Formatter):
         if component == "columns":
             return loader.columns
 
-        if not self.fileDescriptor.parameters:
-            return loader.read()
+        parameters = dict(self.fileDescriptor.parameters or {})
+        batchSize = parameters.pop("batchSize", None)
+        if component == "recordBatches":
+            if batchSize is not None:
+                parameters["batchSize"] = batchSize
+            return loader.iterBatches(**parameters)
+        elif component == "arrowTable":
+            return loader.readArrow(**parameters)
 
-        return loader.read(**self.fileDescriptor.parameters)
+        return loader.read(**parameters)
 
     def write(self, inMemoryDataset: Any) -> None:
         # Docstring inherited from Formatter.write.
         location = self.makeUpdatedLocation(self.fileDescriptor.location)
-        _writeParquet(location.path, inMemoryDataset)
+        _writeParquet(location.path, inMemoryDataset, rowGroupSize=self.writeParameters.get("row_group_size"))
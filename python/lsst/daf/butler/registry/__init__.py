@@ -19,21 +19,47 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from ._config import *
-from ._defaults import *
-from ._exceptions import *
-from ._registry import *
-from ._dbAuth import *
-from ._collectionType import *
-
-from . import wildcards
-from .wildcards import CollectionSearch
-from . import interfaces
-from . import managers
-from . import queries
-from . import summaries
-
-# Some modules intentionally not imported, either because they are purely
+# Symbols are imported on first access (PEP 562); see the comment in
+# lsst.daf.butler.core.__init__.
+
+from typing import TYPE_CHECKING
+
+from ..core._lazyImport import lazyAttributes
+
+__all__, __getattr__, __dir__ = lazyAttributes(
+    __name__,
+    {
+        "._config": ("RegistryConfig",),
+        "._defaults": ("RegistryDefaults",),
+        "._exceptions": ("ConflictingDefinitionError", "InconsistentDataIdError", "MissingCollectionError",
+                         "OrphanedRecordError"),
+        "._registry": ("Registry",),
+        "._dbAuth": ("DbAuth", "DbAuthError", "DbAuthPermissionsError"),
+        "._collectionType": ("CollectionType",),
+        ".wildcards": ("CollectionSearch",),
+    },
+    submodules=("wildcards", "interfaces", "managers", "queries", "summaries"),
+)
+
+if TYPE_CHECKING:
+    from ._config import *
+    from ._defaults import *
+    from ._exceptions import *
+    from ._registry import *
+    from ._dbAuth import *
+    from ._collectionType import *
+
+    from . import wildcards
+    from .wildcards import CollectionSearch
+    from . import interfaces
+    from . import managers
+    from . import queries
+    from . import summaries
+
+# Keep the names used above out of the package namespace.
+del TYPE_CHECKING, lazyAttributes
+
+# Some modules intentionally not exported, either because they are purely
 # internal (e.g. nameShrinker.py) or they contain implementations that are
 # always loaded from configuration strings (e.g. databases subpackage,
 # opaque.py, ...).
@@ -37,6 +37,7 @@ from typing import (
     Mapping,
     Optional,
     Set,
+    Tuple,
     TYPE_CHECKING,
     Union,
 )
@@ -48,6 +49,7 @@ from ..core import (
     Config,
     DataCoordinate,
     DataCoordinateIterable,
+    DataCoordinateSet,
     DataId,
     DatasetAssociation,
     DatasetRef,
@@ -59,6 +61,7 @@ from ..core import (
     DimensionGraph,
     DimensionRecord,
     DimensionUniverse,
+    NamedKeyDict,
     NamedKeyMapping,
     NameLookupMapping,
     StorageClassFactory,
@@ -168,14 +171,16 @@ class Registry:
         DatabaseClass = config.getDatabaseClass()
         database = DatabaseClass.fromUri(str(config.connectionString), origin=config.get("origin", 0),
                                          namespace=config.get("namespace"))
+        cls._configureQueryTracing(database, config)
         managerTypes = RegistryManagerTypes.fromConfig(config)
         managers = managerTypes.makeRepo(database, dimensionConfig)
+        cls._configureCaches(managers, config)
         return cls(database, RegistryDefaults(), managers)
 
     @classmethod
     def fromConfig(cls, config: Union[ButlerConfig, RegistryConfig, Config, str],
                    butlerRoot: Optional[Union[str, ButlerURI]] = None, writeable: bool = True,
-                   defaults: Optional[RegistryDefaults] = None) -> Registry:
+                   defaults: Optional[RegistryDefaults] = None, upgrade: bool = False) -> Registry:
         """Create `Registry` subclass instance from `config`.
 
         Registry database must be inbitialized prior to calling this method.
@@ -191,6 +196,10 @@ class Registry:
         defaults : `RegistryDefaults`, optional
             Default collection search path and/or output `~CollectionType.RUN`
             collection.
+        upgrade : `bool`, optional
+            If `True`, upgrade the repository's schema if it was created with
+            older minor versions of the configured managers.  Older clients
+            may no longer be able to use the repository afterwards.
 
         Returns
         -------
@@ -206,12 +215,54 @@ class Registry:
         DatabaseClass = config.getDatabaseClass()
         database = DatabaseClass.fromUri(str(config.connectionString), origin=config.get("origin", 0),
                                          namespace=config.get("namespace"), writeable=writeable)
+        cls._configureQueryTracing(database, config)
         managerTypes = RegistryManagerTypes.fromConfig(config)
-        managers = managerTypes.loadRepo(database)
+        managers = managerTypes.loadRepo(database, upgrade=upgrade)
+        cls._configureCaches(managers, config)
         if defaults is None:
             defaults = RegistryDefaults()
         return cls(database, defaults, managers)
 
+    @staticmethod
+    def _configureCaches(managers: RegistryManagerInstances, config: RegistryConfig) -> None:
+        """Apply cache-related configuration options to a new set of manager
+        instances.
+
+        Parameters
+        ----------
+        managers : `RegistryManagerInstances`
+            Manager instances for the new registry.
+        config : `RegistryConfig`
+            Registry configuration.  The optional ``dimensionRecordCacheSize``
+            key sets the maximum number of dimension records to cache (`None`
+            for no limit).
+        """
+        recordCache = managers.dimensions.recordCache
+        if recordCache is not None and "dimensionRecordCacheSize" in config:
+            recordCache.maxSize = config["dimensionRecordCacheSize"]
+
+    @staticmethod
+    def _configureQueryTracing(database: Database, config: RegistryConfig) -> None:
+        """Apply slow-query logging configuration options to a new database
+        instance.
+
+        Parameters
+        ----------
+        database : `Database`
+            Database for the new registry.
+        config : `RegistryConfig`
+            Registry configuration.  The optional ``slowQueryThreshold`` key
+            sets the time in seconds above which queries are logged, and the
+            optional ``explainSlowQueries`` key may be `True` to log their
+            query plans as well, or ``"analyze"`` to include actual row counts
+            and times in the plans (see `Database.setQueryTracing`).
+        """
+        threshold = config.get("slowQueryThreshold")
+        if threshold is None:
+            return
+        explain = config.get("explainSlowQueries", False)
+        database.setQueryTracing(float(threshold), explain=bool(explain), analyze=(explain == "analyze"))
+
     def __init__(self, database: Database, defaults: RegistryDefaults, managers: RegistryManagerInstances):
         self._db = database
         self._managers = managers
@@ -294,6 +345,16 @@ class Registry:
         """
         self._managers.refresh()
 
+    def close(self) -> None:
+        """Close the database connection used by this registry.
+
+        Notes
+        -----
+        Neither this registry nor any created from it with `copy` (which
+        share its connection) may be used after this is called.
+        """
+        self._db.close()
+
     @contextlib.contextmanager
     def transaction(self, *, savepoint: bool = False) -> Iterator[None]:
         """Return a context manager that represents a transaction.
@@ -351,7 +412,8 @@ class Registry:
             Additional keyword arguments are interpreted as equality
             constraints that restrict the returned rows (combined with AND);
             keyword arguments are column names and values are the values they
-            must have.
+            must have.  Values that are `list`, `tuple`, `set`, or `frozenset`
+            instances instead match any of their elements.
 
         Yields
         ------
@@ -728,15 +790,44 @@ class Registry:
             collections = self.defaults.collections
         else:
             collections = CollectionSearch.fromExpression(collections)
-        for collectionRecord in collections.iter(self._managers.collections):
-            if (collectionRecord.type is CollectionType.CALIBRATION
-                    and (not storage.datasetType.isCalibration() or timespan is None)):
+        collectionRecords = [
+            collectionRecord for collectionRecord in collections.iter(self._managers.collections)
+            if (collectionRecord.type is not CollectionType.CALIBRATION
+                or (storage.datasetType.isCalibration() and timespan is not None))
+        ]
+        # Skip collections whose cached summaries say they cannot hold this
+        # dataset type with this data ID's governor values, without querying
+        # them.
+        governors = NamedKeyDict({dimension: {dataId[dimension]} for dimension in dataId.graph.governors})
+        pruned = self._managers.datasets.findIncompatibleCollections(storage.datasetType, collectionRecords,
+                                                                     governors, checkDatabase=False)
+        result = None
+        end = len(collectionRecords)
+        for n, collectionRecord in enumerate(collectionRecords):
+            if collectionRecord.key in pruned:
                 continue
             result = storage.find(collectionRecord, dataId, timespan=timespan)
             if result is not None:
-                return result
-
-        return None
+                end = n
+                break
+        # Another client may have added datasets to the skipped collections
+        # since their summaries were cached, so check those that precede the
+        # match (if any) against the database, and search the ones that now
+        # might hold the dataset, in order.
+        skipped = [collectionRecord for collectionRecord in collectionRecords[:end]
+                   if collectionRecord.key in pruned]
+        if skipped:
+            pruned = self._managers.datasets.findIncompatibleCollections(storage.datasetType, skipped,
+                                                                         governors)
+            _LOG.debug("findDataset for %s skipping %d of %d collection(s) using collection summaries.",
+                       storage.datasetType.name, len(pruned), len(collectionRecords))
+            for collectionRecord in skipped:
+                if collectionRecord.key in pruned:
+                    continue
+                earlier = storage.find(collectionRecord, dataId, timespan=timespan)
+                if earlier is not None:
+                    return earlier
+        return result
 
     @transactional
     def insertDatasets(self, datasetType: Union[DatasetType, str], dataIds: Iterable[DataId],
@@ -821,6 +912,30 @@ class Registry:
             return None
         return ref
 
+    def getDatasets(self, ids: Iterable[int]) -> List[Optional[DatasetRef]]:
+        """Retrieve many Dataset entries at once.
+
+        Parameters
+        ----------
+        ids : `Iterable` [ `int` ]
+            The unique identifiers for the datasets.
+
+        Returns
+        -------
+        refs : `list` [ `DatasetRef` or `None` ]
+            Resolved refs to the Datasets, in the same order as ``ids``, with
+            `None` for any ID for which no matching Dataset was found.
+
+        Notes
+        -----
+        This is equivalent to calling `getDataset` for each ID, but issues
+        a small number of queries for the whole batch (grouped by dataset
+        type) instead of two queries per ID.
+        """
+        idList = list(ids)
+        refs = self._managers.datasets.getDatasetRefs(idList)
+        return [refs.get(id) for id in idList]
+
     @transactional
     def removeDatasets(self, refs: Iterable[DatasetRef]) -> None:
         """Remove datasets from the Registry.
@@ -966,6 +1081,47 @@ class Registry:
             storage = self._managers.datasets[datasetType.name]
             storage.certify(collectionRecord, refsForType, timespan)
 
+    @transactional
+    def certifyMany(self, collection: str,
+                    associations: Iterable[Tuple[Iterable[DatasetRef], Timespan]]) -> None:
+        """Associate datasets with a calibration collection and several
+        validity ranges within it.
+
+        This is equivalent to calling `certify` once for each validity range,
+        but checks for conflicts and inserts the new associations in bulk.
+
+        Parameters
+        ----------
+        collection : `str`
+            The name of an already-registered `~CollectionType.CALIBRATION`
+            collection.
+        associations : `Iterable` [ `tuple` ]
+            Tuples of ``(refs, timespan)``, where ``refs`` is an iterable of
+            `DatasetRef` to be associated with the validity range ``timespan``
+            (a `Timespan`).
+
+        Raises
+        ------
+        AmbiguousDatasetError
+            Raised if any of the given `DatasetRef` instances is unresolved.
+        ConflictingDefinitionError
+            Raised if the collection already contains a different dataset with
+            the same `DatasetType` and data ID and an overlapping validity
+            range, or if two of the given datasets do.
+        TypeError
+            Raised if ``collection`` is not a `~CollectionType.CALIBRATION`
+            collection or if one or more datasets are of a dataset type for
+            which `DatasetType.isCalibration` returns `False`.
+        """
+        collectionRecord = self._managers.collections.find(collection)
+        byType: Dict[DatasetType, List[Tuple[List[DatasetRef], Timespan]]] = defaultdict(list)
+        for refs, timespan in associations:
+            for datasetType, refsForType in DatasetRef.groupByType(refs).items():
+                byType[datasetType].append((refsForType, timespan))
+        for datasetType, associationsForType in byType.items():
+            storage = self._managers.datasets[datasetType.name]
+            storage.certifyMany(collectionRecord, associationsForType)
+
     @transactional
     def decertify(self, collection: str, datasetType: Union[str, DatasetType], timespan: Timespan, *,
                   dataIds: Optional[Iterable[DataId]] = None) -> None:
@@ -1204,6 +1360,87 @@ class Registry:
         storage = self._managers.dimensions[element]  # type: ignore
         return storage.sync(record)
 
+    def syncManyDimensionData(self, element: Union[DimensionElement, str],
+                              *data: Union[Mapping[str, Any], DimensionRecord],
+                              conform: bool = True) -> List[bool]:
+        """Synchronize many dimension records with the database, inserting
+        those that do not already exist and comparing values for those that
+        do.
+
+        This is equivalent to calling `syncDimensionData` on each record
+        within a single transaction, but is much more efficient for large
+        numbers of records.
+
+        Parameters
+        ----------
+        element : `DimensionElement` or `str`
+            The `DimensionElement` or name thereof that identifies the table
+            records will be inserted into.
+        data : `dict` or `DimensionRecord` (variadic)
+            One or more records to synchronize.
+        conform : `bool`, optional
+            If `False` (`True` is default) perform no checking or conversions,
+            and assume that ``element`` is a `DimensionElement` instance and
+            ``data`` is a one or more `DimensionRecord` instances of the
+            appropriate subclass.
+
+        Returns
+        -------
+        inserted : `list` [ `bool` ]
+            For each given record, `True` if a new row was inserted, `False`
+            otherwise.
+
+        Raises
+        ------
+        ConflictingDefinitionError
+            Raised if a record exists in the database (according to primary
+            key lookup) but is inconsistent with the given one.  No records
+            are inserted in this case.
+        """
+        if conform:
+            if isinstance(element, str):
+                element = self.dimensions[element]
+            records = [row if isinstance(row, DimensionRecord) else element.RecordClass(**row)
+                       for row in data]
+        else:
+            # Ignore typing since caller said to trust them with conform=False.
+            records = data  # type: ignore
+        storage = self._managers.dimensions[element]  # type: ignore
+        return storage.syncMany(records)
+
+    def fetchDimensionData(self, element: Union[DimensionElement, str],
+                           dataIds: Iterable[DataCoordinate]) -> Iterator[DimensionRecord]:
+        """Fetch the records for many data IDs of a single dimension element.
+
+        Parameters
+        ----------
+        element : `DimensionElement` or `str`
+            The `DimensionElement` or name thereof that identifies the table
+            records will be fetched from.
+        dataIds : iterable of `DataCoordinate`
+            Data IDs that identify the records to fetch.  Each must have
+            exactly the required dimensions of ``element``.
+
+        Returns
+        -------
+        records : `Iterator` [ `DimensionRecord` ]
+            Records for the given data IDs, in no particular order.  Data IDs
+            with no record in the database are silently skipped.
+
+        Notes
+        -----
+        This is much more efficient than calling `expandDataId` on each data
+        ID, as all records are fetched with a small number of queries.
+        """
+        if isinstance(element, str):
+            element = self.dimensions[element]
+        dataIdSet = DataCoordinateSet(frozenset(dataIds), graph=element.graph, hasFull=False,
+                                      hasRecords=False, check=False)
+        if not dataIdSet:
+            return iter(())
+        storage = self._managers.dimensions[element]
+        return iter(storage.fetch(dataIdSet))
+
     def queryDatasetTypes(self, expression: Any = ..., *, components: Optional[bool] = None
                           ) -> Iterator[DatasetType]:
         """Iterate over the dataset types whose names match an expression.
@@ -126,6 +126,19 @@ class MonolithicDatastoreRegistryBridge(DatastoreRegistryBridge):
         super().__init__(datastoreName)
         self._db = db
         self._tables = tables
+        # Prepared query for the common case of checking a moderate number of
+        # datasets; see `check`.
+        location = self._tables.dataset_location
+        self._checkQuery = sqlalchemy.sql.select(
+            [location.columns.dataset_id]
+        ).select_from(
+            location
+        ).where(
+            sqlalchemy.sql.and_(
+                location.columns.datastore_name == self.datastoreName,
+                location.columns.dataset_id.in_(sqlalchemy.sql.bindparam("dataset_ids", expanding=True)),
+            )
+        )
 
     def _refsToRows(self, refs: Iterable[DatasetIdRef]) -> List[dict]:
         """Transform an iterable of `DatasetRef` or `FakeDatasetRef` objects to
@@ -150,54 +163,77 @@ class MonolithicDatastoreRegistryBridge(DatastoreRegistryBridge):
 
     def moveToTrash(self, refs: Iterable[DatasetIdRef]) -> None:
         # Docstring inherited from DatastoreRegistryBridge
-        # TODO: avoid self.check() call via queries like
-        #     INSERT INTO dataset_location_trash
-        #         SELECT datastore_name, dataset_id FROM dataset_location
-        #         WHERE datastore_name=? AND dataset_id IN (?);
-        #     DELETE FROM dataset_location
-        #         WHERE datastore_name=? AND dataset_id IN (?);
-        # ...but the Database interface doesn't support those kinds of queries
-        # right now.
-        rows = self._refsToRows(self.check(refs))
+        location = self._tables.dataset_location
+        ids = [ref.getCheckedId() for ref in refs]
         with self._db.transaction():
-            self._db.delete(self._tables.dataset_location, ["datastore_name", "dataset_id"], *rows)
-            self._db.insert(self._tables.dataset_location_trash, *rows)
+            with self._db.inClauses(location.columns.dataset_id, ids) as inClauses:
+                for inClause in inClauses:
+                    where = sqlalchemy.sql.and_(
+                        location.columns.datastore_name == self.datastoreName,
+                        inClause,
+                    )
+                    self._db.insert(
+                        self._tables.dataset_location_trash,
+                        select=sqlalchemy.sql.select(
+                            [location.columns.datastore_name, location.columns.dataset_id]
+                        ).select_from(location).where(where),
+                    )
+                    self._db.deleteWhere(location, where)
 
     def check(self, refs: Iterable[DatasetIdRef]) -> Iterable[DatasetIdRef]:
         # Docstring inherited from DatastoreRegistryBridge
         byId = {ref.getCheckedId(): ref for ref in refs}
-        sql = sqlalchemy.sql.select(
-            [self._tables.dataset_location.columns.dataset_id]
-        ).select_from(
-            self._tables.dataset_location
-        ).where(
-            sqlalchemy.sql.and_(
-                self._tables.dataset_location.columns.datastore_name == self.datastoreName,
-                self._tables.dataset_location.columns.dataset_id.in_(byId.keys())
-            )
-        )
-        for row in self._db.query(sql).fetchall():
-            yield byId[row["dataset_id"]]
+        if len(byId) <= self._db.IN_CLAUSE_MAX_SIZE:
+            if byId:
+                for row in self._db.queryPrepared(self._checkQuery, dataset_ids=list(byId)).fetchall():
+                    yield byId[row["dataset_id"]]
+            return
+        # Fetch everything before yielding, since the IN clauses may use a
+        # temporary table that must not outlive this call.
+        found = []
+        location = self._tables.dataset_location
+        with self._db.inClauses(location.columns.dataset_id, byId.keys()) as inClauses:
+            for inClause in inClauses:
+                sql = sqlalchemy.sql.select(
+                    [location.columns.dataset_id]
+                ).select_from(
+                    location
+                ).where(
+                    sqlalchemy.sql.and_(
+                        location.columns.datastore_name == self.datastoreName,
+                        inClause,
+                    )
+                )
+                found.extend(row["dataset_id"] for row in self._db.query(sql).fetchall())
+        for id in found:
+            yield byId[id]
 
     @contextmanager
     def emptyTrash(self) -> Iterator[Iterable[DatasetIdRef]]:
         # Docstring inherited from DatastoreRegistryBridge
+        trash = self._tables.dataset_location_trash
         sql = sqlalchemy.sql.select(
-            [self._tables.dataset_location_trash.columns.dataset_id]
+            [trash.columns.dataset_id]
         ).select_from(
-            self._tables.dataset_location_trash
+            trash
         ).where(
-            self._tables.dataset_location_trash.columns.datastore_name == self.datastoreName
+            trash.columns.datastore_name == self.datastoreName
         )
-        # Run query, transform results into a list of dicts that we can later
+        # Run query, transform results into a list of IDs that we can later
         # use to delete.
-        rows = [{"dataset_id": row["dataset_id"], "datastore_name": self.datastoreName}
-                for row in self._db.query(sql).fetchall()]
+        ids = [row["dataset_id"] for row in self._db.query(sql).fetchall()]
         # Start contextmanager, returning generator expression to iterate over.
-        yield (FakeDatasetRef(row["dataset_id"]) for row in rows)
+        yield (FakeDatasetRef(id) for id in ids)
         # No exception raised in context manager block.  Delete those rows
-        # from the trash table.
-        self._db.delete(self._tables.dataset_location_trash, ["dataset_id", "datastore_name"], *rows)
+        # from the trash table.  We can't just delete everything for this
+        # datastore, because more datasets may have been trashed since we
+        # queried.
+        with self._db.inClauses(trash.columns.dataset_id, ids) as inClauses:
+            for inClause in inClauses:
+                self._db.deleteWhere(
+                    trash,
+                    sqlalchemy.sql.and_(trash.columns.datastore_name == self.datastoreName, inClause)
+                )
 
 
 class MonolithicDatastoreRegistryBridgeManager(DatastoreRegistryBridgeManager):
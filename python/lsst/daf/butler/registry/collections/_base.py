@@ -23,7 +23,7 @@ from __future__ import annotations
 __all__ = ()
 
 from abc import abstractmethod
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 import itertools
 from typing import (
     Any,
@@ -31,7 +31,10 @@ from typing import (
     Generic,
     Iterable,
     Iterator,
+    List,
     Optional,
+    Set,
+    Tuple,
     Type,
     TYPE_CHECKING,
     TypeVar,
@@ -47,11 +50,18 @@ from ..interfaces import (
     CollectionManager,
     CollectionRecord,
     RunRecord,
+    VersionTuple,
 )
 from ..wildcards import CollectionSearch
 
 if TYPE_CHECKING:
-    from ..interfaces import Database, DimensionRecordStorageManager
+    from ..interfaces import Database, DimensionRecordStorageManager, StaticTablesContext
+
+
+_FLATTENED_CHAIN_TABLE_NAME = "collection_chain_flat"
+"""Name of the table that holds the flattened contents of all
+`~CollectionType.CHAINED` collections.
+"""
 
 
 def _makeCollectionForeignKey(sourceColumnName: str, collectionIdName: str,
@@ -161,6 +171,44 @@ def makeCollectionChainTableSpec(collectionIdName: str, collectionIdType: type)
     )
 
 
+def makeFlattenedChainTableSpec(collectionIdName: str, collectionIdType: type) -> ddl.TableSpec:
+    """Define specification for "collection_chain_flat" table.
+
+    Parameters
+    ----------
+    collectionIdName : `str`
+        Name of the column in collections table that identifies it (PK).
+    collectionIdType
+        Type of the PK column in the collections table, one of the
+        `sqlalchemy` types.
+
+    Returns
+    -------
+    spec : `ddl.TableSpec`
+        Specification for flattened collection chain table.
+
+    Notes
+    -----
+    This table holds, for every `~CollectionType.CHAINED` collection, all of
+    the non-chained collections it searches (recursively) together with their
+    rank in that search.  It is derived entirely from the "collection_chain"
+    table and is rewritten whenever a chain (or a chain nested in it) is
+    redefined.  It was added in version 2.1 of the collection managers, and is
+    created for older repositories by `DefaultCollectionManager.upgradeSchema`.
+    """
+    return ddl.TableSpec(
+        fields=[
+            ddl.FieldSpec("parent", dtype=collectionIdType, primaryKey=True),
+            ddl.FieldSpec("child", dtype=collectionIdType, primaryKey=True),
+            ddl.FieldSpec("rank", dtype=sqlalchemy.Integer, nullable=False),
+        ],
+        foreignKeys=[
+            _makeCollectionForeignKey("parent", collectionIdName, onDelete="CASCADE"),
+            _makeCollectionForeignKey("child", collectionIdName, onDelete="CASCADE"),
+        ],
+    )
+
+
 class DefaultRunRecord(RunRecord):
     """Default `RunRecord` implementation.
 
@@ -265,9 +313,11 @@ class DefaultChainedCollectionRecord(ChainedCollectionRecord):
                 "child": child.key,
                 "position": next(position),
             })
-        with self._db.transaction():
+        assert isinstance(manager, DefaultCollectionManager)
+        with self._db.transaction(lock=manager._chainTables()):
             self._db.delete(self._table, ["parent"], {"parent": self.key})
             self._db.insert(self._table, *rows)
+            manager._updateFlattenedChains(self)
 
     def _load(self, manager: CollectionManager) -> CollectionSearch:
         # Docstring inherited from ChainedCollectionRecord.
@@ -318,6 +368,44 @@ class DefaultCollectionManager(Generic[K], CollectionManager):
         self._collectionIdName = collectionIdName
         self._records: Dict[K, CollectionRecord] = {}  # indexed by record ID
         self._dimensions = dimensions
+        self._flattened: Optional[sqlalchemy.schema.Table] = None
+        self._flattenedSpec: Optional[ddl.TableSpec] = None
+
+    def _declareFlattenedChainTable(self, context: StaticTablesContext, spec: ddl.TableSpec) -> None:
+        """Look up the flattened chain table, or arrange for it to be created
+        along with the static tables of a new repository.
+
+        Parameters
+        ----------
+        context : `StaticTablesContext`
+            Context object obtained from `Database.declareStaticTables`.
+        spec : `ddl.TableSpec`
+            Specification for the table, as returned by
+            `makeFlattenedChainTableSpec`.
+
+        Notes
+        -----
+        Repositories with a version 2.0 schema do not have this table; it is
+        not created for them here (see `upgradeSchema`), and queries against
+        them fall back to searching the children of chains one at a time.
+        Clients that do not maintain the table cannot open repositories that
+        have it, because their schema version is older.
+        """
+        self._flattenedSpec = spec
+        self._flattened = self._db.getExistingTable(_FLATTENED_CHAIN_TABLE_NAME, spec)
+        if self._flattened is None:
+            context.addInitializer(self._createFlattenedChainTable)
+
+    def _createFlattenedChainTable(self, db: Database) -> None:
+        """Create the flattened chain table in a new repository.
+
+        Parameters
+        ----------
+        db : `Database`
+            Database the static tables were just created in.
+        """
+        assert self._flattenedSpec is not None
+        self._flattened = db.ensureTableExists(_FLATTENED_CHAIN_TABLE_NAME, self._flattenedSpec)
 
     def refresh(self) -> None:
         # Docstring inherited from CollectionManager.
@@ -441,6 +529,175 @@ class DefaultCollectionManager(Generic[K], CollectionManager):
         # Docstring inherited from CollectionManager.
         self._db.update(self._tables.collection, {self._collectionIdName: "key"}, {"key": key, "doc": doc})
 
+    def selectFlattenedChain(self, record: ChainedCollectionRecord) -> Optional[sqlalchemy.sql.FromClause]:
+        # Docstring inherited from CollectionManager.
+        if self._flattened is None:
+            return None
+        return sqlalchemy.sql.select([
+            self._flattened.columns.child,
+            self._flattened.columns.rank,
+        ]).select_from(
+            self._flattened
+        ).where(
+            self._flattened.columns.parent == record.key
+        ).alias()
+
+    def _chainTables(self) -> List[sqlalchemy.schema.Table]:
+        """Return the tables that must be locked while a chain is redefined.
+
+        Returns
+        -------
+        tables : `list` [ `sqlalchemy.schema.Table` ]
+            The "collection_chain" table, and the flattened chain table if
+            this repository has one.
+        """
+        tables = [self._tables.collection_chain]
+        if self._flattened is not None:
+            tables.append(self._flattened)
+        return tables
+
+    def _updateFlattenedChains(self, chain: ChainedCollectionRecord) -> None:
+        """Rewrite the flattened chain table rows for a chain that is being
+        redefined and for all chains that include it.
+
+        Parameters
+        ----------
+        chain : `ChainedCollectionRecord`
+            Chain being redefined.
+
+        Notes
+        -----
+        This must be called within the transaction that updates the
+        "collection_chain" table, after the new rows for ``chain`` have been
+        written and with the tables returned by `_chainTables` locked.  The
+        chains to rewrite and their contents are read from the database, not
+        from this manager's cache, so chains created by other clients since
+        the last `refresh` are handled too.
+        """
+        if self._flattened is None:
+            return
+        # Find every chain that (directly or indirectly) includes this one,
+        # with a recursive query starting from the chain itself.
+        chainTable = self._tables.collection_chain
+        keyColumn = self._tables.collection.columns[self._collectionIdName]
+        ancestors = sqlalchemy.sql.select(
+            [keyColumn.label("key")]
+        ).where(
+            keyColumn == chain.key
+        ).cte("ancestors", recursive=True)
+        ancestors = ancestors.union(
+            sqlalchemy.sql.select(
+                [chainTable.columns.parent]
+            ).select_from(
+                chainTable.join(ancestors, chainTable.columns.child == ancestors.columns.key)
+            )
+        )
+        keys = [row["key"] for row in self._db.query(sqlalchemy.sql.select([ancestors.columns.key]))]
+        self._writeFlattenedChains(keys)
+
+    def _writeFlattenedChains(self, parents: Optional[List[Any]]) -> None:
+        """Replace the flattened chain table rows for some chains, using the
+        current contents of the "collection_chain" table.
+
+        Parameters
+        ----------
+        parents : `list`, optional
+            Keys of the chains whose rows should be rewritten.  If `None`,
+            the rows for all chains are rewritten.
+        """
+        assert self._flattened is not None
+        chainTable = self._tables.collection_chain
+        collection = self._tables.collection
+        keyColumn = collection.columns[self._collectionIdName]
+        # Read the chain table rows for the given chains and (recursively) for
+        # all chains nested in them, along with the type of each child.
+        nested = sqlalchemy.sql.select([
+            chainTable.columns.parent,
+            chainTable.columns.position,
+            chainTable.columns.child,
+        ])
+        if parents is not None:
+            nested = nested.where(chainTable.columns.parent.in_(parents)).cte("nested", recursive=True)
+            nested = nested.union(
+                sqlalchemy.sql.select([
+                    chainTable.columns.parent,
+                    chainTable.columns.position,
+                    chainTable.columns.child,
+                ]).select_from(
+                    chainTable.join(nested, chainTable.columns.parent == nested.columns.child)
+                )
+            )
+        else:
+            nested = nested.alias("nested")
+        sql = sqlalchemy.sql.select([
+            nested.columns.parent,
+            nested.columns.position,
+            nested.columns.child,
+            collection.columns.type,
+        ]).select_from(
+            nested.join(collection, keyColumn == nested.columns.child)
+        )
+        children: Dict[Any, List[Tuple[int, Any, CollectionType]]] = defaultdict(list)
+        for row in self._db.query(sql):
+            children[row["parent"]].append((row["position"], row["child"], CollectionType(row["type"])))
+        for childList in children.values():
+            childList.sort()
+        if parents is None:
+            sql = sqlalchemy.sql.select(
+                [keyColumn]
+            ).where(
+                collection.columns.type == int(CollectionType.CHAINED)
+            )
+            parents = [row[keyColumn] for row in self._db.query(sql)]
+        rows = []
+        for parent in parents:
+            # Flatten in the same order (and with duplicates removed in the
+            # same way) as CollectionSearch.iter.
+            done: Set[Any] = set()
+            flat: List[Any] = []
+
+            def recurse(key: Any) -> None:
+                for _, child, childType in children.get(key, ()):
+                    if child in done:
+                        continue
+                    done.add(child)
+                    if childType is CollectionType.CHAINED:
+                        recurse(child)
+                    else:
+                        flat.append(child)
+
+            recurse(parent)
+            rows.extend({"parent": parent, "child": child, "rank": rank} for rank, child in enumerate(flat))
+        with self._db.transaction():
+            self._db.delete(self._flattened, ["parent"], *[{"parent": parent} for parent in parents])
+            self._db.insert(self._flattened, *rows)
+
+    def upgradeSchema(self, storedVersion: VersionTuple) -> bool:
+        # Docstring inherited from VersionedExtension.
+        if (storedVersion.major, storedVersion.minor) != (2, 0):
+            return False
+        # Version 2.1 added the flattened chain table; create it and fill it
+        # in for all existing chains.
+        assert self._flattenedSpec is not None
+        self._flattened = self._db.ensureTableExists(_FLATTENED_CHAIN_TABLE_NAME, self._flattenedSpec)
+        self._writeFlattenedChains(None)
+        return True
+
+    def _schemaTables(self) -> List[sqlalchemy.schema.Table]:
+        """Return all of the tables whose definitions are included in the
+        schema digest.
+
+        Returns
+        -------
+        tables : `list` [ `sqlalchemy.schema.Table` ]
+            The static tables, and the flattened chain table if this
+            repository has one.
+        """
+        tables = list(self._tables)
+        if self._flattened is not None:
+            tables.append(self._flattened)
+        return tables
+
     def _setRecordCache(self, records: Iterable[CollectionRecord]) -> None:
         """Set internal record cache to contain given records,
         old cached records will be removed.
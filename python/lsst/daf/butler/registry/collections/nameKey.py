@@ -36,6 +36,7 @@ from ._base import (
     DefaultCollectionManager,
     makeRunTableSpec,
     makeCollectionChainTableSpec,
+    makeFlattenedChainTableSpec,
 )
 
 from ...core import TimespanDatabaseRepresentation, ddl
@@ -49,7 +50,7 @@ _KEY_FIELD_SPEC = ddl.FieldSpec("name", dtype=sqlalchemy.String, length=64, prim
 
 
 # This has to be updated on every schema change
-_VERSION = VersionTuple(2, 0, 0)
+_VERSION = VersionTuple(2, 1, 0)
 
 
 def _makeTableSpecs(TimespanReprClass: Type[TimespanDatabaseRepresentation]) -> CollectionTablesTuple:
@@ -84,12 +85,14 @@ class NameKeyCollectionManager(DefaultCollectionManager):
         dimensions: DimensionRecordStorageManager,
     ) -> NameKeyCollectionManager:
         # Docstring inherited from CollectionManager.
-        return cls(
+        manager = cls(
             db,
             tables=context.addTableTuple(_makeTableSpecs(db.getTimespanRepresentation())),  # type: ignore
             collectionIdName="name",
             dimensions=dimensions,
         )
+        manager._declareFlattenedChainTable(context, makeFlattenedChainTableSpec("name", sqlalchemy.String))
+        return manager
 
     @classmethod
     def getCollectionForeignKeyName(cls, prefix: str = "collection") -> str:
@@ -142,4 +145,4 @@ class NameKeyCollectionManager(DefaultCollectionManager):
 
     def schemaDigest(self) -> Optional[str]:
         # Docstring inherited from VersionedExtension.
-        return self._defaultSchemaDigest(self._tables, self._db.dialect)
+        return self._defaultSchemaDigest(self._schemaTables(), self._db.dialect)
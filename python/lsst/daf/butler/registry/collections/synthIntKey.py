@@ -38,6 +38,7 @@ from ._base import (
     DefaultCollectionManager,
     makeRunTableSpec,
     makeCollectionChainTableSpec,
+    makeFlattenedChainTableSpec,
 )
 from ...core import TimespanDatabaseRepresentation, ddl
 from ..interfaces import CollectionRecord, VersionTuple
@@ -51,7 +52,7 @@ _KEY_FIELD_SPEC = ddl.FieldSpec("collection_id", dtype=sqlalchemy.BigInteger, pr
 
 
 # This has to be updated on every schema change
-_VERSION = VersionTuple(2, 0, 0)
+_VERSION = VersionTuple(2, 1, 0)
 
 
 def _makeTableSpecs(TimespanReprClass: Type[TimespanDatabaseRepresentation]) -> CollectionTablesTuple:
@@ -107,12 +108,17 @@ class SynthIntKeyCollectionManager(DefaultCollectionManager):
         dimensions: DimensionRecordStorageManager,
     ) -> SynthIntKeyCollectionManager:
         # Docstring inherited from CollectionManager.
-        return cls(
+        manager = cls(
             db,
             tables=context.addTableTuple(_makeTableSpecs(db.getTimespanRepresentation())),  # type: ignore
             collectionIdName="collection_id",
             dimensions=dimensions,
         )
+        manager._declareFlattenedChainTable(
+            context,
+            makeFlattenedChainTableSpec("collection_id", sqlalchemy.BigInteger),
+        )
+        return manager
 
     @classmethod
     def getCollectionForeignKeyName(cls, prefix: str = "collection") -> str:
@@ -187,4 +193,4 @@ class SynthIntKeyCollectionManager(DefaultCollectionManager):
 
     def schemaDigest(self) -> Optional[str]:
         # Docstring inherited from VersionedExtension.
-        return self._defaultSchemaDigest(self._tables, self._db.dialect)
+        return self._defaultSchemaDigest(self._schemaTables(), self._db.dialect)
@@ -23,7 +23,7 @@ from __future__ import annotations
 __all__ = ["PostgresqlDatabase"]
 
 from contextlib import contextmanager, closing
-from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Type, Union
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Type, Union
 
 import psycopg2
 import sqlalchemy.dialects.postgresql
@@ -31,6 +31,7 @@ import sqlalchemy.dialects.postgresql
 from ..interfaces import Database
 from ..nameShrinker import NameShrinker
 from ...core import ddl, time_utils, Timespan, TimespanDatabaseRepresentation
+from ...core.metrics import timed
 
 
 class PostgresqlDatabase(Database):
@@ -63,6 +64,12 @@ class PostgresqlDatabase(Database):
     on the database being connected to; this is checked at connection time.
     """
 
+    # PostgreSQL has no practical limit on bind parameters, but its planner
+    # does much better with a join against a (small, primary-keyed) temporary
+    # table than with a very long literal IN list.
+    IN_CLAUSE_MAX_SIZE = 1000
+    IN_CLAUSE_TEMPORARY_TABLE_THRESHOLD = 1000
+
     def __init__(self, *, connection: sqlalchemy.engine.Connection, origin: int,
                  namespace: Optional[str] = None, writeable: bool = True):
         super().__init__(origin=origin, connection=connection, namespace=namespace)
@@ -149,6 +156,13 @@ class PostgresqlDatabase(Database):
         # Docstring inherited.
         return _RangeTimespanRepresentation
 
+    def explain(self, sql: sqlalchemy.sql.FromClause, params: Optional[Dict[str, Any]] = None, *,
+                analyze: bool = False) -> List[str]:
+        # Docstring inherited.
+        prefix = "EXPLAIN (ANALYZE, BUFFERS)" if analyze else "EXPLAIN"
+        return [row[0] for row in self._runExplain(sql, params, prefix)]
+
+    @timed("database.replace")
     def replace(self, table: sqlalchemy.schema.Table, *rows: dict) -> None:
         self.assertTableWriteable(table, f"Cannot replace into read-only table {table}.")
         if not rows:
@@ -166,6 +180,7 @@ class PostgresqlDatabase(Database):
         query = query.on_conflict_do_update(constraint=table.primary_key, set_=data)
         self._connection.execute(query, *rows)
 
+    @timed("database.ensure")
     def ensure(self, table: sqlalchemy.schema.Table, *rows: dict) -> int:
         # Docstring inherited.
         self.assertTableWriteable(table, f"Cannot ensure into read-only table {table}.")
@@ -216,7 +231,7 @@ class _RangeTimespanType(sqlalchemy.TypeDecorator):
         converter = time_utils.TimeConverter()
         begin_nsec = converter.min_nsec if value.lower is None else value.lower
         end_nsec = converter.max_nsec if value.upper is None else value.upper
-        return Timespan(begin=None, end=None, _nsec=(begin_nsec, end_nsec))
+        return Timespan._fromNsec(begin_nsec, end_nsec)
 
     class comparator_factory(sqlalchemy.types.Concatenable.Comparator):  # noqa: N801
         """Comparison operators for TimespanColumnRanges.
@@ -35,6 +35,7 @@ import sqlalchemy.ext.compiler
 
 from ..interfaces import Database, StaticTablesContext
 from ...core import ddl
+from ...core.metrics import timed
 
 
 def _onSqlite3Connect(dbapiConnection: sqlite3.Connection,
@@ -361,6 +362,20 @@ class SqliteDatabase(Database):
             kwargs = dict(kwargs, sqlite_autoincrement=True)
         return super()._convertTableSpec(name, spec, metadata, **kwargs)
 
+    def explain(self, sql: sqlalchemy.sql.FromClause, params: Optional[Dict[str, Any]] = None, *,
+                analyze: bool = False) -> List[str]:
+        # Docstring inherited.
+        # SQLite cannot report actual row counts or times, so analyze is
+        # ignored.  Rows are (id, parent, notused, detail), with parent
+        # referring to the id of an earlier row.
+        depths = {0: -1}
+        plan = []
+        for row in self._runExplain(sql, params, "EXPLAIN QUERY PLAN"):
+            depth = depths[row[0]] = depths.get(row[1], -1) + 1
+            plan.append("  " * depth + row[3])
+        return plan
+
+    @timed("database.insert")
     def insert(self, table: sqlalchemy.schema.Table, *rows: dict, returnIds: bool = False,
                select: Optional[sqlalchemy.sql.Select] = None,
                names: Optional[Iterable[str]] = None,
@@ -423,6 +438,7 @@ class SqliteDatabase(Database):
         else:
             return super().insert(table, *rows, select=select, names=names, returnIds=returnIds)
 
+    @timed("database.replace")
     def replace(self, table: sqlalchemy.schema.Table, *rows: dict) -> None:
         self.assertTableWriteable(table, f"Cannot replace into read-only table {table}.")
         if not rows:
@@ -433,6 +449,7 @@ class SqliteDatabase(Database):
             )
         self._connection.execute(_Replace(table), *rows)
 
+    @timed("database.ensure")
     def ensure(self, table: sqlalchemy.schema.Table, *rows: dict) -> int:
         self.assertTableWriteable(table, f"Cannot ensure into read-only table {table}.")
         if not rows:
@@ -5,7 +5,9 @@ __all__ = ("ByDimensionsDatasetRecordStorageManager",)
 from typing import (
     Any,
     Dict,
+    Iterable,
     Iterator,
+    List,
     Optional,
     Tuple,
     TYPE_CHECKING,
@@ -269,10 +271,53 @@ class ByDimensionsDatasetRecordStorageManager(DatasetRecordStorageManager):
             run=self._collections[row[self._collections.getRunForeignKeyName()]].name
         )
 
+    def getDatasetRefs(self, ids: Iterable[int]) -> Dict[int, DatasetRef]:
+        # Docstring inherited from DatasetRecordStorageManager.
+        result: Dict[int, DatasetRef] = {}
+        c = self._static.dataset.columns
+        runKeyColumn = self._collections.getRunForeignKeyName()
+        # Group the dataset IDs by dataset type, remembering the run for each,
+        # so we can look up data IDs with one query per tags table.
+        byType: Dict[int, List[Tuple[int, Any]]] = {}
+        with self._db.inClauses(c.id, ids) as inClauses:
+            for inClause in inClauses:
+                sql = sqlalchemy.sql.select(
+                    [c.id, c.dataset_type_id, c[runKeyColumn]]
+                ).select_from(
+                    self._static.dataset
+                ).where(
+                    inClause
+                )
+                for row in self._db.query(sql):
+                    byType.setdefault(row[c.dataset_type_id], []).append((row[c.id], row[runKeyColumn]))
+        for datasetTypeId, idsAndRuns in byType.items():
+            recordsForType = self._byId.get(datasetTypeId)
+            if recordsForType is None:
+                self.refresh()
+                recordsForType = self._byId.get(datasetTypeId)
+                assert recordsForType is not None, "Should be guaranteed by foreign key constraints."
+            dataIds = recordsForType.getDataIds(id for id, _ in idsAndRuns)
+            for id, runKey in idsAndRuns:
+                result[id] = DatasetRef(
+                    recordsForType.datasetType,
+                    dataId=dataIds[id],
+                    id=id,
+                    run=self._collections[runKey].name
+                )
+        return result
+
     def getCollectionSummary(self, collection: CollectionRecord) -> CollectionSummary:
         # Docstring inherited from DatasetRecordStorageManager.
         return self._summaries.get(collection)
 
+    def refreshCollectionSummaries(self, collections: Iterable[CollectionRecord]) -> None:
+        # Docstring inherited from DatasetRecordStorageManager.
+        def getDatasetType(dataset_type_id: int) -> Optional[DatasetType]:
+            storage = self._byId.get(dataset_type_id)
+            return storage.datasetType if storage is not None else None
+
+        self._summaries.reload(collections, getDatasetType)
+
     @classmethod
     def currentVersion(cls) -> Optional[VersionTuple]:
         # Docstring inherited from VersionedExtension.
@@ -7,14 +7,16 @@ from typing import (
     Dict,
     Iterable,
     Iterator,
+    List,
     Optional,
-    Set,
+    Tuple,
     TYPE_CHECKING,
 )
 
 import sqlalchemy
 
 from lsst.daf.butler import (
+    addDimensionForeignKey,
     CollectionType,
     DataCoordinate,
     DataCoordinateSet,
@@ -22,6 +24,7 @@ from lsst.daf.butler import (
     DatasetType,
     SimpleQuery,
     Timespan,
+    ddl,
 )
 from lsst.daf.butler.registry import ConflictingDefinitionError
 from lsst.daf.butler.registry.interfaces import DatasetRecordStorage
@@ -59,6 +62,7 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
         self._tags = tags
         self._calibs = calibs
         self._runKeyColumn = collections.getRunForeignKeyName()
+        self._findQueries: Dict[CollectionType, sqlalchemy.sql.Select] = {}
 
     def insert(self, run: RunRecord, dataIds: Iterable[DataCoordinate]) -> Iterator[DatasetRef]:
         # Docstring inherited from DatasetRecordStorage.
@@ -111,9 +115,16 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
         if collection.type is CollectionType.CALIBRATION and timespan is None:
             raise TypeError(f"Cannot search for dataset in CALIBRATION collection {collection.name} "
                             f"without an input timespan.")
-        sql = self.select(collection=collection, dataId=dataId, id=SimpleQuery.Select,
-                          run=SimpleQuery.Select, timespan=timespan).combine()
-        results = self._db.query(sql)
+        if collection.type is CollectionType.CALIBRATION:
+            sql = self.select(collection=collection, dataId=dataId, id=SimpleQuery.Select,
+                              run=SimpleQuery.Select, timespan=timespan).combine()
+            results = self._db.query(sql)
+        else:
+            results = self._db.queryPrepared(
+                self._getFindQuery(collection.type),
+                collection_key=collection.key,
+                **{name: dataId[name] for name in self.datasetType.dimensions.required.names}
+            )
         row = results.fetchone()
         if row is None:
             return None
@@ -140,15 +151,66 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
             run=self._collections[row[self._runKeyColumn]].name
         )
 
+    def _getFindQuery(self, collectionType: CollectionType) -> sqlalchemy.sql.Select:
+        """Return the query used by `find` to look up a dataset in a RUN or
+        TAGGED collection.
+
+        Parameters
+        ----------
+        collectionType : `CollectionType`
+            Type of the collection to search; must be `CollectionType.RUN` or
+            `CollectionType.TAGGED`.
+
+        Returns
+        -------
+        sql : `sqlalchemy.sql.Select`
+            Query that returns the ``id`` and run columns, with bind
+            parameters for the collection key (``collection_key``) and for
+            each required dimension (named for the dimension).  The same
+            object is returned for each call with the same collection type,
+            so its compiled form can be cached by `Database.queryPrepared`.
+
+        Notes
+        -----
+        This builds the same query as `select` does with literal values.
+        Lookups in CALIBRATION collections constrain the validity range with a
+        literal timespan, and are not prepared this way.
+        """
+        sql = self._findQueries.get(collectionType)
+        if sql is None:
+            dataset = self._static.dataset
+            collectionColumn = self._tags.columns[self._collections.getCollectionForeignKeyName()]
+            terms = [
+                dataset.columns.dataset_type_id == self._dataset_type_id,
+                collectionColumn == sqlalchemy.sql.bindparam("collection_key"),
+            ]
+            if collectionType is CollectionType.RUN:
+                terms.append(
+                    dataset.columns[self._runKeyColumn] == sqlalchemy.sql.bindparam("collection_key")
+                )
+            terms.extend(
+                self._tags.columns[name] == sqlalchemy.sql.bindparam(name)
+                for name in self.datasetType.dimensions.required.names
+            )
+            sql = sqlalchemy.sql.select(
+                [dataset.columns.id, dataset.columns[self._runKeyColumn]]
+            ).select_from(
+                dataset.join(self._tags, dataset.columns.id == self._tags.columns.dataset_id)
+            ).where(
+                sqlalchemy.sql.and_(*terms)
+            )
+            self._findQueries[collectionType] = sql
+        return sql
+
     def delete(self, datasets: Iterable[DatasetRef]) -> None:
         # Docstring inherited from DatasetRecordStorage.
         # Only delete from common dataset table; ON DELETE foreign key clauses
         # will handle the rest.
-        self._db.delete(
-            self._static.dataset,
-            ["id"],
-            *[{"id": dataset.getCheckedId()} for dataset in datasets],
-        )
+        ids = [dataset.getCheckedId() for dataset in datasets]
+        with self._db.transaction():
+            with self._db.inClauses(self._static.dataset.columns.id, ids) as inClauses:
+                for inClause in inClauses:
+                    self._db.deleteWhere(self._static.dataset, inClause)
 
     def associate(self, collection: CollectionRecord, datasets: Iterable[DatasetRef]) -> None:
         # Docstring inherited from DatasetRecordStorage.
@@ -179,15 +241,15 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
         if collection.type is not CollectionType.TAGGED:
             raise TypeError(f"Cannot disassociate from collection '{collection.name}' "
                             f"of type {collection.type.name}; must be TAGGED.")
-        rows = [
-            {
-                "dataset_id": dataset.getCheckedId(),
-                self._collections.getCollectionForeignKeyName(): collection.key
-            }
-            for dataset in datasets
-        ]
-        self._db.delete(self._tags, ["dataset_id", self._collections.getCollectionForeignKeyName()],
-                        *rows)
+        collectionColumn = self._tags.columns[self._collections.getCollectionForeignKeyName()]
+        ids = [dataset.getCheckedId() for dataset in datasets]
+        with self._db.transaction():
+            with self._db.inClauses(self._tags.columns.dataset_id, ids) as inClauses:
+                for inClause in inClauses:
+                    self._db.deleteWhere(
+                        self._tags,
+                        sqlalchemy.sql.and_(collectionColumn == collection.key, inClause),
+                    )
 
     def _buildCalibOverlapQuery(self, collection: CollectionRecord,
                                 dataIds: Optional[DataCoordinateSet],
@@ -218,6 +280,11 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
     def certify(self, collection: CollectionRecord, datasets: Iterable[DatasetRef],
                 timespan: Timespan) -> None:
         # Docstring inherited from DatasetRecordStorage.
+        self.certifyMany(collection, [(datasets, timespan)])
+
+    def certifyMany(self, collection: CollectionRecord,
+                    associations: Iterable[Tuple[Iterable[DatasetRef], Timespan]]) -> None:
+        # Docstring inherited from DatasetRecordStorage.
         if self._calibs is None:
             raise TypeError(f"Cannot certify datasets of type {self.datasetType.name}, for which "
                             f"DatasetType.isCalibration() is False.")
@@ -231,18 +298,19 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
         }
         rows = []
         governorValues = GovernorDimensionRestriction.makeEmpty(self.datasetType.dimensions.universe)
-        dataIds: Optional[Set[DataCoordinate]] = (
-            set() if not TimespanReprClass.hasExclusionConstraint() else None
-        )
-        for dataset in datasets:
-            row = dict(protoRow, dataset_id=dataset.getCheckedId())
-            for dimension, value in dataset.dataId.items():
-                row[dimension.name] = value
-            TimespanReprClass.update(timespan, result=row)
-            governorValues.update_extract(dataset.dataId)
-            rows.append(row)
-            if dataIds is not None:
-                dataIds.add(dataset.dataId)
+        timespans: Dict[Timespan, List[DataCoordinate]] = {}
+        for datasets, timespan in associations:
+            dataIds = timespans.setdefault(timespan, [])
+            for dataset in datasets:
+                row = dict(protoRow, dataset_id=dataset.getCheckedId())
+                for dimension, value in dataset.dataId.items():
+                    row[dimension.name] = value
+                TimespanReprClass.update(timespan, result=row)
+                governorValues.update_extract(dataset.dataId)
+                rows.append(row)
+                dataIds.append(dataset.dataId)
+        if not rows:
+            return
         # Update the summary tables for this collection in case this is the
         # first time this dataset type or these governor values will be
         # inserted there.
@@ -256,34 +324,119 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
             except sqlalchemy.exc.IntegrityError as err:
                 raise ConflictingDefinitionError(
                     f"Validity range conflict certifying datasets of type {self.datasetType.name} "
-                    f"into {collection.name} for range [{timespan.begin}, {timespan.end})."
+                    f"into {collection.name} for range(s) {', '.join(str(t) for t in timespans)}."
                 ) from err
-        else:
-            # Have to implement exclusion constraint ourselves.
-            # Start by building a SELECT query for any rows that would overlap
-            # this one.
-            query = self._buildCalibOverlapQuery(
-                collection,
-                DataCoordinateSet(dataIds, graph=self.datasetType.dimensions),  # type: ignore
-                timespan
+            return
+        # Have to implement exclusion constraint ourselves.  Acquire a table
+        # lock to ensure there are no concurrent writes could invalidate our
+        # checking before we finish the inserts.  We use a SAVEPOINT in case
+        # there is an outer transaction that a failure here should not roll
+        # back.
+        with self._db.transaction(lock=[self._calibs], savepoint=True):
+            if len(timespans) == 1:
+                # Only one validity range: build a SELECT query for any
+                # existing rows that would overlap it, and check for the same
+                # data ID appearing twice.
+                (timespan, dataIds), = timespans.items()
+                dataIdSet = DataCoordinateSet(set(dataIds), graph=self.datasetType.dimensions)
+                query = self._buildCalibOverlapQuery(collection, dataIdSet, timespan)
+                query.columns.append(sqlalchemy.sql.func.count())
+                conflicting = self._db.query(query.combine()).scalar()
+                if not timespan.isEmpty():
+                    conflicting += len(dataIds) - len(dataIdSet)
+            else:
+                conflicting = self._countCalibOverlapsMany(collection, rows)
+            if conflicting > 0:
+                raise ConflictingDefinitionError(
+                    f"{conflicting} validity range conflicts certifying datasets of type "
+                    f"{self.datasetType.name} into {collection.name} for range(s) "
+                    f"{', '.join(str(t) for t in timespans)}."
+                )
+            # Proceed with the insert.
+            self._db.insert(self._calibs, *rows)
+
+    def _countCalibOverlapsMany(self, collection: CollectionRecord, rows: List[Dict[str, Any]]) -> int:
+        """Count the validity range conflicts that inserting the given rows
+        into the calibs table would cause.
+
+        Parameters
+        ----------
+        collection : `CollectionRecord`
+            Record for the calibration collection the rows will be inserted
+            into.
+        rows : `list` [ `dict` ]
+            Rows to be inserted into ``self._calibs``.
+
+        Returns
+        -------
+        conflicting : `int`
+            Number of pairs of rows with the same data ID and overlapping
+            validity ranges, either between a new row and an existing one or
+            between two new rows.
+
+        Notes
+        -----
+        All data IDs and validity ranges are uploaded to a temporary table,
+        so this runs one query no matter how many validity ranges there are.
+        """
+        assert self._calibs is not None
+        TimespanReprClass = self._db.getTimespanRepresentation()
+        dimensions = self.datasetType.dimensions.required
+        spec = ddl.TableSpec(
+            fields=[ddl.FieldSpec("ordinal", dtype=sqlalchemy.BigInteger, primaryKey=True)]
+        )
+        for dimension in dimensions:
+            addDimensionForeignKey(spec, dimension, primaryKey=False, constraint=False)
+        spec.fields.update(TimespanReprClass.makeFieldSpecs(nullable=False))
+        table = self._db.makeTemporaryTable(spec)
+        try:
+            names = list(dimensions.names) + list(TimespanReprClass.getFieldNames())
+            self._db.insert(table, *[dict({name: row[name] for name in names}, ordinal=n)
+                                     for n, row in enumerate(rows)])
+            # Overlaps between new and existing rows.
+            existing = sqlalchemy.sql.select(
+                [table.columns.ordinal]
+            ).select_from(
+                table.join(
+                    self._calibs,
+                    sqlalchemy.sql.and_(
+                        *[table.columns[name] == self._calibs.columns[name] for name in dimensions.names],
+                        TimespanReprClass.fromSelectable(table).overlaps(
+                            TimespanReprClass.fromSelectable(self._calibs)
+                        ),
+                    )
+                )
+            ).where(
+                sqlalchemy.sql.and_(
+                    self._calibs.columns.dataset_type_id == self._dataset_type_id,
+                    self._calibs.columns[self._collections.getCollectionForeignKeyName()] == collection.key,
+                )
             )
-            query.columns.append(sqlalchemy.sql.func.count())
-            sql = query.combine()
-            # Acquire a table lock to ensure there are no concurrent writes
-            # could invalidate our checking before we finish the inserts.  We
-            # use a SAVEPOINT in case there is an outer transaction that a
-            # failure here should not roll back.
-            with self._db.transaction(lock=[self._calibs], savepoint=True):
-                # Run the check SELECT query.
-                conflicting = self._db.query(sql).scalar()
-                if conflicting > 0:
-                    raise ConflictingDefinitionError(
-                        f"{conflicting} validity range conflicts certifying datasets of type "
-                        f"{self.datasetType.name} into {collection.name} for range "
-                        f"[{timespan.begin}, {timespan.end})."
+            # Overlaps between pairs of new rows.
+            table1 = table.alias("new1")
+            table2 = table.alias("new2")
+            internal = sqlalchemy.sql.select(
+                [table1.columns.ordinal]
+            ).select_from(
+                table1.join(
+                    table2,
+                    sqlalchemy.sql.and_(
+                        *[table1.columns[name] == table2.columns[name] for name in dimensions.names],
+                        table1.columns.ordinal < table2.columns.ordinal,
+                        TimespanReprClass.fromSelectable(table1).overlaps(
+                            TimespanReprClass.fromSelectable(table2)
+                        ),
                     )
-                # Proceed with the insert.
-                self._db.insert(self._calibs, *rows)
+                )
+            )
+            sql = sqlalchemy.sql.select(
+                [sqlalchemy.sql.func.count()]
+            ).select_from(
+                sqlalchemy.sql.union_all(existing, internal).alias("conflicts")
+            )
+            return self._db.query(sql).scalar()
+        finally:
+            self._db.dropTemporaryTable(table)
 
     def decertify(self, collection: CollectionRecord, timespan: Timespan, *,
                   dataIds: Optional[Iterable[DataCoordinate]] = None) -> None:
@@ -343,48 +496,16 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
                ) -> SimpleQuery:
         # Docstring inherited from DatasetRecordStorage.
         assert collection.type is not CollectionType.CHAINED
-        query = SimpleQuery()
-        # We always include the _static.dataset table, and we can always get
-        # the id and run fields from that; passing them as kwargs here tells
-        # SimpleQuery to handle them whether they're constraints or results.
-        # We always constraint the dataset_type_id here as well.
-        static_kwargs = {self._runKeyColumn: run}
-        if ingestDate is not None:
-            static_kwargs["ingest_date"] = SimpleQuery.Select
-        query.join(
-            self._static.dataset,
-            id=id,
-            dataset_type_id=self._dataset_type_id,
-            **static_kwargs
-        )
+        query = self._selectStatic(id=id, run=run, ingestDate=ingestDate)
         # If and only if the collection is a RUN, we constrain it in the static
         # table (and also the tags or calibs table below)
         if collection.type is CollectionType.RUN:
             query.where.append(self._static.dataset.columns[self._runKeyColumn]
                                == collection.key)
-        # We get or constrain the data ID from the tags/calibs table, but
-        # that's multiple columns, not one, so we need to transform the one
-        # Select.Or argument into a dictionary of them.
-        kwargs: Dict[str, Any]
-        if dataId is SimpleQuery.Select:
-            kwargs = {dim.name: SimpleQuery.Select for dim in self.datasetType.dimensions.required}
-        else:
-            kwargs = dict(dataId.byName())
+        kwargs = self._dataIdKwargs(dataId)
         # We always constrain (never retrieve) the collection from the tags
         # table.
         kwargs[self._collections.getCollectionForeignKeyName()] = collection.key
-        # constrain ingest time
-        if isinstance(ingestDate, Timespan):
-            # Tmespan is astropy Time (usually in TAI) and ingest_date is
-            # TIMESTAMP, convert values to Python datetime for sqlalchemy.
-            if ingestDate.isEmpty():
-                raise RuntimeError("Empty timespan constraint provided for ingest_date.")
-            if ingestDate.begin is not None:
-                begin = ingestDate.begin.utc.datetime  # type: ignore
-                query.where.append(self._static.dataset.ingest_date >= begin)
-            if ingestDate.end is not None:
-                end = ingestDate.end.utc.datetime  # type: ignore
-                query.where.append(self._static.dataset.ingest_date < end)
         # And now we finally join in the tags or calibs table.
         if collection.type is CollectionType.CALIBRATION:
             assert self._calibs is not None, \
@@ -413,6 +534,77 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
             )
         return query
 
+    def selectChain(self, flattened: sqlalchemy.sql.FromClause,
+                    dataId: SimpleQuery.Select.Or[DataCoordinate] = SimpleQuery.Select,
+                    id: SimpleQuery.Select.Or[Optional[int]] = SimpleQuery.Select,
+                    run: SimpleQuery.Select.Or[None] = SimpleQuery.Select,
+                    ingestDate: SimpleQuery.Select.Or[Optional[Timespan]] = None,
+                    rank: bool = False,
+                    ) -> SimpleQuery:
+        # Docstring inherited from DatasetRecordStorage.
+        query = self._selectStatic(id=id, run=run, ingestDate=ingestDate)
+        query.join(
+            self._tags,
+            onclause=(self._static.dataset.columns.id == self._tags.columns.dataset_id),
+            **self._dataIdKwargs(dataId)
+        )
+        # A single join against the flattened chain replaces one subquery per
+        # child collection; the calibs table is never involved, because the
+        # tags table has no rows for CALIBRATION collections.
+        query.join(
+            flattened,
+            onclause=(self._tags.columns[self._collections.getCollectionForeignKeyName()]
+                      == flattened.columns.child),
+            rank=SimpleQuery.Select if rank else None,
+        )
+        return query
+
+    def _selectStatic(self, id: SimpleQuery.Select.Or[Optional[int]],
+                      run: SimpleQuery.Select.Or[None],
+                      ingestDate: SimpleQuery.Select.Or[Optional[Timespan]]) -> SimpleQuery:
+        """Start a query for datasets of this type from the static dataset
+        table, handling the arguments `select` and `selectChain` share.
+        """
+        query = SimpleQuery()
+        # We always include the _static.dataset table, and we can always get
+        # the id and run fields from that; passing them as kwargs here tells
+        # SimpleQuery to handle them whether they're constraints or results.
+        # We always constraint the dataset_type_id here as well.
+        static_kwargs = {self._runKeyColumn: run}
+        if ingestDate is not None:
+            static_kwargs["ingest_date"] = SimpleQuery.Select
+        query.join(
+            self._static.dataset,
+            id=id,
+            dataset_type_id=self._dataset_type_id,
+            **static_kwargs
+        )
+        # constrain ingest time
+        if isinstance(ingestDate, Timespan):
+            # Tmespan is astropy Time (usually in TAI) and ingest_date is
+            # TIMESTAMP, convert values to Python datetime for sqlalchemy.
+            if ingestDate.isEmpty():
+                raise RuntimeError("Empty timespan constraint provided for ingest_date.")
+            if ingestDate.begin is not None:
+                begin = ingestDate.begin.utc.datetime  # type: ignore
+                query.where.append(self._static.dataset.ingest_date >= begin)
+            if ingestDate.end is not None:
+                end = ingestDate.end.utc.datetime  # type: ignore
+                query.where.append(self._static.dataset.ingest_date < end)
+        return query
+
+    def _dataIdKwargs(self, dataId: SimpleQuery.Select.Or[DataCoordinate]) -> Dict[str, Any]:
+        """Transform a data ID argument to `select` or `selectChain` into
+        `SimpleQuery.join` keyword arguments for the tags or calibs table.
+        """
+        # We get or constrain the data ID from the tags/calibs table, but
+        # that's multiple columns, not one, so we need to transform the one
+        # Select.Or argument into a dictionary of them.
+        if dataId is SimpleQuery.Select:
+            return {dim.name: SimpleQuery.Select for dim in self.datasetType.dimensions.required}
+        else:
+            return dict(dataId.byName())
+
     def getDataId(self, id: int) -> DataCoordinate:
         # Docstring inherited from DatasetRecordStorage.
         # This query could return multiple rows (one for each tagged collection
@@ -430,3 +622,37 @@ class ByDimensionsDatasetRecordStorage(DatasetRecordStorage):
             {dimension.name: row[dimension.name] for dimension in self.datasetType.dimensions.required},
             graph=self.datasetType.dimensions
         )
+
+    def getDataIds(self, ids: Iterable[int]) -> Dict[int, DataCoordinate]:
+        """Return the data IDs for many datasets of this type at once.
+
+        Parameters
+        ----------
+        ids : `Iterable` [ `int` ]
+            Primary key values for datasets of this type.  All must exist.
+
+        Returns
+        -------
+        dataIds : `dict` [ `int`, `DataCoordinate` ]
+            Mapping from dataset ID to its (minimal) data ID.
+        """
+        # As in getDataId, a dataset may appear once for each collection it
+        # is in; the dict below just deduplicates those rows.
+        names = self.datasetType.dimensions.required.names
+        result: Dict[int, DataCoordinate] = {}
+        with self._db.inClauses(self._tags.columns.dataset_id, ids) as inClauses:
+            for inClause in inClauses:
+                sql = sqlalchemy.sql.select(
+                    [self._tags.columns.dataset_id] + [self._tags.columns[name] for name in names]
+                ).where(
+                    sqlalchemy.sql.and_(
+                        inClause,
+                        self._tags.columns.dataset_type_id == self._dataset_type_id
+                    )
+                )
+                for row in self._db.query(sql):
+                    result[row["dataset_id"]] = DataCoordinate.standardize(
+                        {name: row[name] for name in names},
+                        graph=self.datasetType.dimensions
+                    )
+        return result
@@ -30,6 +30,11 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
     TypeVar,
 )
 
@@ -44,6 +49,7 @@ from lsst.daf.butler import (
     NamedValueSet,
 )
 from lsst.daf.butler import addDimensionForeignKey
+from lsst.daf.butler.core.metrics import countMetric
 from lsst.daf.butler.registry.interfaces import (
     ChainedCollectionRecord,
     CollectionManager,
@@ -57,6 +63,12 @@ from ...summaries import CollectionSummary, GovernorDimensionRestriction
 
 _T = TypeVar("_T")
 
+_SummaryEntry = Tuple[str, Any]
+"""Type alias for an entry in a collection summary table: a tuple of the
+name of the column that holds the value (``dataset_type_id`` or a governor
+dimension name) and the value itself.
+"""
+
 
 class CollectionSummaryTables(Generic[_T]):
     """Structure that holds the table or table specification objects that
@@ -150,6 +162,14 @@ class CollectionSummaryManager:
         self._dimensions = dimensions
         self._tables = tables
         self._cache: Dict[Any, CollectionSummary] = {}
+        # Summary entries known to be present in the database, keyed by
+        # collection key.  We also hold the CollectionRecord for each so we
+        # can detect collections that have been removed and recreated.
+        self._committed: Dict[Any, Tuple[CollectionRecord, Set[_SummaryEntry]]] = {}
+        # Summary entries written in the current (uncommitted) transaction,
+        # with the same structure.
+        self._uncommitted: Dict[Any, Tuple[CollectionRecord, Set[_SummaryEntry]]] = {}
+        self._commitCallbackRegistered = False
 
     @classmethod
     def initialize(
@@ -221,23 +241,35 @@ class CollectionSummaryManager:
         -----
         This method should only be called inside the transaction context of
         another operation that inserts or associates datasets.
+
+        Summary rows that are known to have been committed already, or that
+        were already written earlier in the current transaction, are not
+        written again.  The tags and calibs tables have foreign keys into the
+        summary tables, so new rows cannot be deferred until commit.
         """
-        self._db.ensure(
-            self._tables.datasetType,
-            {
-                "dataset_type_id": dataset_type_id,
-                self._collectionKeyName: collection.key,
-            }
-        )
+        entries = {("dataset_type_id", dataset_type_id)}
         for dimension, values in governors.items():
-            if values:
-                self._db.ensure(
-                    self._tables.dimensions[dimension.name],
-                    *[{
-                        self._collectionKeyName: collection.key,
-                        dimension.name: v
-                    } for v in values],
+            entries.update((dimension.name, v) for v in values)
+        # Skip anything we know has already been committed to the database, or
+        # that was already written earlier in the current transaction.
+        entries -= self._getCommitted(collection)
+        _, uncommitted = self._uncommitted.setdefault(collection.key, (collection, set()))
+        entries -= uncommitted
+        if entries:
+            with self._db.transaction():
+                self._write(collection, entries)
+                uncommitted.update(entries)
+                # If the transaction block that wrote these entries is rolled
+                # back, we'll need to write them again next time.
+                self._db.addTransactionCallbacks(
+                    afterRollback=lambda: uncommitted.difference_update(entries)
                 )
+                if not self._commitCallbackRegistered:
+                    self._commitCallbackRegistered = True
+                    self._db.addTransactionCallbacks(
+                        afterCommit=self._markCommitted,
+                        afterRollback=self._unregisterCommitCallback,
+                    )
         # Update the in-memory cache, too.  These changes will remain even if
         # the database inserts above are rolled back by some later exception in
         # the same transaction, but that's okay: we never promise that a
@@ -245,17 +277,90 @@ class CollectionSummaryManager:
         # values that are actually present, only that it is guaranteed to
         # contain any dataset types or governor dimension values that _may_ be
         # present.
-        # That guarantee (and the possibility of rollbacks) means we can't get
-        # away with checking the cache before we try the database inserts,
-        # however; if someone had attemped to insert datasets of some dataset
-        # type previously, and that rolled back, and we're now trying to insert
+        # That guarantee (and the possibility of rollbacks) means we can't use
+        # this cache to decide whether to skip the database inserts, however;
+        # if someone had attemped to insert datasets of some dataset type
+        # previously, and that rolled back, and we're now trying to insert
         # some more datasets of that same type, it would not be okay to skip
         # the DB summary table insertions because we found entries in the
-        # in-memory cache.
+        # in-memory cache.  That's what the separate record of committed
+        # entries is for.
         summary = self.get(collection)
         summary.datasetTypes.add(datasetType)
         summary.dimensions.update(governors)
 
+    def _getCommitted(self, collection: CollectionRecord) -> Set[_SummaryEntry]:
+        """Return the summary entries known to be committed to the database
+        for the given collection.
+
+        Parameters
+        ----------
+        collection : `CollectionRecord`
+            Record describing the collection.
+
+        Returns
+        -------
+        entries : `set` [ `tuple` ]
+            Set of ``(column name, value)`` tuples.  Must not be modified by
+            the caller.
+        """
+        record, entries = self._committed.get(collection.key, (None, set()))
+        if record is not collection:
+            # The collection has been removed and recreated (possibly with the
+            # same key) since we saw it, or the caller is holding a record
+            # from before the last refresh; either way we can't trust what we
+            # remember.
+            return set()
+        return entries
+
+    def _write(self, collection: CollectionRecord, entries: Set[_SummaryEntry]) -> None:
+        """Insert summary entries into the database, with one ``ensure`` call
+        per summary table.
+
+        Parameters
+        ----------
+        collection : `CollectionRecord`
+            Record describing the collection.
+        entries : `set` [ `tuple` ]
+            Set of ``(column name, value)`` tuples to insert.
+        """
+        rowsByColumn: Dict[str, List[Dict[str, Any]]] = {}
+        for column, value in entries:
+            rowsByColumn.setdefault(column, []).append(
+                {self._collectionKeyName: collection.key, column: value}
+            )
+        for column, rows in rowsByColumn.items():
+            if column == "dataset_type_id":
+                self._db.ensure(self._tables.datasetType, *rows)
+            else:
+                self._db.ensure(self._tables.dimensions[column], *rows)
+
+    def _markCommitted(self) -> None:
+        """Move all entries written in the just-committed transaction to the
+        committed state.
+
+        This is registered as an "after commit" callback on the outermost
+        transaction.
+        """
+        for collectionKey, (record, entries) in self._uncommitted.items():
+            committedRecord, committed = self._committed.get(collectionKey, (None, set()))
+            if committedRecord is not record:
+                committed = set()
+                self._committed[collectionKey] = (record, committed)
+            committed.update(entries)
+        self._uncommitted.clear()
+        self._commitCallbackRegistered = False
+
+    def _unregisterCommitCallback(self) -> None:
+        """Note that the transaction block that registered `_markCommitted`
+        has been rolled back.
+
+        Any entries written within that block have already been (or will be)
+        discarded by their own rollback callbacks; the next call to `update`
+        that writes anything registers `_markCommitted` again.
+        """
+        self._commitCallbackRegistered = False
+
     def refresh(self, get_dataset_type: Callable[[int], DatasetType]) -> None:
         """Load all collection summary information from the database.
 
@@ -265,8 +370,52 @@ class CollectionSummaryManager:
             Function that takes an `int` dataset_type_id value and returns a
             `DatasetType` instance.
         """
-        # Set up the SQL query we'll use to fetch all of the summary
-        # information at once.
+        summaries: Dict[Any, CollectionSummary] = {}
+        committed: Dict[Any, Tuple[CollectionRecord, Set[_SummaryEntry]]] = {}
+        self._load(self._makeQuery(), get_dataset_type, summaries, committed)
+        self._cache = summaries
+        self._committed = committed
+
+    def reload(self, collections: Iterable[CollectionRecord],
+               get_dataset_type: Callable[[int], Optional[DatasetType]]) -> None:
+        """Load the summaries of some collections from the database again,
+        picking up datasets added to them by other clients since the last call
+        to `refresh`.
+
+        Parameters
+        ----------
+        collections : `Iterable` [ `CollectionRecord` ]
+            Records for the (non-chained) collections to reload.
+        get_dataset_type : `Callable`
+            Function that takes an `int` dataset_type_id value and returns a
+            `DatasetType` instance, or `None` for dataset types not known to
+            this client; those are left out of the summaries.
+        """
+        keys = [record.key for record in collections]
+        summaries: Dict[Any, CollectionSummary] = {}
+        # Rows read here may have been written by a transaction of ours that
+        # is still open, so (unlike in refresh) they are not known to be
+        # committed, and we do not update self._committed.
+        column = self._tables.datasetType.columns[self._collectionKeyName]
+        with self._db.inClauses(column, keys) as inClauses:
+            for inClause in inClauses:
+                self._load(self._makeQuery().where(inClause), get_dataset_type, summaries, committed={})
+        for key in keys:
+            summary = summaries.get(key)
+            if summary is not None:
+                cached = self._cache.get(key)
+                self._cache[key] = summary.union(cached) if cached is not None else summary
+
+    def _makeQuery(self) -> sqlalchemy.sql.Select:
+        """Return a query for all collection summary rows.
+
+        Returns
+        -------
+        sql : `sqlalchemy.sql.Select`
+            Query with one row for each combination of collection, dataset
+            type, and governor dimension values (`None` for governor
+            dimensions not present).
+        """
         columns = [
             self._tables.datasetType.columns[self._collectionKeyName].label(self._collectionKeyName),
             self._tables.datasetType.columns.dataset_type_id.label("dataset_type_id"),
@@ -282,11 +431,29 @@ class CollectionSummaryManager:
                 ),
                 isouter=True,
             )
-        sql = sqlalchemy.sql.select(columns).select_from(fromClause)
-        # Run the query and construct CollectionSummary objects from the result
-        # rows.  This will never include CHAINED collections or collections
-        # with no datasets.
-        summaries: Dict[Any, CollectionSummary] = {}
+        return sqlalchemy.sql.select(columns).select_from(fromClause)
+
+    def _load(self, sql: sqlalchemy.sql.Select, get_dataset_type: Callable[[int], Optional[DatasetType]],
+              summaries: Dict[Any, CollectionSummary],
+              committed: Dict[Any, Tuple[CollectionRecord, Set[_SummaryEntry]]]) -> None:
+        """Run a query returned by `_makeQuery` and construct
+        `CollectionSummary` objects from the result rows.
+
+        Parameters
+        ----------
+        sql : `sqlalchemy.sql.Select`
+            Query to run.
+        get_dataset_type : `Callable`
+            Function that takes an `int` dataset_type_id value and returns a
+            `DatasetType` instance or `None`.
+        summaries : `dict`
+            Summaries to update, keyed by collection key.
+        committed : `dict`
+            Summary entries known to be in the database to update, with the
+            same structure as ``self._committed``.
+        """
+        # This will never include CHAINED collections or collections with no
+        # datasets.
         for row in self._db.query(sql):
             # Collection key should never be None/NULL; it's what we join on.
             # Extract that and then turn it into a collection name.
@@ -299,12 +466,15 @@ class CollectionSummaryManager:
             summary = summaries.get(collectionKey)
             if summary is None:
                 summary = CollectionSummary(
-                    datasetTypes=NamedValueSet([datasetType]),
+                    datasetTypes=NamedValueSet(),
                     dimensions=GovernorDimensionRestriction.makeEmpty(self._dimensions.universe),
                 )
                 summaries[collectionKey] = summary
-            else:
+            if datasetType is not None:
                 summary.datasetTypes.add(datasetType)
+            # Remember what's in the database, so `update` can skip it.
+            _, entries = committed.setdefault(collectionKey, (self._collections[collectionKey], set()))
+            entries.add(("dataset_type_id", row["dataset_type_id"]))
             # Update the dimensions with the values in this row that aren't
             # None/NULL (many will be in general, because these enter the query
             # via LEFT OUTER JOIN).
@@ -312,7 +482,7 @@ class CollectionSummaryManager:
                 value = row[dimension.name]
                 if value is not None:
                     summary.dimensions.add(dimension, value)
-        self._cache = summaries
+                    entries.add((dimension.name, value))
 
     def get(self, collection: CollectionRecord) -> CollectionSummary:
         """Return a summary for the given collection.
@@ -330,6 +500,7 @@ class CollectionSummaryManager:
             this collection.
         """
         summary = self._cache.get(collection.key)
+        countMetric("cache.collectionSummary.hit" if summary is not None else "cache.collectionSummary.miss")
         if summary is None:
             # When we load the summary information from the database, we don't
             # create summaries for CHAINED collections; those are created here
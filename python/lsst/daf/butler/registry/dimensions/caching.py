@@ -20,9 +20,10 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
-__all__ = ["CachingDimensionRecordStorage"]
+__all__ = ["CachingDimensionRecordStorage", "DimensionRecordCache"]
 
-from typing import Any, Dict, Iterable, Mapping, Optional, Set
+from collections import OrderedDict
+from typing import Any, Iterable, List, Mapping, Optional, Set, Tuple
 
 import sqlalchemy
 
@@ -41,8 +42,10 @@ from ...core import (
     SpatialRegionDatabaseRepresentation,
     TimespanDatabaseRepresentation,
 )
+from ...core.metrics import countMetric
 from ..interfaces import (
     Database,
+    DatabaseDimensionOverlapStorage,
     DatabaseDimensionRecordStorage,
     GovernorDimensionRecordStorage,
     StaticTablesContext,
@@ -50,6 +53,134 @@ from ..interfaces import (
 from ..queries import QueryBuilder
 
 
+class DimensionRecordCache:
+    """A bounded, least-recently-used cache of `DimensionRecord` objects,
+    shared by all `CachingDimensionRecordStorage` instances in a `Registry`.
+
+    Parameters
+    ----------
+    maxSize : `int`, optional
+        Maximum number of records (including cached "no such record" entries)
+        to hold.  `None` means unbounded.
+    """
+
+    DEFAULT_SIZE = 10000
+    """Default maximum size for caches created by `Registry` (`int`).
+
+    May be overridden by the ``registry.dimensionRecordCacheSize``
+    configuration option.
+    """
+
+    def __init__(self, maxSize: Optional[int] = None):
+        if maxSize is not None and maxSize < 0:
+            raise ValueError(f"Invalid dimension record cache size {maxSize}.")
+        self._maxSize = maxSize
+        self._records: OrderedDict[Tuple[str, DataCoordinate], Optional[DimensionRecord]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    hits: int
+    """Number of successful lookups since construction or the last call to
+    `resetStats` (`int`).
+    """
+
+    misses: int
+    """Number of unsuccessful lookups since construction or the last call to
+    `resetStats` (`int`).
+    """
+
+    @property
+    def maxSize(self) -> Optional[int]:
+        """Maximum number of entries to hold (`int` or `None`).
+
+        Setting this evicts least-recently-used entries as necessary.
+        """
+        return self._maxSize
+
+    @maxSize.setter
+    def maxSize(self, value: Optional[int]) -> None:
+        if value is not None and value < 0:
+            raise ValueError(f"Invalid dimension record cache size {value}.")
+        self._maxSize = value
+        self._evict()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, element: DimensionElement, dataId: DataCoordinate) -> Any:
+        """Look up a record in the cache.
+
+        Parameters
+        ----------
+        element : `DimensionElement`
+            Element the record is for.
+        dataId : `DataCoordinate`
+            Data ID for the record, with ``dataId.graph == element.graph``.
+
+        Returns
+        -------
+        record : `DimensionRecord`, `None`, or `...`
+            The cached record, `None` if it is known that no such record
+            exists, or `...` if there is no cache entry.
+        """
+        key = (element.name, dataId)
+        record = self._records.get(key, ...)
+        if record is ...:
+            self.misses += 1
+            countMetric("cache.dimensionRecord.miss")
+        else:
+            self.hits += 1
+            countMetric("cache.dimensionRecord.hit")
+            self._records.move_to_end(key)
+        return record
+
+    def set(self, element: DimensionElement, dataId: DataCoordinate,
+            record: Optional[DimensionRecord]) -> None:
+        """Add or replace a cache entry.
+
+        Parameters
+        ----------
+        element : `DimensionElement`
+            Element the record is for.
+        dataId : `DataCoordinate`
+            Data ID for the record, with ``dataId.graph == element.graph``.
+        record : `DimensionRecord` or `None`
+            The record, or `None` to record that no such record exists.
+        """
+        key = (element.name, dataId)
+        self._records[key] = record
+        self._records.move_to_end(key)
+        self._evict()
+
+    def clear(self, element: Optional[DimensionElement] = None) -> None:
+        """Remove cache entries.
+
+        Parameters
+        ----------
+        element : `DimensionElement`, optional
+            If provided, only remove entries for this element.
+        """
+        if element is None:
+            self._records.clear()
+        else:
+            for key in [key for key in self._records if key[0] == element.name]:
+                del self._records[key]
+
+    def resetStats(self) -> None:
+        """Reset the `hits` and `misses` counters to zero.
+        """
+        self.hits = 0
+        self.misses = 0
+
+    def _evict(self) -> None:
+        """Remove least-recently-used entries until the cache is no larger
+        than `maxSize`.
+        """
+        if self._maxSize is not None:
+            while len(self._records) > self._maxSize:
+                self._records.popitem(last=False)
+
+
 class CachingDimensionRecordStorage(DatabaseDimensionRecordStorage):
     """A record storage implementation that adds caching to some other nested
     storage implementation.
@@ -59,10 +190,19 @@ class CachingDimensionRecordStorage(DatabaseDimensionRecordStorage):
     nested : `DatabaseDimensionRecordStorage`
         The other storage to cache fetches from and to delegate all other
         operations to.
+    cache : `DimensionRecordCache`, optional
+        Cache to use; may be shared with other storage objects.  If not
+        provided, a new unbounded cache is created.
+    cacheMissing : `bool`, optional
+        If `True` (default), also cache the fact that a record does not exist.
+        This should only be used for elements whose records are not expected
+        to be added by other clients during the lifetime of this object.
     """
-    def __init__(self, nested: DatabaseDimensionRecordStorage):
+    def __init__(self, nested: DatabaseDimensionRecordStorage, *,
+                 cache: Optional[DimensionRecordCache] = None, cacheMissing: bool = True):
         self._nested = nested
-        self._cache: Dict[DataCoordinate, Optional[DimensionRecord]] = {}
+        self._cache = cache if cache is not None else DimensionRecordCache()
+        self._cacheMissing = cacheMissing
 
     @classmethod
     def initialize(
@@ -84,9 +224,19 @@ class CachingDimensionRecordStorage(DatabaseDimensionRecordStorage):
         # Docstring inherited from DimensionRecordStorage.element.
         return self._nested.element
 
+    @property
+    def cache(self) -> DimensionRecordCache:
+        """The cache used by this storage object (`DimensionRecordCache`).
+        """
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: DimensionRecordCache) -> None:
+        self._cache = cache
+
     def clearCaches(self) -> None:
         # Docstring inherited from DimensionRecordStorage.clearCaches.
-        self._cache.clear()
+        self._cache.clear(self.element)
         self._nested.clearCaches()
 
     def join(
@@ -102,36 +252,57 @@ class CachingDimensionRecordStorage(DatabaseDimensionRecordStorage):
         # Docstring inherited from DimensionRecordStorage.insert.
         self._nested.insert(*records)
         for record in records:
-            self._cache[record.dataId] = record
+            self._cache.set(self.element, record.dataId, record)
 
     def sync(self, record: DimensionRecord) -> bool:
         # Docstring inherited from DimensionRecordStorage.sync.
         inserted = self._nested.sync(record)
         if inserted:
-            self._cache[record.dataId] = record
+            self._cache.set(self.element, record.dataId, record)
         return inserted
 
+    def syncMany(self, records: Iterable[DimensionRecord]) -> List[bool]:
+        # Docstring inherited from DimensionRecordStorage.syncMany.
+        records = list(records)
+        result = self._nested.syncMany(records)
+        for record, inserted in zip(records, result):
+            if inserted:
+                self._cache.set(self.element, record.dataId, record)
+        return result
+
     def fetch(self, dataIds: DataCoordinateIterable) -> Iterable[DimensionRecord]:
         # Docstring inherited from DimensionRecordStorage.fetch.
         missing: Set[DataCoordinate] = set()
+        anyCached = False
         for dataId in dataIds:
             # Use ... as sentinal value so we can also cache None == "no such
             # record exists".
-            record = self._cache.get(dataId, ...)
+            record = self._cache.get(self.element, dataId)
             if record is ...:
                 missing.add(dataId)
-            elif record is not None:
-                # Unclear why MyPy can't tell that this isn't ..., but it
-                # thinks it's still a possibility.
-                yield record  # type: ignore
+            else:
+                anyCached = True
+                if record is not None:
+                    # Unclear why MyPy can't tell that this isn't ..., but it
+                    # thinks it's still a possibility.
+                    yield record  # type: ignore
         if missing:
-            toFetch = DataCoordinateSet(missing, graph=self.element.graph)
+            found: Set[DataCoordinate] = set()
+            # If nothing was cached, pass through the original iterable, which
+            # may be able to constrain the nested query more efficiently (e.g.
+            # via a subquery) than an explicit set of data IDs.
+            toFetch = dataIds if not anyCached else DataCoordinateSet(missing, graph=self.element.graph)
             for record in self._nested.fetch(toFetch):
-                self._cache[record.dataId] = record
+                self._cache.set(self.element, record.dataId, record)
+                found.add(record.dataId)
                 yield record
-            missing -= self._cache.keys()
-            for dataId in missing:
-                self._cache[dataId] = None
+            if self._cacheMissing:
+                for dataId in missing - found:
+                    self._cache.set(self.element, dataId, None)
+
+    def connect(self, overlaps: DatabaseDimensionOverlapStorage) -> None:
+        # Docstring inherited from DatabaseDimensionRecordStorage.
+        self._nested.connect(overlaps)
 
     def digestTables(self) -> Iterable[sqlalchemy.schema.Table]:
         # Docstring inherited from DimensionRecordStorage.digestTables.
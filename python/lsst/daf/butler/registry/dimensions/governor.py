@@ -152,6 +152,14 @@ class BasicGovernorDimensionRecordStorage(GovernorDimensionRecordStorage):
                 callback(record)
         return inserted
 
+    def syncMany(self, records: Iterable[DimensionRecord]) -> List[bool]:
+        # Docstring inherited from DimensionRecordStorage.syncMany.
+        # Governor dimensions have few records, and inserting one has side
+        # effects via callbacks, so there's no point in doing anything more
+        # clever than syncing them one at a time.
+        with self._db.transaction():
+            return [self.sync(record) for record in records]
+
     def fetch(self, dataIds: DataCoordinateIterable) -> Iterable[DimensionRecord]:
         # Docstring inherited from DimensionRecordStorage.fetch.
         try:
@@ -22,7 +22,7 @@ from __future__ import annotations
 
 __all__ = ["QueryDimensionRecordStorage"]
 
-from typing import Any, Iterable, Mapping, Optional
+from typing import Any, Iterable, List, Mapping, Optional
 
 import sqlalchemy
 
@@ -164,6 +164,10 @@ class QueryDimensionRecordStorage(DatabaseDimensionRecordStorage):
         # Docstring inherited from DimensionRecordStorage.sync.
         raise TypeError(f"Cannot sync {self.element.name} records.")
 
+    def syncMany(self, records: Iterable[DimensionRecord]) -> List[bool]:
+        # Docstring inherited from DimensionRecordStorage.syncMany.
+        raise TypeError(f"Cannot sync {self.element.name} records.")
+
     def fetch(self, dataIds: DataCoordinateIterable) -> Iterable[DimensionRecord]:
         # Docstring inherited from DimensionRecordStorage.fetch.
         RecordClass = self.element.RecordClass
@@ -22,7 +22,7 @@ from __future__ import annotations
 
 __all__ = ["BasicSkyPixDimensionRecordStorage"]
 
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional
 
 import sqlalchemy
 
@@ -90,6 +90,10 @@ class BasicSkyPixDimensionRecordStorage(SkyPixDimensionRecordStorage):
         # Docstring inherited from DimensionRecordStorage.sync.
         raise TypeError(f"Cannot sync SkyPixdimension {self._dimension.name}.")
 
+    def syncMany(self, records: Iterable[DimensionRecord]) -> List[bool]:
+        # Docstring inherited from DimensionRecordStorage.syncMany.
+        raise TypeError(f"Cannot sync SkyPixdimension {self._dimension.name}.")
+
     def fetch(self, dataIds: DataCoordinateIterable) -> Iterable[DimensionRecord]:
         # Docstring inherited from DimensionRecordStorage.fetch.
         RecordClass = self._dimension.RecordClass
@@ -47,6 +47,7 @@ from ..interfaces import (
     GovernorDimensionRecordStorage,
     VersionTuple
 )
+from .caching import CachingDimensionRecordStorage, DimensionRecordCache
 
 
 # This has to be updated on every schema change
@@ -76,6 +77,9 @@ class StaticDimensionRecordStorageManager(DimensionRecordStorageManager):
         Object that manages saved `DimensionGraph` definitions.
     universe : `DimensionUniverse`
         All known dimensions.
+    recordCache : `DimensionRecordCache`
+        Cache of dimension records shared by all `DatabaseDimensionElement`
+        storage objects in ``records``.
     """
     def __init__(
         self,
@@ -85,10 +89,12 @@ class StaticDimensionRecordStorageManager(DimensionRecordStorageManager):
                        DatabaseDimensionOverlapStorage],
         dimensionGraphStorage: _DimensionGraphStorage,
         universe: DimensionUniverse,
+        recordCache: DimensionRecordCache,
     ):
         super().__init__(universe=universe)
         self._db = db
         self._records = records
+        self._recordCache = recordCache
         self._overlaps = overlaps
         self._dimensionGraphStorage = dimensionGraphStorage
 
@@ -107,10 +113,19 @@ class StaticDimensionRecordStorageManager(DimensionRecordStorageManager):
             records[dimension] = governorStorage
         # Next we initialize storage for DatabaseDimensionElements.
         # We remember the spatial ones (grouped by family) so we can go back
-        # and initialize overlap storage for them later.
+        # and initialize overlap storage for them later.  All of these share a
+        # single bounded record cache; elements configured to be cached also
+        # cache the absence of records, while others (whose records may be
+        # added by other clients at any time) only cache records that exist.
+        recordCache = DimensionRecordCache(maxSize=DimensionRecordCache.DEFAULT_SIZE)
         spatial = NamedKeyDict[DatabaseTopologicalFamily, List[DatabaseDimensionRecordStorage]]()
         for element in universe.getDatabaseElements():
             elementStorage = element.makeStorage(db, context=context, governors=governors)
+            if isinstance(elementStorage, CachingDimensionRecordStorage):
+                elementStorage.cache = recordCache
+            else:
+                elementStorage = CachingDimensionRecordStorage(elementStorage, cache=recordCache,
+                                                               cacheMissing=False)
             records[element] = elementStorage
             if element.spatial is not None:
                 spatial.setdefault(element.spatial, []).append(elementStorage)
@@ -140,7 +155,7 @@ class StaticDimensionRecordStorageManager(DimensionRecordStorageManager):
         # Create table that stores DimensionGraph definitions.
         dimensionGraphStorage = _DimensionGraphStorage.initialize(db, context, universe=universe)
         return cls(db=db, records=records, universe=universe, overlaps=overlaps,
-                   dimensionGraphStorage=dimensionGraphStorage)
+                   dimensionGraphStorage=dimensionGraphStorage, recordCache=recordCache)
 
     def refresh(self) -> None:
         # Docstring inherited from DimensionRecordStorageManager.
@@ -172,9 +187,15 @@ class StaticDimensionRecordStorageManager(DimensionRecordStorageManager):
 
     def clearCaches(self) -> None:
         # Docstring inherited from DimensionRecordStorageManager.
+        self._recordCache.clear()
         for storage in self._records.values():
             storage.clearCaches()
 
+    @property
+    def recordCache(self) -> DimensionRecordCache:
+        # Docstring inherited from DimensionRecordStorageManager.
+        return self._recordCache
+
     @classmethod
     def currentVersion(cls) -> Optional[VersionTuple]:
         # Docstring inherited from VersionedExtension.
@@ -23,6 +23,7 @@ from __future__ import annotations
 __all__ = ["TableDimensionRecordStorage"]
 
 from collections import defaultdict
+import itertools
 import logging
 from typing import (
     AbstractSet,
@@ -45,6 +46,8 @@ from ...core import (
     DatabaseDimensionElement,
     DataCoordinate,
     DataCoordinateIterable,
+    DataCoordinateSequence,
+    DataCoordinateSet,
     ddl,
     DimensionElement,
     DimensionRecord,
@@ -60,6 +63,7 @@ from ...core import (
 )
 from ..interfaces import (
     Database,
+    DatabaseConflictError,
     DatabaseDimensionOverlapStorage,
     DatabaseDimensionRecordStorage,
     GovernorDimensionRecordStorage,
@@ -77,8 +81,16 @@ MAX_FETCH_CHUNK = 1000
 
 Barring something database-engine-specific, this sets the size of the actual
 SQL query, not just the number of result rows, because the only way to query
-for multiple data IDs in a single SELECT query via SQLAlchemy is to have an OR
-term in the WHERE clause for each one.
+for multiple data IDs in a single SELECT query via SQLAlchemy is to put them
+in the WHERE clause (see `DataCoordinateIterable.constrain`).  This only
+applies to in-memory collections of data IDs; those backed by queries are
+always fetched in a single query, via a subquery.
+"""
+
+
+MAX_OVERLAP_INSERT_CHUNK = 10000
+"""Maximum number of skypix overlap rows held in memory and inserted at a
+time.
 """
 
 
@@ -192,24 +204,49 @@ class TableDimensionRecordStorage(DatabaseDimensionRecordStorage):
         builder.finishJoin(self._table, joinOn)
         return self._table
 
-    def fetch(self, dataIds: DataCoordinateIterable) -> Iterable[DimensionRecord]:
-        # Docstring inherited from DimensionRecordStorage.fetch.
-        RecordClass = self.element.RecordClass
+    def _makeFetchQuery(self) -> SimpleQuery:
+        """Return a query that selects all record columns from this element's
+        table, to be constrained by the caller and passed to `_readRecords`.
+        """
         query = SimpleQuery()
-        query.columns.extend(self._table.columns[name] for name in RecordClass.fields.standard.names)
+        query.columns.extend(self._table.columns[name]
+                             for name in self.element.RecordClass.fields.standard.names)
         if self.element.spatial is not None:
             query.columns.append(self._table.columns["region"])
         if self.element.temporal is not None:
             TimespanReprClass = self._db.getTimespanRepresentation()
             query.columns.extend(self._table.columns[name] for name in TimespanReprClass.getFieldNames())
         query.join(self._table)
-        dataIds.constrain(query, lambda name: self._fetchColumns[name])
+        return query
+
+    def _readRecords(self, query: SimpleQuery) -> Iterator[DimensionRecord]:
+        """Execute a query constructed by `_makeFetchQuery` and transform its
+        result rows into records.
+        """
+        RecordClass = self.element.RecordClass
+        TimespanReprClass = self._db.getTimespanRepresentation()
         for row in self._db.query(query.combine()):
             values = dict(row)
             if self.element.temporal is not None:
                 values[TimespanDatabaseRepresentation.NAME] = TimespanReprClass.extract(values)
             yield RecordClass(**values)
 
+    def fetch(self, dataIds: DataCoordinateIterable) -> Iterable[DimensionRecord]:
+        # Docstring inherited from DimensionRecordStorage.fetch.
+        if (isinstance(dataIds, (DataCoordinateSet, DataCoordinateSequence))
+                and len(dataIds) > MAX_FETCH_CHUNK):
+            dataIdList = list(dataIds)
+            for start in range(0, len(dataIdList), MAX_FETCH_CHUNK):
+                yield from self.fetch(
+                    DataCoordinateSequence(dataIdList[start:start + MAX_FETCH_CHUNK], graph=dataIds.graph,
+                                           hasFull=dataIds.hasFull(), hasRecords=dataIds.hasRecords(),
+                                           check=False)
+                )
+            return
+        query = self._makeFetchQuery()
+        dataIds.constrain(query, lambda name: self._fetchColumns[name])
+        yield from self._readRecords(query)
+
     def insert(self, *records: DimensionRecord) -> None:
         # Docstring inherited from DimensionRecordStorage.insert.
         elementRows = [record.toDict() for record in records]
@@ -243,6 +280,54 @@ class TableDimensionRecordStorage(DatabaseDimensionRecordStorage):
                 self._skyPixOverlap.insert([record])
         return inserted
 
+    def syncMany(self, records: Iterable[DimensionRecord]) -> List[bool]:
+        # Docstring inherited from DimensionRecordStorage.syncMany.
+        records = list(records)
+        if not records:
+            return []
+        # Group the primary key values of the given records by the values of
+        # all but the last key column, so we can look for existing records
+        # with one IN clause per group (usually per governor value).
+        keyNames = list(self.element.RecordClass.fields.required.names)
+        outerNames, innerName = keyNames[:-1], keyNames[-1]
+        grouped: Dict[tuple, Set[Any]] = defaultdict(set)
+        for record in records:
+            grouped[tuple(getattr(record, name) for name in outerNames)].add(getattr(record, innerName))
+        # Lock the table (as Database.sync does) so no other process can
+        # insert the records we are about to insert between our looking for
+        # them and inserting them.
+        lock = [self._table] if self._db.isTableWriteable(self._table) else []
+        with self._db.transaction(lock=lock):
+            existing: Dict[DataCoordinate, DimensionRecord] = {}
+            for outerValues, innerValues in grouped.items():
+                with self._db.inClauses(self._table.columns[innerName], innerValues) as inClauses:
+                    for inClause in inClauses:
+                        query = self._makeFetchQuery()
+                        query.where.extend(self._table.columns[name] == value
+                                           for name, value in zip(outerNames, outerValues))
+                        query.where.append(inClause)
+                        existing.update((record.dataId, record) for record in self._readRecords(query))
+            inserted: List[bool] = []
+            toInsert: Dict[DataCoordinate, DimensionRecord] = {}
+            for record in records:
+                old = existing.get(record.dataId)
+                if old is None:
+                    old = toInsert.get(record.dataId)
+                if old is None:
+                    toInsert[record.dataId] = record
+                    inserted.append(True)
+                    continue
+                oldValues = old.toDict()
+                bad = [name for name, value in record.toDict().items() if oldValues[name] != value]
+                if bad:
+                    raise DatabaseConflictError(
+                        f"Conflict in sync for table {self._table.name} on column(s) {bad}."
+                    )
+                inserted.append(False)
+            if toInsert:
+                self.insert(*toInsert.values())
+        return inserted
+
     def digestTables(self) -> Iterable[sqlalchemy.schema.Table]:
         # Docstring inherited from DimensionRecordStorage.digestTables.
         result = [self._table]
@@ -620,30 +705,38 @@ class _SkyPixOverlapStorage:
             gvCol = self._summaryTable.columns[self._governor.element.name]
             sysCol = self._summaryTable.columns.skypix_system
             lvlCol = self._summaryTable.columns.skypix_level
-            query = sqlalchemy.sql.select(
-                [gvCol, sysCol, lvlCol],
-            ).select_from(
-                self._summaryTable
-            ).where(
-                gvCol.in_(list(grouped.keys()))
-            )
             # Group results by governor value, then skypix system.
             skypix: Dict[str, NamedKeyDict[SkyPixSystem, List[int]]] = {
                 gv: NamedKeyDict() for gv in grouped.keys()
             }
-            for summaryRow in self._db.query(query):
-                system = self.element.universe.skypix[summaryRow[sysCol]]
-                skypix[summaryRow[gvCol]].setdefault(system, []).append(summaryRow[lvlCol])
-            overlapRecords: List[dict] = []
-            # Compute overlaps for one governor value at a time, but gather
-            # them all up for one insert.
-            for gv, group in grouped.items():
-                overlapRecords.extend(self._compute(group, skypix[gv], gv))
+            with self._db.inClauses(gvCol, grouped.keys()) as inClauses:
+                for inClause in inClauses:
+                    query = sqlalchemy.sql.select(
+                        [gvCol, sysCol, lvlCol],
+                    ).select_from(
+                        self._summaryTable
+                    ).where(
+                        inClause
+                    )
+                    for summaryRow in self._db.query(query):
+                        system = self.element.universe.skypix[summaryRow[sysCol]]
+                        skypix[summaryRow[gvCol]].setdefault(system, []).append(summaryRow[lvlCol])
+            # Compute overlaps for one governor value at a time, and insert
+            # them in bounded batches, so we never hold all rows in memory.
+            overlapRecords = itertools.chain.from_iterable(
+                self._compute(group, skypix[gv], gv) for gv, group in grouped.items()
+            )
+            nInserted = 0
+            while True:
+                batch = list(itertools.islice(overlapRecords, MAX_OVERLAP_INSERT_CHUNK))
+                if not batch:
+                    break
+                self._db.insert(self._overlapTable, *batch)
+                nInserted += len(batch)
             _LOG.debug(
-                "Inserting %d new skypix overlap rows for %s where %s in %s.",
-                len(overlapRecords), self.element.name, self._governor.element.name, grouped.keys()
+                "Inserted %d new skypix overlap rows for %s where %s in %s.",
+                nInserted, self.element.name, self._governor.element.name, grouped.keys()
             )
-            self._db.insert(self._overlapTable, *overlapRecords)
 
     def _compute(
         self,
@@ -35,6 +35,8 @@ from typing import (
     TYPE_CHECKING,
 )
 
+import sqlalchemy
+
 from ...core import ddl, DimensionUniverse, Timespan
 from ..wildcards import CollectionSearch
 from .._collectionType import CollectionType
@@ -557,3 +559,27 @@ class CollectionManager(VersionedExtension):
             Docstring for the collection with the given key.
         """
         raise NotImplementedError()
+
+    def selectFlattenedChain(self, record: ChainedCollectionRecord) -> Optional[sqlalchemy.sql.FromClause]:
+        """Return a query for all of the non-chained collections searched by
+        a `~CollectionType.CHAINED` collection.
+
+        Parameters
+        ----------
+        record : `ChainedCollectionRecord`
+            Record for the chained collection.
+
+        Returns
+        -------
+        flattened : `sqlalchemy.sql.FromClause` or `None`
+            Subquery with a "child" column holding the primary key values of
+            the (recursively) searched collections and a "rank" column that
+            orders them the same way `CollectionSearch.iter` does, or `None`
+            if this manager cannot provide one for this chain; callers must
+            then search the chain's children individually.
+
+        Notes
+        -----
+        The default implementation always returns `None`.
+        """
+        return None
@@ -33,6 +33,7 @@ from contextlib import contextmanager
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Dict,
     Iterable,
     Iterator,
@@ -44,16 +45,157 @@ from typing import (
     Type,
     Union,
 )
+import logging
+import time
 import uuid
 import warnings
 
 import astropy.time
 import sqlalchemy
+import sqlalchemy.ext.compiler
 
 from ...core import SpatialRegionDatabaseRepresentation, TimespanDatabaseRepresentation, ddl, time_utils
+from ...core.metrics import timed
 from .._exceptions import ConflictingDefinitionError
 
 _IN_SAVEPOINT_TRANSACTION = "IN_SAVEPOINT_TRANSACTION"
+_TRANSACTION_CALLBACKS = "TRANSACTION_CALLBACKS"
+
+_slowQueryLog = logging.getLogger("lsst.daf.butler.registry.slowQueries")
+
+
+class _Explain(sqlalchemy.sql.expression.Executable, sqlalchemy.sql.expression.ClauseElement):
+    """A SQLAlchemy statement that runs ``EXPLAIN`` (or a dialect-specific
+    variant) on a ``SELECT`` query.
+
+    Parameters
+    ----------
+    statement : `sqlalchemy.sql.FromClause`
+        The query to explain.
+    prefix : `str`
+        The SQL to put before the query, e.g. ``EXPLAIN ANALYZE``.
+    """
+
+    def __init__(self, statement: sqlalchemy.sql.FromClause, prefix: str):
+        self.statement = statement
+        self.prefix = prefix
+
+
+@sqlalchemy.ext.compiler.compiles(_Explain)
+def _compileExplain(element: _Explain, compiler: sqlalchemy.sql.compiler.SQLCompiler, **kwargs: Any) -> str:
+    return f"{element.prefix} {compiler.process(element.statement, **kwargs)}"
+
+
+class _TracedResult:
+    """A wrapper for `sqlalchemy.engine.ResultProxy` that measures the time
+    spent executing a query and fetching its rows, and reports it to
+    `Database` when all rows have been fetched or the result is closed.
+
+    Results that are garbage-collected before that (e.g. after a caller
+    fetches only one row) are reported too, but only with the timing and SQL
+    text already at hand, as the finalizer may run at any point (in another
+    thread, inside an unrelated transaction, or at interpreter shutdown) and
+    so must not use the database.
+
+    Parameters
+    ----------
+    db : `Database`
+        Database the query was run against.
+    sql : `sqlalchemy.sql.FromClause`
+        The query.
+    params : `dict`
+        Bind parameter values passed with the query.
+    execute : `Callable`
+        Callable with no arguments that executes the query and returns a
+        `sqlalchemy.engine.ResultProxy`.
+    """
+
+    def __init__(self, db: Database, sql: sqlalchemy.sql.FromClause, params: Dict[str, Any],
+                 execute: Callable[[], sqlalchemy.engine.ResultProxy]):
+        self._db = db
+        self._sql = sql
+        self._params = params
+        self._rowCount = 0
+        # Nothing to report (even from __del__) if execution fails.
+        self._done = True
+        start = time.perf_counter()
+        self._result = execute()
+        self._elapsed = time.perf_counter() - start
+        self._done = False
+
+    def __del__(self) -> None:
+        # Report results that were dropped without being exhausted or closed,
+        # without compiling or running anything (see class docstring).
+        if not self._done:
+            self._done = True
+            context = getattr(self._result, "context", None)
+            self._db._reportDroppedQuery(getattr(context, "statement", None), self._elapsed,
+                                         self._rowCount)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._result, name)
+
+    def __iter__(self) -> Iterator[sqlalchemy.engine.RowProxy]:
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
+
+    def fetchone(self) -> Optional[sqlalchemy.engine.RowProxy]:
+        start = time.perf_counter()
+        row = self._result.fetchone()
+        self._elapsed += time.perf_counter() - start
+        if row is None:
+            self._finish()
+        else:
+            self._rowCount += 1
+        return row
+
+    def fetchall(self) -> List[sqlalchemy.engine.RowProxy]:
+        start = time.perf_counter()
+        rows = self._result.fetchall()
+        self._elapsed += time.perf_counter() - start
+        self._rowCount += len(rows)
+        self._finish()
+        return rows
+
+    def first(self) -> Optional[sqlalchemy.engine.RowProxy]:
+        start = time.perf_counter()
+        row = self._result.first()
+        self._elapsed += time.perf_counter() - start
+        self._rowCount += row is not None
+        self._finish()
+        return row
+
+    def scalar(self) -> Any:
+        row = self.first()
+        return row[0] if row is not None else None
+
+    def close(self) -> None:
+        self._result.close()
+        self._finish()
+
+    def _finish(self) -> None:
+        if not self._done:
+            self._done = True
+            self._db._reportQuery(self._sql, self._params, self._elapsed, self._rowCount)
+
+
+class _TransactionCallbacks:
+    """Struct holding the callbacks registered with a single
+    `Database.transaction` block.
+    """
+    def __init__(self) -> None:
+        self.afterCommit: List[Callable[[], None]] = []
+        self.afterRollback: List[Callable[[], None]] = []
+
+    def merge(self, other: _TransactionCallbacks) -> None:
+        """Append the callbacks of a nested block that has completed
+        successfully, making them the responsibility of this block.
+        """
+        self.afterCommit.extend(other.afterCommit)
+        self.afterRollback.extend(other.afterRollback)
 
 
 def _checkExistingTableDefinition(name: str, spec: ddl.TableSpec, inspection: List[Dict[str, Any]]) -> None:
@@ -220,6 +362,10 @@ class Database(ABC):
         self._connection = connection
         self._metadata: Optional[sqlalchemy.schema.MetaData] = None
         self._tempTables: Set[str] = set()
+        self._compiledCache = sqlalchemy.util.LRUCache(self.COMPILED_CACHE_SIZE)
+        self._slowQueryThreshold: Optional[float] = None
+        self._explainSlowQueries = False
+        self._explainAnalyze = False
 
     def __repr__(self) -> str:
         # Rather than try to reproduce all the parameters used to create
@@ -387,22 +533,77 @@ class Database(ABC):
         # `Connection.in_nested_transaction()` method.
         savepoint = savepoint or self._connection.info.get(_IN_SAVEPOINT_TRANSACTION, False)
         self._connection.info[_IN_SAVEPOINT_TRANSACTION] = savepoint
-        if self._connection.in_transaction() and savepoint:
+        outermost = not self._connection.in_transaction()
+        if not outermost and savepoint:
             trans = self._connection.begin_nested()
         else:
             # Use a regular (non-savepoint) transaction always for the
             # outermost context, as well as when a savepoint was not requested.
             trans = self._connection.begin()
+        # Callbacks registered via addTransactionCallbacks are tracked with
+        # one frame per block, also in the connection's 'info' dict.
+        callbackStack = self._connection.info.setdefault(_TRANSACTION_CALLBACKS, [])
+        callbacks = _TransactionCallbacks()
+        callbackStack.append(callbacks)
         self._lockTables(lock)
         try:
             yield
             trans.commit()
         except BaseException:
             trans.rollback()
+            callbackStack.pop()
+            for callback in callbacks.afterRollback:
+                callback()
             raise
+        else:
+            callbackStack.pop()
+            if outermost:
+                for callback in callbacks.afterCommit:
+                    callback()
+            elif callbackStack:
+                callbackStack[-1].merge(callbacks)
         finally:
             if not self._connection.in_transaction():
                 self._connection.info.pop(_IN_SAVEPOINT_TRANSACTION, None)
+                self._connection.info.pop(_TRANSACTION_CALLBACKS, None)
+
+    def addTransactionCallbacks(self, *,
+                                afterCommit: Optional[Callable[[], None]] = None,
+                                afterRollback: Optional[Callable[[], None]] = None) -> None:
+        """Register functions to be called when the current transaction
+        completes.
+
+        Parameters
+        ----------
+        afterCommit : `Callable`, optional
+            Function with no arguments to call after the outermost transaction
+            has been committed.
+        afterRollback : `Callable`, optional
+            Function with no arguments to call after the innermost transaction
+            block active at the time of this call (or any block that encloses
+            it) is rolled back.
+
+        Raises
+        ------
+        RuntimeError
+            Raised if there is no active transaction.
+
+        Notes
+        -----
+        Callbacks registered in a nested transaction block that completes
+        successfully are transferred to the enclosing block, so an
+        ``afterCommit`` callback is never called if an enclosing block is
+        rolled back, and an ``afterRollback`` callback is called if any
+        enclosing block is rolled back before the outermost commit.
+        """
+        callbackStack = self._connection.info.get(_TRANSACTION_CALLBACKS)
+        if not callbackStack:
+            raise RuntimeError("Transaction callbacks may only be registered inside a transaction.")
+        callbacks = callbackStack[-1]
+        if afterCommit is not None:
+            callbacks.afterCommit.append(afterCommit)
+        if afterRollback is not None:
+            callbacks.afterRollback.append(afterRollback)
 
     @abstractmethod
     def _lockTables(self, tables: Iterable[sqlalchemy.schema.Table] = ()) -> None:
@@ -525,6 +726,18 @@ class Database(ABC):
             self._metadata = None
             raise
 
+    def close(self) -> None:
+        """Close the connection to the database.
+
+        Notes
+        -----
+        The `Database` must not be used after this is called.  Connections
+        passed to `fromConnection` may be shared between `Database` instances,
+        so this should only be called by the code that created the connection
+        (e.g. via `fromUri`).
+        """
+        self._connection.close()
+
     @abstractmethod
     def isWriteable(self) -> bool:
         """Return `True` if this database can be modified by this client.
@@ -1017,6 +1230,7 @@ class Database(ABC):
         """
         return SpatialRegionDatabaseRepresentation
 
+    @timed("database.sync")
     def sync(self, table: sqlalchemy.schema.Table, *,
              keys: Dict[str, Any],
              compared: Optional[Dict[str, Any]] = None,
@@ -1179,6 +1393,7 @@ class Database(ABC):
             assert result is not None
             return {k: v for k, v in zip(returning, result)}, inserted
 
+    @timed("database.insert")
     def insert(self, table: sqlalchemy.schema.Table, *rows: dict, returnIds: bool = False,
                select: Optional[sqlalchemy.sql.Select] = None,
                names: Optional[Iterable[str]] = None,
@@ -1250,6 +1465,7 @@ class Database(ABC):
             return [self._connection.execute(sql, row).inserted_primary_key[0] for row in rows]
 
     @abstractmethod
+    @timed("database.replace")
     def replace(self, table: sqlalchemy.schema.Table, *rows: dict) -> None:
         """Insert one or more rows into a table, replacing any existing rows
         for which insertion of a new row would violate the primary key
@@ -1284,6 +1500,7 @@ class Database(ABC):
         raise NotImplementedError()
 
     @abstractmethod
+    @timed("database.ensure")
     def ensure(self, table: sqlalchemy.schema.Table, *rows: dict) -> int:
         """Insert one or more rows into a table, skipping any rows for which
         insertion would violate any constraint.
@@ -1319,6 +1536,7 @@ class Database(ABC):
         """
         raise NotImplementedError()
 
+    @timed("database.delete")
     def delete(self, table: sqlalchemy.schema.Table, columns: Iterable[str], *rows: dict) -> int:
         """Delete one or more rows from a table.
 
@@ -1367,6 +1585,101 @@ class Database(ABC):
             sql = sql.where(sqlalchemy.sql.and_(*whereTerms))
         return self._connection.execute(sql, *rows).rowcount
 
+    def deleteWhere(self, table: sqlalchemy.schema.Table, where: sqlalchemy.sql.ClauseElement) -> int:
+        """Delete rows from a table with pre-constructed WHERE clause.
+
+        Parameters
+        ----------
+        table : `sqlalchemy.schema.Table`
+            Table that rows should be deleted from.
+        where: `sqlalchemy.sql.ClauseElement`
+            Boolean SQL expression that selects the rows to delete.  This may
+            include subqueries (e.g. ``column.in_(select)``) and bound value
+            lists (e.g. ``column.in_(values)``).
+
+        Returns
+        -------
+        count : `int`
+            Number of rows deleted.
+
+        Raises
+        ------
+        ReadOnlyDatabaseError
+            Raised if `isWriteable` returns `False` when this method is called.
+
+        Notes
+        -----
+        May be used inside transaction contexts, so implementations may not
+        perform operations that interrupt transactions.
+
+        The default implementation should be sufficient for most derived
+        classes.
+        """
+        self.assertTableWriteable(table, f"Cannot delete from read-only table {table}.")
+        sql = table.delete().where(where)
+        return self._connection.execute(sql).rowcount
+
+    @contextmanager
+    def inClauses(self, column: sqlalchemy.sql.ColumnElement,
+                  values: Iterable[Any]) -> Iterator[List[sqlalchemy.sql.ColumnElement]]:
+        """Return a context manager that provides boolean SQL expressions that
+        together constrain a column to a possibly very large set of values.
+
+        Parameters
+        ----------
+        column : `sqlalchemy.sql.ColumnElement`
+            Column to constrain.  If a temporary table is used, its type (and
+            length, for strings) is used to define the temporary table.
+        values : `Iterable`
+            Values the column may have.  Duplicates are ignored.
+
+        Returns
+        -------
+        context : `contextlib.AbstractContextManager`
+            Context manager that returns a `list` of boolean expressions
+            (`sqlalchemy.sql.ColumnElement`) when entered.  Callers should run
+            one statement (e.g. ``SELECT`` or ``DELETE``) per clause and
+            combine the results; no value appears in more than one clause.
+            The list is empty if ``values`` is empty.
+
+        Notes
+        -----
+        Depending on the number of values, the list holds either a single
+        ``IN`` expression with all values bound as literals, one such
+        expression per chunk of at most `IN_CLAUSE_MAX_SIZE` values, or (for
+        more than `IN_CLAUSE_TEMPORARY_TABLE_THRESHOLD` values, in writeable
+        databases) a single ``IN`` expression with a subquery on a temporary
+        table holding all values.  In the latter case the temporary table is
+        dropped when the context is exited, so the clauses must not be used
+        after that, and results should be fully fetched before then.  Callers
+        that are themselves generators should not yield inside the context,
+        as that would leave the temporary table alive for as long as their
+        own caller holds on to them.
+
+        Because a temporary table may be created, this may not be used
+        where temporary tables cannot be (see `makeTemporaryTable`).
+        """
+        valueList = list(dict.fromkeys(values))
+        if (self.IN_CLAUSE_TEMPORARY_TABLE_THRESHOLD is not None
+                and len(valueList) > max(self.IN_CLAUSE_TEMPORARY_TABLE_THRESHOLD, self.IN_CLAUSE_MAX_SIZE)
+                and self.isWriteable()):
+            spec = ddl.TableSpec(
+                fields=[
+                    ddl.FieldSpec("value", dtype=type(column.type),
+                                  length=getattr(column.type, "length", None), primaryKey=True),
+                ]
+            )
+            table = self.makeTemporaryTable(spec)
+            try:
+                self._connection.execute(table.insert(), *[{"value": v} for v in valueList])
+                yield [column.in_(sqlalchemy.sql.select([table.columns.value]))]
+            finally:
+                self.dropTemporaryTable(table)
+        else:
+            yield [column.in_(valueList[start:start + self.IN_CLAUSE_MAX_SIZE])
+                   for start in range(0, len(valueList), self.IN_CLAUSE_MAX_SIZE)]
+
+    @timed("database.update")
     def update(self, table: sqlalchemy.schema.Table, where: Dict[str, str], *rows: dict) -> int:
         """Update one or more rows in a table.
 
@@ -1412,6 +1725,7 @@ class Database(ABC):
         )
         return self._connection.execute(sql, *rows).rowcount
 
+    @timed("database.query")
     def query(self, sql: sqlalchemy.sql.FromClause,
               *args: Any, **kwds: Any) -> sqlalchemy.engine.ResultProxy:
         """Run a SELECT query against the database.
@@ -1438,7 +1752,176 @@ class Database(ABC):
         classes.
         """
         # TODO: should we guard against non-SELECT queries here?
-        return self._connection.execute(sql, *args, **kwds)
+        if self._slowQueryThreshold is None:
+            return self._connection.execute(sql, *args, **kwds)
+        params = dict(kwds)
+        for arg in args:
+            if isinstance(arg, dict):
+                params.update(arg)
+        return _TracedResult(self, sql, params, lambda: self._connection.execute(sql, *args, **kwds))
+
+    @timed("database.query")
+    def queryPrepared(self, sql: sqlalchemy.sql.FromClause, **params: Any) -> sqlalchemy.engine.ResultProxy:
+        """Run a reusable SELECT query, caching its compiled form.
+
+        Parameters
+        ----------
+        sql : `sqlalchemy.sql.FromClause`
+            A SQLAlchemy representation of a ``SELECT`` query whose varying
+            values are all `sqlalchemy.sql.bindparam` objects (use
+            ``expanding=True`` for ``IN`` lists).  The compiled form is cached
+            by the identity of this object, so callers should construct it
+            once and hold on to it, rather than constructing equivalent
+            queries for each call.
+        **params
+            Values for the bind parameters in ``sql``.
+
+        Returns
+        -------
+        result : `sqlalchemy.engine.ResultProxy`
+            Query results.
+
+        Notes
+        -----
+        At most `COMPILED_CACHE_SIZE` compiled queries are cached, with the
+        least recently used discarded first.
+        """
+        connection = self._connection.execution_options(compiled_cache=self._compiledCache)
+        if self._slowQueryThreshold is None:
+            return connection.execute(sql, params)
+        return _TracedResult(self, sql, params, lambda: connection.execute(sql, params))
+
+    def explain(self, sql: sqlalchemy.sql.FromClause, params: Optional[Dict[str, Any]] = None, *,
+                analyze: bool = False) -> List[str]:
+        """Return the database's plan for a SELECT query.
+
+        Parameters
+        ----------
+        sql : `sqlalchemy.sql.FromClause`
+            A SQLAlchemy representation of a ``SELECT`` query.
+        params : `dict`, optional
+            Values for any bind parameters in ``sql``.
+        analyze : `bool`, optional
+            If `True`, and the database supports it, actually run the query
+            and include the actual row counts and times in the plan.
+
+        Returns
+        -------
+        plan : `list` [ `str` ]
+            Lines of the query plan, as reported by the database.
+
+        Notes
+        -----
+        The default implementation runs ``EXPLAIN`` and joins the columns of
+        each result row with spaces, ignoring ``analyze``; derived classes
+        should override it to use the database's native syntax.
+        """
+        return [" ".join(str(value) for value in row) for row in self._runExplain(sql, params, "EXPLAIN")]
+
+    def _runExplain(self, sql: sqlalchemy.sql.FromClause, params: Optional[Dict[str, Any]],
+                    prefix: str) -> sqlalchemy.engine.ResultProxy:
+        """Run ``EXPLAIN`` or a variant of it on a query.
+
+        This is a helper for implementations of `explain`.
+
+        Parameters
+        ----------
+        sql : `sqlalchemy.sql.FromClause`
+            A SQLAlchemy representation of a ``SELECT`` query.
+        params : `dict` or `None`
+            Values for any bind parameters in ``sql``.
+        prefix : `str`
+            SQL to put before the query, e.g. ``EXPLAIN ANALYZE``.
+
+        Returns
+        -------
+        result : `sqlalchemy.engine.ResultProxy`
+            The rows returned by the database.
+        """
+        return self._connection.execute(_Explain(sql, prefix), params or {})
+
+    def setQueryTracing(self, threshold: Optional[float], *, explain: bool = False,
+                        analyze: bool = False) -> None:
+        """Configure logging of slow queries.
+
+        Parameters
+        ----------
+        threshold : `float` or `None`
+            Queries run with `query` or `queryPrepared` that spend at least
+            this many seconds executing and fetching rows are logged (with
+            their SQL, bind parameters, wall time and row count) as warnings
+            to the ``lsst.daf.butler.registry.slowQueries`` logger.  `None`
+            disables tracing.  Use ``0`` to log all queries.
+        explain : `bool`, optional
+            If `True`, include the database's plan for each logged query
+            (see `explain`).
+        analyze : `bool`, optional
+            If `True`, ask for the actual row counts and times in the query
+            plan, if the database supports it.  This runs slow queries a
+            second time.
+
+        Notes
+        -----
+        Queries are reported once all of their result rows have been fetched,
+        or the result has been closed.  A result that is garbage-collected
+        before then is still reported, with the SQL that was sent to the
+        database, but never explained, since that would mean running queries
+        from a finalizer.
+        """
+        self._slowQueryThreshold = threshold
+        self._explainSlowQueries = explain
+        self._explainAnalyze = analyze
+
+    def _reportQuery(self, sql: sqlalchemy.sql.FromClause, params: Dict[str, Any], elapsed: float,
+                     rowCount: int) -> None:
+        """Log a traced query if it was slow.
+
+        Parameters
+        ----------
+        sql : `sqlalchemy.sql.FromClause`
+            The query.
+        params : `dict`
+            Bind parameter values passed with the query.
+        elapsed : `float`
+            Time spent executing the query and fetching rows, in seconds.
+        rowCount : `int`
+            Number of rows fetched.
+        """
+        if self._slowQueryThreshold is None or elapsed < self._slowQueryThreshold:
+            return
+        compiled = sql.compile(dialect=self._connection.dialect)
+        allParams = dict(compiled.params, **params)
+        message = f"Slow query ({elapsed:.3f}s, {rowCount} rows):\n{compiled}\nParameters: {allParams}"
+        if self._explainSlowQueries:
+            try:
+                plan = self.explain(sql, params, analyze=self._explainAnalyze)
+            except Exception as err:
+                plan = [f"EXPLAIN failed: {err}"]
+            message += "\nQuery plan:\n" + "\n".join(plan)
+        _slowQueryLog.warning(message)
+
+    def _reportDroppedQuery(self, statement: Optional[str], elapsed: float, rowCount: int) -> None:
+        """Log a traced query whose result was garbage-collected before all of
+        its rows were fetched, if it was slow.
+
+        Parameters
+        ----------
+        statement : `str` or `None`
+            SQL sent to the database, if known.
+        elapsed : `float`
+            Time spent executing the query and fetching rows, in seconds.
+        rowCount : `int`
+            Number of rows fetched.
+
+        Notes
+        -----
+        This is called from a finalizer, so unlike `_reportQuery` it must not
+        compile the query or run ``EXPLAIN``; it only logs what it is given.
+        """
+        if self._slowQueryThreshold is None or elapsed < self._slowQueryThreshold:
+            return
+        _slowQueryLog.warning("Slow query (%.3fs, %d rows, result dropped before all rows were "
+                              "fetched):\n%s", elapsed, rowCount, statement)
 
     origin: int
     """An integer ID that should be used as the default for any datasets,
@@ -1450,3 +1933,26 @@ class Database(ABC):
     """The schema or namespace this database instance is associated with
     (`str` or `None`).
     """
+
+    COMPILED_CACHE_SIZE: ClassVar[int] = 1000
+    """Maximum number of compiled statements cached by `queryPrepared`
+    (`int`).
+    """
+
+    IN_CLAUSE_MAX_SIZE: ClassVar[int] = 500
+    """Maximum number of values bound as literals into a single ``IN``
+    expression by `inClauses` (`int`).
+
+    The default keeps statements well below the bind-parameter limit of
+    SQLite (999 in versions before 3.32), leaving room for the other
+    parameters of the statement.  This is the one place that limit is
+    configured; code that binds many values should go through `inClauses`
+    (or compare against this attribute) rather than defining its own.
+    """
+
+    IN_CLAUSE_TEMPORARY_TABLE_THRESHOLD: ClassVar[Optional[int]] = 10000
+    """Number of values above which `inClauses` uploads values to a
+    temporary table instead of splitting them into chunks (`int` or `None`).
+
+    `None` disables the use of temporary tables.
+    """
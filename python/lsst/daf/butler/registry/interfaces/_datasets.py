@@ -25,19 +25,26 @@ __all__ = ("DatasetRecordStorageManager", "DatasetRecordStorage")
 
 from abc import ABC, abstractmethod
 from typing import (
+    AbstractSet,
     Any,
+    Dict,
     Iterable,
     Iterator,
     Optional,
+    Set,
     Tuple,
     TYPE_CHECKING,
 )
 
+import sqlalchemy
+
 from ...core import (
     DataCoordinate,
     DatasetRef,
     DatasetType,
     ddl,
+    GovernorDimension,
+    NamedKeyMapping,
     SimpleQuery,
     Timespan,
 )
@@ -207,6 +214,44 @@ class DatasetRecordStorage(ABC):
         """
         raise NotImplementedError()
 
+    def certifyMany(self, collection: CollectionRecord,
+                    associations: Iterable[Tuple[Iterable[DatasetRef], Timespan]]) -> None:
+        """Associate datasets with a calibration collection and several
+        validity ranges within it.
+
+        Parameters
+        ----------
+        collection : `CollectionRecord`
+            The record object describing the collection.  ``collection.type``
+            must be `~CollectionType.CALIBRATION`.
+        associations : `Iterable` [ `tuple` ]
+            Tuples of ``(datasets, timespan)``, where ``datasets`` is an
+            iterable of `DatasetRef` as in `certify` and ``timespan`` is the
+            `Timespan` validity range for them.
+
+        Raises
+        ------
+        AmbiguousDatasetError
+            Raised if any of the given `DatasetRef` instances is unresolved.
+        ConflictingDefinitionError
+            Raised if the collection already contains a different dataset with
+            the same `DatasetType` and data ID and an overlapping validity
+            range, or if two of the given datasets have the same data ID and
+            overlapping validity ranges.
+        TypeError
+            Raised if
+            ``collection.type is not CollectionType.CALIBRATION`` or if
+            ``self.datasetType.isCalibration() is False``.
+
+        Notes
+        -----
+        The default implementation just calls `certify` for each validity
+        range.  Implementations should override it to check for conflicts
+        and insert all associations at once.
+        """
+        for datasets, timespan in associations:
+            self.certify(collection, datasets, timespan)
+
     @abstractmethod
     def decertify(self, collection: CollectionRecord, timespan: Timespan, *,
                   dataIds: Optional[Iterable[DataCoordinate]] = None) -> None:
@@ -291,6 +336,48 @@ class DatasetRecordStorage(ABC):
         """
         raise NotImplementedError()
 
+    def selectChain(self, flattened: sqlalchemy.sql.FromClause,
+                    dataId: SimpleQuery.Select.Or[DataCoordinate] = SimpleQuery.Select,
+                    id: SimpleQuery.Select.Or[Optional[int]] = SimpleQuery.Select,
+                    run: SimpleQuery.Select.Or[None] = SimpleQuery.Select,
+                    ingestDate: SimpleQuery.Select.Or[Optional[Timespan]] = None,
+                    rank: bool = False,
+                    ) -> Optional[SimpleQuery]:
+        """Return a SQLAlchemy object that represents a ``SELECT`` query for
+        this `DatasetType` in all of the collections searched by a
+        `~CollectionType.CHAINED` collection at once.
+
+        Parameters
+        ----------
+        flattened : `sqlalchemy.sql.FromClause`
+            Subquery returned by `CollectionManager.selectFlattenedChain`.
+        dataId : `DataCoordinate` or `Select`
+            As in `select`.
+        id : `int`, `Select` or None,
+            As in `select`.
+        run : `None` or `Select`
+            As in `select`.
+        ingestDate : `None`, `Select`, or `Timespan`
+            As in `select`.
+        rank : `bool`, optional
+            If `True`, include the rank of the collection each dataset was
+            found in within the chain, as a "rank" column.
+
+        Returns
+        -------
+        query : `SimpleQuery` or `None`
+            A struct containing the SQLAlchemy object that representing a
+            simple ``SELECT`` query, or `None` if this object cannot search
+            many collections at once; callers must then call `select` for each
+            collection instead.
+
+        Notes
+        -----
+        Datasets in `~CollectionType.CALIBRATION` collections are never
+        included.  The default implementation always returns `None`.
+        """
+        return None
+
     datasetType: DatasetType
     """Dataset type whose records this object manages (`DatasetType`).
     """
@@ -492,6 +579,31 @@ class DatasetRecordStorageManager(VersionedExtension):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def getDatasetRefs(self, ids: Iterable[int]) -> Dict[int, DatasetRef]:
+        """Return `DatasetRef` instances for many dataset primary key values
+        at once.
+
+        Parameters
+        ----------
+        ids : `Iterable` [ `int` ]
+            Autoincrement primary key values for the datasets.
+
+        Returns
+        -------
+        refs : `dict` [ `int`, `DatasetRef` ]
+            Mapping from dataset ID to the object representing that dataset.
+            IDs that do not correspond to any dataset in this layer are
+            omitted.
+
+        Notes
+        -----
+        Implementations should be substantially more efficient than calling
+        `getDatasetRef` in a loop, e.g. by grouping IDs by dataset type and
+        running one query per group.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def getCollectionSummary(self, collection: CollectionRecord) -> CollectionSummary:
         """Return a summary for the given collection.
@@ -509,3 +621,67 @@ class DatasetRecordStorageManager(VersionedExtension):
             this collection.
         """
         raise NotImplementedError()
+
+    @abstractmethod
+    def refreshCollectionSummaries(self, collections: Iterable[CollectionRecord]) -> None:
+        """Reload the summaries of the given collections from the database.
+
+        Parameters
+        ----------
+        collections : `Iterable` [ `CollectionRecord` ]
+            Records for the (non-chained) collections whose summaries should
+            be reloaded.
+
+        Notes
+        -----
+        Summaries are otherwise only loaded by `refresh`, and hence do not
+        reflect datasets added by other clients since then.
+        """
+        raise NotImplementedError()
+
+    def findIncompatibleCollections(self, datasetType: DatasetType,
+                                    collections: Iterable[CollectionRecord],
+                                    governors: NamedKeyMapping[GovernorDimension, AbstractSet[str]],
+                                    checkDatabase: bool = True) -> Set[Any]:
+        """Find collections that cannot contain datasets of the given type
+        with the given governor dimension values.
+
+        Parameters
+        ----------
+        datasetType : `DatasetType`
+            Dataset type to be searched for.
+        collections : `Iterable` [ `CollectionRecord` ]
+            Records for the (non-chained) collections to be searched.
+        governors : `NamedKeyMapping` [ `GovernorDimension`, `Set` [ `str` ] ]
+            Values the governor dimensions of the searched datasets may take.
+            Governor dimensions not present are not constrained.
+        checkDatabase : `bool`, optional
+            If `True` (default), check the collections ruled out by the
+            cached summaries against the database.  If `False`, trust the
+            cached summaries; callers must then check any of those collections
+            that they would otherwise have searched (by calling this method
+            again with just those collections) before relying on a search's
+            result.
+
+        Returns
+        -------
+        keys : `set`
+            Primary keys of the collections that need not be searched.
+
+        Notes
+        -----
+        This uses `getCollectionSummary`, and then `refreshCollectionSummaries`
+        to check any collections it rules out against the database, so a
+        collection is never skipped just because the datasets in it were added
+        by another client.  That costs one query, rather than one per skipped
+        collection.
+        """
+        candidates = [record for record in collections
+                      if not self.getCollectionSummary(record).isCompatibleWith(datasetType, governors)]
+        if not candidates:
+            return set()
+        if not checkDatabase:
+            return {record.key for record in candidates}
+        self.refreshCollectionSummaries(candidates)
+        return {record.key for record in candidates
+                if not self.getCollectionSummary(record).isCompatibleWith(datasetType, governors)}
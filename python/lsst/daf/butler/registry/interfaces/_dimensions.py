@@ -33,7 +33,9 @@ from abc import ABC, abstractmethod
 from typing import (
     AbstractSet, Any,
     Callable,
-    Iterable, Mapping,
+    Iterable,
+    List,
+    Mapping,
     Optional,
     Tuple,
     TYPE_CHECKING,
@@ -55,6 +57,7 @@ if TYPE_CHECKING:
         NamedKeyMapping,
         TimespanDatabaseRepresentation,
     )
+    from ..dimensions.caching import DimensionRecordCache
     from ..queries import QueryBuilder
     from ._database import Database, StaticTablesContext
 
@@ -194,6 +197,36 @@ class DimensionRecordStorage(ABC):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def syncMany(self, records: Iterable[DimensionRecord]) -> List[bool]:
+        """Synchronize many records with the database, inserting those that
+        do not exist and comparing values for those that do.
+
+        Parameters
+        ----------
+        records : `Iterable` [ `DimensionRecord` ]
+            Instances of the `DimensionRecord` subclass for the element this
+            storage is associated with.
+
+        Returns
+        -------
+        inserted : `list` [ `bool` ]
+            For each given record, `True` if a new row was inserted, `False`
+            otherwise.
+
+        Raises
+        ------
+        DatabaseConflictError
+            Raised if a record exists in the database (according to primary
+            key lookup) but is inconsistent with the given one.
+        TypeError
+            Raised if the element does not support record synchronization.
+        sqlalchemy.exc.IntegrityError
+            Raised if one or more records violate database integrity
+            constraints.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def fetch(self, dataIds: DataCoordinateIterable) -> Iterable[DimensionRecord]:
         """Retrieve records from storage.
@@ -604,6 +637,15 @@ class DimensionRecordStorageManager(VersionedExtension):
         """
         raise NotImplementedError()
 
+    @property
+    def recordCache(self) -> Optional[DimensionRecordCache]:
+        """The cache of dimension records shared by the storage objects of
+        this manager (`DimensionRecordCache` or `None`).
+
+        `None` if this manager does not use a shared cache.
+        """
+        return None
+
     universe: DimensionUniverse
     """Universe of all dimensions and dimension elements known to the
     `Registry` (`DimensionUniverse`).
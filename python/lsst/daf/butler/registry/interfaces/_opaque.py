@@ -71,7 +71,8 @@ class OpaqueTableStorage(ABC):
             Additional keyword arguments are interpreted as equality
             constraints that restrict the returned rows (combined with AND);
             keyword arguments are column names and values are the values they
-            must have.
+            must have.  Values that are `list`, `tuple`, `set`, or `frozenset`
+            instances instead match any of their elements.
 
         Yields
         ------
@@ -141,6 +141,31 @@ class VersionedExtension(ABC):
         """
         raise NotImplementedError()
 
+    def upgradeSchema(self, storedVersion: VersionTuple) -> bool:
+        """Upgrade the schema piece managed by this extension in an existing
+        repository from an older minor version to the current one.
+
+        Parameters
+        ----------
+        storedVersion : `VersionTuple`
+            Version stored in the repository; has the same major version as
+            `currentVersion` and an older minor version.
+
+        Returns
+        -------
+        upgraded : `bool`
+            `True` if the repository was upgraded, `False` if this extension
+            does not know how to upgrade from ``storedVersion``.
+
+        Notes
+        -----
+        This is called (outside of any transaction) on extensions that have
+        already been loaded and refreshed.  The caller stores the new version
+        and schema digest if it returns `True`.  The default implementation
+        returns `False`.
+        """
+        return False
+
     def _defaultSchemaDigest(self, tables: Iterable[sqlalchemy.schema.Table],
                              dialect: sqlalchemy.engine.Dialect) -> str:
         """Calculate digest for a schema based on list of tables schemas.
@@ -165,7 +165,7 @@ class RegistryManagerTypes(_GenericRegistryManagers[
             raise RuntimeError("Unexpectedly failed to serialize DimensionConfig to JSON")
         return instances
 
-    def loadRepo(self, database: Database) -> RegistryManagerInstances:
+    def loadRepo(self, database: Database, *, upgrade: bool = False) -> RegistryManagerInstances:
         """Construct manager instances that point to an existing data
         repository.
 
@@ -175,6 +175,11 @@ class RegistryManagerTypes(_GenericRegistryManagers[
             Object that represents a connection to the SQL database that backs
             the data repository.  Must point to a namespace that already holds
             all tables and other persistent entities used by butler.
+        upgrade : `bool`, optional
+            If `True`, upgrade the schemas of managers whose stored versions
+            have an older minor version than the configured ones (see
+            `VersionedExtension.upgradeSchema`), instead of refusing to write
+            to the repository.  ``database`` must be writeable.
 
         Returns
         -------
@@ -182,6 +187,11 @@ class RegistryManagerTypes(_GenericRegistryManagers[
             Struct containing instances of the types contained by ``self``,
             pointing to the new repository and backed by ``database``.
         """
+        if upgrade and not database.isWriteable():
+            raise ValueError("Cannot upgrade a repository through a read-only database connection.")
+        # Older minor versions are only compatible with read-only access, so
+        # check the versions as if read-only when we're going to upgrade.
+        writeable = database.isWriteable() and not upgrade
         # Create attributes manager only first, so we can use it to load the
         # embedded dimensions configuration.
         with database.declareStaticTables(create=False) as context:
@@ -192,7 +202,7 @@ class RegistryManagerTypes(_GenericRegistryManagers[
             )
             # verify that configured versions are compatible with schema
             versions.checkManagersConfig()
-            versions.checkManagersVersions(database.isWriteable())
+            versions.checkManagersVersions(writeable)
         # get serialized as a string from database
         dimensionsString = attributes.get(_DIMENSIONS_ATTR)
         if dimensionsString is not None:
@@ -205,7 +215,7 @@ class RegistryManagerTypes(_GenericRegistryManagers[
             versions = instances.getVersions()
         # verify that configured versions are compatible with schema
         versions.checkManagersConfig()
-        versions.checkManagersVersions(database.isWriteable())
+        versions.checkManagersVersions(writeable)
         try:
             versions.checkManagersDigests()
         except DigestMismatchError as exc:
@@ -215,6 +225,8 @@ class RegistryManagerTypes(_GenericRegistryManagers[
             _LOG.warning(f"Registry schema digest mismatch: {exc}")
         # Load content from database that we try to keep in-memory.
         instances.refresh()
+        if upgrade:
+            versions.upgradeManagers()
         return instances
 
 
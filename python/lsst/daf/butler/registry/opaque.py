@@ -31,6 +31,7 @@ from typing import (
     Dict,
     Iterator,
     Optional,
+    Tuple,
 )
 
 import sqlalchemy
@@ -71,6 +72,7 @@ class ByNameOpaqueTableStorage(OpaqueTableStorage):
         super().__init__(name=name)
         self._db = db
         self._table = table
+        self._fetchQueries: Dict[Tuple[Tuple[str, ...], Optional[str]], sqlalchemy.sql.Select] = {}
 
     def insert(self, *data: dict) -> None:
         # Docstring inherited from OpaqueTableStorage.
@@ -78,11 +80,79 @@ class ByNameOpaqueTableStorage(OpaqueTableStorage):
 
     def fetch(self, **where: Any) -> Iterator[dict]:
         # Docstring inherited from OpaqueTableStorage.
-        sql = self._table.select().where(
-            sqlalchemy.sql.and_(*[self._table.columns[k] == v for k, v in where.items()])
-        )
-        for row in self._db.query(sql):
-            yield dict(row)
+        terms = []
+        scalars = {}
+        manyName: Optional[str] = None
+        for k, v in where.items():
+            if isinstance(v, (list, tuple, set, frozenset)):
+                if manyName is None:
+                    # The first collection-valued constraint may be
+                    # arbitrarily large; let Database decide how to bind it.
+                    manyName = k
+                    continue
+                terms.append(self._table.columns[k].in_(v))
+            else:
+                scalars[k] = v
+        if not terms:
+            # The common cases (e.g. looking up one or a moderate number of
+            # dataset IDs) can use a prepared query, so the SQL is compiled
+            # only once.
+            if manyName is None:
+                for row in self._db.queryPrepared(self._getFetchQuery(tuple(scalars), None), **scalars):
+                    yield dict(row)
+                return
+            values = list(dict.fromkeys(where[manyName]))
+            if len(values) <= self._db.IN_CLAUSE_MAX_SIZE:
+                if values:
+                    sql = self._getFetchQuery(tuple(scalars), manyName)
+                    for row in self._db.queryPrepared(sql, **scalars, **{manyName: values}).fetchall():
+                        yield dict(row)
+                return
+        terms.extend(self._table.columns[k] == v for k, v in scalars.items())
+        if manyName is None:
+            sql = self._table.select().where(sqlalchemy.sql.and_(*terms))
+            for row in self._db.query(sql):
+                yield dict(row)
+        else:
+            # Fetch everything before yielding, since the IN clauses may use
+            # a temporary table that must not outlive this call.
+            rows = []
+            with self._db.inClauses(self._table.columns[manyName], where[manyName]) as inClauses:
+                for inClause in inClauses:
+                    sql = self._table.select().where(sqlalchemy.sql.and_(inClause, *terms))
+                    rows.extend(dict(row) for row in self._db.query(sql).fetchall())
+            yield from rows
+
+    def _getFetchQuery(self, names: Tuple[str, ...], manyName: Optional[str]) -> sqlalchemy.sql.Select:
+        """Return a prepared query for `fetch`.
+
+        Parameters
+        ----------
+        names : `tuple` [ `str` ]
+            Names of columns constrained to be equal to a bind parameter with
+            the same name.
+        manyName : `str`, optional
+            Name of a column constrained to be in a list bound to an
+            expanding bind parameter with the same name.
+
+        Returns
+        -------
+        sql : `sqlalchemy.sql.Select`
+            Query for all columns of the table.  The same object is returned
+            for the same arguments, so its compiled form can be cached by
+            `Database.queryPrepared`.
+        """
+        key = (names, manyName)
+        sql = self._fetchQueries.get(key)
+        if sql is None:
+            terms = [self._table.columns[name] == sqlalchemy.sql.bindparam(name) for name in names]
+            if manyName is not None:
+                terms.append(
+                    self._table.columns[manyName].in_(sqlalchemy.sql.bindparam(manyName, expanding=True))
+                )
+            sql = self._table.select().where(sqlalchemy.sql.and_(*terms))
+            self._fetchQueries[key] = sql
+        return sql
 
     def delete(self, **where: Any) -> None:
         # Docstring inherited from OpaqueTableStorage.
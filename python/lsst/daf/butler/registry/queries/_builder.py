@@ -22,7 +22,8 @@ from __future__ import annotations
 
 __all__ = ("QueryBuilder",)
 
-from typing import AbstractSet, Any, Iterable, List, Optional
+import logging
+from typing import AbstractSet, Any, Iterable, List, Optional, Tuple, Union
 
 import sqlalchemy.sql
 
@@ -37,11 +38,14 @@ from ...core import (
 from ...core.named import NamedKeyDict, NamedValueAbstractSet, NamedValueSet
 
 from .._collectionType import CollectionType
+from ..interfaces import ChainedCollectionRecord, CollectionRecord
 from ._structs import QuerySummary, QueryColumns, DatasetQueryColumns, RegistryManagers
 from .expressions import convertExpressionToSql
 from ._query import DirectQuery, DirectQueryUniqueness, EmptyQuery, Query
 from ..wildcards import CollectionSearch, CollectionQuery
 
+_LOG = logging.getLogger(__name__)
+
 
 class QueryBuilder:
     """A builder for potentially complex queries that join tables based
@@ -160,6 +164,19 @@ class QueryBuilder:
         runKeyName = self._managers.collections.getRunForeignKeyName()
         baseColumnNames = {"id", runKeyName, "ingest_date"} if isResult else set()
         baseColumnNames.update(datasetType.dimensions.required.names)
+        # If we are searching a single CHAINED collection, try to search all
+        # of its children with a single query against the flattened chain,
+        # instead of a UNION ALL over one subquery per child.
+        chainQuery: Optional[SimpleQuery] = None
+        flattened = self._selectFlattenedChain(collections, collectionTypes)
+        if flattened is not None:
+            chainQuery = datasetRecordStorage.selectChain(flattened,
+                                                          dataId=SimpleQuery.Select,
+                                                          id=SimpleQuery.Select if isResult else None,
+                                                          run=SimpleQuery.Select if isResult else None,
+                                                          ingestDate=SimpleQuery.Select if isResult else None,
+                                                          rank=findFirst)
+        collectionRecords: List[Tuple[int, CollectionRecord]] = []
         for rank, collectionRecord in enumerate(collections.iter(self._managers.collections,
                                                                  collectionTypes=collectionTypes)):
             if collectionRecord.type is CollectionType.CALIBRATION:
@@ -172,6 +189,25 @@ class QueryBuilder:
                     # We can never find a non-calibration dataset in a
                     # CALIBRATION collection.
                     continue
+            collectionRecords.append((rank, collectionRecord))
+        # Skip collections whose summaries say they cannot hold this dataset
+        # type with the governor values the query is restricted to.
+        governors = NamedKeyDict(self.summary.where.restriction.items())
+        for dimension in self.summary.where.dataId.graph.governors:
+            governors[dimension] = {self.summary.where.dataId[dimension]}
+        pruned = self._managers.datasets.findIncompatibleCollections(
+            datasetType, [collectionRecord for _, collectionRecord in collectionRecords], governors
+        )
+        if pruned:
+            _LOG.debug("Query for %s skipping %d of %d collection(s) using collection summaries.",
+                       datasetType.name, len(pruned), len(collectionRecords))
+        anyChildren = False
+        for rank, collectionRecord in collectionRecords:
+            if collectionRecord.key in pruned:
+                continue
+            if chainQuery is not None:
+                anyChildren = True
+                continue
             ssq = datasetRecordStorage.select(collection=collectionRecord,
                                               dataId=SimpleQuery.Select,
                                               id=SimpleQuery.Select if isResult else None,
@@ -183,6 +219,13 @@ class QueryBuilder:
             if findFirst:
                 ssq.columns.append(sqlalchemy.sql.literal(rank).label("rank"))
             subsubqueries.append(ssq.combine())
+        if chainQuery is not None and anyChildren:
+            assert flattened is not None
+            assert {c.name for c in chainQuery.columns} - {"rank"} == baseColumnNames
+            if pruned:
+                # Skip the same children the per-collection path would.
+                chainQuery.where.append(flattened.columns.child.notin_(pruned))
+            subsubqueries.append(chainQuery.combine())
         if not subsubqueries:
             return False
         subquery = sqlalchemy.sql.union_all(*subsubqueries)
@@ -190,8 +233,9 @@ class QueryBuilder:
         if isResult:
             if findFirst:
                 # Rewrite the subquery (currently a UNION ALL over
-                # per-collection subsubqueries) to select the rows with the
-                # lowest rank per data ID.  The block below will set subquery
+                # per-collection subsubqueries, or a single query against a
+                # flattened chain) to select the rows with the lowest rank per
+                # data ID.  The block below will set subquery
                 # to something like this:
                 #
                 # WITH {dst}_search AS (
@@ -262,6 +306,34 @@ class QueryBuilder:
         self.joinTable(subquery, datasetType.dimensions.required, datasets=columns)
         return True
 
+    def _selectFlattenedChain(self, collections: Union[CollectionSearch, CollectionQuery],
+                              collectionTypes: AbstractSet[CollectionType]
+                              ) -> Optional[sqlalchemy.sql.FromClause]:
+        """Return a subquery for all collections searched by the given
+        expression, if it identifies a single `~CollectionType.CHAINED`
+        collection.
+
+        Parameters
+        ----------
+        collections : `CollectionSearch` or `CollectionQuery`
+            Collections to search.
+        collectionTypes : `AbstractSet` [ `CollectionType` ]
+            Types of collections to search.
+
+        Returns
+        -------
+        flattened : `sqlalchemy.sql.FromClause` or `None`
+            Subquery returned by `CollectionManager.selectFlattenedChain`, or
+            `None` if ``collections`` is not a single chain or the collection
+            manager cannot flatten it.
+        """
+        records = list(collections.iter(self._managers.collections, collectionTypes=collectionTypes,
+                                        flattenChains=False, includeChains=True))
+        if len(records) != 1 or records[0].type is not CollectionType.CHAINED:
+            return None
+        assert isinstance(records[0], ChainedCollectionRecord)
+        return self._managers.collections.selectFlattenedChain(records[0])
+
     def joinTable(self, table: sqlalchemy.sql.FromClause, dimensions: NamedValueAbstractSet[Dimension], *,
                   datasets: Optional[DatasetQueryColumns] = None) -> None:
         """Join an arbitrary table to the query via dimension relationships.
@@ -30,6 +30,7 @@ from typing import (
     Callable,
     Iterable,
     Iterator,
+    List,
     Mapping,
     Optional,
     Tuple,
@@ -261,6 +262,28 @@ class Query(ABC):
             if predicate(row):
                 yield row
 
+    def explain(self, db: Database, *, analyze: bool = False) -> List[str]:
+        """Return the database's plan for this query.
+
+        Parameters
+        ----------
+        db : `Database`
+            Database engine to explain the query with.
+        analyze : `bool`, optional
+            If `True`, and the database supports it, actually run the query
+            and include the actual row counts and times in the plan.
+
+        Returns
+        -------
+        plan : `list` [ `str` ]
+            Lines of the query plan, as reported by `Database.explain`; empty
+            if there is no SQL query to run (see `EmptyQuery`).
+        """
+        sql = self.sql
+        if sql is None:
+            return []
+        return db.explain(sql, analyze=analyze)
+
     def extractDimensionsTuple(self, row: Optional[sqlalchemy.engine.RowProxy],
                                dimensions: Iterable[Dimension]) -> tuple:
         """Extract a tuple of data ID values from a result row.
@@ -36,6 +36,7 @@ from typing import (
     ContextManager,
     Iterable,
     Iterator,
+    List,
     Mapping,
     Optional,
     Sequence,
@@ -175,6 +176,24 @@ class DataCoordinateQueryResults(DataCoordinateIterable):
         else:
             return self
 
+    def explain(self, *, analyze: bool = False) -> List[str]:
+        """Return the database's plan for the query behind these results,
+        without fetching any results.
+
+        Parameters
+        ----------
+        analyze : `bool`, optional
+            If `True`, and the database supports it, actually run the query
+            and include the actual row counts and times in the plan.
+
+        Returns
+        -------
+        plan : `list` [ `str` ]
+            Lines of the query plan, as reported by the database (see
+            `Database.explain`).
+        """
+        return self._query.explain(self._db, analyze=analyze)
+
     def subset(self, graph: Optional[DimensionGraph] = None, *,
                unique: bool = False) -> DataCoordinateQueryResults:
         """Return a results object containing a subset of the dimensions of
@@ -370,6 +389,25 @@ class DatasetQueryResults(Iterable[DatasetRef]):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def explain(self, *, analyze: bool = False) -> List[str]:
+        """Return the database's plan for the query (or queries) behind these
+        results, without fetching any results.
+
+        Parameters
+        ----------
+        analyze : `bool`, optional
+            If `True`, and the database supports it, actually run the queries
+            and include the actual row counts and times in the plans.
+
+        Returns
+        -------
+        plan : `list` [ `str` ]
+            Lines of the query plans, as reported by the database (see
+            `Database.explain`), one query after another.
+        """
+        raise NotImplementedError()
+
 
 class ParentDatasetQueryResults(DatasetQueryResults):
     """An object that represents results from a query for datasets with a
@@ -471,6 +509,10 @@ class ParentDatasetQueryResults(DatasetQueryResults):
         else:
             return self
 
+    def explain(self, *, analyze: bool = False) -> List[str]:
+        # Docstring inherited from DatasetQueryResults.
+        return self._query.explain(self._db, analyze=analyze)
+
 
 class ChainedDatasetQueryResults(DatasetQueryResults):
     """A `DatasetQueryResults` implementation that simply chains together
@@ -505,3 +547,7 @@ class ChainedDatasetQueryResults(DatasetQueryResults):
     def expanded(self) -> ChainedDatasetQueryResults:
         # Docstring inherited from DatasetQueryResults.
         return ChainedDatasetQueryResults([r.expanded() for r in self._chain])
+
+    def explain(self, *, analyze: bool = False) -> List[str]:
+        # Docstring inherited from DatasetQueryResults.
+        return [line for r in self._chain for line in r.explain(analyze=analyze)]
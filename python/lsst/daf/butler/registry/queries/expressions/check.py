@@ -417,8 +417,16 @@ class CheckVisitor(NormalFormVisitor[TreeSummary, InnerSummary, OuterSummary]):
         summary = OuterSummary()
         for branch in branches:
             summary.update(branch)
-            summary.governors.update(branch.governors)
             summary.defaultsNeeded.update(branch.defaultsNeeded)
+        # A governor dimension is only constrained by the full expression if
+        # it is constrained in every branch; start from the first branch's
+        # values, since unioning into an unconstrained restriction is a no-op.
+        if branches:
+            summary.governors = GovernorDimensionRestriction(
+                NamedKeyDict((governor, {value}) for governor, value in branches[0].governors.items())
+            )
+            for branch in branches[1:]:
+                summary.governors.update(branch.governors)
         # See if we've referenced any dimensions that weren't in the original
         # query graph; if so, we update that to include them.  This is what
         # lets a user say "tract=X" on the command line (well, "skymap=Y AND
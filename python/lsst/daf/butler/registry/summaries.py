@@ -311,6 +311,36 @@ class CollectionSummary:
         dimensions = self.dimensions.union(*[o.dimensions for o in others])
         return CollectionSummary(datasetTypes, dimensions)
 
+    def isCompatibleWith(self, datasetType: DatasetType,
+                         dimensions: NamedKeyMapping[GovernorDimension, AbstractSet[str]]) -> bool:
+        """Test whether the collection may contain datasets of the given type
+        with the given governor dimension values.
+
+        Parameters
+        ----------
+        datasetType : `DatasetType`
+            Dataset type to test.  Components are tested via their parent
+            dataset type.
+        dimensions : `NamedKeyMapping` [ `GovernorDimension`, `Set` [ `str` ] ]
+            Values the governor dimensions of the searched datasets may take.
+            Governor dimensions not present are not constrained.  A
+            `GovernorDimensionRestriction` may be passed.
+
+        Returns
+        -------
+        compatible : `bool`
+            `False` if the collection definitely does not contain any such
+            datasets; `True` if it may.
+        """
+        parentName, _ = DatasetType.splitDatasetTypeName(datasetType.name)
+        if parentName not in self.datasetTypes.names:
+            return False
+        for dimension in datasetType.dimensions.governors:
+            if dimension.name in self.dimensions.names and dimension.name in dimensions.names:
+                if self.dimensions[dimension].isdisjoint(dimensions[dimension]):
+                    return False
+        return True
+
     datasetTypes: NamedValueSet[DatasetType]
     """Dataset types that may be present in the collection
     (`NamedValueSet` [ `DatasetType` ]).
@@ -28,6 +28,7 @@ from collections import namedtuple
 from concurrent.futures import ThreadPoolExecutor
 import itertools
 from typing import ContextManager, Iterable, Set, Tuple
+import unittest.mock
 import warnings
 
 import astropy.time
@@ -413,6 +414,153 @@ class DatabaseTests(ABC):
         self.assertEqual(db.query(count.select_from(tables.a)).scalar(), 0)
         self.assertEqual(db.query(count.select_from(d)).scalar(), 0)
 
+    def testDeleteWhere(self):
+        """Tests for `Database.deleteWhere`.
+        """
+        db = self.makeEmptyDatabase(origin=1)
+        with db.declareStaticTables(create=True) as context:
+            tables = context.addTableTuple(STATIC_TABLE_SPECS)
+        db.insert(tables.b, *[{"id": i, "name": f"b{i}"} for i in range(10)])
+        count = sqlalchemy.sql.select([sqlalchemy.sql.func.count()])
+        # Delete with a bound list of values.
+        n = db.deleteWhere(tables.b, tables.b.columns.id.in_([1, 2, 3]))
+        self.assertEqual(n, 3)
+        self.assertEqual(db.query(count.select_from(tables.b)).scalar(), 7)
+        # Delete with a subquery.
+        n = db.deleteWhere(
+            tables.b,
+            tables.b.columns.id.in_(
+                sqlalchemy.sql.select([tables.b.columns.id]).where(tables.b.columns.id > 4)
+            )
+        )
+        self.assertEqual(n, 5)
+        self.assertEqual(sorted(row["id"] for row in db.query(tables.b.select()).fetchall()), [0, 4])
+        # Delete with a condition that matches nothing.
+        n = db.deleteWhere(tables.b, tables.b.columns.name == "b1")
+        self.assertEqual(n, 0)
+        with self.asReadOnly(db) as rodb:
+            with rodb.declareStaticTables(create=False) as context:
+                rotables = context.addTableTuple(STATIC_TABLE_SPECS)
+            with self.assertRaises(ReadOnlyDatabaseError):
+                rodb.deleteWhere(rotables.b, rotables.b.columns.id == 0)
+
+    def testInClauses(self):
+        """Tests for `Database.inClauses`.
+        """
+        db = self.makeEmptyDatabase(origin=1)
+        with db.declareStaticTables(create=True) as context:
+            tables = context.addTableTuple(STATIC_TABLE_SPECS)
+        db.insert(tables.b, *[{"id": i, "name": f"b{i}"} for i in range(20)])
+        db.IN_CLAUSE_MAX_SIZE = 4
+        db.IN_CLAUSE_TEMPORARY_TABLE_THRESHOLD = 10
+
+        def run(column, values):
+            results = []
+            with db.inClauses(column, values) as clauses:
+                for clause in clauses:
+                    results.extend(row[column.name]
+                                   for row in db.query(tables.b.select().where(clause)).fetchall())
+            return len(clauses), sorted(results)
+
+        self.assertEqual(run(tables.b.columns.id, []), (0, []))
+        # Small value lists are bound directly.
+        self.assertEqual(run(tables.b.columns.id, [3, 1, 3, 50]), (1, [1, 3]))
+        # Medium value lists are split into chunks, after removing
+        # duplicates.
+        self.assertEqual(run(tables.b.columns.id, [0, 1, 2, 3, 4, 5, 1, 2]), (2, list(range(6))))
+        # Large value lists go through a temporary table, which works for
+        # strings as well as integers, and is dropped afterwards.
+        names = [f"b{i}" for i in range(2, 17)]
+        self.assertEqual(run(tables.b.columns.name, names), (1, sorted(names)))
+        self.assertEqual(run(tables.b.columns.id, range(100)), (1, list(range(20))))
+        self.assertEqual(db._tempTables, set())
+        # The temporary table lives exactly as long as the context.
+        with db.inClauses(tables.b.columns.id, range(100)):
+            self.assertEqual(len(db._tempTables), 1)
+        self.assertEqual(db._tempTables, set())
+        # Clauses work in DELETE statements, too.
+        with db.transaction():
+            with db.inClauses(tables.b.columns.id, range(5, 100)) as clauses:
+                for clause in clauses:
+                    db.deleteWhere(tables.b, clause)
+        self.assertEqual(run(tables.b.columns.id, range(100)), (1, list(range(5))))
+
+    def testQueryPrepared(self):
+        """Tests for `Database.queryPrepared`.
+        """
+        db = self.makeEmptyDatabase(origin=1)
+        with db.declareStaticTables(create=True) as context:
+            tables = context.addTableTuple(STATIC_TABLE_SPECS)
+        db.insert(tables.b, *[{"id": i, "name": f"b{i}"} for i in range(10)])
+        byName = tables.b.select().where(tables.b.columns.name == sqlalchemy.sql.bindparam("name"))
+        byIds = sqlalchemy.sql.select([tables.b.columns.name]).where(
+            tables.b.columns.id.in_(sqlalchemy.sql.bindparam("ids", expanding=True))
+        )
+        for i in range(3):
+            rows = db.queryPrepared(byName, name=f"b{i}").fetchall()
+            self.assertEqual([row["id"] for row in rows], [i])
+            rows = db.queryPrepared(byIds, ids=list(range(i + 1))).fetchall()
+            self.assertCountEqual([row["name"] for row in rows], [f"b{j}" for j in range(i + 1)])
+        # Each statement should have been compiled only once.
+        self.assertEqual(len(db._compiledCache), 2)
+
+    def testQueryTracing(self):
+        """Tests for `Database.setQueryTracing` and `Database.explain`.
+        """
+        db = self.makeEmptyDatabase(origin=1)
+        with db.declareStaticTables(create=True) as context:
+            tables = context.addTableTuple(STATIC_TABLE_SPECS)
+        db.insert(tables.b, *[{"id": i, "name": f"b{i}"} for i in range(10)])
+        byIds = sqlalchemy.sql.select([tables.b.columns.name]).where(
+            tables.b.columns.id.in_(sqlalchemy.sql.bindparam("ids", expanding=True))
+        )
+        plan = db.explain(byIds, {"ids": [1, 2]})
+        self.assertTrue(plan)
+        self.assertTrue(all(isinstance(line, str) for line in plan))
+        logName = "lsst.daf.butler.registry.slowQueries"
+        # Nothing is logged by default.
+        with self.assertRaises(AssertionError):
+            with self.assertLogs(logName):
+                db.query(tables.b.select()).fetchall()
+        # With a threshold of zero everything is logged, once all rows have
+        # been fetched.
+        db.setQueryTracing(0.0, explain=True)
+        with self.assertLogs(logName, level="WARNING") as cm:
+            self.assertEqual(len(db.query(tables.b.select()).fetchall()), 10)
+            self.assertEqual(len(list(db.query(tables.b.select()))), 10)
+            self.assertEqual(db.query(sqlalchemy.sql.select([sqlalchemy.sql.func.count()])
+                                      .select_from(tables.b)).scalar(), 10)
+            self.assertCountEqual([row["name"] for row in db.queryPrepared(byIds, ids=[3, 4])],
+                                  ["b3", "b4"])
+        self.assertEqual(len(cm.output), 4)
+        self.assertIn("10 rows", cm.output[0])
+        self.assertIn("10 rows", cm.output[1])
+        self.assertIn("1 rows", cm.output[2])
+        self.assertIn("2 rows", cm.output[3])
+        self.assertIn("[3, 4]", cm.output[3])
+        for message in cm.output:
+            self.assertIn("Query plan:", message)
+        # Results that are dropped after fetching just one row are reported
+        # too, but never explained, since the finalizer that reports them
+        # must not use the database.
+        with unittest.mock.patch.object(db, "explain", side_effect=AssertionError("explained")):
+            with self.assertLogs(logName, level="WARNING") as cm:
+                self.assertIsNotNone(db.query(tables.b.select()).fetchone())
+                rows = iter(db.queryPrepared(byIds, ids=[3, 4]))
+                next(rows)
+                del rows
+        self.assertEqual(len(cm.output), 2)
+        for message in cm.output:
+            self.assertIn("1 rows", message)
+            self.assertIn("SELECT", message)
+            self.assertNotIn("Query plan:", message)
+        # Queries faster than the threshold are not logged.
+        db.setQueryTracing(3600.0)
+        with self.assertRaises(AssertionError):
+            with self.assertLogs(logName):
+                db.query(tables.b.select()).fetchall()
+        db.setQueryTracing(None)
+
     def testUpdate(self):
         """Tests for `Database.update`.
         """
@@ -599,6 +747,47 @@ class DatabaseTests(ABC):
             [{"name": "a1", "region": None}, {"name": "a2", "region": None}, {"name": "a3", "region": None}],
         )
 
+    def testTransactionCallbacks(self):
+        """Test that callbacks registered with
+        `Database.addTransactionCallbacks` are called (or not) according to
+        the fate of the enclosing transaction blocks.
+        """
+        db = self.makeEmptyDatabase(origin=1)
+        with db.declareStaticTables(create=True) as context:
+            tables = context.addTableTuple(STATIC_TABLE_SPECS)
+        calls = []
+
+        def register(label):
+            db.addTransactionCallbacks(
+                afterCommit=lambda: calls.append(("after", label)),
+                afterRollback=lambda: calls.append(("rollback", label)),
+            )
+
+        with self.assertRaises(RuntimeError):
+            register("none")
+        # Callbacks in committed nested blocks are deferred to the outermost
+        # commit; those in rolled-back savepoints are not.
+        with db.transaction():
+            register("outer")
+            with db.transaction():
+                register("inner")
+            self.assertEqual(calls, [])
+            with self.assertRaises(sqlalchemy.exc.IntegrityError):
+                with db.transaction(savepoint=True):
+                    register("savepoint")
+                    db.insert(tables.a, {"name": "a1"})
+                    db.insert(tables.a, {"name": "a1"})
+            self.assertEqual(calls, [("rollback", "savepoint")])
+        self.assertEqual(calls, [("rollback", "savepoint"), ("after", "outer"), ("after", "inner")])
+        # Rolling back the outermost transaction runs all rollback callbacks.
+        calls.clear()
+        with self.assertRaises(RuntimeError):
+            with db.transaction():
+                with db.transaction():
+                    register("inner")
+                raise RuntimeError("rollback")
+        self.assertEqual(calls, [("rollback", "inner")])
+
     def testTransactionLocking(self):
         """Test that `Database.transaction` can be used to acquire a lock
         that prohibits concurrent writes.
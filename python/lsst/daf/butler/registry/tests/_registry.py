@@ -29,6 +29,7 @@ import logging
 import os
 import re
 import unittest
+import unittest.mock
 
 import astropy.time
 import sqlalchemy
@@ -139,6 +140,8 @@ class RegistryTests(ABC):
         self.assertEqual(rows[0:1], list(registry.fetchOpaqueData(table, id=1)))
         self.assertEqual(rows[1:2], list(registry.fetchOpaqueData(table, name="two")))
         self.assertEqual([], list(registry.fetchOpaqueData(table, id=1, name="two")))
+        self.assertCountEqual(rows[1:], list(registry.fetchOpaqueData(table, id=[2, 3, 4])))
+        self.assertEqual(rows[1:2], list(registry.fetchOpaqueData(table, id={1, 2}, name=("two", "four"))))
         registry.deleteOpaqueData(table, id=3)
         self.assertCountEqual(rows[:2], list(registry.fetchOpaqueData(table)))
         registry.deleteOpaqueData(table)
@@ -242,6 +245,84 @@ class RegistryTests(ABC):
                  "name_in_raft": "four", "purpose": "SCIENCE"}
             )
 
+    def testSyncManyDimensionData(self):
+        """Tests for `Registry.syncManyDimensionData`.
+        """
+        registry = self.makeRegistry()
+        self.loadData(registry, "base.yaml")
+        existing = registry.expandDataId(instrument="Cam1", detector=1).records["detector"]
+        new = [
+            {"instrument": "Cam1", "id": 5, "full_name": "Ee", "raft": "B", "name_in_raft": "e",
+             "purpose": "SCIENCE"},
+            {"instrument": "Cam1", "id": 6, "full_name": "Ff", "raft": "B", "name_in_raft": "f",
+             "purpose": "SCIENCE"},
+        ]
+        self.assertEqual(
+            registry.syncManyDimensionData("detector", new[0], existing, new[1], new[0]),
+            [True, False, True, False],
+        )
+        self.assertEqual(registry.syncManyDimensionData("detector", *new), [False, False])
+        self.assertEqual(registry.expandDataId(instrument="Cam1", detector=6).records["detector"].full_name,
+                         "Ff")
+        # A conflict with any record means none are inserted.
+        with self.assertRaises(ConflictingDefinitionError):
+            registry.syncManyDimensionData(
+                "detector",
+                {"instrument": "Cam1", "id": 7, "full_name": "Gg", "raft": "B", "name_in_raft": "g",
+                 "purpose": "SCIENCE"},
+                dict(new[0], full_name="Zz"),
+            )
+        self.assertEqual(
+            {dataId["detector"] for dataId in registry.queryDataIds(["detector"], instrument="Cam1")},
+            {1, 2, 3, 4, 5, 6},
+        )
+        # Elements without tables cannot be synced.
+        with self.assertRaises(TypeError):
+            registry.syncManyDimensionData("band", {"name": "i"})
+
+    def testDimensionRecordCache(self):
+        """Test the shared, bounded cache used by `Registry.expandDataId` and
+        expanded query results.
+        """
+        registry = self.makeRegistry()
+        self.loadData(registry, "base.yaml")
+        cache = registry._managers.dimensions.recordCache
+        cache.clear()
+        cache.resetStats()
+        dataId = registry.expandDataId(instrument="Cam1", detector=1)
+        self.assertEqual(cache.hits, 0)
+        misses = cache.misses
+        self.assertGreater(misses, 0)
+        self.assertEqual(registry.expandDataId(instrument="Cam1", detector=1), dataId)
+        self.assertEqual(cache.misses, misses)
+        self.assertEqual(cache.hits, misses)
+        # Missing records for non-static elements are not cached, so records
+        # added later (e.g. by another client) are still found.
+        with self.assertRaises(LookupError):
+            registry.expandDataId(instrument="Cam1", exposure=1)
+        registry.insertDimensionData(
+            "exposure",
+            {"instrument": "Cam1", "id": 1, "obs_id": "one", "physical_filter": "Cam1-G"},
+        )
+        self.assertEqual(registry.expandDataId(instrument="Cam1", exposure=1)["exposure"], 1)
+        # Expanded query results populate the same cache.
+        cache.clear()
+        cache.resetStats()
+        self.assertEqual(len(list(registry.queryDataIds(["detector"]).expanded())), 4)
+        self.assertEqual(len(cache), 4)
+        self.assertEqual(registry.expandDataId(instrument="Cam1", detector=3)["detector"], 3)
+        self.assertEqual(cache.hits, 1)
+        # Shrinking the cache evicts least-recently-used entries first.
+        cache.maxSize = 1
+        self.assertEqual(len(cache), 1)
+        cache.resetStats()
+        registry.expandDataId(instrument="Cam1", detector=3)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+        registry.expandDataId(instrument="Cam1", detector=2)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        with self.assertRaises(ValueError):
+            cache.maxSize = -1
+
     @unittest.skipIf(np is None, "numpy not available.")
     def testNumpyDataId(self):
         """Test that we can use a numpy int in a dataId."""
@@ -310,6 +391,11 @@ class RegistryTests(ABC):
         outRef = registry.getDataset(ref.id)
         self.assertIsNotNone(ref.id)
         self.assertEqual(ref, outRef)
+        # Bulk lookup should give the same answers, including for IDs that
+        # do not exist.
+        ref2, = registry.insertDatasets("flat", dataIds=[dict(dataId, physical_filter="Cam1-G")], run=run)
+        self.assertEqual(registry.getDatasets([ref2.id, ref.id, ref.id + ref2.id + 100]),
+                         [ref2, ref, None])
         with self.assertRaises(ConflictingDefinitionError):
             registry.insertDatasets(datasetType, dataIds=[dataId], run=run)
         registry.removeDatasets([ref])
@@ -1105,6 +1191,45 @@ class RegistryTests(ABC):
             ]
         )
 
+    def testFlattenedChainSearch(self):
+        """Test that searches in a CHAINED collection via the flattened chain
+        table agree with searches in its children, and that the flattened
+        chain is kept up to date when chains are redefined.
+        """
+        registry = self.makeRegistry()
+        self.loadData(registry, "base.yaml")
+        self.loadData(registry, "datasets.yaml")
+        registry.registerCollection("inner", type=CollectionType.CHAINED)
+        registry.registerCollection("outer", type=CollectionType.CHAINED)
+        registry.setCollectionChain("inner", ["imported_r"])
+        registry.setCollectionChain("outer", ["imported_g", "inner"])
+        manager = registry._managers.collections
+        self.assertIsNotNone(manager.selectFlattenedChain(manager.find("outer")))
+
+        def check(children):
+            for findFirst in (False, True):
+                self.assertCountEqual(
+                    list(registry.queryDatasets("bias", collections="outer", findFirst=findFirst)),
+                    list(registry.queryDatasets("bias", collections=children, findFirst=findFirst)),
+                )
+            self.assertCountEqual(
+                list(registry.queryDataIds(["detector"], datasets="bias", collections="outer")),
+                list(registry.queryDataIds(["detector"], datasets="bias", collections=children)),
+            )
+
+        check(["imported_g", "imported_r"])
+        # Redefining the inner chain must update the outer one, too.
+        registry.setCollectionChain("inner", [])
+        check(["imported_g"])
+        registry.setCollectionChain("inner", ["imported_r", "imported_g"])
+        registry.setCollectionChain("outer", ["inner"])
+        check(["imported_r", "imported_g"])
+        # The table is still used after a refresh.
+        registry.refresh()
+        manager = registry._managers.collections
+        self.assertIsNotNone(manager.selectFlattenedChain(manager.find("outer")))
+        check(["imported_r", "imported_g"])
+
     def testQueryResults(self):
         """Test querying for data IDs and then manipulating the QueryResults
         object returned to perform other queries.
@@ -1686,6 +1811,80 @@ class RegistryTests(ABC):
                 expected = None
             assertLookup(detector=2, timespan=timespan, expected=expected)
 
+    def testCertifyMany(self):
+        """Test `Registry.certifyMany`, including detection of conflicts
+        within a batch and between a batch and existing associations.
+        """
+        registry = self.makeRegistry()
+        self.loadData(registry, "base.yaml")
+        self.loadData(registry, "datasets.yaml")
+        t1 = astropy.time.Time('2020-01-01T01:00:00', format="isot", scale="tai")
+        t2 = astropy.time.Time('2020-01-01T02:00:00', format="isot", scale="tai")
+        t3 = astropy.time.Time('2020-01-01T03:00:00', format="isot", scale="tai")
+        t4 = astropy.time.Time('2020-01-01T04:00:00', format="isot", scale="tai")
+        bias2a = registry.findDataset("bias", instrument="Cam1", detector=2, collections="imported_g")
+        bias3a = registry.findDataset("bias", instrument="Cam1", detector=3, collections="imported_g")
+        bias2b = registry.findDataset("bias", instrument="Cam1", detector=2, collections="imported_r")
+        bias3b = registry.findDataset("bias", instrument="Cam1", detector=3, collections="imported_r")
+        collection = "Cam1/calibs/default"
+        registry.registerCollection(collection, type=CollectionType.CALIBRATION)
+        # Certify several non-overlapping validity ranges in one call.
+        registry.certifyMany(
+            collection,
+            [
+                ([bias2a], Timespan(begin=t1, end=t2)),
+                ([bias2b], Timespan(begin=t3, end=None)),
+                ([bias3a], Timespan(begin=None, end=t1)),
+            ]
+        )
+        expected = [
+            DatasetAssociation(ref=bias2a, collection=collection, timespan=Timespan(begin=t1, end=t2)),
+            DatasetAssociation(ref=bias2b, collection=collection, timespan=Timespan(begin=t3, end=None)),
+            DatasetAssociation(ref=bias3a, collection=collection, timespan=Timespan(begin=None, end=t1)),
+        ]
+        self.assertCountEqual(
+            list(registry.queryDatasetAssociations("bias", collections=collection)),
+            expected,
+        )
+        # Overlaps with existing associations are rejected, and nothing from
+        # the batch is inserted.
+        with self.assertRaises(ConflictingDefinitionError):
+            registry.certifyMany(
+                collection,
+                [
+                    ([bias3a], Timespan(begin=t2, end=t3)),
+                    ([bias2b], Timespan(begin=t4, end=None)),
+                ]
+            )
+        # Overlaps within the batch are rejected, too.
+        with self.assertRaises(ConflictingDefinitionError):
+            registry.certifyMany(
+                collection,
+                [
+                    ([bias3a], Timespan(begin=t2, end=t4)),
+                    ([bias3b], Timespan(begin=t3, end=None)),
+                ]
+            )
+        with self.assertRaises(ConflictingDefinitionError):
+            registry.certifyMany(collection, [([bias3a, bias3b], Timespan(begin=t2, end=t3))])
+        self.assertCountEqual(
+            list(registry.queryDatasetAssociations("bias", collections=collection)),
+            expected,
+        )
+        # Adjacent ranges in the same batch do not conflict.
+        registry.certifyMany(
+            collection,
+            [
+                ([bias3a], Timespan(begin=t1, end=t2)),
+                ([bias3b], Timespan(begin=t2, end=None)),
+            ]
+        )
+        self.assertEqual(
+            registry.findDataset("bias", instrument="Cam1", detector=3, collections=collection,
+                                 timespan=Timespan(begin=t3, end=t4)),
+            bias3b,
+        )
+
     def testIngestTimeQuery(self):
 
         registry = self.makeRegistry()
@@ -1829,3 +2028,93 @@ class RegistryTests(ABC):
         self.assertEqual(registry.getCollectionSummary("imported_r"), expected1)
         self.assertEqual(registry.getCollectionSummary(tag), expected2)
         self.assertEqual(registry.getCollectionSummary(calibs), expected2)
+
+    def testCollectionSummaryPruning(self):
+        """Test that dataset searches skip collections whose summaries rule
+        out the dataset type or governor dimension values.
+        """
+        registry = self.makeRegistry()
+        self.loadData(registry, "base.yaml")
+        self.loadData(registry, "datasets.yaml")
+        registry.insertDimensionData("instrument", {"name": "Cam2"})
+        registry.insertDimensionData("detector", {"instrument": "Cam2", "id": 1, "full_name": "A"})
+        registry.registerRun("cam2")
+        registry.registerRun("empty")
+        bias = registry.getDatasetType("bias")
+        (cam2Bias,) = registry.insertDatasets(bias, [{"instrument": "Cam2", "detector": 1}], run="cam2")
+        collections = ["cam2", "empty", "imported_g"]
+        with self.assertLogs("lsst.daf.butler.registry", level="DEBUG") as cm:
+            self.assertEqual(
+                registry.findDataset(bias, instrument="Cam1", detector=1, collections=collections),
+                registry.findDataset(bias, instrument="Cam1", detector=1, collections="imported_g"),
+            )
+        self.assertTrue(any("skipping 2 of 3 collection(s)" in line for line in cm.output))
+        # Skipped collections cost one query to check against the database,
+        # and only if they precede the match.
+        with unittest.mock.patch.object(registry._db, "query", wraps=registry._db.query) as query:
+            registry.findDataset(bias, instrument="Cam1", detector=1, collections="imported_g")
+            direct = query.call_count
+            query.reset_mock()
+            registry.findDataset(bias, instrument="Cam1", detector=1, collections=collections)
+            self.assertEqual(query.call_count, direct + 1)
+            query.reset_mock()
+            registry.findDataset(bias, instrument="Cam1", detector=1,
+                                 collections=["imported_g", "cam2", "empty"])
+            self.assertEqual(query.call_count, direct)
+        self.assertEqual(
+            registry.findDataset(bias, instrument="Cam2", detector=1, collections=collections),
+            cam2Bias,
+        )
+        with self.assertLogs("lsst.daf.butler.registry", level="DEBUG") as cm:
+            self.assertCountEqual(
+                list(registry.queryDatasets(bias, collections=collections, where="instrument='Cam1'")),
+                list(registry.queryDatasets(bias, collections="imported_g")),
+            )
+        self.assertTrue(any("skipping 2 of 3 collection(s)" in line for line in cm.output))
+        self.assertIn(cam2Bias, set(registry.queryDatasets(bias, collections=collections)))
+        self.assertIn(cam2Bias, set(registry.queryDatasets(bias, collections=collections,
+                                                           where="instrument='Cam1' OR instrument='Cam2'")))
+        self.assertCountEqual(
+            list(registry.queryDatasets(bias, collections=collections, findFirst=True,
+                                        dataId={"instrument": "Cam2"})),
+            [cam2Bias],
+        )
+        # Searches of a chain via the flattened chain table skip the same
+        # children.
+        registry.registerCollection("chain", CollectionType.CHAINED)
+        registry.setCollectionChain("chain", collections)
+        for findFirst in (False, True):
+            results = registry.queryDatasets(bias, collections="chain", findFirst=findFirst,
+                                             where="instrument='Cam1'")
+            if registry._managers.collections.selectFlattenedChain(
+                    registry._managers.collections.find("chain")) is not None:
+                self.assertIn("NOT IN", str(results._query.sql))
+            self.assertCountEqual(list(results),
+                                  list(registry.queryDatasets(bias, collections="imported_g")))
+
+    def testCollectionSummaryRollback(self):
+        """Test that collection summary rows skipped as already-written are
+        written again after the transaction that wrote them is rolled back.
+        """
+        registry = self.makeRegistry()
+        self.loadData(registry, "base.yaml")
+        run = "run"
+        registry.registerRun(run)
+        bias = registry.getDatasetType("bias")
+        with self.assertRaises(RuntimeError):
+            with registry.transaction():
+                registry.insertDatasets(bias, [{"instrument": "Cam1", "detector": 1}], run=run)
+                raise RuntimeError("Roll back the summary rows, too.")
+        with registry.transaction():
+            with self.assertRaises(RuntimeError):
+                with registry.transaction(savepoint=True):
+                    registry.insertDatasets(bias, [{"instrument": "Cam1", "detector": 1}], run=run)
+                    raise RuntimeError("Roll back the summary rows, too.")
+            # If the summary rows were not rewritten here, the tags table's
+            # foreign key to them would be violated.
+            registry.insertDatasets(bias, [{"instrument": "Cam1", "detector": 1}], run=run)
+        # Rows known to be committed are skipped on later inserts.
+        registry.insertDatasets(bias, [{"instrument": "Cam1", "detector": 2}], run=run)
+        registry.refresh()
+        self.assertIn(bias, registry.getCollectionSummary(run).datasetTypes)
+        self.assertEqual(len(list(registry.queryDatasets(bias, collections=run))), 2)
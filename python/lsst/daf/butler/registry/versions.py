@@ -327,6 +327,43 @@ class ButlerVersionsManager:
                         f"{storedVersion} for extension {extension.extensionName()}"
                     )
 
+    def upgradeManagers(self) -> None:
+        """Upgrade the schemas of extensions whose stored versions have an
+        older minor version than their current versions, and store the new
+        versions and schema digests.
+
+        Raises
+        ------
+        IncompatibleVersionError
+            Raised if an extension cannot upgrade from its stored version.
+        MissingVersionError
+            Raised if database has no stored version for one or more groups.
+        """
+        if self._attributesEmpty:
+            return
+
+        for extension in self._managers.values():
+            version = extension.currentVersion()
+            if version:
+                key = self._managerVersionKey(extension)
+                storedVersionStr = self._attributes.get(key)
+                if storedVersionStr is None:
+                    raise MissingVersionError(f"Failed to read version number {key}")
+                storedVersion = VersionTuple.fromString(storedVersionStr)
+                if storedVersion.major != version.major or storedVersion.minor >= version.minor:
+                    continue
+                if not extension.upgradeSchema(storedVersion):
+                    raise IncompatibleVersionError(
+                        f"Cannot upgrade extension {extension.extensionName()} from stored version "
+                        f"{storedVersion} to {version}"
+                    )
+                self._attributes.set(key, str(version), force=True)
+                _LOG.info("upgraded manager %s from version %s to %s", extension.extensionName(),
+                          storedVersion, version)
+                digest = extension.schemaDigest()
+                if digest is not None:
+                    self._attributes.set(self._managerDigestKey(extension), digest, force=True)
+
     def checkManagersDigests(self) -> None:
         """Compare current schema digests with digests stored in database.
 
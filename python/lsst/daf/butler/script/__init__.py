@@ -26,8 +26,8 @@ from .configDump import configDump
 from .configValidate import configValidate
 from .pruneCollection import pruneCollection
 from .queryCollections import queryCollections
-from .queryDataIds import queryDataIds
-from .queryDatasets import queryDatasets
+from .queryDataIds import queryDataIds, streamDataIds
+from .queryDatasets import explainDatasets, queryDatasets, streamDatasets
 from .queryDatasetTypes import queryDatasetTypes
 from .queryDimensionRecords import queryDimensionRecords
 from .removeDatasetType import removeDatasetType
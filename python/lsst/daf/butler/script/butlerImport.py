@@ -19,10 +19,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
+
 from .. import Butler
 
 
-def butlerImport(repo, directory, export_file, transfer, skip_dimensions):
+def butlerImport(repo, directory, export_file, transfer, skip_dimensions, format=None):
     """Import data into a butler repository.
 
     Parameters
@@ -42,14 +44,26 @@ def butlerImport(repo, directory, export_file, transfer, skip_dimensions):
         The external data transfer type.
     skip_dimensions : `list`, or `None`
         Dimensions that should be skipped.
+    format : `str`, or `None`
+        Format of the export file.  If `None`, the extension of
+        ``export_file`` is used if it is a known format, and "yaml"
+        otherwise.
     """
     butler = Butler(repo, writeable=True)
 
     if skip_dimensions is not None:
         skip_dimensions = set(skip_dimensions)
 
+    if format is None:
+        # Use the extension of the export file if it names a known format,
+        # since files with other extensions have always been read as YAML.
+        _, ext = os.path.splitext(getattr(export_file, "name", ""))
+        format = ext.lstrip(".")
+        if not format or format not in butler._config["repo_transfer_formats"]:
+            format = "yaml"
+
     butler.import_(directory=directory,
                    filename=export_file,
                    transfer=transfer,
-                   format="yaml",
+                   format=format,
                    skip_dimensions=skip_dimensions)
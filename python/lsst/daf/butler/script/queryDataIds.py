@@ -20,10 +20,11 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from astropy.table import Table as AstropyTable
+import itertools
 import numpy as np
 
 from .. import Butler
-from ..cli.utils import sortAstropyTable
+from ..cli.utils import sortAstropyTable, StreamingTableWriter
 
 
 class _Table:
@@ -74,19 +75,57 @@ class _Table:
         return sortAstropyTable(table, dimensions)
 
 
-def queryDataIds(repo, dimensions, datasets, where, collections):
+def _queryDataIds(repo, dimensions, datasets, where, collections):
+    """Run the data ID query shared by `queryDataIds` and `streamDataIds`.
+    """
+    butler = Butler(repo)
+    return butler.registry.queryDataIds(dimensions,
+                                        datasets=datasets,
+                                        where=where,
+                                        collections=collections)
+
+
+def queryDataIds(repo, dimensions, datasets, where, collections, limit=0):
     # Docstring for supported parameters is the same as Registry.queryDataIds
 
-    butler = Butler(repo)
-    results = butler.registry.queryDataIds(dimensions,
-                                           datasets=datasets,
-                                           where=where,
-                                           collections=collections)
+    results = _queryDataIds(repo, dimensions, datasets, where, collections)
 
     if len(results.graph) > 0:
         table = _Table()
-        for dataId in results:
+        for dataId in itertools.islice(results, limit or None):
             table.add(dataId)
         return table.getAstropyTable()
     else:
         return None
+
+
+def streamDataIds(repo, dimensions, datasets, where, collections, limit=0, format="csv", output=None):
+    """Write data IDs as they are returned by the database, without
+    collecting, de-duplicating or sorting them.
+
+    Parameters are the same as `Registry.queryDataIds`, plus:
+
+    Parameters
+    ----------
+    limit : `int`, optional
+        Maximum number of data IDs to write; 0 for no limit.
+    format : `str`, optional
+        Output format; see `StreamingTableWriter`.
+    output : `str`, optional
+        File to write to instead of standard output.
+
+    Returns
+    -------
+    count : `int`
+        The number of data IDs written.
+    """
+    results = _queryDataIds(repo, dimensions, datasets, where, collections)
+    if len(results.graph) == 0:
+        return 0
+    columns = None
+    with StreamingTableWriter(format, output) as writer:
+        for dataId in itertools.islice(results, limit or None):
+            if columns is None:
+                columns = [str(dimension) for dimension in dataId.full.keys()]
+            writer.write(columns, dataId.full.values())
+    return writer.count
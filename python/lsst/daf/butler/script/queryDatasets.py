@@ -22,16 +22,20 @@ from __future__ import annotations
 
 from astropy.table import Table as AstropyTable
 from collections import defaultdict, namedtuple
-from typing import Any, Dict
+import itertools
+from typing import Any, Dict, List
 import numpy as np
 
 from .. import Butler
 from ..core.utils import globToRegex
-from ..cli.utils import sortAstropyTable
+from ..cli.utils import sortAstropyTable, StreamingTableWriter
 
 
 _RefInfo = namedtuple("_RefInfo", ["datasetRef", "uri"])
 
+# Number of datasets whose URIs are looked up together.
+_URI_CHUNK_SIZE = 10000
+
 
 class _Table:
     """Aggregates rows for a single dataset type, and creates an astropy table
@@ -105,7 +109,60 @@ class _Table:
         return sortAstropyTable(dataset_table, dimensions, ["type", "run"])
 
 
-def queryDatasets(repo, glob, collections, where, find_first, show_uri):
+def _makeQuery(butler, glob, collections, where, find_first):
+    """Make the dataset query shared by all of the functions in this module.
+
+    Returns
+    -------
+    datasets : `DatasetQueryResults`
+        The lazy query results.
+    """
+    dataset: Any = globToRegex(glob)
+
+    if not find_first:
+        collections = globToRegex(collections)
+
+    return butler.registry.queryDatasets(datasetType=dataset,
+                                         collections=collections,
+                                         where=where,
+                                         findFirst=find_first)
+
+
+def _iterDatasets(repo, glob, collections, where, find_first, show_uri, limit):
+    """Run the dataset query shared by `queryDatasets` and `streamDatasets`.
+
+    Yields
+    ------
+    datasetTypeName : `str`
+        Name of the dataset type (or component dataset type, when showing
+        the URIs of disassembled datasets) to report.
+    datasetRef : `DatasetRef`
+        The dataset.
+    uri : `ButlerURI` or `None`
+        The URI to report, or `None` if ``show_uri`` is `False`.
+    """
+    butler = Butler(repo)
+    datasets = _makeQuery(butler, glob, collections, where, find_first)
+    iterator = itertools.islice(datasets, limit or None)
+
+    if not show_uri:
+        for datasetRef in iterator:
+            yield datasetRef.datasetType.name, datasetRef, None
+    else:
+        # The query results are already resolved, so fetch their URIs from
+        # the datastore directly, in bulk, as they arrive.
+        while True:
+            chunk = list(itertools.islice(iterator, _URI_CHUNK_SIZE))
+            if not chunk:
+                break
+            for datasetRef, (primaryURI, componentURIs) in butler.getManyURIs(chunk).items():
+                if primaryURI:
+                    yield datasetRef.datasetType.name, datasetRef, primaryURI
+                for name, uri in componentURIs.items():
+                    yield datasetRef.datasetType.componentTypeName(name), datasetRef, uri
+
+
+def queryDatasets(repo, glob, collections, where, find_first, show_uri, limit=0):
     """Get dataset refs from a repository.
 
     Parameters
@@ -131,33 +188,70 @@ def queryDatasets(repo, glob, collections, where, find_first, show_uri):
         wildcards.
     show_uri : `bool`
         If True, include the dataset URI in the output.
+    limit : `int`, optional
+        Maximum number of datasets to return; 0 for no limit.
+
     Returns
     -------
     datasetTables : `list` [``astropy.table._Table``]
         A list of astropy tables, one for each dataset type.
     """
-    butler = Butler(repo)
+    tables: Dict[str, _Table] = defaultdict(_Table)
+    for datasetTypeName, datasetRef, uri in _iterDatasets(repo, glob, collections, where, find_first,
+                                                          show_uri, limit):
+        tables[datasetTypeName].add(datasetRef, uri)
 
-    dataset: Any = globToRegex(glob)
+    return [table.getAstropyTable(datasetTypeName) for datasetTypeName, table in tables.items()]
 
-    if not find_first:
-        collections = globToRegex(collections)
 
-    datasets = butler.registry.queryDatasets(datasetType=dataset,
-                                             collections=collections,
-                                             where=where,
-                                             findFirst=find_first)
+def streamDatasets(repo, glob, collections, where, find_first, show_uri, limit=0, format="csv",
+                   output=None):
+    """Write dataset refs as they are returned by the database, without
+    collecting, de-duplicating or sorting them.
 
-    tables: Dict[str, _Table] = defaultdict(_Table)
+    Parameters are the same as `queryDatasets`, plus:
 
-    for datasetRef in datasets:
-        if not show_uri:
-            tables[datasetRef.datasetType.name].add(datasetRef)
-        else:
-            primaryURI, componentURIs = butler.getURIs(datasetRef, collections=datasetRef.run)
-            if primaryURI:
-                tables[datasetRef.datasetType.name].add(datasetRef, primaryURI)
-            for name, uri in componentURIs.items():
-                tables[datasetRef.datasetType.componentTypeName(name)].add(datasetRef, uri)
+    Parameters
+    ----------
+    format : `str`, optional
+        Output format; see `StreamingTableWriter`.
+    output : `str`, optional
+        File to write to instead of standard output.
 
-    return [table.getAstropyTable(datasetTypeName) for datasetTypeName, table in tables.items()]
+    Returns
+    -------
+    count : `int`
+        The number of rows written.
+    """
+    columnsByType: Dict[str, List[str]] = {}
+    with StreamingTableWriter(format, output) as writer:
+        for datasetTypeName, datasetRef, uri in _iterDatasets(repo, glob, collections, where, find_first,
+                                                              show_uri, limit):
+            columns = columnsByType.get(datasetTypeName)
+            if columns is None:
+                columns = ["type", "run", "id", *[str(item) for item in datasetRef.dataId.full.keys()]]
+                if show_uri:
+                    columns.append("URI")
+                columnsByType[datasetTypeName] = columns
+            row = [datasetTypeName, datasetRef.run, datasetRef.id, *datasetRef.dataId.full.values()]
+            if show_uri:
+                row.append(str(uri))
+            writer.write(columns, row)
+    return writer.count
+
+
+def explainDatasets(repo, glob, collections, where, find_first):
+    """Get the database's plans for the queries that `queryDatasets` would
+    run, without running them.
+
+    Parameters are the same as `queryDatasets`.
+
+    Returns
+    -------
+    plans : `list` [`tuple` [`str`, `list` [`str`]]]
+        The name of each parent dataset type that would be queried, with the
+        lines of the plan for its query.
+    """
+    butler = Butler(repo)
+    datasets = _makeQuery(butler, glob, collections, where, find_first)
+    return [(parent.parentDatasetType.name, parent.explain()) for parent in datasets.byParentDatasetType()]
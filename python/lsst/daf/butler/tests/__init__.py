@@ -23,5 +23,6 @@ from ._datasetsHelper import *
 from ._dummyRegistry import *
 from ._examplePythonTypes import *
 from ._testRepo import *
+from ._benchmarkRepo import *
 from .cliCmdTestBase import CliCmdTestBase
 from .cliLogTestBase import CliLogTestBase
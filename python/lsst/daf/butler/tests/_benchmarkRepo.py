@@ -0,0 +1,267 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Synthetic repositories of configurable size, for benchmarks.
+"""
+
+from __future__ import annotations
+
+__all__ = ["BenchmarkScale", "BenchmarkRepo", "makeBenchmarkRepo"]
+
+from dataclasses import dataclass, field
+import random
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+from lsst.daf.butler import (
+    Butler,
+    CollectionType,
+    Config,
+    DataCoordinate,
+    DatasetRef,
+    DatasetType,
+)
+
+
+BENCHMARK_INSTRUMENT = "BenchCam"
+"""Name of the instrument in benchmark repositories (`str`).
+"""
+
+BENCHMARK_STORAGE_CLASS = "StructuredDataDict"
+"""Storage class of the dataset types in benchmark repositories (`str`).
+"""
+
+
+@dataclass(frozen=True)
+class BenchmarkScale:
+    """The number of entities of each kind in a benchmark repository.
+    """
+
+    detectors: int = 4
+    """Number of detector dimension records (`int`).
+    """
+
+    exposures: int = 4
+    """Number of exposure dimension records (`int`).
+    """
+
+    physicalFilters: int = 2
+    """Number of physical_filter dimension records (`int`).
+    """
+
+    datasetTypes: int = 1
+    """Number of dataset types with ``{instrument, exposure, detector}``
+    dimensions (`int`).
+    """
+
+    runs: int = 2
+    """Number of RUN collections that datasets are distributed over (`int`).
+    """
+
+    chains: int = 1
+    """Number of CHAINED collections, each of which contains all of the RUN
+    collections in a different order (`int`).
+    """
+
+    @property
+    def datasets(self) -> int:
+        """Total number of datasets in the repository (`int`).
+        """
+        return self.datasetTypes * self.exposures * self.detectors
+
+    @classmethod
+    def fromDatasets(cls, n: int, **kwargs: Any) -> BenchmarkScale:
+        """Construct a scale with approximately ``n`` datasets of a single
+        dataset type.
+
+        Parameters
+        ----------
+        n : `int`
+            Desired number of datasets.
+        **kwargs
+            Other attributes of the scale.
+
+        Returns
+        -------
+        scale : `BenchmarkScale`
+            The scale.  The number of detectors is fixed at 10 (or ``n``, if
+            that is smaller) and the number of exposures varies.
+        """
+        kwargs.setdefault("detectors", min(n, 10))
+        kwargs.setdefault("exposures", max(n // kwargs["detectors"], 1))
+        return cls(**kwargs)
+
+
+@dataclass
+class BenchmarkRepo:
+    """A synthetic repository created by `makeBenchmarkRepo`.
+    """
+
+    butler: Butler
+    """Writeable butler for the repository, with no default collections
+    (`Butler`).
+    """
+
+    scale: BenchmarkScale
+    """The size of the repository (`BenchmarkScale`).
+    """
+
+    datasetTypes: List[DatasetType] = field(default_factory=list)
+    """The registered dataset types (`list` [ `DatasetType` ]).
+    """
+
+    dataIds: List[DataCoordinate] = field(default_factory=list)
+    """All ``{instrument, exposure, detector}`` data IDs, expanded
+    (`list` [ `DataCoordinate` ]).
+    """
+
+    runs: List[str] = field(default_factory=list)
+    """Names of the RUN collections (`list` [ `str` ]).
+    """
+
+    chains: List[str] = field(default_factory=list)
+    """Names of the CHAINED collections (`list` [ `str` ]).
+    """
+
+    refs: List[DatasetRef] = field(default_factory=list)
+    """The datasets in the repository (`list` [ `DatasetRef` ]).
+    """
+
+    def makeObject(self, dataId: DataCoordinate) -> Dict[str, Any]:
+        """Return the in-memory object stored for a data ID.
+
+        Parameters
+        ----------
+        dataId : `DataCoordinate`
+            Data ID of the dataset.
+
+        Returns
+        -------
+        obj : `dict`
+            A small dictionary, suitable for the ``StructuredDataDict``
+            storage class.
+        """
+        return {"exposure": dataId["exposure"], "detector": dataId["detector"], "values": list(range(8))}
+
+
+def makeBenchmarkRepo(root: str, scale: BenchmarkScale, *, seed: int = 0, db: Optional[str] = None,
+                      namespace: Optional[str] = None, store: bool = True) -> BenchmarkRepo:
+    """Create a repository populated with synthetic dimension records,
+    collections and datasets.
+
+    Parameters
+    ----------
+    root : `str`
+        Directory for the new repository; it should be empty.
+    scale : `BenchmarkScale`
+        The number of entities of each kind to create.
+    seed : `int`, optional
+        Seed for the random assignment of datasets to RUN collections and of
+        RUN collections to positions in chains.  Repositories created with
+        the same arguments are identical.
+    db : `str`, optional
+        SQLAlchemy connection string for the registry database (e.g. a
+        PostgreSQL server).  If not provided, a SQLite database in ``root``
+        is used.
+    namespace : `str`, optional
+        Database namespace (schema) for the registry; should be unique when
+        ``db`` is shared between repositories.
+    store : `bool`, optional
+        If `True` (default) write the datasets to the datastore with
+        `Butler.put`.  If `False` only insert them into the registry, which
+        is much faster for benchmarks that do not read them.
+
+    Returns
+    -------
+    repo : `BenchmarkRepo`
+        Struct holding a butler for the new repository and the entities that
+        were created.
+    """
+    rng = random.Random(seed)
+    config = Config()
+    config["datastore", "checksum"] = False
+    if db is not None:
+        config["registry", "db"] = db
+        if namespace is not None:
+            config["registry", "namespace"] = namespace
+    Butler.makeRepo(root, config=config)
+    butler = Butler(root, writeable=True)
+    registry = butler.registry
+    repo = BenchmarkRepo(butler=butler, scale=scale)
+
+    registry.insertDimensionData("instrument", {"name": BENCHMARK_INSTRUMENT, "visit_max": 1 << 20,
+                                                "exposure_max": 1 << 20, "detector_max": 1 << 10})
+    filters = [f"filter{i}" for i in range(scale.physicalFilters)]
+    registry.insertDimensionData(
+        "physical_filter",
+        *[{"instrument": BENCHMARK_INSTRUMENT, "name": name, "band": f"band{i}"}
+          for i, name in enumerate(filters)]
+    )
+    registry.insertDimensionData(
+        "detector",
+        *[{"instrument": BENCHMARK_INSTRUMENT, "id": i, "full_name": f"det{i:04d}"}
+          for i in range(scale.detectors)]
+    )
+    registry.insertDimensionData(
+        "exposure",
+        *[{"instrument": BENCHMARK_INSTRUMENT, "id": i, "obs_id": f"exp{i:06d}",
+           "physical_filter": filters[i % len(filters)]}
+          for i in range(scale.exposures)]
+    )
+    repo.dataIds = list(
+        registry.queryDataIds(["exposure", "detector"], instrument=BENCHMARK_INSTRUMENT).expanded()
+    )
+    repo.dataIds.sort(key=lambda dataId: (dataId["exposure"], dataId["detector"]))
+
+    dimensions = registry.dimensions.extract(["instrument", "exposure", "detector"])
+    for i in range(scale.datasetTypes):
+        datasetType = DatasetType(f"bench{i}", dimensions, BENCHMARK_STORAGE_CLASS)
+        registry.registerDatasetType(datasetType)
+        repo.datasetTypes.append(datasetType)
+
+    repo.runs = [f"bench/run{i}" for i in range(scale.runs)]
+    for run in repo.runs:
+        registry.registerRun(run)
+    for i in range(scale.chains):
+        chain = f"bench/chain{i}"
+        registry.registerCollection(chain, CollectionType.CHAINED)
+        children = list(repo.runs)
+        rng.shuffle(children)
+        registry.setCollectionChain(chain, children)
+        repo.chains.append(chain)
+
+    # Assign each data ID to a run, the same for all dataset types, so that
+    # chains always find each dataset in its one run.
+    assignments: Dict[str, List[DataCoordinate]] = {run: [] for run in repo.runs}
+    for dataId in repo.dataIds:
+        assignments[rng.choice(repo.runs)].append(dataId)
+    for datasetType in repo.datasetTypes:
+        for run, dataIds in assignments.items():
+            if store:
+                repo.refs.extend(butler.put(repo.makeObject(dataId), datasetType, dataId, run=run)
+                                 for dataId in dataIds)
+            else:
+                repo.refs.extend(registry.insertDatasets(datasetType, dataIds, run=run))
+    return repo
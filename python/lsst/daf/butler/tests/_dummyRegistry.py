@@ -59,8 +59,10 @@ class DummyOpaqueTableStorage(OpaqueTableStorage):
 
     def fetch(self, **where: Any) -> Iterator[dict]:
         # Docstring inherited from OpaqueTableStorage.
+        where = {k: frozenset(v) if isinstance(v, (list, tuple, set, frozenset)) else {v}
+                 for k, v in where.items()}
         for d in self._rows:
-            if all(d[k] == v for k, v in where.items()):
+            if all(d[k] in v for k, v in where.items()):
                 yield d
 
     def delete(self, **where: Any):
@@ -293,7 +293,8 @@ class DatastoreMock:
     @staticmethod
     def _mock_export(refs: Iterable[DatasetRef], *,
                      directory: Optional[str] = None,
-                     transfer: Optional[str] = None) -> Iterable[FileDataset]:
+                     transfer: Optional[str] = None,
+                     workers: Optional[int] = None) -> Iterable[FileDataset]:
         """A mock of `Datastore.export` that satisfies the requirement that
         the refs passed in are included in the `FileDataset` objects
         returned.
@@ -24,6 +24,8 @@ from __future__ import annotations
 __all__ = ["RepoExportContext"]
 
 from typing import (
+    AbstractSet,
+    Any,
     Callable,
     Dict,
     Iterable,
@@ -38,13 +40,14 @@ from ..core import (
     DataCoordinate,
     DatasetAssociation,
     DimensionElement,
+    DimensionGraph,
     DimensionRecord,
     DatasetRef,
     DatasetType,
     Datastore,
     FileDataset,
 )
-from ..registry import CollectionType, Registry
+from ..registry import CollectionType, InconsistentDataIdError, Registry
 from ..registry.interfaces import ChainedCollectionRecord, CollectionRecord
 from ._interfaces import RepoExportBackend
 
@@ -71,20 +74,27 @@ class RepoExportContext:
         Directory to pass to `Datastore.export`.
     transfer : `str`, optional
         Transfer mdoe to pass to `Datastore.export`.
+    workers : `int`, optional
+        Maximum number of threads to pass to `Datastore.export`.
     """
 
     def __init__(self, registry: Registry, datastore: Datastore, backend: RepoExportBackend, *,
-                 directory: Optional[str] = None, transfer: Optional[str] = None):
+                 directory: Optional[str] = None, transfer: Optional[str] = None,
+                 workers: Optional[int] = None):
         self._registry = registry
         self._datastore = datastore
         self._backend = backend
         self._directory = directory
         self._transfer = transfer
-        self._records: Dict[DimensionElement, Dict[DataCoordinate, DimensionRecord]] = defaultdict(dict)
+        self._workers = workers
+        # Records and datasets are passed to the backend as soon as they are
+        # saved; we only remember what we have already exported, so we can
+        # ignore duplicates and find associations with other collections.
+        self._savedDataIds: Dict[DimensionElement, Set[DataCoordinate]] = defaultdict(set)
         self._dataset_ids: Set[int] = set()
-        self._datasets: Dict[DatasetType, Dict[str, List[FileDataset]]] \
-            = defaultdict(lambda: defaultdict(list))
+        self._datasetTypes: Set[DatasetType] = set()
         self._collections: Dict[str, CollectionRecord] = {}
+        self._savedCollections: Set[str] = set()
 
     def saveCollection(self, name: str) -> None:
         """Export the given collection.
@@ -109,7 +119,8 @@ class RepoExportContext:
         export its child collections; these must be explicitly exported or
         already be present in the repository they are being imported into.
         """
-        self._collections[name] = self._registry._managers.collections.find(name)
+        if name not in self._collections:
+            self._collections[name] = self._registry._managers.collections.find(name)
 
     def saveDimensionData(self, element: Union[str, DimensionElement],
                           records: Iterable[Union[dict, DimensionRecord]]) -> None:
@@ -127,6 +138,7 @@ class RepoExportContext:
         """
         if not isinstance(element, DimensionElement):
             element = self._registry.dimensions[element]
+        checked = []
         for record in records:
             if not isinstance(record, DimensionRecord):
                 record = element.RecordClass(**record)
@@ -135,7 +147,8 @@ class RepoExportContext:
                     f"Mismatch between element={element.name} and "
                     f"dimension record with definition={record.definition.name}."
                 )
-            self._records[element].setdefault(record.dataId, record)
+            checked.append(record)
+        self._saveRecords(checked)
 
     def saveDataIds(self, dataIds: Iterable[DataCoordinate], *,
                     elements: Optional[Iterable[Union[str, DimensionElement]]] = None) -> None:
@@ -152,6 +165,15 @@ class RepoExportContext:
         elements : iterable of `DimensionElement` or `str`, optional
             Dimension elements whose records should be exported.  If `None`,
             records for all dimensions will be exported.
+
+        Raises
+        ------
+        LookupError
+            Raised if a record for a required dimension of a data ID could not
+            be found.
+        InconsistentDataIdError
+            Raised if the records found for a data ID are inconsistent with
+            each other or with its values.
         """
         if elements is None:
             elements = frozenset(element for element in self._registry.dimensions.getStaticElements()
@@ -163,16 +185,147 @@ class RepoExportContext:
                     element = self._registry.dimensions[element]
                 if element.hasTable() and element.viewOf is None:
                     elements.add(element)
+        # Data IDs that already have records can be handled directly; the rest
+        # are grouped by their dimensions so their records can be fetched
+        # with one query per element, instead of one per data ID.
+        records: List[DimensionRecord] = []
+        keysByGraph: Dict[DimensionGraph, List[Dict[str, Any]]] = defaultdict(list)
         for dataId in dataIds:
-            # This is potentially quite slow, because it's approximately
-            # len(dataId.graph.elements) queries per data ID.  But it's a no-op
-            # if the data ID is already expanded, and DM-26692 will add (or at
-            # least start to add / unblock) query functionality that should
-            # let us speed this up internally as well.
-            dataId = self._registry.expandDataId(dataId)
-            for record in dataId.records.values():
-                if record is not None and record.definition in elements:
-                    self._records[record.definition].setdefault(record.dataId, record)
+            if dataId.hasRecords():
+                records.extend(record for record in dataId.records.values()
+                               if record is not None and record.definition in elements)
+            else:
+                keys = dataId.full.byName() if dataId.hasFull() else dataId.byName()
+                keysByGraph[dataId.graph].append(dict(keys))
+        for graph, keysList in keysByGraph.items():
+            records.extend(self._fetchRecords(graph, keysList, elements))
+        self._saveRecords(records)
+
+    def _fetchRecords(self, graph: DimensionGraph, keysList: List[Dict[str, Any]],
+                      elements: AbstractSet[DimensionElement]) -> List[DimensionRecord]:
+        """Fetch the dimension records for many data IDs that share the same
+        dimensions.
+
+        This method is intended for internal use by `saveDataIds` only.  It
+        performs the same checks as `Registry.expandDataId`, but with one
+        query per dimension element instead of one per data ID.
+
+        Parameters
+        ----------
+        graph : `DimensionGraph`
+            Dimensions of all data IDs.
+        keysList : `list` [ `dict` [ `str`, `object` ] ]
+            Key-value pairs for each data ID.  Values for implied dimensions
+            may be missing, and are added in-place as records are fetched.
+        elements : `AbstractSet` [ `DimensionElement` ]
+            Elements whose records should be returned.
+
+        Returns
+        -------
+        records : `list` [ `DimensionRecord` ]
+            Records for the given data IDs whose elements are in ``elements``.
+
+        Raises
+        ------
+        LookupError
+            Raised if a record for a required dimension could not be found.
+        InconsistentDataIdError
+            Raised if the records found for a data ID are inconsistent with
+            each other or with its values.
+        """
+        result: List[DimensionRecord] = []
+        for element in graph.primaryKeyTraversalOrder:
+            # primaryKeyTraversalOrder guarantees that we have already filled
+            # in any implied dimension values needed for this element's
+            # required dimensions.  Records for required dimensions and
+            # alwaysJoin elements are always fetched, to check that they
+            # exist.
+            needImplied = any(d.name not in keys for keys in keysList for d in element.implied)
+            if not (element in elements or needImplied or element in graph.required
+                    or element.alwaysJoin):
+                continue
+            dataIdsForKeys = [
+                DataCoordinate.fromRequiredValues(
+                    element.graph,
+                    tuple(keys[d.name] for d in element.graph.required)
+                )
+                if all(keys.get(d.name) is not None for d in element.graph.required) else None
+                for keys in keysList
+            ]
+            records = {
+                record.dataId: record
+                for record in self._registry.fetchDimensionData(
+                    element, (dataId for dataId in dataIdsForKeys if dataId is not None)
+                )
+            }
+            for keys, dataId in zip(keysList, dataIdsForKeys):
+                if dataId is None and element in graph.required:
+                    raise LookupError(f"No value or null value for required dimension {element.name}.")
+                record = records.get(dataId) if dataId is not None else None
+                if record is not None:
+                    for d in element.implied:
+                        value = getattr(record, d.name)
+                        if keys.setdefault(d.name, value) != value:
+                            raise InconsistentDataIdError(
+                                f"Data ID {keys} has {d.name}={keys[d.name]!r}, "
+                                f"but {element.name} implies {d.name}={value!r}."
+                            )
+                else:
+                    if element in graph.required:
+                        raise LookupError(
+                            f"Could not fetch record for required dimension {element.name} via keys {keys}."
+                        )
+                    if element.alwaysJoin:
+                        raise InconsistentDataIdError(
+                            f"Could not fetch record for element {element.name} via keys {keys}, "
+                            "but it is marked alwaysJoin=True; this means one or more dimensions are not "
+                            "related."
+                        )
+                    for d in element.implied:
+                        keys.setdefault(d.name, None)
+            if element in elements:
+                result.extend(records.values())
+        return result
+
+    def _saveRecords(self, records: Iterable[DimensionRecord]) -> None:
+        """Pass dimension records that have not already been exported to the
+        backend.
+
+        This method is intended for internal use by `RepoExportContext` only.
+
+        Parameters
+        ----------
+        records : iterable of `DimensionRecord`
+            Records to export, possibly including duplicates and records that
+            have already been exported.
+        """
+        newRecords: Dict[DimensionElement, Dict[DataCoordinate, DimensionRecord]] = defaultdict(dict)
+        for record in records:
+            if record.dataId not in self._savedDataIds[record.definition]:
+                newRecords[record.definition].setdefault(record.dataId, record)
+        # Elements are saved in dependency order, and records are sorted
+        # within each element to make the export deterministic.
+        for element in self._registry.dimensions.sorted(newRecords.keys()):
+            r = newRecords[element]
+            self._savedDataIds[element].update(r.keys())
+            self._backend.saveDimensionData(element, *[r[dataId] for dataId in sorted(r.keys())])
+
+    def _saveRun(self, run: str) -> None:
+        """Pass a `~CollectionType.RUN` collection to the backend immediately,
+        if it has not already been exported.
+
+        This method is intended for internal use by `saveDatasets` only.
+
+        Parameters
+        ----------
+        run : `str`
+            Name of the collection.
+        """
+        if run not in self._savedCollections:
+            self.saveCollection(run)
+            self._backend.saveCollection(self._collections[run],
+                                         self._registry.getCollectionDocumentation(run))
+            self._savedCollections.add(run)
 
     def saveDatasets(self, refs: Iterable[DatasetRef], *,
                      elements: Optional[Iterable[Union[str, DimensionElement]]] = None,
@@ -205,47 +358,45 @@ class RepoExportContext:
         collections.  Other collections will be included in the export in the
         future (once `Registry` provides a way to look up that information).
         """
-        dataIds = set()
+        # The query interfaces that are often used to generate the refs
+        # passed here often don't remove duplicates, so do that here for
+        # convenience.
+        newRefs = []
         for ref in sorted(refs):
-            # The query interfaces that are often used to generate the refs
-            # passed here often don't remove duplicates, so do that here for
-            # convenience.
-            if ref.id in self._dataset_ids:
-                continue
+            if ref.id not in self._dataset_ids:
+                self._dataset_ids.add(ref.getCheckedId())
+                newRefs.append(ref)
+        exports = self._datastore.export(newRefs, directory=self._directory, transfer=self._transfer,
+                                         workers=self._workers)
+        dataIds = set()
+        datasets: Dict[DatasetType, Dict[str, List[FileDataset]]] = defaultdict(lambda: defaultdict(list))
+        for ref, export in zip(newRefs, exports):
             dataIds.add(ref.dataId)
-            # `exports` is a single-element list here, because we anticipate
-            # a future where more than just Datastore.export has a vectorized
-            # API and we can pull this out of the loop.
-            exports = self._datastore.export([ref], directory=self._directory, transfer=self._transfer)
             if rewrite is not None:
-                exports = [rewrite(export) for export in exports]
-            self._dataset_ids.add(ref.getCheckedId())
+                export = rewrite(export)
             assert ref.run is not None
-            self._datasets[ref.datasetType][ref.run].extend(exports)
+            datasets[ref.datasetType][ref.run].append(export)
+        # Datasets are passed to the backend right away, after the dimension
+        # records and runs they depend on.  Sort the dataset types and runs
+        # to ensure reproducible order in export file.
         self.saveDataIds(dataIds, elements=elements)
+        for run in sorted({run for datasetsByRun in datasets.values() for run in datasetsByRun}):
+            self._saveRun(run)
+        for datasetType in sorted(datasets.keys()):
+            self._datasetTypes.add(datasetType)
+            for run in sorted(datasets[datasetType].keys()):
+                self._backend.saveDatasets(datasetType, run, *sorted(datasets[datasetType][run]))
 
     def _finish(self) -> None:
         """Delegate to the backend to finish the export process.
 
         For use by `Butler.export` only.
         """
-        for element in self._registry.dimensions.sorted(self._records.keys()):
-            # To make export deterministic sort the DataCoordinate instances.
-            r = self._records[element]
-            self._backend.saveDimensionData(element, *[r[dataId] for dataId in sorted(r.keys())])
-        for datasetsByRun in self._datasets.values():
-            for run in datasetsByRun.keys():
-                self._collections[run] = self._registry._managers.collections.find(run)
         for collectionName in self._computeSortedCollections():
-            doc = self._registry.getCollectionDocumentation(collectionName)
-            self._backend.saveCollection(self._collections[collectionName], doc)
-        # Sort the dataset types and runs before exporting to ensure
-        # reproducible order in export file.
-        for datasetType in sorted(self._datasets.keys()):
-            for run in sorted(self._datasets[datasetType].keys()):
-                # Sort the FileDataset
-                records = sorted(self._datasets[datasetType][run])
-                self._backend.saveDatasets(datasetType, run, *records)
+            if collectionName not in self._savedCollections:
+                doc = self._registry.getCollectionDocumentation(collectionName)
+                self._backend.saveCollection(self._collections[collectionName], doc)
+                self._savedCollections.add(collectionName)
         # Export associations between datasets and collections.  These need to
         # be sorted (at two levels; they're dicts) or created more
         # deterministically, too, which probably involves more data ID sorting.
@@ -309,7 +460,7 @@ class RepoExportContext:
             representing an association between that collection and a dataset.
         """
         results = defaultdict(list)
-        for datasetType in self._datasets.keys():
+        for datasetType in sorted(self._datasetTypes):
             # We query for _all_ datasets of each dataset type we export, in
             # the specific collections we are exporting.  The worst-case
             # efficiency of this is _awful_ (i.e. big repo, exporting a tiny
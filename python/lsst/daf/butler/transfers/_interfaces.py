@@ -25,6 +25,7 @@ __all__ = ["RepoExportBackend", "RepoImportBackend", "RepoTransferFormatConfig"]
 
 from abc import ABC, abstractmethod
 from typing import (
+    ClassVar,
     Iterable,
     Optional,
     Set,
@@ -56,7 +57,16 @@ class RepoExportBackend(ABC):
     """An abstract interface for data repository export implementations.
 
     Methods are guaranteed to be called in ways that reflect foreign key
-    dependencies.
+    dependencies: anything passed to a call depends only on what was passed to
+    earlier calls.  `saveDimensionData` and `saveDatasets` may be called more
+    than once for the same dimension element, dataset type, or run.
+    Implementations are encouraged to write what they are given as it arrives,
+    rather than holding everything in memory until `finish` is called.
+    """
+
+    binary: ClassVar[bool] = False
+    """Whether this backend writes to a binary stream rather than a text
+    stream (`bool`).
     """
 
     @abstractmethod
@@ -140,6 +150,11 @@ class RepoImportBackend(ABC):
     corresponding export backend), along with a `Registry`.
     """
 
+    binary: ClassVar[bool] = False
+    """Whether this backend reads from a binary stream rather than a text
+    stream (`bool`).
+    """
+
     @abstractmethod
     def register(self) -> None:
         """Register all runs and dataset types associated with the backend with
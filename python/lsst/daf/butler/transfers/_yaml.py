@@ -83,16 +83,44 @@ class YamlRepoExportBackend(RepoExportBackend):
     ----------
     stream
         A writeable file-like object.
+
+    Notes
+    -----
+    Each block of records is written to ``stream`` as soon as it is passed to
+    this object, rather than being held in memory until `finish` is called.
+    The result is identical to dumping a single YAML document.
     """
 
     def __init__(self, stream: IO):
         self.stream = stream
-        self.data: List[Dict[str, Any]] = []
+        self._started = False
+        self._datasetTypeNames: Set[str] = set()
+
+    def _write(self, data: Dict[str, Any]) -> None:
+        """Write a single entry of the "data" sequence to the stream.
+        """
+        if not self._started:
+            self._writeHeader()
+            self.stream.write("data:\n")
+            self._started = True
+        yaml.dump([data], stream=self.stream, sort_keys=False)
+
+    def _writeHeader(self) -> None:
+        """Write the top-level description and version keys to the stream.
+        """
+        yaml.dump(
+            {
+                "description": "Butler Data Repository Export",
+                "version": str(EXPORT_FORMAT_VERSION),
+            },
+            stream=self.stream,
+            sort_keys=False,
+        )
 
     def saveDimensionData(self, element: DimensionElement, *data: DimensionRecord) -> None:
         # Docstring inherited from RepoExportBackend.saveDimensionData.
         data_dicts = [record.toDict(splitTimespan=True) for record in data]
-        self.data.append({
+        self._write({
             "type": "dimension",
             "element": element.name,
             "records": data_dicts,
@@ -113,18 +141,20 @@ class YamlRepoExportBackend(RepoExportBackend):
             data["timespan_end"] = record.timespan.end
         elif isinstance(record, ChainedCollectionRecord):
             data["children"] = list(record.children)
-        self.data.append(data)
+        self._write(data)
 
     def saveDatasets(self, datasetType: DatasetType, run: str, *datasets: FileDataset) -> None:
         # Docstring inherited from RepoExportBackend.saveDatasets.
-        self.data.append({
-            "type": "dataset_type",
-            "name": datasetType.name,
-            "dimensions": [d.name for d in datasetType.dimensions],
-            "storage_class": datasetType.storageClass.name,
-            "is_calibration": datasetType.isCalibration(),
-        })
-        self.data.append({
+        if datasetType.name not in self._datasetTypeNames:
+            self._write({
+                "type": "dataset_type",
+                "name": datasetType.name,
+                "dimensions": [d.name for d in datasetType.dimensions],
+                "storage_class": datasetType.storageClass.name,
+                "is_calibration": datasetType.isCalibration(),
+            })
+            self._datasetTypeNames.add(datasetType.name)
+        self._write({
             "type": "dataset",
             "dataset_type": datasetType.name,
             "run": run,
@@ -144,7 +174,7 @@ class YamlRepoExportBackend(RepoExportBackend):
                                 associations: Iterable[DatasetAssociation]) -> None:
         # Docstring inherited from RepoExportBackend.saveDatasetAssociations.
         if collectionType is CollectionType.TAGGED:
-            self.data.append({
+            self._write({
                 "type": "associations",
                 "collection": collection,
                 "collection_type": collectionType.name,
@@ -156,7 +186,7 @@ class YamlRepoExportBackend(RepoExportBackend):
                 assert association.timespan is not None
                 assert association.ref.id is not None
                 idsByTimespan[association.timespan].append(association.ref.id)
-            self.data.append({
+            self._write({
                 "type": "associations",
                 "collection": collection,
                 "collection_type": collectionType.name,
@@ -172,15 +202,11 @@ class YamlRepoExportBackend(RepoExportBackend):
 
     def finish(self) -> None:
         # Docstring inherited from RepoExportBackend.
-        yaml.dump(
-            {
-                "description": "Butler Data Repository Export",
-                "version": str(EXPORT_FORMAT_VERSION),
-                "data": self.data,
-            },
-            stream=self.stream,
-            sort_keys=False,
-        )
+        if not self._started:
+            self._writeHeader()
+            yaml.dump({"data": []}, stream=self.stream, sort_keys=False)
+            self._started = True
+        self.stream.flush()
 
 
 class YamlRepoImportBackend(RepoImportBackend):
@@ -330,10 +356,12 @@ class YamlRepoImportBackend(RepoImportBackend):
              directory: Optional[str] = None, transfer: Optional[str] = None,
              skip_dimensions: Optional[Set] = None) -> None:
         # Docstring inherited from RepoImportBackend.load.
-        for element, dimensionRecords in self.dimensions.items():
+        # Records for an element may be split across several blocks in the
+        # file, so insert them in dependency order rather than file order.
+        for element in self.registry.dimensions.sorted(self.dimensions.keys()):
             if skip_dimensions and element in skip_dimensions:
                 continue
-            self.registry.insertDimensionData(element, *dimensionRecords)
+            self.registry.insertDimensionData(element, *self.dimensions[element])
         # FileDatasets to ingest into the datastore (in bulk):
         fileDatasets = []
         for (datasetTypeName, run), records in self.datasets.items():
@@ -379,5 +407,8 @@ class YamlRepoImportBackend(RepoImportBackend):
             self.registry.associate(collection, [self.refsByFileId[i] for i in dataset_ids])
         # Associate datasets with calibration collections.
         for collection, idsByTimespan in self.calibAssociations.items():
-            for timespan, dataset_ids in idsByTimespan.items():
-                self.registry.certify(collection, [self.refsByFileId[i] for i in dataset_ids], timespan)
+            self.registry.certifyMany(
+                collection,
+                [([self.refsByFileId[i] for i in dataset_ids], timespan)
+                 for timespan, dataset_ids in idsByTimespan.items()]
+            )
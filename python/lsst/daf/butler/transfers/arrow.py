@@ -0,0 +1,633 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Repository import/export backends that use the Apache Arrow IPC streaming
+format.
+
+This module requires ``pyarrow``, which is an optional dependency of
+daf_butler; it is therefore not imported by `lsst.daf.butler.transfers`.
+"""
+
+from __future__ import annotations
+
+__all__ = ["ArrowRepoExportBackend", "ArrowRepoImportBackend"]
+
+import itertools
+import json
+import os
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import astropy.time
+import pyarrow as pa
+import sqlalchemy
+
+from lsst.sphgeom import Region
+from lsst.utils import doImport
+from ..core import (
+    DatasetAssociation,
+    DatasetRef,
+    DatasetType,
+    Datastore,
+    DimensionElement,
+    DimensionRecord,
+    FileDataset,
+    SpatialRegionDatabaseRepresentation,
+    Timespan,
+    TimespanDatabaseRepresentation,
+    ddl,
+)
+from ..core.named import NamedValueSet
+from ..core.time_utils import TimeConverter
+from ..registry import CollectionType, Registry
+from ..registry.interfaces import (
+    ChainedCollectionRecord,
+    CollectionRecord,
+    RunRecord,
+    VersionTuple,
+)
+from ..registry.versions import IncompatibleVersionError
+from ._interfaces import RepoExportBackend, RepoImportBackend
+
+
+ARROW_FORMAT_VERSION = VersionTuple(1, 0, 0)
+"""Arrow export format version.
+
+Files with a different major version or a newer minor version cannot be read by
+this version of the code.
+"""
+
+CHUNK_SIZE = 10000
+"""Default maximum number of rows in each Arrow record batch, and hence the
+number of records converted and inserted at once on import.
+"""
+
+
+def _encodeTimes(values: List[Any]) -> List[Optional[int]]:
+    # Convert all non-null times at once; this is much faster than converting
+    # astropy times one at a time.
+    indices = [i for i, v in enumerate(values) if v is not None]
+    result: List[Optional[int]] = [None]*len(values)
+    if indices:
+        nsec = TimeConverter().astropy_to_nsec_array(astropy.time.Time([values[i] for i in indices]))
+        for i, v in zip(indices, nsec.tolist()):
+            result[i] = v
+    return result
+
+
+def _decodeTimes(values: List[Optional[int]]) -> List[Any]:
+    indices = [i for i, v in enumerate(values) if v is not None]
+    result: List[Any] = [None]*len(values)
+    if indices:
+        times = TimeConverter().nsec_to_astropy_array([values[i] for i in indices])
+        for i, t in zip(indices, times):
+            result[i] = t
+    return result
+
+
+def _encodeRegions(values: List[Optional[Region]]) -> List[Optional[bytes]]:
+    return [v.encode() if v is not None else None for v in values]
+
+
+def _decodeRegions(values: List[Optional[bytes]]) -> List[Optional[Region]]:
+    return [Region.decode(v) if v is not None else None for v in values]
+
+
+def _updateTimespan(row: Dict[str, Any], timespan: Optional[Timespan], name: str) -> None:
+    """Add the integer nanosecond bounds of a timespan to a row, as the
+    ``{name}_begin`` and ``{name}_end`` columns.
+    """
+    TimespanDatabaseRepresentation.Compound.update(timespan, name=name, result=row)
+
+
+def _extractTimespan(row: Mapping[str, Any], name: str) -> Timespan:
+    """Extract a timespan from the ``{name}_begin`` and ``{name}_end``
+    integer nanosecond columns of a row, treating nulls as unbounded.
+    """
+    converter = TimeConverter()
+    begin = row[f"{name}_begin"]
+    end = row[f"{name}_end"]
+    timespan = TimespanDatabaseRepresentation.Compound.extract(
+        {
+            f"{name}_begin": begin if begin is not None else converter.min_nsec,
+            f"{name}_end": end if end is not None else converter.max_nsec,
+        },
+        name=name,
+    )
+    assert timespan is not None
+    return timespan
+
+
+class _Column:
+    """A description of how one field of a Python record is stored in an
+    Arrow column.
+
+    Parameters
+    ----------
+    name : `str`
+        Name of the field and column.
+    type : `pyarrow.DataType`
+        Arrow type of the column.
+    encode : callable, optional
+        Callable that converts a list of Python values into a list of values
+        Arrow understands.
+    decode : callable, optional
+        Callable that inverts ``encode``.
+    """
+
+    def __init__(self, name: str, type: pa.DataType, *,
+                 encode: Optional[Callable[[List[Any]], List[Any]]] = None,
+                 decode: Optional[Callable[[List[Any]], List[Any]]] = None):
+        self.name = name
+        self.type = type
+        self.encode = encode
+        self.decode = decode
+
+    @classmethod
+    def fromFieldSpec(cls, spec: ddl.FieldSpec, name: Optional[str] = None) -> _Column:
+        """Construct a column for a `ddl.FieldSpec`.
+
+        Parameters
+        ----------
+        spec : `ddl.FieldSpec`
+            Specification for the field.
+        name : `str`, optional
+            Name for the column, if different from ``spec.name``.
+        """
+        if name is None:
+            name = spec.name
+        # Base64Region is a subclass of Base64Bytes, so test it first.
+        if issubclass(spec.dtype, ddl.Base64Region):
+            return cls(name, pa.binary(), encode=_encodeRegions, decode=_decodeRegions)
+        if issubclass(spec.dtype, ddl.AstropyTimeNsecTai):
+            return cls(name, pa.int64(), encode=_encodeTimes, decode=_decodeTimes)
+        for dtype, arrowType in _ARROW_TYPES:
+            if issubclass(spec.dtype, dtype):
+                return cls(name, arrowType)
+        raise NotImplementedError(f"Field {spec.name} has type {spec.dtype.__name__}, which cannot be "
+                                  "exported to Arrow.")
+
+    def makeArray(self, values: List[Any]) -> pa.Array:
+        """Make an Arrow array from a list of Python values.
+        """
+        if self.encode is not None:
+            values = self.encode(values)
+        return pa.array(values, type=self.type)
+
+    def readArray(self, array: pa.Array) -> List[Any]:
+        """Make a list of Python values from an Arrow array.
+        """
+        values = array.to_pylist()
+        if self.decode is not None:
+            values = self.decode(values)
+        return values
+
+    name: str
+    """Name of the field and column (`str`).
+    """
+
+    type: pa.DataType
+    """Arrow type of the column (`pyarrow.DataType`).
+    """
+
+
+_ARROW_TYPES = (
+    (sqlalchemy.Boolean, pa.bool_()),
+    (sqlalchemy.Integer, pa.int64()),
+    (sqlalchemy.Float, pa.float64()),
+    (sqlalchemy.String, pa.string()),
+    (sqlalchemy.LargeBinary, pa.binary()),
+    (ddl.Base64Bytes, pa.binary()),
+)
+
+
+def _makeElementColumns(element: DimensionElement) -> List[_Column]:
+    """Return the columns used to store records for a dimension element.
+    """
+    columns = [_Column.fromFieldSpec(spec) for spec in element.RecordClass.fields.standard]
+    if element.spatial is not None:
+        columns.append(_Column(SpatialRegionDatabaseRepresentation.NAME, pa.binary(),
+                               encode=_encodeRegions, decode=_decodeRegions))
+    if element.temporal is not None:
+        # Timespans are stored as integer TAI nanoseconds, exactly as in the
+        # database, so they never need to be converted to astropy times.
+        columns.extend(_Column(name, pa.int64()) for name in ("datetime_begin", "datetime_end"))
+    return columns
+
+
+def _makeDatasetColumns(datasetType: DatasetType) -> List[_Column]:
+    """Return the columns used to store datasets of a particular type.
+    """
+    columns = [
+        _Column("file_index", pa.int64()),
+        _Column("dataset_id", pa.int64()),
+        _Column("path", pa.string()),
+        _Column("formatter", pa.string()),
+    ]
+    columns.extend(_Column.fromFieldSpec(dimension.primaryKey, name=dimension.name)
+                   for dimension in datasetType.dimensions.required)
+    return columns
+
+
+_COLLECTION_COLUMNS = [
+    _Column("name", pa.string()),
+    _Column("collection_type", pa.string()),
+    _Column("doc", pa.string()),
+    _Column("host", pa.string()),
+    _Column("timespan_begin", pa.int64()),
+    _Column("timespan_end", pa.int64()),
+    _Column("children", pa.list_(pa.string())),
+]
+
+_ASSOCIATION_COLUMNS = [
+    _Column("dataset_id", pa.int64()),
+    _Column("timespan_begin", pa.int64()),
+    _Column("timespan_end", pa.int64()),
+]
+
+
+def _iterRows(table: pa.Table, columns: List[_Column], chunkSize: int) -> Iterator[List[Dict[str, Any]]]:
+    """Iterate over chunks of a table, converting each to a list of `dict`
+    rows.
+    """
+    for batch in table.to_batches(max_chunksize=chunkSize):
+        values = [column.readArray(batch.column(batch.schema.get_field_index(column.name)))
+                  for column in columns]
+        names = [column.name for column in columns]
+        yield [dict(zip(names, row)) for row in zip(*values)]
+
+
+class ArrowRepoExportBackend(RepoExportBackend):
+    """A repository export implementation that saves to a sequence of Apache
+    Arrow IPC streams in a single binary file.
+
+    Parameters
+    ----------
+    stream
+        A writeable binary file-like object.
+    chunkSize : `int`, optional
+        Maximum number of rows in each Arrow record batch.
+
+    Notes
+    -----
+    Each call to `saveDimensionData` and `saveDatasets` writes one Arrow
+    stream (i.e. one table, with a schema specific to that dimension element
+    or dataset type) to the file, in batches of at most ``chunkSize`` rows.
+    Collections are buffered and written together as a single table.  Schema
+    metadata records what each table contains.
+    """
+
+    binary = True
+
+    def __init__(self, stream: IO, *, chunkSize: int = CHUNK_SIZE):
+        self.stream = stream
+        self._chunkSize = chunkSize
+        self._collections: List[Dict[str, Any]] = []
+
+    def _writeTable(self, columns: List[_Column], rows: Iterable[Mapping[str, Any]],
+                    **metadata: str) -> None:
+        """Write a single table to the stream as an Arrow IPC stream.
+
+        Parameters
+        ----------
+        columns : `list` [ `_Column` ]
+            Descriptions of the table's columns.
+        rows : iterable of `dict`
+            Rows to write, as mappings from column name to Python value.
+        **metadata
+            Additional schema metadata.
+        """
+        schema = pa.schema(
+            [pa.field(column.name, column.type) for column in columns],
+            metadata=dict(metadata, version=str(ARROW_FORMAT_VERSION)),
+        )
+        iterator = iter(rows)
+        with pa.ipc.new_stream(self.stream, schema) as writer:
+            while True:
+                chunk = list(itertools.islice(iterator, self._chunkSize))
+                if not chunk:
+                    break
+                writer.write_batch(
+                    pa.record_batch([column.makeArray([row[column.name] for row in chunk])
+                                     for column in columns],
+                                    schema=schema)
+                )
+
+    def _flushCollections(self) -> None:
+        """Write any buffered collections to the stream.
+        """
+        if self._collections:
+            self._writeTable(_COLLECTION_COLUMNS, self._collections, type="collection")
+            self._collections = []
+
+    def saveDimensionData(self, element: DimensionElement, *data: DimensionRecord) -> None:
+        # Docstring inherited from RepoExportBackend.saveDimensionData.
+        self._flushCollections()
+
+        def rows() -> Iterator[Dict[str, Any]]:
+            for record in data:
+                row = record.toDict()
+                if element.temporal is not None:
+                    _updateTimespan(row, row.pop(TimespanDatabaseRepresentation.NAME), "datetime")
+                yield row
+
+        self._writeTable(_makeElementColumns(element), rows(), type="dimension", element=element.name)
+
+    def saveCollection(self, record: CollectionRecord, doc: Optional[str]) -> None:
+        # Docstring inherited from RepoExportBackend.saveCollections.
+        row: Dict[str, Any] = {
+            "name": record.name,
+            "collection_type": record.type.name,
+            "doc": doc,
+            "host": None,
+            "timespan_begin": None,
+            "timespan_end": None,
+            "children": None,
+        }
+        if isinstance(record, RunRecord):
+            row["host"] = record.host
+            _updateTimespan(row, record.timespan, "timespan")
+        elif isinstance(record, ChainedCollectionRecord):
+            row["children"] = list(record.children)
+        self._collections.append(row)
+
+    def saveDatasets(self, datasetType: DatasetType, run: str, *datasets: FileDataset) -> None:
+        # Docstring inherited from RepoExportBackend.saveDatasets.
+        self._flushCollections()
+        dimensions = datasetType.dimensions.required.names
+
+        def rows() -> Iterator[Dict[str, Any]]:
+            for index, dataset in enumerate(datasets):
+                for ref in sorted(dataset.refs):
+                    row = {
+                        "file_index": index,
+                        "dataset_id": ref.id,
+                        "path": dataset.path,
+                        "formatter": dataset.formatter,
+                    }
+                    row.update((name, ref.dataId[name]) for name in dimensions)
+                    yield row
+
+        self._writeTable(
+            _makeDatasetColumns(datasetType),
+            rows(),
+            type="dataset",
+            dataset_type=datasetType.name,
+            dimensions=json.dumps(list(datasetType.dimensions.names)),
+            storage_class=datasetType.storageClass.name,
+            is_calibration=json.dumps(datasetType.isCalibration()),
+            run=run,
+        )
+
+    def saveDatasetAssociations(self, collection: str, collectionType: CollectionType,
+                                associations: Iterable[DatasetAssociation]) -> None:
+        # Docstring inherited from RepoExportBackend.saveDatasetAssociations.
+        self._flushCollections()
+        self._writeTable(
+            _ASSOCIATION_COLUMNS,
+            (
+                TimespanDatabaseRepresentation.Compound.update(
+                    association.timespan,
+                    result={"dataset_id": association.ref.id},
+                )
+                for association in associations
+            ),
+            type="associations",
+            collection=collection,
+            collection_type=collectionType.name,
+        )
+
+    def finish(self) -> None:
+        # Docstring inherited from RepoExportBackend.
+        self._flushCollections()
+        self.stream.flush()
+
+
+class ArrowRepoImportBackend(RepoImportBackend):
+    """A repository import implementation that reads a file written by
+    `ArrowRepoExportBackend`.
+
+    Parameters
+    ----------
+    stream
+        A readable binary file-like object.
+    registry : `Registry`
+        The registry datasets will be imported into.  Only used to retreive
+        dataset types during construction; all write happen in `register`
+        and `load`.
+    chunkSize : `int`, optional
+        Maximum number of dimension records or datasets to convert to Python
+        objects and insert at once.
+
+    Notes
+    -----
+    Collections, dataset types and associations are read into Python objects
+    on construction.  Dimension records and datasets are held in memory only
+    as (columnar) Arrow tables, and are converted and inserted in chunks by
+    `load`.
+    """
+
+    binary = True
+
+    def __init__(self, stream: IO, registry: Registry, *, chunkSize: int = CHUNK_SIZE):
+        self.registry: Registry = registry
+        self.runs: Dict[str, Tuple[Optional[str], Timespan]] = {}
+        self.chains: Dict[str, List[str]] = {}
+        self.collections: Dict[str, CollectionType] = {}
+        self.collectionDocs: Dict[str, str] = {}
+        self.datasetTypes: NamedValueSet[DatasetType] = NamedValueSet()
+        self.dimensions: Dict[DimensionElement, List[pa.Table]] = defaultdict(list)
+        self.datasets: Dict[Tuple[str, str], List[pa.Table]] = defaultdict(list)
+        self.tagAssociations: Dict[str, List[int]] = defaultdict(list)
+        self.calibAssociations: Dict[str, Dict[Timespan, List[int]]] = defaultdict(lambda: defaultdict(list))
+        self.refsByFileId: Dict[int, DatasetRef] = {}
+        self._chunkSize = chunkSize
+        for table in self._readTables(stream):
+            metadata = {k.decode(): v.decode() for k, v in table.schema.metadata.items()}
+            self._checkVersion(metadata)
+            if metadata["type"] == "dimension":
+                self.dimensions[self.registry.dimensions[metadata["element"]]].append(table)
+            elif metadata["type"] == "collection":
+                for rows in _iterRows(table, _COLLECTION_COLUMNS, self._chunkSize):
+                    for row in rows:
+                        self._readCollection(row)
+            elif metadata["type"] == "dataset":
+                self.datasetTypes.add(
+                    DatasetType(metadata["dataset_type"], dimensions=json.loads(metadata["dimensions"]),
+                                storageClass=metadata["storage_class"], universe=self.registry.dimensions,
+                                isCalibration=json.loads(metadata["is_calibration"]))
+                )
+                self.datasets[metadata["dataset_type"], metadata["run"]].append(table)
+            elif metadata["type"] == "associations":
+                collectionType = CollectionType.__members__[metadata["collection_type"]]
+                for rows in _iterRows(table, _ASSOCIATION_COLUMNS, self._chunkSize):
+                    if collectionType is CollectionType.TAGGED:
+                        self.tagAssociations[metadata["collection"]].extend(
+                            row["dataset_id"] for row in rows
+                        )
+                    elif collectionType is CollectionType.CALIBRATION:
+                        idsByTimespan = self.calibAssociations[metadata["collection"]]
+                        for row in rows:
+                            idsByTimespan[_extractTimespan(row, "timespan")].append(row["dataset_id"])
+                    else:
+                        raise ValueError(
+                            f"Unexpected calibration type for association: {collectionType.name}."
+                        )
+            else:
+                raise ValueError(f"Unexpected table type: {metadata['type']}.")
+
+    @staticmethod
+    def _readTables(stream: IO) -> Iterator[pa.Table]:
+        """Read all Arrow IPC streams from a file.
+        """
+        while True:
+            if hasattr(stream, "peek"):
+                if not stream.peek(1):
+                    return
+            else:
+                position = stream.tell()
+                if not stream.read(1):
+                    return
+                stream.seek(position)
+            yield pa.ipc.open_stream(stream).read_all()
+
+    @staticmethod
+    def _checkVersion(metadata: Mapping[str, str]) -> None:
+        """Check that a table was written with a compatible format version.
+        """
+        fileVersion = VersionTuple.fromString(metadata["version"])
+        if fileVersion.major != ARROW_FORMAT_VERSION.major:
+            raise IncompatibleVersionError(
+                f"Cannot read repository export file with version={fileVersion} "
+                f"({ARROW_FORMAT_VERSION.major}.x.x required)."
+            )
+        if fileVersion.minor > ARROW_FORMAT_VERSION.minor:
+            raise IncompatibleVersionError(
+                f"Cannot read repository export file with version={fileVersion} "
+                f"< {ARROW_FORMAT_VERSION.major}.{ARROW_FORMAT_VERSION.minor}.x required."
+            )
+
+    def _readCollection(self, row: Mapping[str, Any]) -> None:
+        """Record a collection read from a file.
+        """
+        collectionType = CollectionType.__members__[row["collection_type"]]
+        if collectionType is CollectionType.RUN:
+            self.runs[row["name"]] = (
+                row["host"],
+                _extractTimespan(row, "timespan"),
+            )
+        elif collectionType is CollectionType.CHAINED:
+            self.chains[row["name"]] = list(row["children"])
+        else:
+            self.collections[row["name"]] = collectionType
+        if row["doc"] is not None:
+            self.collectionDocs[row["name"]] = row["doc"]
+
+    def register(self) -> None:
+        # Docstring inherited from RepoImportBackend.register.
+        for datasetType in self.datasetTypes:
+            self.registry.registerDatasetType(datasetType)
+        for run in self.runs:
+            self.registry.registerRun(run, doc=self.collectionDocs.get(run))
+            # No way to add extra run info to registry yet.
+        for collection, collection_type in self.collections.items():
+            self.registry.registerCollection(collection, collection_type,
+                                             doc=self.collectionDocs.get(collection))
+        for chain, children in self.chains.items():
+            self.registry.registerCollection(chain, CollectionType.CHAINED,
+                                             doc=self.collectionDocs.get(chain))
+            self.registry.setCollectionChain(chain, children)
+
+    def load(self, datastore: Optional[Datastore], *,
+             directory: Optional[str] = None, transfer: Optional[str] = None,
+             skip_dimensions: Optional[Set] = None) -> None:
+        # Docstring inherited from RepoImportBackend.load.
+        # Records for an element may be split across several tables in the
+        # file, so insert them in dependency order rather than file order.
+        for element in self.registry.dimensions.sorted(self.dimensions.keys()):
+            if skip_dimensions and element in skip_dimensions:
+                continue
+            columns = _makeElementColumns(element)
+            for table in self.dimensions[element]:
+                for rows in _iterRows(table, columns, self._chunkSize):
+                    if element.temporal is not None:
+                        for row in rows:
+                            row[TimespanDatabaseRepresentation.NAME] = _extractTimespan(row, "datetime")
+                            del row["datetime_begin"]
+                            del row["datetime_end"]
+                    self.registry.insertDimensionData(element, *[element.RecordClass(**row) for row in rows])
+        # FileDatasets to ingest into the datastore (in bulk):
+        fileDatasets = []
+        for (datasetTypeName, run), tables in self.datasets.items():
+            datasetType = self.registry.getDatasetType(datasetTypeName)
+            columns = _makeDatasetColumns(datasetType)
+            dimensions = datasetType.dimensions.required.names
+            for table in tables:
+                # Rows that belong to the same file are adjacent, and may be
+                # split across chunks.
+                byFileIndex: Dict[int, FileDataset] = {}
+                for rows in _iterRows(table, columns, self._chunkSize):
+                    # For now, we ignore the dataset_id we pulled from the
+                    # file and just insert without one to get a new
+                    # autoincrement value.  Eventually (once we have origin in
+                    # IDs) we'll preserve them.
+                    resolvedRefs = self.registry.insertDatasets(
+                        datasetType,
+                        dataIds=[{name: row[name] for name in dimensions} for row in rows],
+                        run=run,
+                    )
+                    for row, ref in zip(rows, resolvedRefs):
+                        self.refsByFileId[row["dataset_id"]] = ref
+                        fileDataset = byFileIndex.get(row["file_index"])
+                        if fileDataset is None:
+                            path = row["path"]
+                            if directory is not None:
+                                path = os.path.join(directory, path)
+                            formatter = doImport(row["formatter"]) if row["formatter"] is not None else None
+                            byFileIndex[row["file_index"]] = FileDataset(path, [ref], formatter=formatter)
+                        else:
+                            fileDataset.refs.append(ref)
+                fileDatasets.extend(byFileIndex.values())
+        # Ingest everything into the datastore at once.
+        if datastore is not None and fileDatasets:
+            datastore.ingest(*fileDatasets, transfer=transfer)
+        # Associate datasets with tagged collections.
+        for collection, dataset_ids in self.tagAssociations.items():
+            self.registry.associate(collection, [self.refsByFileId[i] for i in dataset_ids])
+        # Associate datasets with calibration collections.
+        for collection, idsByTimespan in self.calibAssociations.items():
+            self.registry.certifyMany(
+                collection,
+                [([self.refsByFileId[i] for i in dataset_ids], timespan)
+                 for timespan, dataset_ids in idsByTimespan.items()]
+            )
@@ -0,0 +1,118 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for AsyncButler.
+"""
+
+import asyncio
+import os
+import unittest
+import unittest.mock
+
+from lsst.daf.butler import AsyncButler, Butler, DatasetType, Registry
+from lsst.daf.butler.tests.utils import makeTestTempDir, removeTestTempDir
+
+TESTDIR = os.path.abspath(os.path.dirname(__file__))
+
+
+class AsyncButlerTestCase(unittest.TestCase):
+    """Tests for the asyncio facade, using a POSIX datastore and SQLite
+    registry in a temporary directory.
+    """
+
+    def setUp(self):
+        self.root = makeTestTempDir(TESTDIR)
+        Butler.makeRepo(self.root)
+        self.butler = Butler(self.root, run="run")
+        self.butler.registry.insertDimensionData("instrument", {"name": "Cam1"})
+        self.datasetType = DatasetType("metrics", ["instrument"], "StructuredDataDict",
+                                       universe=self.butler.registry.dimensions)
+        self.butler.registry.registerDatasetType(self.datasetType)
+
+    def tearDown(self):
+        removeTestTempDir(self.root)
+
+    def _roundTrip(self, **kwargs):
+        async def run():
+            async with AsyncButler(self.butler, **kwargs) as abutler:
+                ref = await abutler.put({"a": 1}, self.datasetType, instrument="Cam1")
+                results = await asyncio.gather(
+                    *[abutler.get(self.datasetType, instrument="Cam1") for _ in range(4)]
+                )
+                exists = await abutler.exists(self.datasetType, instrument="Cam1")
+                primary, components = await abutler.getURIs(ref)
+                refs = await abutler.queryDatasets(self.datasetType, collections="run")
+            return ref, results, exists, primary, components, refs
+
+        ref, results, exists, primary, components, refs = asyncio.run(run())
+        self.assertEqual(results, [{"a": 1}]*4)
+        self.assertTrue(exists)
+        self.assertTrue(primary.exists())
+        self.assertEqual(components, {})
+        self.assertEqual(refs, [ref])
+
+    def testClonedButlers(self):
+        """Test operations with one butler per worker thread.
+        """
+        self._roundTrip()
+
+    def testSharedButler(self):
+        """Test operations that all share the wrapped butler.
+        """
+        self._roundTrip(cloneButlers=False, workers=2)
+
+    def testPutNewRun(self):
+        """Test that datasets put into a run registered through the facade
+        can be found by all of the other butlers, and that the clones are
+        closed with the facade.
+        """
+        async def run(abutler):
+            # Make sure there are clones that exist before the run is
+            # registered.
+            await asyncio.gather(*[abutler.exists(self.datasetType, instrument="Cam1", collections="run")
+                                   for _ in range(4)])
+            await abutler.registerRun("new")
+            ref = await abutler.put({"b": 2}, self.datasetType, instrument="Cam1", run="new")
+            refs = await abutler.queryDatasets(self.datasetType, collections="new")
+            results = await asyncio.gather(
+                *[abutler.get(self.datasetType, instrument="Cam1", collections="new") for _ in range(4)]
+            )
+            return ref, refs, results
+
+        self.butler.put({"a": 1}, self.datasetType, instrument="Cam1")
+        abutler = AsyncButler(self.butler, workers=4)
+        ref, refs, results = asyncio.run(run(abutler))
+        self.assertEqual(refs, [ref])
+        self.assertEqual(results, [{"b": 2}]*4)
+        clones = list(abutler._clones)
+        self.assertTrue(clones)
+        with unittest.mock.patch.object(Registry, "close", autospec=True) as mockClose:
+            abutler.close()
+        self.assertCountEqual([call.args[0] for call in mockClose.call_args_list],
+                              [clone.registry for clone in clones])
+
+    def testBadLimits(self):
+        with self.assertRaises(ValueError):
+            AsyncButler(self.butler, workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for `lsst.daf.butler.tests.makeBenchmarkRepo`.
+"""
+
+import os
+import unittest
+
+from lsst.daf.butler import CollectionType
+from lsst.daf.butler.tests import BenchmarkScale, makeBenchmarkRepo
+from lsst.daf.butler.tests.utils import makeTestTempDir, removeTestTempDir
+
+
+TESTDIR = os.path.abspath(os.path.dirname(__file__))
+
+
+class BenchmarkRepoTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.root = makeTestTempDir(TESTDIR)
+
+    def tearDown(self):
+        removeTestTempDir(self.root)
+
+    def testScale(self):
+        scale = BenchmarkScale.fromDatasets(100)
+        self.assertEqual(scale.detectors, 10)
+        self.assertEqual(scale.exposures, 10)
+        self.assertEqual(scale.datasets, 100)
+        self.assertEqual(BenchmarkScale.fromDatasets(3).datasets, 3)
+
+    def testMakeRepo(self):
+        scale = BenchmarkScale(detectors=3, exposures=4, datasetTypes=2, runs=3, chains=2)
+        repo = makeBenchmarkRepo(self.root, scale)
+        registry = repo.butler.registry
+        self.assertEqual(len(repo.dataIds), 12)
+        self.assertEqual(len(repo.refs), scale.datasets)
+        self.assertEqual(len(set(repo.refs)), scale.datasets)
+        for chain in repo.chains:
+            self.assertEqual(registry.getCollectionType(chain), CollectionType.CHAINED)
+            self.assertCountEqual(registry.getCollectionChain(chain), repo.runs)
+        for ref in repo.refs:
+            self.assertIn(ref.run, repo.runs)
+            self.assertEqual(registry.findDataset(ref.datasetType, ref.dataId, collections=repo.chains[0]),
+                             ref)
+        ref = repo.refs[0]
+        self.assertEqual(repo.butler.getDirect(ref), repo.makeObject(ref.dataId))
+
+    def testRegistryOnly(self):
+        scale = BenchmarkScale(detectors=2, exposures=2)
+        repo = makeBenchmarkRepo(self.root, scale, store=False)
+        self.assertEqual(len(repo.refs), 4)
+        self.assertFalse(any(repo.butler.datastore.exists(ref) for ref in repo.refs))
+
+
+if __name__ == "__main__":
+    unittest.main()
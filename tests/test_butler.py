@@ -438,6 +438,14 @@ class ButlerTests(ButlerPutGetTests):
         datasets = list(butler.registry.queryDatasets(..., collections="ingest"))
         self.assertEqual(len(datasets), 1)
         uri, components = butler.getURIs(datasets[0])
+        self.assertEqual(butler.getManyURIs(datasets), {datasets[0]: (uri, components)})
+
+        # A dataset unknown to the datastore is an error unless allowed.
+        missing = datasets[0].unresolved().resolved(id=datasets[0].id + 1000, run=datasets[0].run)
+        with self.assertRaises(FileNotFoundError):
+            butler.getManyURIs([missing, datasets[0]])
+        self.assertEqual(list(butler.getManyURIs([missing, datasets[0]], allowMissing=True)),
+                         [datasets[0]])
 
         if butler.datastore.isEphemeral:
             # Never disassemble in-memory datastore
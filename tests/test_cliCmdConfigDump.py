@@ -37,7 +37,7 @@ TESTDIR = os.path.abspath(os.path.dirname(__file__))
 
 class ConfigDumpTest(CliCmdTestBase, unittest.TestCase):
 
-    mockFuncName = "lsst.daf.butler.cli.cmd.commands.script.configDump"
+    mockFuncName = "lsst.daf.butler.script.configDump"
 
     @staticmethod
     def defaultExpected():
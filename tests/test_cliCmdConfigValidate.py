@@ -33,7 +33,7 @@ from lsst.daf.butler.tests import CliCmdTestBase
 
 class ValidateTest(CliCmdTestBase, unittest.TestCase):
 
-    mockFuncName = "lsst.daf.butler.cli.cmd.commands.script.configValidate"
+    mockFuncName = "lsst.daf.butler.script.configValidate"
 
     @staticmethod
     def defaultExpected():
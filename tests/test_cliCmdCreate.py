@@ -27,7 +27,7 @@ from lsst.daf.butler.cli.cmd import create
 
 class CreateTest(CliCmdTestBase, unittest.TestCase):
 
-    mockFuncName = "lsst.daf.butler.cli.cmd.commands.script.createRepo"
+    mockFuncName = "lsst.daf.butler.script.createRepo"
 
     @staticmethod
     def defaultExpected():
@@ -32,7 +32,7 @@ from lsst.daf.butler.cli.cmd import butler_import
 
 class ImportTestCase(CliCmdTestBase, unittest.TestCase):
 
-    mockFuncName = "lsst.daf.butler.cli.cmd.commands.script.butlerImport"
+    mockFuncName = "lsst.daf.butler.script.butlerImport"
 
     @staticmethod
     def defaultExpected():
@@ -40,7 +40,8 @@ class ImportTestCase(CliCmdTestBase, unittest.TestCase):
                     transfer="auto",
                     directory=None,
                     skip_dimensions=(),
-                    export_file=None)
+                    export_file=None,
+                    format=None)
 
     @staticmethod
     def command():
@@ -57,9 +58,9 @@ class ImportTestCase(CliCmdTestBase, unittest.TestCase):
         case below.
         """
         self.run_test(["import", "here", "foo",
-                       "--transfer", "symlink"],
+                       "--transfer", "symlink", "--format", "arrow"],
                       self.makeExpected(repo="here", directory="foo",
-                                        transfer="symlink"))
+                                        transfer="symlink", format="arrow"))
 
     def test_missingArgument(self):
         """Verify the command fails if either of the positional arguments,
@@ -70,7 +71,7 @@ class ImportTestCase(CliCmdTestBase, unittest.TestCase):
 
 class ExportFileCase(CliCmdTestBase, unittest.TestCase):
 
-    mockFuncName = "lsst.daf.butler.cli.cmd.commands.script.butlerImport"
+    mockFuncName = "lsst.daf.butler.script.butlerImport"
 
     @property
     def mock(self):
@@ -83,7 +84,8 @@ class ExportFileCase(CliCmdTestBase, unittest.TestCase):
         return dict(repo=None,
                     transfer="auto",
                     directory=None,
-                    export_file=None)
+                    export_file=None,
+                    format=None)
 
     @staticmethod
     def command():
@@ -94,7 +94,7 @@ class PruneCollectionExecutionTest(unittest.TestCase, ButlerTestHelper):
     verify collections can be pruned.
     """
 
-    mockFuncName = "lsst.daf.butler.cli.cmd.commands.script.pruneCollection"
+    mockFuncName = "lsst.daf.butler.script.pruneCollection"
 
     def setUp(self):
         self.runner = LogCliRunner()
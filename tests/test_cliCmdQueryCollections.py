@@ -44,7 +44,7 @@ TESTDIR = os.path.abspath(os.path.dirname(__file__))
 
 class QueryCollectionsCmdTest(CliCmdTestBase, unittest.TestCase):
 
-    mockFuncName = "lsst.daf.butler.cli.cmd.commands.script.queryCollections"
+    mockFuncName = "lsst.daf.butler.script.queryCollections"
 
     @staticmethod
     def defaultExpected():
@@ -23,6 +23,8 @@
 """
 
 from astropy.table import Table as AstropyTable
+import csv
+import json
 from numpy import array
 import os
 import unittest
@@ -37,7 +39,7 @@ TESTDIR = os.path.abspath(os.path.dirname(__file__))
 
 class QueryDataIdsTest(unittest.TestCase, ButlerTestHelper):
 
-    mockFuncName = "lsst.daf.butler.cli.cmd.commands.script.queryDataIds"
+    mockFuncName = "lsst.daf.butler.script.queryDataIds"
 
     @staticmethod
     def _queryDataIds(repo, dimensions=(), collections=(), datasets=None, where=None):
@@ -69,6 +71,31 @@ class QueryDataIdsTest(unittest.TestCase, ButlerTestHelper):
         )
         self.assertAstropyTablesEqual(res, expected)
 
+    def testStreaming(self):
+        """Test writing data IDs as they arrive, in several formats."""
+        output = os.path.join(self.root, "dataIds.csv")
+        count = script.streamDataIds(repo=self.root, dimensions=("visit",), collections=(), datasets=None,
+                                     where=None, format="csv", output=output)
+        self.assertEqual(count, 2)
+        with open(output) as stream:
+            rows = list(csv.reader(stream))
+        self.assertEqual(rows[0], ["band", "instrument", "physical_filter", "visit_system", "visit"])
+        self.assertCountEqual(rows[1:], [["R", "DummyCamComp", "d-r", "1", "423"],
+                                         ["R", "DummyCamComp", "d-r", "1", "424"]])
+
+        output = os.path.join(self.root, "dataIds.json")
+        count = script.streamDataIds(repo=self.root, dimensions=("visit",), collections=(), datasets=None,
+                                     where=None, limit=1, format="json", output=output)
+        self.assertEqual(count, 1)
+        with open(output) as stream:
+            rows = [json.loads(line) for line in stream]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["instrument"], "DummyCamComp")
+        self.assertIn(rows[0]["visit"], (423, 424))
+
+        self.assertEqual(script.streamDataIds(repo=self.root, dimensions=(), collections=(), datasets=None,
+                                              where=None, format="csv"), 0)
+
     def testNull(self):
         "Test asking for nothing."
         res = self._queryDataIds(self.root)
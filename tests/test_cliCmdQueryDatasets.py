@@ -27,8 +27,15 @@ from numpy import array
 import os
 import unittest
 
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
 from lsst.daf.butler import StorageClassFactory
 from lsst.daf.butler import script
+from lsst.daf.butler.cli.butler import cli as butlerCli
+from lsst.daf.butler.cli.utils import clickResultMsg, LogCliRunner
 from lsst.daf.butler.tests import addDatasetType
 from lsst.daf.butler.tests.utils import ButlerTestHelper, makeTestTempDir, MetricTestRepo, removeTestTempDir
 
@@ -38,7 +45,7 @@ TESTDIR = os.path.abspath(os.path.dirname(__file__))
 
 class QueryDatasetsTest(unittest.TestCase, ButlerTestHelper):
 
-    mockFuncName = "lsst.daf.butler.cli.cmd.commands.script.queryDatasets"
+    mockFuncName = "lsst.daf.butler.script.queryDatasets"
 
     configFile = os.path.join(TESTDIR, "config/basic/butler.yaml")
     storageClassFactory = StorageClassFactory()
@@ -55,6 +62,42 @@ class QueryDatasetsTest(unittest.TestCase, ButlerTestHelper):
     def tearDown(self):
         removeTestTempDir(self.root)
 
+    @unittest.skipUnless(pyarrow is not None, "Cannot test Parquet output without pyarrow.")
+    def testStreaming(self):
+        """Test writing datasets as they arrive, with and without URIs."""
+        output = os.path.join(self.root, "datasets.parq")
+        count = script.streamDatasets(self.root, (), (), "", False, True, format="parquet", output=output)
+        # The datasets are disassembled, so there is a row for each component.
+        self.assertEqual(count, 6)
+        table = pyarrow.parquet.read_table(output)
+        self.assertEqual(table.column_names,
+                         ["type", "run", "id", "band", "instrument", "physical_filter", "visit_system",
+                          "visit", "URI"])
+        self.assertCountEqual(table.column("visit").to_pylist(), [423, 424] * 3)
+        self.assertEqual(set(table.column("type").to_pylist()),
+                         {"test_metric_comp.data", "test_metric_comp.output", "test_metric_comp.summary"})
+        for uri in table.column("URI").to_pylist():
+            self.assertTrue(uri.startswith("file://"))
+        count = script.streamDatasets(self.root, (), (), "", False, False, limit=1, format="parquet",
+                                      output=output)
+        self.assertEqual(count, 1)
+        self.assertEqual(pyarrow.parquet.read_table(output).num_rows, 1)
+
+    def testExplain(self):
+        """Test getting query plans instead of datasets."""
+        plans = script.explainDatasets(self.root, (), (), "visit = 423 AND instrument = 'DummyCamComp'",
+                                       False)
+        self.assertEqual([name for name, _ in plans], ["test_metric_comp"])
+        self.assertTrue(plans[0][1])
+        for line in plans[0][1]:
+            self.assertIsInstance(line, str)
+        result = LogCliRunner().invoke(butlerCli, ["query-datasets", self.root, "--explain", "--where",
+                                                   "visit = 423 AND instrument = 'DummyCamComp'"])
+        self.assertEqual(result.exit_code, 0, clickResultMsg(result))
+        lines = result.output.splitlines()
+        self.assertEqual(lines[0], "test_metric_comp:")
+        self.assertEqual(lines[1:], [f"  {line}" for line in plans[0][1]])
+
     def testShowURI(self):
         """Test for expected output with show_uri=True."""
         tables = self._queryDatasets(repo=self.root, show_uri=True)
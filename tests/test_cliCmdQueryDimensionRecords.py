@@ -45,7 +45,7 @@ TESTDIR = os.path.abspath(os.path.dirname(__file__))
 
 class QueryDimensionRecordsTest(unittest.TestCase, ButlerTestHelper):
 
-    mockFuncName = "lsst.daf.butler.cli.cmd.commands.script.queryDimensionRecords"
+    mockFuncName = "lsst.daf.butler.script.queryDimensionRecords"
 
     configFile = os.path.join(TESTDIR, "config/basic/butler.yaml")
     storageClassFactory = StorageClassFactory()
@@ -21,6 +21,7 @@
 
 import os
 import unittest
+import unittest.mock
 import shutil
 import yaml
 import tempfile
@@ -31,6 +32,7 @@ from lsst.utils import doImport
 from lsst.daf.butler import StorageClassFactory, StorageClass, DimensionUniverse, FileDataset
 from lsst.daf.butler import DatastoreConfig, DatasetTypeNotSupportedError, DatastoreValidationError
 from lsst.daf.butler.formatters.yaml import YamlFormatter
+from lsst.daf.butler.datastores.fileDatastore import FileDatastore
 
 from lsst.daf.butler.tests import (DatasetTestHelper, DatastoreTestHelper, BadWriteFormatter,
                                    BadNoWriteFormatter, MetricsExample, DummyRegistry)
@@ -616,6 +618,148 @@ class PosixDatastoreTestCase(DatastoreTests, unittest.TestCase):
         self.root = tempfile.mkdtemp(dir=TESTDIR)
         super().setUp()
 
+    def testParallelIngest(self):
+        """Test ingesting many files with a pool of worker threads, and that
+        rolling back the transaction removes all of them.
+        """
+        datastore = self.makeDatastore()
+        if not isinstance(datastore, FileDatastore):
+            self.skipTest("Parallel ingest is specific to FileDatastore.")
+        datastore.ingestWorkers = 4
+        storageClass = self.storageClassFactory.getStorageClass("StructuredData")
+        dimensions = self.universe.extract(("visit", "physical_filter"))
+        metrics = makeExampleMetrics()
+
+        def makeDatasets(visits, directory):
+            datasets = []
+            for visit in visits:
+                ref = self.makeDatasetRef("metric", dimensions, storageClass,
+                                          {"instrument": "dummy", "visit": visit, "physical_filter": "V"},
+                                          conform=False)
+                path = os.path.join(directory, f"metric_{visit}.yaml")
+                with open(path, "w") as fd:
+                    yaml.dump(metrics._asdict(), stream=fd)
+                datasets.append(FileDataset(path=path, refs=ref))
+            return datasets
+
+        with tempfile.TemporaryDirectory(dir=TESTDIR) as inputDir:
+            datasets = makeDatasets(range(10), inputDir)
+            datastore.ingest(*datasets, transfer="copy")
+            for dataset in datasets:
+                self.assertEqual(datastore.get(dataset.refs[0]), metrics)
+            datasets = makeDatasets(range(10, 20), inputDir)
+            with self.assertRaises(TransactionTestError):
+                with datastore.transaction():
+                    datastore.ingest(*datasets, transfer="copy")
+                    uris = [datastore.getURI(dataset.refs[0]) for dataset in datasets]
+                    self.assertTrue(all(uri.exists() for uri in uris))
+                    raise TransactionTestError("This should roll back the transaction")
+            self.assertFalse(any(uri.exists() for uri in uris))
+
+    def testDirectoryCache(self):
+        """Test that directories known to exist are not checked again, and
+        that a failed write forgets them.
+        """
+        datastore = self.makeDatastore()
+        if not isinstance(datastore, FileDatastore):
+            self.skipTest("Directory caching is specific to FileDatastore.")
+        datastore._directoryCacheSize = 2
+        storageClass = self.storageClassFactory.getStorageClass("StructuredData")
+        dimensions = self.universe.extract(("visit", "physical_filter"))
+        metrics = makeExampleMetrics()
+
+        refs = [self.makeDatasetRef("metric", dimensions, storageClass,
+                                    {"instrument": "dummy", "visit": visit, "physical_filter": "V"},
+                                    conform=False)
+                for visit in range(3)]
+        datastore.put(metrics, refs[0])
+        directory = datastore.getURI(refs[0]).dirname()
+        self.assertIn(str(directory), datastore._knownDirectories)
+
+        # A known directory is not checked again, even if it has been
+        # removed behind the datastore's back.
+        shutil.rmtree(directory.ospath)
+        datastore._ensureDirectory(directory)
+        self.assertFalse(directory.exists())
+
+        # A failed write forgets the directory, so the retry recreates it.
+        datastore.formatterFactory.registerFormatter(refs[1].datasetType, BadWriteFormatter,
+                                                     overwrite=True)
+        with self.assertRaises(Exception):
+            datastore.put(metrics, refs[1])
+        self.assertNotIn(str(directory), datastore._knownDirectories)
+        datastore.formatterFactory.registerFormatter(refs[1].datasetType, YamlFormatter, overwrite=True)
+        datastore.put(metrics, refs[1])
+        self.assertTrue(directory.exists())
+        self.assertEqual(datastore.get(refs[1]), metrics)
+
+        # The cache is bounded, dropping the least recently used directory.
+        others = [datastore.root.join(f"other{i}/") for i in range(2)]
+        for other in others:
+            datastore._ensureDirectory(other)
+            self.assertTrue(other.exists())
+        self.assertEqual(list(datastore._knownDirectories), [str(other) for other in others])
+
+        # With directory creation disabled nothing is checked or remembered.
+        datastore.createDirectories = False
+        datastore._knownDirectories.clear()
+        datastore.put(metrics, refs[2])
+        self.assertEqual(len(datastore._knownDirectories), 0)
+
+    def testWritePlanCache(self):
+        """Test that constraints, templates and formatters are resolved once
+        per dataset type and instrument, and re-resolved when formatters
+        change.
+        """
+        datastore = self.makeDatastore()
+        if not isinstance(datastore, FileDatastore):
+            self.skipTest("Write plans are specific to FileDatastore.")
+        storageClass = self.storageClassFactory.getStorageClass("StructuredData")
+        dimensions = self.universe.extract(("visit", "physical_filter"))
+        metrics = makeExampleMetrics()
+
+        refs = [self.makeDatasetRef("metric", dimensions, storageClass,
+                                    {"instrument": "dummy", "visit": visit, "physical_filter": "V"},
+                                    conform=False)
+                for visit in range(3)]
+        with unittest.mock.patch.object(datastore.constraints, "isAcceptable",
+                                        wraps=datastore.constraints.isAcceptable) as isAcceptable:
+            datastore.put(metrics, refs[0])
+            self.assertEqual(list(datastore._writePlans), [(refs[0].datasetType, "dummy")])
+            plan = datastore._writePlans[refs[0].datasetType, "dummy"]
+            datastore.put(metrics, refs[1])
+            self.assertIs(datastore._writePlans[refs[0].datasetType, "dummy"], plan)
+            self.assertNotEqual(datastore.getURI(refs[0]), datastore.getURI(refs[1]))
+            self.assertEqual(isAcceptable.call_count, 1)
+
+        # Rejections are cached, too.
+        rejected = [self.makeDatasetRef("rejected", dimensions, storageClass,
+                                        {"instrument": "dummy", "visit": visit, "physical_filter": "V"},
+                                        conform=False)
+                    for visit in range(2)]
+        with unittest.mock.patch.object(datastore.constraints, "isAcceptable",
+                                        return_value=False) as isAcceptable:
+            for ref in rejected:
+                with self.assertRaises(DatasetTypeNotSupportedError):
+                    datastore.put(metrics, ref)
+            self.assertEqual(isAcceptable.call_count, 1)
+
+        # Registering a formatter invalidates the plan.
+        datastore.formatterFactory.registerFormatter(refs[2].datasetType, BadWriteFormatter,
+                                                     overwrite=True)
+        with self.assertRaises(RuntimeError):
+            datastore.put(metrics, refs[2])
+        self.assertIs(datastore._writePlans[refs[2].datasetType, "dummy"].formatterClass,
+                      BadWriteFormatter)
+
+        # Formatters that modify their parameters do not affect later puts.
+        datastore.formatterFactory.registerFormatter(refs[2].datasetType, YamlFormatter, overwrite=True,
+                                                     writeParameters={"unsafe_dump": True})
+        _, formatter = datastore._prepare_for_put(metrics, refs[2])
+        formatter.writeParameters["unsafe_dump"] = False
+        _, formatter = datastore._prepare_for_put(metrics, refs[2])
+        self.assertEqual(formatter.writeParameters, {"unsafe_dump": True})
+
 
 class PosixDatastoreNoChecksumsTestCase(PosixDatastoreTestCase):
     """Posix datastore tests but with checksums disabled."""
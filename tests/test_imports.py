@@ -0,0 +1,209 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the lazily-imported package namespaces, and an import-time
+benchmark for the command-line interface.
+"""
+
+import ast
+import importlib
+import json
+import os
+import subprocess
+import sys
+import types
+import unittest
+
+import lsst.daf.butler
+import lsst.daf.butler.core
+import lsst.daf.butler.registry
+
+# Modules that are slow to import, and should not be needed until a command
+# actually does something with a repository.
+HEAVY_MODULES = (
+    "astropy.time",
+    "lsst.sphgeom",
+    "sqlalchemy",
+    "lsst.daf.butler._butler",
+    "lsst.daf.butler.core.dimensions",
+    "lsst.daf.butler.registry._registry",
+)
+
+# Python snippet run in a fresh interpreter; reports which of the heavy
+# modules were imported and how long the import statements took.
+IMPORT_BENCHMARK = """
+import json
+import sys
+import time
+start = time.perf_counter()
+{statements}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def runImportBenchmark(*statements):
+    """Execute import statements in a new interpreter.
+
+    Parameters
+    ----------
+    *statements : `str`
+        Python statements to execute.
+
+    Returns
+    -------
+    elapsed : `float`
+        Wall-clock time taken by the statements, in seconds.
+    loaded : `list` [ `str` ]
+        The entries in `HEAVY_MODULES` that were imported.
+    """
+    code = IMPORT_BENCHMARK.format(statements="\n".join(statements), heavy=HEAVY_MODULES)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in sys.path if p)
+    result = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            env=env, check=True, universal_newlines=True)
+    report = json.loads(result.stdout.splitlines()[-1])
+    return report["elapsed"], report["loaded"]
+
+
+def getTypeCheckingExports(package):
+    """Return the names imported by the ``if TYPE_CHECKING:`` block of a
+    package's ``__init__.py``.
+
+    Parameters
+    ----------
+    package : `types.ModuleType`
+        The package to inspect.
+
+    Returns
+    -------
+    names : `set` [ `str` ]
+        Names imported explicitly, plus the names provided by each module
+        imported with ``import *``.
+    """
+    with open(package.__file__) as f:
+        tree = ast.parse(f.read())
+    (block,) = [node for node in tree.body
+                if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING"]
+    names = set()
+    for node in block.body:
+        assert isinstance(node, ast.ImportFrom), ast.dump(node)
+        module = importlib.import_module("." * node.level + (node.module or ""), package.__name__)
+        for alias in node.names:
+            if alias.name == "*" and hasattr(module, "__all__"):
+                names.update(module.__all__)
+            elif alias.name == "*":
+                # Subpackages without __all__ export their public names, but
+                # not their submodules.
+                names.update(name for name, value in vars(module).items()
+                             if not name.startswith("_") and not isinstance(value, types.ModuleType))
+            else:
+                names.add(alias.asname or alias.name)
+    return names
+
+
+class LazyImportTestCase(unittest.TestCase):
+    """Tests for the PEP 562 namespaces of the daf_butler packages."""
+
+    def testCoreSymbols(self):
+        """Test that the lazy core namespace resolves all of its exports to
+        the objects defined in its submodules.
+        """
+        core = lsst.daf.butler.core
+        for name in core.__all__:
+            with self.subTest(name=name):
+                value = getattr(core, name)
+                if getattr(value, "__name__", None) == name:
+                    # A class or function, rather than a type alias.
+                    module = importlib.import_module(value.__module__)
+                    self.assertIs(getattr(module, name), value)
+        self.assertIn("DatasetRef", dir(core))
+        with self.assertRaises(AttributeError):
+            core.NotASymbol
+        with self.assertRaises(ImportError):
+            from lsst.daf.butler.core import NotASymbol  # noqa: F401
+
+    def testPackageSymbols(self):
+        """Test that the top-level and registry namespaces resolve all of
+        their exports, and that they match the objects in the submodules.
+        """
+        for package in (lsst.daf.butler, lsst.daf.butler.registry):
+            for name in package.__all__:
+                with self.subTest(package=package.__name__, name=name):
+                    self.assertIsNotNone(getattr(package, name))
+        self.assertIs(lsst.daf.butler.Butler, importlib.import_module("lsst.daf.butler._butler").Butler)
+        self.assertIs(lsst.daf.butler.ddl, importlib.import_module("lsst.daf.butler.core.ddl"))
+        self.assertIs(lsst.daf.butler.CollectionType, lsst.daf.butler.registry.CollectionType)
+
+    def testSymbolTables(self):
+        """Test that the lazy symbol tables export exactly the names that the
+        ``TYPE_CHECKING`` imports in each package provide, so neither can get
+        out of sync with the submodules' ``__all__``.
+        """
+        for package in (lsst.daf.butler, lsst.daf.butler.core, lsst.daf.butler.registry):
+            with self.subTest(package=package.__name__):
+                self.assertEqual(sorted(package.__all__), sorted(set(package.__all__)))
+                self.assertEqual(set(package.__all__), getTypeCheckingExports(package))
+                for name in ("TYPE_CHECKING", "lazyAttributes", "_coreSymbols"):
+                    self.assertFalse(hasattr(package, name))
+                    self.assertNotIn(name, dir(package))
+
+    def testStarImport(self):
+        """Test that ``from lsst.daf.butler import *`` still provides the
+        full namespace.
+        """
+        namespace = {}
+        exec("from lsst.daf.butler import *", namespace)
+        for name in ("Butler", "DatasetRef", "DimensionUniverse", "Registry", "Timespan", "ddl"):
+            self.assertIn(name, namespace)
+
+
+class ImportTimeTestCase(unittest.TestCase):
+    """Guard against regressions in the time needed to import the package and
+    start the command-line interface.
+
+    Timings are too noisy to assert on, so these tests check that the heavy
+    dependencies stay unimported instead.
+    """
+
+    def testPackageImport(self):
+        _, loaded = runImportBenchmark("import lsst.daf.butler")
+        self.assertEqual(loaded, [])
+
+    def testCommandLineHelp(self):
+        _, loaded = runImportBenchmark(
+            "from click.testing import CliRunner",
+            "from lsst.daf.butler.cli.butler import cli",
+            "assert CliRunner().invoke(cli, ['--help']).exit_code == 0",
+            "assert CliRunner().invoke(cli, ['query-datasets', '--help']).exit_code == 0",
+        )
+        self.assertEqual(loaded, [])
+
+    def testSymbolImport(self):
+        """Test that lightweight symbols do not pull in the whole package."""
+        _, loaded = runImportBenchmark("from lsst.daf.butler import Config, CollectionType")
+        self.assertEqual(loaded, [])
+        _, loaded = runImportBenchmark("from lsst.daf.butler import Butler")
+        self.assertEqual(set(loaded), set(HEAVY_MODULES))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for `lsst.daf.butler.core.metrics`.
+"""
+
+import logging
+import os
+import unittest
+
+from lsst.daf.butler import Butler, ButlerURI
+from lsst.daf.butler.core.metrics import (
+    MetricsCollector,
+    MetricsReporter,
+    collectMetrics,
+    countMetric,
+    disableMetrics,
+    enableMetrics,
+    metricsEnabled,
+    metricsSnapshot,
+    timed,
+    timer,
+)
+from lsst.daf.butler.tests import MetricsExample, addDatasetType, registerMetricsExample
+from lsst.daf.butler.tests.utils import makeTestTempDir, removeTestTempDir
+
+
+TESTDIR = os.path.abspath(os.path.dirname(__file__))
+
+
+class _Base:
+
+    @timed("test.method")
+    def method(self):
+        return "base"
+
+
+class _Derived(_Base):
+
+    @timed("test.method")
+    def method(self):
+        return super().method()
+
+
+class MetricsTestCase(unittest.TestCase):
+    """Tests for collectors, timers and counters.
+    """
+
+    def tearDown(self):
+        disableMetrics()
+
+    def testDisabled(self):
+        self.assertFalse(metricsEnabled())
+        # Nothing is recorded anywhere, and a shared context is returned.
+        self.assertIs(timer("a"), timer("b"))
+        with timer("a"):
+            countMetric("b")
+        self.assertEqual(_Derived().method(), "base")
+        self.assertEqual(metricsSnapshot(), {"timers": {}, "counters": {}})
+
+    def testScoped(self):
+        with collectMetrics() as outer:
+            self.assertTrue(metricsEnabled())
+            with timer("a"):
+                pass
+            with collectMetrics() as inner:
+                countMetric("b", 2)
+                self.assertEqual(_Derived().method(), "base")
+            countMetric("b")
+        self.assertFalse(metricsEnabled())
+        countMetric("b")
+        snapshot = outer.snapshot()
+        self.assertEqual(snapshot["counters"], {"b": 3})
+        self.assertEqual(set(snapshot["timers"]), {"a", "test.method"})
+        # Nested calls to an operation with the same name are counted once.
+        self.assertEqual(snapshot["timers"]["test.method"]["count"], 1)
+        self.assertEqual(inner.snapshot()["counters"], {"b": 2})
+        stats = snapshot["timers"]["a"]
+        self.assertEqual(stats["count"], 1)
+        self.assertLessEqual(stats["min"], stats["mean"])
+        self.assertLessEqual(stats["mean"], stats["max"])
+
+    def testGlobal(self):
+        collector = enableMetrics(reset=True)
+        countMetric("b")
+        with collectMetrics():
+            countMetric("b")
+        disableMetrics()
+        countMetric("b")
+        self.assertEqual(metricsSnapshot()["counters"], {"b": 2})
+        self.assertEqual(enableMetrics(reset=True), collector)
+        self.assertEqual(metricsSnapshot()["counters"], {})
+
+    def testPrometheus(self):
+        collector = MetricsCollector()
+        collector.addTime("database.query", 0.5)
+        collector.addTime("database.query", 0.25)
+        collector.addCount("cache.dimensionRecord.hit", 3)
+        text = collector.toPrometheus()
+        self.assertIn('daf_butler_operation_seconds_count{operation="database.query"} 2\n', text)
+        self.assertIn('daf_butler_operation_seconds_sum{operation="database.query"} 0.75\n', text)
+        self.assertIn('daf_butler_events_total{event="cache.dimensionRecord.hit"} 3\n', text)
+        self.assertIn("# TYPE daf_butler_operation_seconds summary", text)
+        collector.reset()
+        self.assertEqual(collector.snapshot(), {"timers": {}, "counters": {}})
+
+    def testReporter(self):
+        root = makeTestTempDir(TESTDIR)
+        self.addCleanup(removeTestTempDir, root)
+        path = os.path.join(root, "metrics.prom")
+        collector = MetricsCollector()
+        collector.addCount("b")
+        with self.assertLogs("lsst.daf.butler.core.metrics", level=logging.INFO) as cm:
+            with MetricsReporter(3600, collector, prometheusPath=path):
+                pass
+        self.assertIn("b: 1", cm.output[0])
+        with open(path) as stream:
+            self.assertIn('{event="b"} 1', stream.read())
+
+
+class ButlerMetricsTestCase(unittest.TestCase):
+    """Test that butler operations are instrumented.
+    """
+
+    def setUp(self):
+        self.root = makeTestTempDir(TESTDIR)
+        self.addCleanup(removeTestTempDir, self.root)
+
+    def testPutGet(self):
+        Butler.makeRepo(self.root)
+        butler = Butler(self.root, run="run")
+        butler.registry.insertDimensionData("instrument", {"name": "DummyCam"})
+        registerMetricsExample(butler)
+        addDatasetType(butler, "metrics", {"instrument"}, "StructuredDataNoComponents")
+        metric = MetricsExample({"a": 1}, {"b": 2}, [3])
+        with collectMetrics() as metrics:
+            ref = butler.put(metric, "metrics", instrument="DummyCam")
+            butler.getDirect(ref)
+        snapshot = metrics.snapshot()
+        for name in ("database.query", "database.insert", "formatter.write", "uri.file.size",
+                     "uri.file.read", "formatter.fromBytes"):
+            self.assertGreater(snapshot["timers"][name]["count"], 0, msg=name)
+        self.assertIn("cache.datastoreWritePlan.miss", snapshot["counters"])
+
+    def testURI(self):
+        uri = ButlerURI(os.path.join(self.root, "file.txt"))
+        with collectMetrics() as metrics:
+            uri.write(b"abc")
+            self.assertTrue(uri.exists())
+            self.assertEqual(uri.read(), b"abc")
+        self.assertEqual(set(metrics.snapshot()["timers"]),
+                         {"uri.file.write", "uri.file.exists", "uri.file.read"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -34,7 +34,7 @@ try:
 except ImportError:
     pyarrow = None
 
-from lsst.daf.butler import Butler, DatasetType
+from lsst.daf.butler import Butler, DatasetRef, DatasetType, FileDataset
 from lsst.daf.butler.tests.utils import makeTestTempDir, removeTestTempDir
 
 
@@ -113,6 +113,57 @@ class ParquetFormatterTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.butler.get(self.datasetType, dataId={}, parameters={"columns": ["d"]})
 
+    def testPartialReads(self):
+        df1 = pd.DataFrame({"a": np.arange(10, dtype=float), "b": np.random.randn(10)},
+                           index=np.arange(10, dtype=int))
+        # Ingest a file with several row groups.
+        path = os.path.join(self.root, "external.parq")
+        pyarrow.parquet.write_table(pyarrow.Table.from_pandas(df1), path, row_group_size=4)
+        self.butler.ingest(FileDataset(path=path, refs=[DatasetRef(self.datasetType, {})]),
+                           transfer="move")
+        # Select row groups.
+        df2 = self.butler.get(self.datasetType, dataId={}, parameters={"rowGroups": [0, 2]})
+        self.assertTrue(df1.iloc[[0, 1, 2, 3, 8, 9]].equals(df2))
+        df3 = self.butler.get(self.datasetType, dataId={}, parameters={"rowGroups": 1, "columns": ["b"]})
+        self.assertTrue(df1.loc[4:7, ["b"]].equals(df3))
+        with self.assertRaises(ValueError):
+            self.butler.get(self.datasetType, dataId={}, parameters={"rowGroups": [3]})
+        # Filter rows, with and without selecting columns and row groups.
+        df4 = self.butler.get(self.datasetType, dataId={}, parameters={"filters": [("a", ">=", 3)]})
+        self.assertTrue(df1[df1.a >= 3].equals(df4))
+        df5 = self.butler.get(self.datasetType, dataId={},
+                              parameters={"filters": [("a", "<", 6)], "columns": "b", "rowGroups": [1, 2]})
+        self.assertTrue(df1.loc[4:5, ["b"]].equals(df5))
+        # Read as Arrow without converting to pandas.
+        table = self.butler.get(self.datasetType.componentTypeName("arrowTable"), dataId={},
+                                parameters={"columns": ["a"], "filters": [("a", "<", 2)]})
+        self.assertIsInstance(table, pyarrow.Table)
+        self.assertEqual(table.column("a").to_pylist(), [0.0, 1.0])
+        self.assertTrue(df1.equals(
+            self.butler.get(self.datasetType.componentTypeName("arrowTable"), dataId={}).to_pandas()
+        ))
+        # Read incrementally.
+        batches = list(self.butler.get(self.datasetType.componentTypeName("recordBatches"), dataId={},
+                                       parameters={"batchSize": 3, "rowGroups": [0, 1]}))
+        self.assertGreater(len(batches), 1)
+        self.assertTrue(all(batch.num_rows <= 3 for batch in batches))
+        self.assertTrue(df1.iloc[:8].equals(pyarrow.Table.from_batches(batches).to_pandas()))
+
+    def testRecordBatchesOutliveFile(self):
+        """Test that record batch iterators can be consumed after the file
+        they read from is removed, as happens to the temporary local copies
+        of remote datasets.
+        """
+        df1 = pd.DataFrame({"a": np.arange(10, dtype=float), "b": np.random.randn(10)},
+                           index=np.arange(10, dtype=int))
+        ref = self.butler.put(df1, self.datasetType, dataId={})
+        componentName = self.datasetType.componentTypeName("recordBatches")
+        batches = self.butler.get(componentName, dataId={}, parameters={"batchSize": 3})
+        filtered = self.butler.get(componentName, dataId={}, parameters={"filters": [("a", ">=", 5)]})
+        os.remove(self.butler.getURI(ref).ospath)
+        self.assertTrue(df1.equals(pyarrow.Table.from_batches(list(batches)).to_pandas()))
+        self.assertTrue(df1[df1.a >= 5].equals(pyarrow.Table.from_batches(list(filtered)).to_pandas()))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -31,12 +31,18 @@ try:
 except ImportError:
     np = None
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 import astropy.time
 
 from lsst.daf.butler import (
     Butler,
     ButlerConfig,
     CollectionType,
+    DataCoordinate,
     DatasetType,
     Registry,
     Timespan,
@@ -152,6 +158,58 @@ class SimpleButlerTestCase(unittest.TestCase):
             [ref.unresolved() for ref in butler2.registry.queryDatasets(..., collections=...)],
         )
 
+    @unittest.skipUnless(pyarrow is not None, "Cannot test Arrow import/export without pyarrow.")
+    def testArrowTransfers(self):
+        """Test exporting and then importing dimension records, datasets and
+        collections with the Arrow backend.
+        """
+        butler1 = self.makeButler(writeable=True)
+        butler1.import_(filename=os.path.join(TESTDIR, "data", "registry", "hsc-rc2-subset.yaml"))
+        butler1.import_(filename=os.path.join(TESTDIR, "data", "registry", "base.yaml"))
+        butler1.import_(filename=os.path.join(TESTDIR, "data", "registry", "datasets.yaml"))
+        registry1 = butler1.registry
+        registry1.registerCollection("tag1", CollectionType.TAGGED, doc="A tagged collection.")
+        registry1.registerCollection("calibration1", CollectionType.CALIBRATION)
+        registry1.registerCollection("chain1", CollectionType.CHAINED)
+        registry1.setCollectionChain("chain1", ["tag1", "calibration1"])
+        flats = list(registry1.queryDatasets("flat", collections=...))
+        registry1.associate("tag1", flats)
+        t1 = astropy.time.Time('2020-01-01T01:00:00', format="isot", scale="tai")
+        t2 = astropy.time.Time('2020-01-01T02:00:00', format="isot", scale="tai")
+        biases = list(registry1.queryDatasets("bias", collections="imported_g"))
+        registry1.certify("calibration1", biases, Timespan(t1, t2))
+        visits = list(registry1.queryDimensionRecords("visit"))
+        self.assertGreater(len(visits), 0)
+        with tempfile.TemporaryDirectory(dir=self.root) as directory:
+            filename = os.path.join(directory, "export.arrow")
+            with butler1.export(filename=filename) as exporter:
+                exporter.saveDataIds([record.dataId for record in visits])
+                for collection in ("tag1", "calibration1", "chain1"):
+                    exporter.saveCollection(collection)
+                exporter.saveDatasets(registry1.queryDatasets(..., collections=...))
+            butler2 = self.makeButler(writeable=True)
+            butler2.import_(filename=filename)
+        registry2 = butler2.registry
+        self.assertCountEqual(
+            [ref.unresolved() for ref in registry1.queryDatasets(..., collections=...)],
+            [ref.unresolved() for ref in registry2.queryDatasets(..., collections=...)],
+        )
+        self.assertCountEqual(
+            [ref.unresolved() for ref in registry1.queryDatasets(..., collections="tag1")],
+            [ref.unresolved() for ref in registry2.queryDatasets(..., collections="tag1")],
+        )
+        self.assertCountEqual(
+            [(assoc.ref.unresolved(), assoc.timespan)
+             for assoc in registry1.queryDatasetAssociations("bias", collections="calibration1")],
+            [(assoc.ref.unresolved(), assoc.timespan)
+             for assoc in registry2.queryDatasetAssociations("bias", collections="calibration1")],
+        )
+        self.assertEqual(list(registry2.getCollectionChain("chain1")), ["tag1", "calibration1"])
+        self.assertEqual(registry2.getCollectionDocumentation("tag1"), "A tagged collection.")
+        for record1 in visits:
+            record2 = registry2.expandDataId(record1.dataId).records["visit"]
+            self.assertEqual(record1.toDict(), record2.toDict())
+
     def testCollectionTransfers(self):
         """Test exporting and then importing collections of various types.
         """
@@ -224,6 +282,39 @@ class SimpleButlerTestCase(unittest.TestCase):
              for assoc in registry2.queryDatasetAssociations("bias", collections="calibration1")],
         )
 
+    def testDataIdExports(self):
+        """Test that exporting data IDs that do not have records yields the
+        same result as exporting the equivalent expanded data IDs.
+        """
+        butler = self.makeButler(writeable=True)
+        butler.import_(filename=os.path.join(TESTDIR, "data", "registry", "base.yaml"))
+        registry = butler.registry
+        dataIds = list(registry.queryDataIds(["detector", "physical_filter"]))
+        self.assertGreater(len(dataIds), 0)
+        self.assertFalse(any(dataId.hasRecords() for dataId in dataIds))
+        # A data ID with only required values must have its implied values
+        # looked up along with the records.
+        minimal = DataCoordinate.standardize(instrument="Cam1", physical_filter="Cam1-G",
+                                             universe=registry.dimensions)
+        self.assertFalse(minimal.hasFull())
+        contents = []
+        for toExport in (dataIds + [minimal],
+                         [registry.expandDataId(dataId) for dataId in dataIds + [minimal]]):
+            with tempfile.NamedTemporaryFile(mode='w', suffix=".yaml") as file:
+                with butler.export(filename=file.name) as exporter:
+                    exporter.saveDataIds(toExport)
+                with open(file.name) as f:
+                    contents.append(f.read())
+        self.assertEqual(contents[0], contents[1])
+        self.assertIn("band: g", contents[0])
+        # Data IDs with no records in the registry are an error, just as they
+        # are for expandDataId.
+        missing = DataCoordinate.standardize(instrument="Cam1", detector=99, universe=registry.dimensions)
+        with tempfile.NamedTemporaryFile(mode='w', suffix=".yaml") as file:
+            with self.assertRaises(LookupError):
+                with butler.export(filename=file.name) as exporter:
+                    exporter.saveDataIds(dataIds + [missing])
+
     def testButlerGet(self):
         """Test that butler.get can work with different variants."""
 
@@ -32,7 +32,8 @@ from lsst.daf.butler import ddl
 from lsst.daf.butler.registry.databases.sqlite import SqliteDatabase
 from lsst.daf.butler.registry.attributes import MissingAttributesTableError
 from lsst.daf.butler.registry.tests import DatabaseTests, RegistryTests
-from lsst.daf.butler.registry import Registry
+from lsst.daf.butler.registry.versions import IncompatibleVersionError
+from lsst.daf.butler.registry import CollectionType, Registry
 from lsst.daf.butler.tests.utils import makeTestTempDir, removeTestTempDir
 
 TESTDIR = os.path.abspath(os.path.dirname(__file__))
@@ -207,6 +208,93 @@ class SqliteFileRegistryTests(RegistryTests):
         config["db"] = f"sqlite:///{filename}"
         return Registry.createFromConfig(config, butlerRoot=self.root)
 
+    def testFlattenedChainUpgrade(self):
+        """Test that repositories with version 2.0 collection managers, which
+        have no flattened chain table, can be read but not written, and that
+        upgrading them creates and fills in the table.
+        """
+        _, filename = tempfile.mkstemp(dir=self.root, suffix=".sqlite3")
+        config = self.makeRegistryConfig()
+        config["db"] = f"sqlite:///{filename}"
+        registry = Registry.createFromConfig(config, butlerRoot=self.root)
+        self.loadData(registry, "base.yaml")
+        self.loadData(registry, "datasets.yaml")
+        registry.registerCollection("inner", type=CollectionType.CHAINED)
+        registry.registerCollection("outer", type=CollectionType.CHAINED)
+        registry.setCollectionChain("inner", ["imported_r"])
+        registry.setCollectionChain("outer", ["imported_g", "inner"])
+        expected = set(registry.queryDatasets("bias", collections=["imported_g", "imported_r"]))
+        # Make this look like a repository created with version 2.0.
+        manager = registry._managers.collections
+        versionKey = f"version:{manager.extensionName()}"
+        registry._db._connection.execute("DROP TABLE collection_chain_flat")
+        registry._managers.attributes.set(versionKey, "2.0.0", force=True)
+        with self.assertRaises(IncompatibleVersionError):
+            Registry.fromConfig(config, butlerRoot=self.root)
+        # Read-only clients fall back to searching the children of chains one
+        # at a time.
+        registry = Registry.fromConfig(config, butlerRoot=self.root, writeable=False)
+        manager = registry._managers.collections
+        self.assertIsNone(manager.selectFlattenedChain(manager.find("outer")))
+        self.assertEqual(set(registry.queryDatasets("bias", collections="outer")), expected)
+        # Upgrading creates the table and fills it in for existing chains.
+        registry = Registry.fromConfig(config, butlerRoot=self.root, upgrade=True)
+        self.assertEqual(registry._managers.attributes.get(versionKey), str(manager.currentVersion()))
+        manager = registry._managers.collections
+        self.assertIsNotNone(manager.selectFlattenedChain(manager.find("outer")))
+        self.assertEqual(set(registry.queryDatasets("bias", collections="outer")), expected)
+        registry = Registry.fromConfig(config, butlerRoot=self.root)
+        registry.setCollectionChain("inner", [])
+        self.assertEqual(set(registry.queryDatasets("bias", collections="outer")),
+                         set(registry.queryDatasets("bias", collections="imported_g")))
+
+    def testFlattenedChainsFromOtherClients(self):
+        """Test that redefining a chain updates the flattened rows of chains
+        that include it, even if they were created by another client since
+        the last refresh.
+        """
+        _, filename = tempfile.mkstemp(dir=self.root, suffix=".sqlite3")
+        config = self.makeRegistryConfig()
+        config["db"] = f"sqlite:///{filename}"
+        registry1 = Registry.createFromConfig(config, butlerRoot=self.root)
+        self.loadData(registry1, "base.yaml")
+        self.loadData(registry1, "datasets.yaml")
+        registry1.registerCollection("inner", type=CollectionType.CHAINED)
+        registry1.setCollectionChain("inner", ["imported_r"])
+        registry2 = Registry.fromConfig(config, butlerRoot=self.root)
+        # The outer chain is unknown to registry2, which has not refreshed.
+        registry1.registerCollection("outer", type=CollectionType.CHAINED)
+        registry1.setCollectionChain("outer", ["imported_g", "inner"])
+        registry2.setCollectionChain("inner", [])
+        registry3 = Registry.fromConfig(config, butlerRoot=self.root)
+        self.assertEqual(set(registry3.queryDatasets("bias", collections="outer")),
+                         set(registry3.queryDatasets("bias", collections="imported_g")))
+
+    def testCollectionSummariesFromOtherClients(self):
+        """Test that dataset searches do not skip collections that another
+        client has added datasets to since their summaries were cached, no
+        matter how often they have been skipped before.
+        """
+        _, filename = tempfile.mkstemp(dir=self.root, suffix=".sqlite3")
+        config = self.makeRegistryConfig()
+        config["db"] = f"sqlite:///{filename}"
+        registry1 = Registry.createFromConfig(config, butlerRoot=self.root)
+        self.loadData(registry1, "base.yaml")
+        registry1.registerRun("first")
+        registry1.registerRun("second")
+        bias = registry1.getDatasetType("bias")
+        dataId = {"instrument": "Cam1", "detector": 1}
+        (secondRef,) = registry1.insertDatasets(bias, [dataId], run="second")
+        registry2 = Registry.fromConfig(config, butlerRoot=self.root)
+        for _ in range(2):
+            self.assertEqual(registry2.findDataset(bias, dataId, collections=["first", "second"]),
+                             secondRef)
+        (firstRef,) = registry1.insertDatasets(bias, [dataId], run="first")
+        self.assertEqual(registry2.findDataset(bias, dataId, collections=["first", "second"]), firstRef)
+        self.assertEqual(list(registry2.queryDatasets(bias, collections=["first", "second"],
+                                                      findFirst=True)),
+                         [firstRef])
+
 
 class SqliteFileRegistryNameKeyCollMgrTestCase(SqliteFileRegistryTests, unittest.TestCase):
     """Tests for `Registry` backed by a SQLite file-based database.
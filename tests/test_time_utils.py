@@ -105,6 +105,27 @@ class TimeTestCase(unittest.TestCase):
                     # nanosecond, but there are rounding errors too
                     self.assertLess(abs(delta2_sec), 0.51e-9)
 
+    def test_array_conversion(self):
+        """Test that array conversions give the same results as scalar ones.
+        """
+        converter = TimeConverter()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=astropy.utils.exceptions.AstropyWarning)
+            if erfa is not None:
+                warnings.simplefilter("ignore", category=erfa.ErfaWarning)
+            times = Time(["1950-01-01T00:00:00", "1970-01-01T12:00:00.123", "2030-01-01T12:00:00.123456789",
+                          "2099-12-31T23:00:50", "2101-01-01T00:00:00", "3000-01-01T00:00:00"],
+                         format="isot", scale="tai")
+        times = times + TimeDelta(0.3e-9, format="sec")
+        nsec = converter.astropy_to_nsec_array(times)
+        self.assertEqual(list(nsec), [converter.astropy_to_nsec(t) for t in times])
+        self.assertEqual(nsec[0], converter.min_nsec)
+        self.assertEqual(nsec[-1], converter.max_nsec)
+        times = converter.nsec_to_astropy_array(nsec)
+        self.assertEqual(times.shape, (len(nsec),))
+        for value, time in zip(nsec, times):
+            self.assertTrue(converter.times_equal(time, converter.nsec_to_astropy(int(value))))
+
     def test_times_equal(self):
         """Test for times_equal method
         """
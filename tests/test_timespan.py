@@ -21,6 +21,7 @@
 
 import unittest
 import itertools
+import pickle
 import warnings
 
 import astropy.time
@@ -185,6 +186,24 @@ class TimespanTestCase(unittest.TestCase):
                     if diffs2 is not None:
                         self.assertEqual(diffs2, (b,))
 
+    def testLazyBounds(self):
+        """Test that operations on timespans do not compute their astropy
+        bounds, and that those are cached once computed.
+        """
+        a, b = self.timespans[-2], self.timespans[-1]
+        a = pickle.loads(pickle.dumps(a))
+        results = [a.intersection(b)]
+        results.extend(a.difference(b))
+        results.extend(b.difference(a))
+        self.assertTrue(results)
+        for t in [a, b] + results:
+            hash(t)
+            t.overlaps(a)
+            self.assertFalse(hasattr(t, "_cached_begin"))
+            self.assertFalse(hasattr(t, "_cached_end"))
+        self.assertIs(a.begin, a.begin)
+        self.assertEqual(a.begin, self.timestamps[0])
+
     def testPrecision(self):
         """Test that we only use nanosecond precision for equality."""
         ts1 = self.timespans[-1]